@@ -75,6 +75,13 @@ class DeliveryBase(DeliveryNamedTuple):
         new_kwargs = {key: to_tuple(item) for key, item in kwargs.items()}
         return super().__new__(cls, *new_args, **new_kwargs)
 
+    @classmethod
+    def _from_arrays(cls: Type[DeliveryGeneric], *arrays) -> DeliveryGeneric:
+        """Create a Delivery from NumPy arrays, such as memory-mapped
+        ones, converting each to nested tuples in bulk instead of
+        element by element as ``to_tuple`` does."""
+        return tuple.__new__(cls, (_array_to_tuple(array) for array in arrays))
+
     @classmethod
     def _empty(cls: Type[DeliveryGeneric]) -> DeliveryGeneric:
         return cls(
@@ -215,3 +222,16 @@ class DeliveryBase(DeliveryNamedTuple):
             new_delivery_data.append(np.array(item)[::skip_size])
 
         return cls(*new_delivery_data)
+
+
+def _array_to_tuple(array):
+    array = np.asarray(array)
+
+    return _nested_list_to_tuple(array.tolist(), array.ndim)
+
+
+def _nested_list_to_tuple(values, depth):
+    if depth == 1:
+        return tuple(values)
+
+    return tuple(_nested_list_to_tuple(item, depth - 1) for item in values)
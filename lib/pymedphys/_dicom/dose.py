@@ -15,9 +15,8 @@
 """A DICOM RT Dose toolbox"""
 
 import copy
-from typing import Sequence
+from typing import Dict, Sequence
 
-from pymedphys._imports import matplotlib
 from pymedphys._imports import numpy as np
 from pymedphys._imports import plt, pydicom, scipy
 
@@ -25,7 +24,8 @@ from . import orientation
 from .coords import coords_in_datasets_are_equal, xyz_axes_from_dataset
 from .header import patient_ids_in_datasets_are_equal
 from .rtplan import get_surface_entry_point_with_fallback, require_gantries_be_zero
-from .structure import pull_structure
+from .structure import get_roi_contour_sequence_by_name, list_structures
+from .structure.rasterise import rasterise_contours
 
 # pylint: disable=C0103
 
@@ -49,6 +49,83 @@ def dose_from_dataset(ds, set_transfer_syntax_uid=True):
     return dose
 
 
+def zyx_and_dose_frames_from_file(filepath):
+    """Read the coordinates of an RT Dose file, along with its dose as
+    :class:`DoseFrames`, which only reads frames from disk as they are
+    indexed.
+
+    Parameters
+    ----------
+    filepath : str or pathlib.Path
+        The path to a DICOM RT Dose file.
+
+    Returns
+    -------
+    coords : tuple(z, y, x)
+        The coordinates of the dose grid, as given by
+        :func:`zyx_and_dose_from_dataset`.
+    dose : DoseFrames
+        The dose grid, indexed by frame first.
+    """
+    dataset = pydicom.dcmread(filepath, stop_before_pixels=True)
+    x, y, z = xyz_axes_from_dataset(dataset)
+
+    return (z, y, x), DoseFrames(filepath, dataset)
+
+
+class DoseFrames:
+    """The dose grid of an RT Dose file, decoded one frame at a time.
+
+    Indexing along the first axis only reads the frames requested, so that
+    slabs of a dose grid larger than memory can be processed in turn.
+    """
+
+    def __init__(self, filepath, dataset=None):
+        if dataset is None:
+            dataset = pydicom.dcmread(filepath, stop_before_pixels=True)
+
+        self.filepath = filepath
+        self.dose_grid_scaling = float(dataset.DoseGridScaling)
+        self.shape = (
+            int(dataset.get("NumberOfFrames", 1)),
+            int(dataset.Rows),
+            int(dataset.Columns),
+        )
+
+    ndim = 3
+
+    @property
+    def dtype(self):
+        return np.dtype(float)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        frame_key, remaining_key = key[0], key[1:]
+
+        if isinstance(frame_key, (int, np.integer)):
+            dose = self._read_frame(range(self.shape[0])[frame_key])
+        else:
+            dose = np.empty((0,) + self.shape[1:])
+            frames = np.arange(self.shape[0])[frame_key]
+            if len(frames) != 0:
+                dose = np.array([self._read_frame(frame) for frame in frames])
+
+        return dose[(slice(None),) * (dose.ndim - 2) + remaining_key]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self[:], dtype=dtype)
+
+    def _read_frame(self, frame):
+        pixels = pydicom.pixels.pixel_array(self.filepath, index=int(frame))
+
+        return np.reshape(pixels, self.shape[1:]) * self.dose_grid_scaling
+
+
 def dicom_dose_interpolate(interp_coords, dicom_dose_dataset):
     """Interpolates across a DICOM dose dataset.
 
@@ -182,23 +259,27 @@ def profile(displacements, depth, direction, dose_dataset, plan_dataset):
     return extracted_dose
 
 
+# The distance, in mm, within which contour and dose planes are aligned
+Z_TOLERANCE = 0.01
+
+# The number of contour plane pixels, across all structures, which are
+# rasterised within a single call. Each pixel is held as a float64.
+MAXIMUM_RASTERISED_PIXELS = 2**24
+
+
 def get_dose_grid_structure_mask(
     structure_name: str,
     structure_dataset: "pydicom.Dataset",
     dose_dataset: "pydicom.Dataset",
+    supersampling: int = 1,
+    partial_volume: bool = False,
 ):
     """Determines the 3D boolean mask defining whether or not a grid
     point is inside or outside of a defined structure.
 
-    In its current implementation the dose grid and the planes upon
-    which the structures are defined need to be aligned. This is due to
-    the implementation only stepping through each structure plane and
-    undergoing a 2D mask on the respective dose grid. In order to
-    undergo a mask when the contours and dose grids do not align
-    inter-slice contour interpolation would be required.
-
-    For now, having two contours for the same structure name on a single
-    slice is also not supported.
+    See :func:`get_dose_grid_structure_masks`, which determines the masks
+    of many structures at once, for how the contours are placed onto the
+    dose grid.
 
     Parameters
     ----------
@@ -210,75 +291,285 @@ def get_dose_grid_structure_mask(
     dose_dataset : pydicom.Dataset
         An RT Dose DICOM object from which the grid mask coordinates are
         determined.
+    supersampling : int, optional
+        The number of points along each side of a voxel which are tested
+        for being within the structure. Defaults to 1, only the centre of
+        each voxel.
+    partial_volume : bool, optional
+        If True, return the fraction of each voxel within the structure
+        instead of a boolean mask.
+
+    Returns
+    -------
+    mask : np.ndarray
+        Indexed by (z, y, x), matching the dose grid.
 
     Raises
     ------
     ValueError
-        If an unsupported contour is provided or the dose grid does not
-        align with the structure planes.
+        If a contour does not lie within a single axial plane.
 
     """
-    x_dose, y_dose, z_dose = xyz_axes_from_dataset(dose_dataset)
+    return get_dose_grid_structure_masks(
+        structure_dataset,
+        dose_dataset,
+        structure_names=[structure_name],
+        supersampling=supersampling,
+        partial_volume=partial_volume,
+    )[structure_name]
 
-    xx, yy = np.meshgrid(x_dose, y_dose)
-    points = np.swapaxes(np.vstack([xx.ravel(), yy.ravel()]), 0, 1)
 
-    x_structure, y_structure, z_structure = pull_structure(
-        structure_name, structure_dataset
-    )
+def get_dose_grid_structure_masks(
+    structure_dataset: "pydicom.Dataset",
+    dose_dataset: "pydicom.Dataset",
+    structure_names: Sequence[str] = None,
+    supersampling: int = 1,
+    partial_volume: bool = False,
+) -> Dict[str, "np.ndarray"]:
+    """Determines the masks of many structures upon a dose grid at once.
+
+    The closed planar contours of the structures are scan-line filled
+    onto the x-y plane of the dose grid together, within compiled code,
+    in batches which bound the memory used.
+    All of the contours of a structure upon the same plane are filled
+    together, so that a contour within another contour is a hole within
+    it.
+
+    Dose planes which align with a contour plane are given that plane's
+    mask. Dose planes between two contour planes are given the shape
+    based interpolation of the two, found by linearly interpolating their
+    signed distance maps. Dose planes beyond the first or last contour
+    plane, or beside a gap within the contours larger than one and a half
+    times the contour plane spacing, are given the mask of the nearest
+    contour plane within half of that spacing, and are otherwise empty.
 
-    structure_z_values = []
-    for item in z_structure:
-        item = np.unique(item)
-        if len(item) != 1:
-            raise ValueError("Only one z value per contour supported")
-        structure_z_values.append(item[0])
+    Parameters
+    ----------
+    structure_dataset : pydicom.Dataset
+        An RT Structure DICOM object containing the respective
+        structures.
+    dose_dataset : pydicom.Dataset
+        An RT Dose DICOM object from which the grid mask coordinates are
+        determined.
+    structure_names : Sequence[str], optional
+        The names of the structures for which masks are to be created.
+        Defaults to every structure within `structure_dataset`.
+    supersampling : int, optional
+        The number of points along each side of a voxel, spread evenly
+        across it, which are tested for being within the structure. A
+        voxel is within the boolean mask when at least half of these
+        points are. Defaults to 1, only the centre of each voxel.
+    partial_volume : bool, optional
+        If True, return the fraction of each voxel within the structure
+        instead of a boolean mask. For dose planes between contour planes
+        this fraction is estimated from the interpolated signed distance
+        of the voxel centre from the structure's surface.
+
+    Returns
+    -------
+    masks : Dict[str, np.ndarray]
+        The mask of each structure, indexed by (z, y, x), matching the
+        dose grid.
+
+    Raises
+    ------
+    ValueError
+        If a contour does not lie within a single axial plane.
+
+    """
+    masks = {}
+    for structure_name, coverage in iter_dose_grid_structure_coverage(
+        structure_dataset, dose_dataset, structure_names, supersampling
+    ):
+        if partial_volume:
+            masks[structure_name] = coverage
+        else:
+            masks[structure_name] = coverage >= 0.5
 
-    structure_z_values = np.sort(structure_z_values)
-    unique_structure_z_values = np.unique(structure_z_values)
+    return masks
 
-    if np.any(structure_z_values != unique_structure_z_values):
-        raise ValueError("Only one contour per slice is currently supported")
 
-    sorted_dose_z = np.sort(z_dose)
+def iter_dose_grid_structure_coverage(
+    structure_dataset, dose_dataset, structure_names=None, supersampling=1
+):
+    """Yield the name and the fraction of each dose grid voxel within
+    each structure, one structure at a time.
+
+    The contours of consecutive structures are rasterised together, in
+    batches of up to ``MAXIMUM_RASTERISED_PIXELS`` contour plane pixels.
+    Peak memory is therefore about one batch of rasterised contour planes,
+    or all of the planes of the largest structure if that is more, along
+    with one structure's coverage of the full dose grid. See
+    ``get_dose_grid_structure_masks`` for details.
+    """
+    x_dose, y_dose, z_dose = xyz_axes_from_dataset(dose_dataset)
+    z_dose = np.atleast_1d(z_dose)
 
-    first_dose_index = np.where(sorted_dose_z == structure_z_values[0])[0][0]
-    for i, z_val in enumerate(structure_z_values):
-        dose_index = first_dose_index + i
-        if structure_z_values[i] != sorted_dose_z[dose_index]:
-            raise ValueError(
-                "Only contours where both, there are no gaps in the "
-                "z-axis of the contours, and the contour axis and dose "
-                "axis, are aligned are supported."
+    if structure_names is None:
+        structure_names = list_structures(structure_dataset)
+
+    maximum_planes = max(MAXIMUM_RASTERISED_PIXELS // (len(y_dose) * len(x_dose)), 1)
+
+    batch = {}
+    for structure_name in structure_names:
+        planes = _closed_planar_contours_by_plane(structure_name, structure_dataset)
+
+        planes_within_batch = sum(len(batch_planes) for batch_planes in batch.values())
+        if batch and planes_within_batch + len(planes) > maximum_planes:
+            yield from _rasterise_structures(
+                batch, x_dose, y_dose, z_dose, supersampling
             )
+            batch = {}
 
-    mask_yxz = np.zeros((len(y_dose), len(x_dose), len(z_dose)), dtype=bool)
+        batch[structure_name] = planes
 
-    for structure_index, z_val in enumerate(structure_z_values):
-        dose_index = int(np.where(z_dose == z_val)[0])
+    yield from _rasterise_structures(batch, x_dose, y_dose, z_dose, supersampling)
 
-        if z_structure[structure_index][0] != z_dose[dose_index]:
-            raise ValueError("Structure and dose indices do not align")
 
-        structure_polygon = matplotlib.path.Path(
-            [
-                (x_structure[structure_index][i], y_structure[structure_index][i])
-                for i in range(len(x_structure[structure_index]))
-            ]
-        )
+def _rasterise_structures(planes_by_structure, x_dose, y_dose, z_dose, supersampling):
+    """Rasterise the contour planes of a batch of structures within a
+    single call, and yield each structure's coverage of the dose grid."""
+    x_spacing = _axis_spacing(x_dose)
+    y_spacing = _axis_spacing(y_dose)
+
+    contours_by_plane = [
+        [
+            np.column_stack([(x - x_dose[0]) / x_spacing, (y - y_dose[0]) / y_spacing])
+            for x, y in contours
+        ]
+        for planes in planes_by_structure.values()
+        for contours in planes.values()
+    ]
 
-        # This logical "or" here is actually in place for the case where
-        # there may be multiple contours on the one slice. That's not
-        # going to be used at the moment however, as that case is not
-        # yet supported in the logic above.
-        mask_yxz[:, :, dose_index] = mask_yxz[:, :, dose_index] | (
-            structure_polygon.contains_points(points).reshape(len(y_dose), len(x_dose))
+    coverage = rasterise_contours(
+        contours_by_plane, (len(y_dose), len(x_dose)), supersampling=supersampling
+    )
+
+    first_plane = 0
+    for structure_name, planes in planes_by_structure.items():
+        plane_z = np.array(list(planes.keys()))
+        number_of_planes = len(plane_z)
+        structure_coverage = _stack_planes_onto_dose_grid(
+            plane_z,
+            coverage[first_plane : first_plane + number_of_planes],
+            z_dose,
+            (abs(y_spacing), abs(x_spacing)),
         )
+        first_plane += number_of_planes
+
+        yield structure_name, structure_coverage
+
+
+def _axis_spacing(axis):
+    if len(axis) < 2:
+        return 1.0
+
+    return axis[1] - axis[0]
+
+
+def _closed_planar_contours_by_plane(structure_name, structure_dataset):
+    """The (x, y) coordinates of the closed planar contours of a
+    structure, grouped by plane and sorted by z."""
+    roi_contour_sequence = get_roi_contour_sequence_by_name(
+        structure_name, structure_dataset
+    )
+
+    planes = {}
+    for contour in getattr(roi_contour_sequence, "ContourSequence", []):
+        geometric_type = getattr(contour, "ContourGeometricType", "CLOSED_PLANAR")
+        if geometric_type != "CLOSED_PLANAR":
+            continue
 
-    mask_xyz = np.swapaxes(mask_yxz, 0, 1)
-    mask_zyx = np.swapaxes(mask_xyz, 0, 2)
+        contour_data = np.array(contour.ContourData, dtype=float).reshape(-1, 3)
+        x, y, z = contour_data.T
+
+        if np.ptp(z) > Z_TOLERANCE:
+            raise ValueError("Only one z value per contour supported")
+
+        plane_z = round(float(z[0]) / Z_TOLERANCE) * Z_TOLERANCE
+        planes.setdefault(plane_z, []).append((x, y))
+
+    return dict(sorted(planes.items()))
+
+
+def _stack_planes_onto_dose_grid(plane_z, plane_coverage, z_dose, pixel_spacing):
+    """Place the coverage of each contour plane onto the planes of the
+    dose grid, interpolating between contour planes."""
+    coverage = np.zeros((len(z_dose),) + plane_coverage.shape[1:])
+    if len(plane_z) == 0:
+        return coverage
+
+    if len(plane_z) > 1:
+        thickness = np.min(np.diff(plane_z))
+    elif len(z_dose) > 1:
+        thickness = np.min(np.abs(np.diff(z_dose)))
+    else:
+        thickness = 0
+
+    # Each is only computed when first required, and then reused for
+    # every dose plane between the same two contour planes.
+    signed_distances = [None] * len(plane_z)
+
+    width = np.mean(pixel_spacing)
+
+    for dose_index, z in enumerate(z_dose):
+        upper = int(np.searchsorted(plane_z, z))
+        lower = upper - 1
+
+        distances = [
+            (abs(plane_z[plane] - z), plane)
+            for plane in (lower, upper)
+            if 0 <= plane < len(plane_z)
+        ]
+        distance, nearest = min(distances)
+
+        if distance <= Z_TOLERANCE:
+            coverage[dose_index] = plane_coverage[nearest]
+        elif (
+            len(distances) == 2
+            and plane_z[upper] - plane_z[lower] <= 1.5 * thickness + Z_TOLERANCE
+        ):
+            for plane in (lower, upper):
+                if signed_distances[plane] is None:
+                    signed_distances[plane] = _signed_distance(
+                        plane_coverage[plane], pixel_spacing
+                    )
+
+            weight = (z - plane_z[lower]) / (plane_z[upper] - plane_z[lower])
+            interpolated = (1 - weight) * signed_distances[lower]
+            interpolated += weight * signed_distances[upper]
+
+            with np.errstate(invalid="ignore"):
+                coverage[dose_index] = np.nan_to_num(
+                    np.clip(0.5 + interpolated / width, 0, 1), nan=0.0
+                )
+        elif distance <= thickness / 2 + Z_TOLERANCE:
+            coverage[dose_index] = plane_coverage[nearest]
+
+    return coverage
+
+
+def _signed_distance(coverage, pixel_spacing):
+    """The distance, in mm, from each pixel centre to the edge of the
+    pixels which are at least half covered, positive inside and negative
+    outside."""
+    inside = coverage >= 0.5
+    if not np.any(inside):
+        return np.full(coverage.shape, -np.inf)
+    if np.all(inside):
+        return np.full(coverage.shape, np.inf)
+
+    # The edge lies half way between neighbouring inside and outside
+    # pixel centres.
+    half_width = np.mean(pixel_spacing) / 2
+    distance_inside = scipy.ndimage.distance_transform_edt(
+        inside, sampling=pixel_spacing
+    )
+    distance_outside = scipy.ndimage.distance_transform_edt(
+        ~inside, sampling=pixel_spacing
+    )
 
-    return mask_zyx
+    return np.where(inside, distance_inside - half_width, half_width - distance_outside)
 
 
 def find_dose_within_structure(structure_name, structure_dataset, dose_dataset):
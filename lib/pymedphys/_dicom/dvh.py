@@ -0,0 +1,487 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Cumulative dose volume histograms of whole structure sets.
+
+The RT Dose is decoded once, the contours of the structures are
+rasterised onto its grid together in bounded batches, and each
+structure's histogram is then binned with a fixed bin width, so that the histograms of different
+structures and plans share the same dose bins.
+"""
+
+import collections
+import functools
+import logging
+import os
+import pathlib
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pydicom
+
+from pymedphys._utilities.parallel import map_many
+
+from .coords import xyz_axes_from_dataset
+from .dose import dose_from_dataset, iter_dose_grid_structure_coverage
+from .structure import list_structures
+
+DEFAULT_BIN_WIDTH = 0.01
+DEFAULT_METRICS = ("Dmean", "D98", "D95", "D50", "D2", "V20")
+MAXIMUM_CACHE_ENTRIES = 32
+
+_METRIC_PATTERN = re.compile(r"^([DV])(\d+(?:\.\d+)?)(%|cc|Gy)?$")
+_CACHE: "collections.OrderedDict" = collections.OrderedDict()
+
+
+@dataclass(frozen=True)
+class DVH:
+    """The cumulative dose volume histogram of a structure.
+
+    Attributes
+    ----------
+    structure_name : str
+        The name of the structure.
+    dose : np.ndarray
+        The dose, in Gy, at each bin edge. Starts at zero and increases
+        by the bin width.
+    volume : np.ndarray
+        The volume, in cc, which receives at least each of ``dose``. The
+        final value is always zero.
+    minimum, mean, maximum : float
+        The volume weighted statistics of the dose within the structure,
+        determined from the dose of each voxel instead of the bins. NaN
+        if the structure does not overlap the dose grid.
+    """
+
+    structure_name: str
+    dose: "np.ndarray"
+    volume: "np.ndarray"
+    minimum: float
+    mean: float
+    maximum: float
+
+    @property
+    def bin_width(self) -> float:
+        return float(self.dose[1] - self.dose[0])
+
+    @property
+    def total_volume(self) -> float:
+        return float(self.volume[0])
+
+    @property
+    def relative_volume(self) -> "np.ndarray":
+        """The percentage of the structure which receives at least each
+        of ``dose``."""
+        if self.total_volume == 0:
+            return np.zeros_like(self.volume)
+
+        return 100 * self.volume / self.total_volume
+
+    @property
+    def differential(self) -> "np.ndarray":
+        """The volume, in cc, within each bin, ``[dose[i], dose[i + 1])``."""
+        return -np.diff(self.volume)
+
+    def dose_to_volume(self, volume, relative=True):
+        """The minimum dose, in Gy, received by the hottest part of the
+        structure, such as D95 for ``volume=95``.
+
+        Parameters
+        ----------
+        volume : float
+            The volume of the hottest part of the structure, as a
+            percentage of the structure if ``relative``, otherwise in cc.
+        relative : bool, optional
+        """
+        cumulative = self.relative_volume if relative else self.volume
+        if self.total_volume == 0 or volume > cumulative[0]:
+            return np.nan
+
+        # The last bin edge which at least the volume receives, and then
+        # linearly interpolating across the bin which follows it.
+        i = int(np.count_nonzero(cumulative >= volume)) - 1
+        if i == len(cumulative) - 1:
+            return float(self.dose[i])
+
+        fraction = (cumulative[i] - volume) / (cumulative[i] - cumulative[i + 1])
+
+        return float(self.dose[i] + fraction * (self.dose[i + 1] - self.dose[i]))
+
+    def volume_receiving(self, dose, relative=True):
+        """The volume which receives at least ``dose`` Gy, such as V20
+        for ``dose=20``. As a percentage of the structure if ``relative``,
+        otherwise in cc.
+        """
+        cumulative = self.relative_volume if relative else self.volume
+
+        return float(np.interp(dose, self.dose, cumulative, right=0))
+
+    def metric(self, name: str) -> float:
+        """Determine a DVH metric by its name.
+
+        Supported are ``Dmean``, ``Dmin`` and ``Dmax``, the dose to a
+        percentage of the structure such as ``D95`` or ``D95%``, the dose
+        to an absolute volume such as ``D2cc``, the percentage of the
+        structure receiving a dose such as ``V20`` or ``V20Gy``, and the
+        absolute volume receiving a dose such as ``V20cc``.
+        """
+        statistics = {"Dmin": self.minimum, "Dmean": self.mean, "Dmax": self.maximum}
+        if name in statistics:
+            return statistics[name]
+
+        match = _METRIC_PATTERN.match(name)
+        if match is None:
+            raise ValueError(f"DVH metric '{name}' not recognised")
+
+        quantity, value, unit = match.groups()
+        value = float(value)
+
+        if quantity == "D" and unit in (None, "%"):
+            return self.dose_to_volume(value)
+        if quantity == "D" and unit == "cc":
+            return self.dose_to_volume(value, relative=False)
+        if quantity == "V" and unit in (None, "Gy"):
+            return self.volume_receiving(value)
+        if quantity == "V" and unit == "cc":
+            return self.volume_receiving(value, relative=False)
+
+        raise ValueError(f"DVH metric '{name}' not recognised")
+
+
+def dvh(
+    dose_dataset: "pydicom.Dataset",
+    structure_dataset: "pydicom.Dataset",
+    structure_names: Sequence[str] = None,
+    bin_width: float = DEFAULT_BIN_WIDTH,
+    supersampling: int = 1,
+    cache: bool = True,
+) -> Dict[str, DVH]:
+    """Calculate the cumulative DVH of many structures at once.
+
+    The dose grid is decoded once, and the contours of the structures
+    are rasterised onto it together in bounded batches, see
+    :func:`pymedphys._dicom.dose.get_dose_grid_structure_masks`. Each
+    voxel contributes the fraction of its volume which is within the
+    structure.
+
+    Parameters
+    ----------
+    dose_dataset : pydicom.Dataset
+        An RT Dose DICOM object, with its dose in Gy.
+    structure_dataset : pydicom.Dataset
+        The RT Structure Set DICOM object containing the structures.
+    structure_names : Sequence[str], optional
+        The structures for which to calculate a DVH. Defaults to every
+        structure within ``structure_dataset``.
+    bin_width : float, optional
+        The width, in Gy, of the dose bins. Defaults to 0.01 Gy.
+    supersampling : int, optional
+        The number of points along each side of a voxel, spread evenly
+        across it, which are tested for being within each structure.
+    cache : bool, optional
+        Reuse the DVHs previously calculated within this process for the
+        same dose and structure set, as identified by their
+        ``SOPInstanceUID``, and the same parameters. Defaults to True.
+
+    Returns
+    -------
+    dvhs : Dict[str, DVH]
+        The DVH of each structure.
+
+    Examples
+    --------
+    >>> dvhs = pymedphys.dicom.dvh(dose_dataset, structure_dataset)  # doctest: +SKIP
+    >>> dvhs["PTV"].metric("D95")  # doctest: +SKIP
+    """
+    if bin_width <= 0:
+        raise ValueError("bin_width must be positive")
+
+    if structure_names is not None:
+        structure_names = tuple(structure_names)
+
+    key = None
+    if cache:
+        key = _cache_key(
+            dose_dataset, structure_dataset, structure_names, bin_width, supersampling
+        )
+
+    if key is not None and key in _CACHE:
+        _CACHE.move_to_end(key)
+        return dict(_CACHE[key])
+
+    _, _, z_dose = xyz_axes_from_dataset(dose_dataset)
+    z_dose = np.atleast_1d(z_dose)
+
+    dose = dose_from_dataset(dose_dataset).reshape(
+        len(z_dose), dose_dataset.Rows, dose_dataset.Columns
+    )
+    voxel_volume = (
+        float(np.prod(np.abs(np.array(dose_dataset.PixelSpacing, dtype=float))))
+        * _plane_thickness(dose_dataset, z_dose)
+        / 1000
+    )
+
+    dvhs = {}
+    for structure_name, coverage in iter_dose_grid_structure_coverage(
+        structure_dataset, dose_dataset, structure_names, supersampling
+    ):
+        dvhs[structure_name] = _dvh_from_coverage(
+            structure_name, dose, coverage, voxel_volume, bin_width
+        )
+
+    if key is not None:
+        _CACHE[key] = dvhs
+        while len(_CACHE) > MAXIMUM_CACHE_ENTRIES:
+            _CACHE.popitem(last=False)
+
+    return dict(dvhs)
+
+
+def clear_dvh_cache():
+    """Remove every DVH cached by :func:`dvh` within this process."""
+    _CACHE.clear()
+
+
+def dvh_directory(
+    directory,
+    structure_names: Sequence[str] = None,
+    metrics: Sequence[str] = DEFAULT_METRICS,
+    bin_width: float = DEFAULT_BIN_WIDTH,
+    supersampling: int = 1,
+    workers: Optional[int] = None,
+) -> "pd.DataFrame":
+    """Determine the DVH metrics of every structure of every RT Dose
+    within a directory, such as a directory of patients.
+
+    Each RT Dose is paired with its RT Structure Set through the RT Plan
+    it references, or the structure set it references directly. An RT
+    Dose without either is paired with the patient's structure set when
+    the patient has only one. Every pair is evaluated within a pool of
+    worker processes.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        The directory, which is searched recursively for DICOM files.
+    structure_names : Sequence[str], optional
+        The structures to evaluate, where they exist. Defaults to every
+        structure.
+    metrics : Sequence[str], optional
+        The names of the metrics to determine, see :meth:`DVH.metric`.
+    bin_width : float, optional
+        The width, in Gy, of the dose bins.
+    supersampling : int, optional
+        See :func:`dvh`.
+    workers : int, optional
+        The number of worker processes to utilise. Defaults to the
+        number of processors on the machine. If ``1``, the DVHs are
+        calculated serially within the current process.
+
+    Returns
+    -------
+    summary : pd.DataFrame
+        A row for each structure of each RT Dose, with the volume of the
+        structure in cc and each of ``metrics``. An RT Dose which could
+        not be evaluated has a single row with its ``error``.
+    """
+    pairs = _find_dose_and_structure_pairs(directory)
+
+    logging.info(
+        "Calculating the DVHs of %i RT Dose files with %s workers",
+        len(pairs),
+        workers or os.cpu_count(),
+    )
+
+    rows = []
+    for result in map_many(
+        functools.partial(
+            _dvh_rows,
+            structure_names=structure_names,
+            metrics=tuple(metrics),
+            bin_width=bin_width,
+            supersampling=supersampling,
+        ),
+        pairs,
+        workers=workers,
+    ):
+        if result.error is None:
+            rows += result.result
+        else:
+            patient_id, dose_path, structure_path = result.path
+            rows.append(
+                {
+                    "patient_id": patient_id,
+                    "dose": dose_path,
+                    "structure_set": structure_path,
+                    "error": repr(result.error),
+                }
+            )
+
+    columns = ["patient_id", "dose", "structure_set", "structure", "volume"]
+    columns += list(metrics) + ["error"]
+
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _dvh_from_coverage(structure_name, dose, coverage, voxel_volume, bin_width):
+    within = coverage > 0
+    structure_dose = dose[within]
+    weights = (coverage * voxel_volume[:, None, None])[within]
+
+    bins = np.floor(np.clip(structure_dose, 0, None) / bin_width).astype(np.int64)
+    number_of_bins = int(bins.max()) + 1 if bins.size else 1
+
+    differential = np.bincount(bins, weights=weights, minlength=number_of_bins)
+    volume = np.append(np.cumsum(differential[::-1])[::-1], 0)
+    dose_edges = bin_width * np.arange(number_of_bins + 1)
+
+    if weights.size:
+        minimum = float(structure_dose.min())
+        mean = float(np.average(structure_dose, weights=weights))
+        maximum = float(structure_dose.max())
+    else:
+        minimum = mean = maximum = np.nan
+
+    return DVH(structure_name, dose_edges, volume, minimum, mean, maximum)
+
+
+def _plane_thickness(dose_dataset, z_dose):
+    """The thickness, in mm, of each plane of the dose grid."""
+    if len(z_dose) > 1:
+        return np.abs(np.gradient(z_dose))
+
+    try:
+        return np.array([float(dose_dataset.SliceThickness)])
+    except (AttributeError, TypeError, ValueError) as e:
+        raise ValueError(
+            "The thickness of a single plane dose grid requires its SliceThickness"
+        ) from e
+
+
+def _cache_key(dose_dataset, structure_dataset, structure_names, *parameters):
+    dose_uid = getattr(dose_dataset, "SOPInstanceUID", None)
+    structure_uid = getattr(structure_dataset, "SOPInstanceUID", None)
+    if dose_uid is None or structure_uid is None:
+        return None
+
+    return (str(dose_uid), str(structure_uid), structure_names) + parameters
+
+
+def _dvh_rows(pair, structure_names, metrics, bin_width, supersampling) -> List[dict]:
+    patient_id, dose_path, structure_path = pair
+
+    dose_dataset = pydicom.dcmread(dose_path, force=True)
+    structure_dataset = pydicom.dcmread(structure_path, force=True)
+
+    if structure_names is not None:
+        available = set(list_structures(structure_dataset))
+        structure_names = [name for name in structure_names if name in available]
+
+    dvhs = dvh(
+        dose_dataset,
+        structure_dataset,
+        structure_names,
+        bin_width=bin_width,
+        supersampling=supersampling,
+        cache=False,
+    )
+
+    return [
+        {
+            "patient_id": patient_id,
+            "dose": dose_path,
+            "structure_set": structure_path,
+            "structure": structure_name,
+            "volume": structure_dvh.total_volume,
+            **{metric: structure_dvh.metric(metric) for metric in metrics},
+        }
+        for structure_name, structure_dvh in dvhs.items()
+    ]
+
+
+def _find_dose_and_structure_pairs(directory):
+    """Pair each RT Dose within a directory with its RT Structure Set,
+    returning the patient ID and the path of each."""
+    headers = {"RTDOSE": [], "RTPLAN": [], "RTSTRUCT": []}
+
+    for path in sorted(pathlib.Path(directory).rglob("*")):
+        if not path.is_file():
+            continue
+
+        try:
+            header = pydicom.dcmread(
+                path,
+                stop_before_pixels=True,
+                specific_tags=[
+                    "Modality",
+                    "PatientID",
+                    "SOPInstanceUID",
+                    "ReferencedRTPlanSequence",
+                    "ReferencedStructureSetSequence",
+                ],
+            )
+        except (pydicom.errors.InvalidDicomError, OSError):
+            continue
+
+        modality = getattr(header, "Modality", None)
+        if modality in headers:
+            headers[modality].append((str(path), header))
+
+    structure_paths = {
+        str(header.SOPInstanceUID): path for path, header in headers["RTSTRUCT"]
+    }
+    structure_paths_by_patient = collections.defaultdict(list)
+    for path, header in headers["RTSTRUCT"]:
+        structure_paths_by_patient[str(header.get("PatientID", ""))].append(path)
+
+    structure_uid_by_plan = {
+        str(header.SOPInstanceUID): _referenced_uid(
+            header, "ReferencedStructureSetSequence"
+        )
+        for _, header in headers["RTPLAN"]
+    }
+
+    pairs = []
+    for dose_path, header in headers["RTDOSE"]:
+        patient_id = str(header.get("PatientID", ""))
+
+        structure_uid = _referenced_uid(header, "ReferencedStructureSetSequence")
+        if structure_uid is None:
+            structure_uid = structure_uid_by_plan.get(
+                _referenced_uid(header, "ReferencedRTPlanSequence")
+            )
+
+        if structure_uid in structure_paths:
+            structure_path = structure_paths[structure_uid]
+        elif len(structure_paths_by_patient[patient_id]) == 1:
+            structure_path = structure_paths_by_patient[patient_id][0]
+        else:
+            logging.warning("Unable to determine the RT Structure Set of %s", dose_path)
+            continue
+
+        pairs.append((patient_id, dose_path, structure_path))
+
+    return pairs
+
+
+def _referenced_uid(header, sequence_name):
+    sequence = getattr(header, sequence_name, None)
+    if not sequence:
+        return None
+
+    return str(sequence[0].ReferencedSOPInstanceUID)
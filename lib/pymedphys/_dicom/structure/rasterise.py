@@ -0,0 +1,176 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Scan-line rasterisation of planar contours onto a regular grid.
+
+Each row of the grid, or each of its sub-rows when supersampling, is
+crossed by the edges of the contours on a plane an even number of times.
+The pixels between the first and second crossing, the third and fourth,
+and so on, are filled. As this considers the edges of every contour on
+the plane together, a contour within another contour is a hole within it.
+"""
+
+from functools import cache
+from typing import Sequence
+
+from pymedphys._imports import numba as nb
+from pymedphys._imports import numpy as np
+
+
+def rasterise_contours(
+    contours_by_plane: Sequence[Sequence["np.ndarray"]],
+    shape,
+    supersampling: int = 1,
+):
+    """Determine the fraction of each pixel of a set of planes that is
+    within the contours on that plane.
+
+    Parameters
+    ----------
+    contours_by_plane : Sequence[Sequence[np.ndarray]]
+        For each plane, its contours. Each contour is an array of shape
+        (n, 2) of the (column, row) coordinates of its vertices, in units
+        of pixels such that the centre of pixel ``[row, column]`` is at
+        ``(column, row)``.
+    shape : tuple(int, int)
+        The number of rows and columns of each plane.
+    supersampling : int, optional
+        The number of points along each side of a pixel, spread evenly
+        across it, which are tested for being within the contours. The
+        default of 1 tests only the centre of each pixel.
+
+    Returns
+    -------
+    coverage : np.ndarray
+        The fraction of the points within each pixel that are within the
+        contours, with shape (planes, rows, columns).
+    """
+    supersampling = int(supersampling)
+    if supersampling < 1:
+        raise ValueError("supersampling must be a positive integer")
+
+    rows, columns = shape
+
+    vertices = [
+        np.asarray(contour, dtype=np.float64).reshape(-1, 2)
+        for contours in contours_by_plane
+        for contour in contours
+    ]
+    contour_starts = np.cumsum([0] + [len(contour) for contour in vertices])
+    plane_contour_starts = np.cumsum(
+        [0] + [len(contours) for contours in contours_by_plane]
+    )
+
+    if vertices:
+        vertices = np.concatenate(vertices)
+    else:
+        vertices = np.empty((0, 2))
+
+    coverage = np.zeros((len(contours_by_plane), rows, columns))
+
+    _get_rasterise_kernel()(
+        np.ascontiguousarray(vertices[:, 0]),
+        np.ascontiguousarray(vertices[:, 1]),
+        contour_starts.astype(np.int64),
+        plane_contour_starts.astype(np.int64),
+        supersampling,
+        coverage,
+    )
+
+    return coverage
+
+
+@cache
+def _get_rasterise_kernel():
+    @nb.njit(parallel=True, cache=True)
+    def _rasterise(u, v, contour_starts, plane_contour_starts, supersampling, coverage):
+        number_of_planes, rows, columns = coverage.shape
+        sub_rows = rows * supersampling
+        sub_columns = columns * supersampling
+
+        # Sub-row g is at row (g + 0.5) / supersampling - 0.5, and so the
+        # first sub-row at or after the row coordinate r is
+        # ceil((r + 0.5) * supersampling - 0.5).
+        u_scaled = (u + 0.5) * supersampling - 0.5
+        v_scaled = (v + 0.5) * supersampling - 0.5
+
+        # First count the crossings of each sub-row, so that they can all
+        # be stored within a single array.
+        counts = np.zeros(number_of_planes * sub_rows + 1, dtype=np.int64)
+
+        # pylint: disable=not-an-iterable
+        for plane in nb.prange(number_of_planes):
+            for contour in range(
+                plane_contour_starts[plane], plane_contour_starts[plane + 1]
+            ):
+                start = contour_starts[contour]
+                stop = contour_starts[contour + 1]
+                for i in range(start, stop):
+                    j = i + 1 if i + 1 < stop else start
+
+                    # Each edge crosses the sub-rows within [v0, v1), so
+                    # that a vertex shared by two edges is counted once.
+                    first = max(int(np.ceil(min(v_scaled[i], v_scaled[j]))), 0)
+                    last = min(int(np.ceil(max(v_scaled[i], v_scaled[j]))), sub_rows)
+                    for g in range(first, last):
+                        counts[plane * sub_rows + g + 1] += 1
+
+        offsets = np.cumsum(counts)
+        crossings = np.empty(offsets[-1])
+        cursor = offsets[:-1].copy()
+
+        for plane in nb.prange(number_of_planes):
+            for contour in range(
+                plane_contour_starts[plane], plane_contour_starts[plane + 1]
+            ):
+                start = contour_starts[contour]
+                stop = contour_starts[contour + 1]
+                for i in range(start, stop):
+                    j = i + 1 if i + 1 < stop else start
+
+                    first = max(int(np.ceil(min(v_scaled[i], v_scaled[j]))), 0)
+                    last = min(int(np.ceil(max(v_scaled[i], v_scaled[j]))), sub_rows)
+                    if first >= last:
+                        continue
+
+                    gradient = (u_scaled[j] - u_scaled[i]) / (v_scaled[j] - v_scaled[i])
+                    for g in range(first, last):
+                        index = plane * sub_rows + g
+                        crossings[cursor[index]] = u_scaled[i] + gradient * (
+                            g - v_scaled[i]
+                        )
+                        cursor[index] += 1
+
+        # Then fill between each pair of crossings, one row at a time so
+        # that each pixel is only written to by a single thread.
+        for plane_row in nb.prange(number_of_planes * rows):
+            plane = plane_row // rows
+            row = plane_row % rows
+
+            for g in range(row * supersampling, (row + 1) * supersampling):
+                index = plane * sub_rows + g
+                row_crossings = crossings[offsets[index] : offsets[index + 1]]
+                row_crossings.sort()
+
+                for pair in range(0, row_crossings.size - 1, 2):
+                    first = max(int(np.ceil(row_crossings[pair])), 0)
+                    last = min(int(np.ceil(row_crossings[pair + 1])), sub_columns)
+                    for h in range(first, last):
+                        coverage[plane, row, h // supersampling] += 1
+
+            for column in range(columns):
+                coverage[plane, row, column] /= supersampling * supersampling
+
+    return _rasterise
@@ -0,0 +1,371 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Calculate gamma for many pairs of DICOM dose files across a pool of
+processes.
+
+The comparisons to undertake are described by a manifest. As each
+comparison completes, a row is appended to a CSV summary, so that an
+interrupted batch can be resumed by skipping the comparisons which
+already have a successful row.
+"""
+
+import csv
+import dataclasses
+import functools
+import logging
+import os
+import pathlib
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pydicom
+
+from pymedphys._utilities.parallel import map_many
+
+from ..implementation.shell import DEFAULT_RAM, ENGINES
+from ..utilities import calculate_pass_rate
+from .core import gamma_dicom
+
+REQUIRED_MANIFEST_COLUMNS = (
+    "reference",
+    "evaluation",
+    "dose_percent_threshold",
+    "distance_mm_threshold",
+)
+
+SUMMARY_COLUMNS = (
+    "job_id",
+    "reference",
+    "evaluation",
+    "dose_percent_threshold",
+    "distance_mm_threshold",
+    "lower_percent_dose_cutoff",
+    "local_gamma",
+    "max_gamma",
+    "status",
+    "pass_rate",
+    "mean_gamma",
+    "points_evaluated",
+    "duration",
+    "error",
+)
+
+
+@dataclass(frozen=True)
+class GammaJob:
+    """A single gamma comparison between two DICOM RT Dose files."""
+
+    job_id: str
+    reference: str
+    evaluation: str
+    dose_percent_threshold: float
+    distance_mm_threshold: float
+    lower_percent_dose_cutoff: float = 20
+    local_gamma: bool = False
+    max_gamma: Optional[float] = None
+    interp_fraction: int = 10
+
+
+def read_manifest(path) -> List[GammaJob]:
+    """Read the gamma comparisons described within a CSV manifest.
+
+    The manifest requires the columns ``reference``, ``evaluation``,
+    ``dose_percent_threshold`` and ``distance_mm_threshold``. The columns
+    ``job_id``, ``lower_percent_dose_cutoff``, ``local_gamma``,
+    ``max_gamma`` and ``interp_fraction`` are optional, with empty values
+    taking their defaults. Relative file paths are relative to the
+    directory of the manifest.
+
+    When not provided, the ``job_id`` is made from the file paths and
+    criteria, so that it is stable between runs.
+    """
+    path = pathlib.Path(path)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    if rows:
+        missing_columns = [
+            column for column in REQUIRED_MANIFEST_COLUMNS if column not in rows[0]
+        ]
+        if missing_columns:
+            raise ValueError(
+                f"The manifest {path} is missing the columns {missing_columns}"
+            )
+
+    jobs = []
+    for row in rows:
+        row = {key: value.strip() for key, value in row.items() if value is not None}
+        reference = str(path.parent.joinpath(row["reference"]))
+        evaluation = str(path.parent.joinpath(row["evaluation"]))
+
+        kwargs = {}
+        for name, convert in (
+            ("lower_percent_dose_cutoff", float),
+            ("local_gamma", _as_bool),
+            ("max_gamma", float),
+            ("interp_fraction", int),
+        ):
+            if row.get(name):
+                kwargs[name] = convert(row[name])
+
+        job_id = row.get("job_id") or (
+            f"{row['reference']}|{row['evaluation']}|"
+            f"{row['dose_percent_threshold']}%/{row['distance_mm_threshold']}mm"
+        )
+
+        jobs.append(
+            GammaJob(
+                job_id,
+                reference,
+                evaluation,
+                float(row["dose_percent_threshold"]),
+                float(row["distance_mm_threshold"]),
+                **kwargs,
+            )
+        )
+
+    job_ids = [job.job_id for job in jobs]
+    if len(set(job_ids)) != len(job_ids):
+        raise ValueError(f"The job IDs within the manifest {path} are not unique")
+
+    return jobs
+
+
+def _as_bool(value):
+    value = value.lower()
+    if value in ("true", "yes", "1"):
+        return True
+    if value in ("false", "no", "0"):
+        return False
+
+    raise ValueError(f"Unable to interpret '{value}' as a boolean")
+
+
+def gamma_batch(
+    jobs: Iterable[GammaJob],
+    summary_path,
+    workers: Optional[int] = None,
+    ram_available=DEFAULT_RAM,
+    resume=True,
+    engine="numpy",
+) -> "pd.DataFrame":
+    """Calculate gamma for many pairs of DICOM dose files in parallel.
+
+    Each comparison is calculated within a separate worker process, and
+    is appended to the summary as soon as it completes. A failed
+    comparison does not abort the batch, instead it is recorded within
+    the summary with a status of ``"failed"``.
+
+    Parameters
+    ----------
+    jobs : Iterable[GammaJob]
+        The comparisons to undertake, for example from
+        :func:`read_manifest`.
+    summary_path : str or pathlib.Path
+        Where the summary is written. A ``.parquet`` path is written once
+        the batch completes, with the rows streamed to a ``.partial.csv``
+        file alongside it until then. Any other path is written to as a
+        CSV file.
+    workers : int, optional
+        The number of worker processes to utilise. Defaults to the
+        number of processors on the machine. If ``1``, the comparisons
+        are undertaken serially within the current process.
+    ram_available : int, optional
+        The number of bytes of RAM available across the whole batch. Each
+        concurrent comparison is given an equal share of this, which
+        :func:`pymedphys.gamma` then splits its calculation to fit within.
+    resume : bool, optional
+        Skip the comparisons which already have a successful row within
+        the summary. Failed comparisons are retried. If ``False``, any
+        existing summary is overwritten. Defaults to ``True``.
+    engine : str, optional
+        The gamma engine, see :func:`pymedphys.gamma`.
+
+    Returns
+    -------
+    summary : pd.DataFrame
+        The summary of every comparison, including those completed
+        within a previous run.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Gamma engine '{engine}' not recognised")
+
+    jobs = list(jobs)
+    summary_path = pathlib.Path(summary_path)
+    is_parquet = summary_path.suffix == ".parquet"
+
+    if is_parquet:
+        journal_path = summary_path.with_name(f"{summary_path.name}.partial.csv")
+    else:
+        journal_path = summary_path
+
+    completed_rows = []
+    if resume:
+        completed_rows = _read_completed_rows(summary_path, journal_path, is_parquet)
+
+    completed_job_ids = {str(row["job_id"]) for row in completed_rows}
+    jobs_to_run = [job for job in jobs if str(job.job_id) not in completed_job_ids]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ram_per_job = int(ram_available // max(min(workers, len(jobs_to_run)), 1))
+
+    logging.info(
+        "Running %i gamma comparisons, skipping %i already completed, with "
+        "%i workers of %.2f GB each",
+        len(jobs_to_run),
+        len(jobs) - len(jobs_to_run),
+        workers,
+        ram_per_job / 2**30,
+    )
+
+    _start_journal(journal_path, completed_rows)
+
+    with open(journal_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+
+        for result in map_many(
+            functools.partial(_run_job, ram_available=ram_per_job, engine=engine),
+            jobs_to_run,
+            workers=workers,
+            ordered=False,
+        ):
+            if result.error is None:
+                row = result.result
+            else:
+                row = _job_row(result.path, status="failed", error=repr(result.error))
+
+            writer.writerow(row)
+            f.flush()
+
+    summary = pd.read_csv(
+        journal_path,
+        dtype={"job_id": str, "reference": str, "evaluation": str, "error": str},
+        keep_default_na=False,
+        na_values=[""],
+    )
+
+    if is_parquet:
+        summary.to_parquet(summary_path, index=False)
+        journal_path.unlink()
+
+    return summary
+
+
+def _run_job(job: GammaJob, ram_available, engine):
+    start = time.perf_counter()
+
+    gamma = gamma_dicom(
+        pydicom.dcmread(job.reference, force=True),
+        pydicom.dcmread(job.evaluation, force=True),
+        job.dose_percent_threshold,
+        job.distance_mm_threshold,
+        lower_percent_dose_cutoff=job.lower_percent_dose_cutoff,
+        interp_fraction=job.interp_fraction,
+        max_gamma=job.max_gamma,
+        local_gamma=job.local_gamma,
+        ram_available=ram_available,
+        engine=engine,
+    )
+
+    valid_gamma = gamma[~np.isnan(gamma)]
+
+    return _job_row(
+        job,
+        status="ok",
+        pass_rate=calculate_pass_rate(gamma),
+        mean_gamma=np.mean(valid_gamma) if len(valid_gamma) else np.nan,
+        points_evaluated=len(valid_gamma),
+        duration=time.perf_counter() - start,
+    )
+
+
+def _job_row(job: GammaJob, **results):
+    row = dict.fromkeys(SUMMARY_COLUMNS, "")
+    row.update(
+        {
+            key: value
+            for key, value in dataclasses.asdict(job).items()
+            if key in SUMMARY_COLUMNS
+        }
+    )
+    row.update(results)
+
+    return row
+
+
+def _read_completed_rows(summary_path, journal_path, is_parquet):
+    """The successful rows of a previous run. The journal of an
+    interrupted Parquet summary takes precedence over the Parquet file
+    itself. As ``error`` is the final column, a row that was only
+    partially written before an interruption has no ``error`` value and is
+    ignored."""
+    if journal_path.exists():
+        with open(journal_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+    elif is_parquet and summary_path.exists():
+        rows = (
+            pd.read_parquet(summary_path)
+            .astype(object)
+            .where(lambda df: df.notna(), "")
+            .to_dict("records")
+        )
+    else:
+        return []
+
+    return [
+        {column: row.get(column, "") for column in SUMMARY_COLUMNS}
+        for row in rows
+        if row.get("status") == "ok" and row.get("error") is not None
+    ]
+
+
+def _start_journal(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def gamma_batch_cli(args):
+    summary = gamma_batch(
+        read_manifest(args.manifest),
+        args.summary,
+        workers=args.jobs,
+        ram_available=int(args.ram_available * 2**30),
+        resume=not args.no_resume,
+        engine=args.engine,
+    )
+
+    failed = summary[summary["status"] != "ok"]
+    print(
+        f"Completed {len(summary) - len(failed)} of {len(summary)} gamma "
+        f"comparisons, summary written to {args.summary}"
+    )
+
+    if len(failed) != 0:
+        raise ValueError(
+            "The following gamma comparisons failed:\n{}".format(
+                "\n".join(
+                    f"{job_id}: {error}"
+                    for job_id, error in zip(failed["job_id"], failed["error"])
+                )
+            )
+        )
@@ -13,7 +13,7 @@
 
 from pymedphys._dicom.dose import zyx_and_dose_from_dataset
 
-from ..implementation import gamma_filter_numpy, gamma_shell
+from ..implementation import gamma_filter_numpy, gamma_pass_rate, gamma_shell
 from ..utilities import calculate_pass_rate
 
 
@@ -74,7 +74,17 @@ def gamma_percent_pass(
             distance_mm_threshold,
             **kwargs,
         )
+    elif method == "pass_rate":
+        percent_pass = gamma_pass_rate(
+            axes_reference,
+            dose_reference,
+            axes_evaluation,
+            dose_evaluation,
+            dose_percent_threshold,
+            distance_mm_threshold,
+            **kwargs,
+        ).pass_rate
     else:
-        raise ValueError("method should be either `shell` or `filter`")
+        raise ValueError("method should be one of `shell`, `filter` or `pass_rate`")
 
     return percent_pass
@@ -15,4 +15,8 @@
 # ruff: noqa: F401
 
 from .filter import gamma_filter_numpy
+from .passrate import GammaPassRate, gamma_pass_rate
+from .points import gamma_point_cloud
 from .shell import gamma_shell
+from .slab import gamma_slabs
+from .sweep import GammaSweep, MinimumDoseDifferenceCurve, gamma_sweep
@@ -0,0 +1,246 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Determine only the gamma pass rate, without exact gamma values.
+
+The gamma shell search for a reference point can stop as soon as that
+point is known to pass or to fail. A point passes once any shell point
+gives a gamma below one, and fails once the search distance reaches the
+distance threshold without having passed. The reference points can also
+be sampled progressively, stopping once the confidence interval of the
+pass rate is narrower than a given tolerance.
+"""
+
+import dataclasses
+import logging
+from dataclasses import dataclass
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import scipy
+
+from .shell import DEFAULT_RAM, GammaInternalFixedOptions, gamma_loop
+
+
+@dataclass(frozen=True)
+class GammaPassRate:
+    """The gamma pass rate, as a percentage, along with its confidence
+    interval.
+
+    When every reference point has been evaluated, ``lower`` and
+    ``upper`` are equal to ``pass_rate``.
+    """
+
+    pass_rate: float
+    lower: float
+    upper: float
+    confidence: float
+    points_evaluated: int
+    points_total: int
+
+    @property
+    def uncertainty(self):
+        """Half the width of the confidence interval."""
+        return (self.upper - self.lower) / 2
+
+
+def gamma_pass_rate(
+    axes_reference,
+    dose_reference,
+    axes_evaluation,
+    dose_evaluation,
+    dose_percent_threshold,
+    distance_mm_threshold,
+    lower_percent_dose_cutoff=20,
+    interp_fraction=10,
+    local_gamma=False,
+    global_normalisation=None,
+    tolerance=None,
+    confidence=0.95,
+    initial_sample_size=1000,
+    random_state=None,
+    ram_available=DEFAULT_RAM,
+    interp_algo="pymedphys",
+    engine="numpy",
+) -> GammaPassRate:
+    """Determine the gamma pass rate, terminating the search for each
+    reference point as soon as it is known to pass or fail.
+
+    The inputs are as for :func:`pymedphys.gamma`, with only a single dose
+    and distance threshold supported.
+
+    Parameters
+    ----------
+    tolerance : float, optional
+        When given, reference points are evaluated in progressively
+        larger random samples, stopping once half the width of the
+        confidence interval of the pass rate is no more than this many
+        percent. By default every reference point is evaluated.
+    confidence : float, optional
+        The confidence level of the returned interval. Defaults to 0.95.
+    initial_sample_size : int, optional
+        The number of reference points within the first random sample.
+        Each subsequent sample doubles the number evaluated.
+    random_state : int or np.random.Generator, optional
+        Seeds the order in which reference points are sampled.
+
+    Returns
+    -------
+    GammaPassRate
+        The pass rate as a percentage, with its confidence interval and
+        the number of reference points evaluated.
+    """
+    if np.size(dose_percent_threshold) != 1 or np.size(distance_mm_threshold) != 1:
+        raise ValueError(
+            "Only a single dose and distance threshold is supported when "
+            "determining the pass rate"
+        )
+
+    # Searching no further than the distance threshold, and skipping
+    # points once they pass, means every point stops being searched as
+    # soon as it has either passed or failed.
+    options = GammaInternalFixedOptions.from_user_inputs(
+        axes_reference,
+        dose_reference,
+        axes_evaluation,
+        dose_evaluation,
+        dose_percent_threshold,
+        distance_mm_threshold,
+        lower_percent_dose_cutoff=lower_percent_dose_cutoff,
+        interp_fraction=interp_fraction,
+        max_gamma=1,
+        local_gamma=local_gamma,
+        global_normalisation=global_normalisation,
+        skip_once_passed=True,
+        ram_available=ram_available,
+        interp_algo=interp_algo,
+        engine=engine,
+    )
+
+    to_calc_index = np.where(options.reference_points_to_calc)[0]
+    points_total = len(to_calc_index)
+
+    if tolerance is None:
+        sample_sizes = [points_total]
+    else:
+        rng = np.random.default_rng(random_state)
+        to_calc_index = rng.permutation(to_calc_index)
+        sample_sizes = _progressive_sample_sizes(initial_sample_size, points_total)
+
+    passed = 0
+    evaluated = 0
+    points_evaluated = 0
+    result = _pass_rate_with_confidence(0, 0, 0, points_total, confidence)
+
+    for sample_size in sample_sizes:
+        sample = to_calc_index[points_evaluated : points_evaluated + sample_size]
+        points_evaluated += len(sample)
+
+        reference_points_to_calc = np.full_like(
+            options.reference_points_to_calc, False, dtype=bool
+        )
+        reference_points_to_calc[sample] = True
+
+        gamma = gamma_loop(
+            dataclasses.replace(
+                options, reference_points_to_calc=reference_points_to_calc
+            )
+        )[sample, 0, 0]
+
+        # Reference points outside of the evaluation grid are excluded,
+        # as they are by calculate_pass_rate.
+        valid = np.isfinite(gamma)
+        passed += np.count_nonzero(gamma[valid] < 1)
+        evaluated += np.count_nonzero(valid)
+
+        result = _pass_rate_with_confidence(
+            passed,
+            evaluated,
+            points_evaluated,
+            points_total,
+            confidence,
+        )
+
+        logging.info(
+            "Gamma pass rate %.2f%% (%.2f%% to %.2f%%) from %i of %i points",
+            result.pass_rate,
+            result.lower,
+            result.upper,
+            points_evaluated,
+            points_total,
+        )
+
+        if tolerance is not None and result.uncertainty <= tolerance:
+            break
+
+    return result
+
+
+def _progressive_sample_sizes(initial_sample_size, points_total):
+    sample_sizes = []
+    remaining = points_total
+    sample_size = max(int(initial_sample_size), 1)
+
+    while remaining > 0:
+        sample_sizes.append(min(sample_size, remaining))
+        remaining -= sample_sizes[-1]
+        sample_size = points_total - remaining
+
+    return sample_sizes
+
+
+def _pass_rate_with_confidence(
+    passed, evaluated, points_evaluated, points_total, confidence
+):
+    """The Wilson score interval of the pass rate, with a finite
+    population correction as the reference points are sampled without
+    replacement."""
+    if evaluated == 0:
+        return GammaPassRate(np.nan, 0, 100, confidence, points_evaluated, points_total)
+
+    pass_rate = 100 * passed / evaluated
+
+    if points_evaluated >= points_total:
+        return GammaPassRate(
+            pass_rate,
+            pass_rate,
+            pass_rate,
+            confidence,
+            points_evaluated,
+            points_total,
+        )
+
+    proportion = passed / evaluated
+    z = scipy.special.ndtri(0.5 + confidence / 2)
+    effective_size = evaluated * (points_total - 1) / (points_total - points_evaluated)
+
+    denominator = 1 + z**2 / effective_size
+    centre = (proportion + z**2 / (2 * effective_size)) / denominator
+    half_width = (
+        z
+        * np.sqrt(
+            proportion * (1 - proportion) / effective_size
+            + z**2 / (4 * effective_size**2)
+        )
+        / denominator
+    )
+
+    return GammaPassRate(
+        pass_rate,
+        100 * max(centre - half_width, 0),
+        100 * min(centre + half_width, 1),
+        confidence,
+        points_evaluated,
+        points_total,
+    )
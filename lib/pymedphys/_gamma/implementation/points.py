@@ -0,0 +1,244 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Gamma between arbitrary point clouds, such as detector arrays.
+
+Instead of interpolating the evaluation dose on shells about each
+reference point, the evaluation points themselves are searched. A KD-tree
+restricts that search to the neighbourhood of each reference point that
+could possibly lower its gamma.
+"""
+
+import itertools
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import scipy
+
+CHUNK_SIZE = 2**16
+
+
+def gamma_point_cloud(
+    points_reference,
+    dose_reference,
+    points_evaluation,
+    dose_evaluation,
+    dose_percent_threshold,
+    distance_mm_threshold,
+    lower_percent_dose_cutoff=20,
+    max_gamma=None,
+    local_gamma=False,
+    global_normalisation=None,
+):
+    """Compare two dose distributions, each defined at arbitrary points,
+    with the gamma index.
+
+    Neither distribution is resampled, gamma is the minimum over the
+    evaluation points themselves. This makes it suitable for comparing
+    measured detector arrays, or EPID point sets, against a TPS dose
+    grid, or against one another.
+
+    Parameters
+    ----------
+    points_reference : np.ndarray or tuple
+        The reference coordinates. Either an array of shape (N, D), one
+        row per point, or a tuple of D axes which define a grid in the
+        same way as :func:`pymedphys.gamma`.
+    dose_reference : np.ndarray
+        The reference dose at each of the reference points. Gamma is
+        calculated for each of these points.
+    points_evaluation : np.ndarray or tuple
+        The evaluation coordinates, in the same form as
+        ``points_reference``.
+    dose_evaluation : np.ndarray
+        The evaluation dose at each of the evaluation points. Points with
+        a dose of ``NaN`` are ignored.
+    dose_percent_threshold : float
+        The percent dose threshold
+    distance_mm_threshold : float
+        The gamma distance threshold. Units must match those of the
+        coordinates given.
+    lower_percent_dose_cutoff : float, optional
+        The percent lower dose cutoff below which gamma will not be
+        calculated. This is only applied to the reference dose.
+    max_gamma : float, optional
+        The maximum gamma searched for. Evaluation points further than
+        ``distance_mm_threshold * max_gamma`` from a reference point are
+        never considered for it, and gamma values above this are set to
+        ``max_gamma``. Defaults to :obj:`np.inf`.
+    local_gamma : bool, optional
+        Designates local gamma should be used instead of global. Defaults
+        to False.
+    global_normalisation : float, optional
+        The dose normalisation value that the percent inputs calculate
+        from. Defaults to the maximum value of :obj:`dose_reference`.
+
+    Returns
+    -------
+    gamma : np.ndarray
+        The gamma value for each reference point, the same shape as
+        ``dose_reference``. Points below the lower dose cutoff are
+        ``NaN``.
+    """
+    reference_points, reference_dose = _as_point_cloud(points_reference, dose_reference)
+    evaluation_points, evaluation_dose = _as_point_cloud(
+        points_evaluation, dose_evaluation
+    )
+
+    if reference_points.shape[1] != evaluation_points.shape[1]:
+        raise ValueError("The dimensions of the input data do not match")
+
+    evaluation_is_valid = ~np.isnan(evaluation_dose)
+    evaluation_points = evaluation_points[evaluation_is_valid]
+    evaluation_dose = evaluation_dose[evaluation_is_valid]
+
+    if len(evaluation_dose) == 0:
+        raise ValueError("No evaluation points with a valid dose were provided")
+
+    if max_gamma is None:
+        max_gamma = np.inf
+
+    if global_normalisation is None:
+        global_normalisation = np.nanmax(reference_dose)
+
+    lower_dose_cutoff = lower_percent_dose_cutoff / 100 * global_normalisation
+
+    with np.errstate(invalid="ignore"):
+        to_be_checked = np.where(reference_dose >= lower_dose_cutoff)[0]
+
+    gamma = np.full(len(reference_dose), np.nan)
+    evaluation_tree = scipy.spatial.cKDTree(evaluation_points)
+
+    for start in range(0, len(to_be_checked), CHUNK_SIZE):
+        index = to_be_checked[start : start + CHUNK_SIZE]
+
+        if local_gamma:
+            dose_criterion = dose_percent_threshold / 100 * reference_dose[index]
+        else:
+            dose_criterion = dose_percent_threshold / 100 * global_normalisation
+
+        gamma[index] = _gamma_for_chunk(
+            evaluation_tree,
+            evaluation_dose,
+            reference_points[index],
+            reference_dose[index],
+            dose_criterion,
+            distance_mm_threshold,
+            max_gamma,
+        )
+
+    return np.reshape(gamma, np.shape(dose_reference))
+
+
+def _gamma_for_chunk(
+    evaluation_tree,
+    evaluation_dose,
+    reference_points,
+    reference_dose,
+    dose_criterion,
+    distance_mm_threshold,
+    max_gamma,
+):
+    def gamma_to(evaluation_index, distance, reference_index):
+        dose_criterion_for_pairs = np.broadcast_to(
+            dose_criterion, reference_dose.shape
+        )[reference_index]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(
+                (
+                    (
+                        evaluation_dose[evaluation_index]
+                        - reference_dose[reference_index]
+                    )
+                    / dose_criterion_for_pairs
+                )
+                ** 2
+                + (distance / distance_mm_threshold) ** 2
+            )
+
+    # As gamma is at least the distance term, the gamma to the nearest
+    # evaluation point bounds the neighbourhood that needs searching.
+    distance, nearest = evaluation_tree.query(reference_points, workers=-1)
+    gamma = gamma_to(nearest, distance, np.arange(len(reference_points)))
+
+    search_radius = distance_mm_threshold * np.minimum(gamma, max_gamma)
+    search_radius[~np.isfinite(search_radius)] = 0
+
+    neighbours = evaluation_tree.query_ball_point(
+        reference_points, search_radius, workers=-1
+    )
+
+    number_of_neighbours = np.fromiter(
+        map(len, neighbours), dtype=int, count=len(neighbours)
+    )
+    reference_index = np.repeat(np.arange(len(reference_points)), number_of_neighbours)
+    evaluation_index = np.fromiter(
+        itertools.chain.from_iterable(neighbours),
+        dtype=int,
+        count=np.sum(number_of_neighbours),
+    )
+
+    pair_distance = np.sqrt(
+        np.sum(
+            (evaluation_tree.data[evaluation_index] - reference_points[reference_index])
+            ** 2,
+            axis=-1,
+        )
+    )
+
+    np.fmin.at(
+        gamma,
+        reference_index,
+        gamma_to(evaluation_index, pair_distance, reference_index),
+    )
+
+    gamma[np.isinf(gamma)] = np.nan
+    with np.errstate(invalid="ignore"):
+        gamma[gamma > max_gamma] = max_gamma
+
+    return gamma
+
+
+def _as_point_cloud(points, dose):
+    """Convert either a grid, defined by a tuple of axes, or an array of
+    points into an (N, D) array of points along with N doses."""
+    dose = np.asarray(dose, dtype=float)
+
+    if isinstance(points, tuple):
+        if tuple(len(axis) for axis in points) != np.shape(dose):
+            raise ValueError(
+                "Length of items in the axes ({}) does not match the "
+                "shape of the dose ({})".format(
+                    tuple(len(axis) for axis in points), np.shape(dose)
+                )
+            )
+
+        mesh = np.meshgrid(*points, indexing="ij")
+        points = np.column_stack([np.ravel(item) for item in mesh])
+    else:
+        points = np.asarray(points, dtype=float)
+        if points.ndim == 1:
+            points = points[:, None]
+
+    dose = np.ravel(dose)
+
+    if points.ndim != 2 or len(points) != len(dose):
+        raise ValueError(
+            "Expected one row of coordinates for each dose point, instead "
+            f"received coordinates of shape {np.shape(points)} for "
+            f"{len(dose)} dose points"
+        )
+
+    return np.asarray(points, dtype=float), dose
@@ -17,19 +17,28 @@
 
 import logging
 from dataclasses import dataclass
+from functools import cache, cached_property
 from typing import Any, Optional
 from warnings import warn
 
+from pymedphys._imports import numba as nb
 from pymedphys._imports import numpy as np
 from pymedphys._imports import scipy
 
 from pymedphys import interpolate as pmp_interp
+from pymedphys._interp.interp import (
+    _is_evenly_spaced,
+    interp_point_linear,
+    register_interp_point_linear,
+)
 import pymedphys._utilities.createshells
 
 from ..utilities import run_input_checks
 
 DEFAULT_RAM = int(2**30 * 1.5)  # 1.5 GB
 
+ENGINES = ("numpy", "numba")
+
 
 def gamma_shell(
     axes_reference,
@@ -48,6 +57,7 @@ def gamma_shell(
     ram_available=DEFAULT_RAM,
     quiet=None,
     interp_algo="pymedphys",
+    engine="numpy",
 ):
     """Compare two dose grids with the gamma index.
 
@@ -106,6 +116,19 @@ def gamma_shell(
         level. Basic information is given for the `info` level.
         Additional information using for benchmarking or troubleshooting
         performance is provided for the `debug` level.
+    interp_algo : str, optional
+        The interpolation used by the ``"numpy"`` engine, either
+        ``"pymedphys"`` or ``"scipy"``. Defaults to ``"pymedphys"``.
+    engine : str, optional
+        Either ``"numpy"`` or ``"numba"``. The ``"numpy"`` engine builds
+        arrays of every shell point for every remaining reference point,
+        splitting the work according to ``ram_available``. The ``"numba"``
+        engine instead interpolates each shell point within a compiled
+        kernel that runs in parallel across the reference points, without
+        any large intermediate arrays. It searches the same distances and
+        shell points, and so gives results comparable to the ``"numpy"``
+        engine with ``interp_algo="pymedphys"``. It requires evenly spaced
+        evaluation axes. Defaults to ``"numpy"``.
 
     Returns
     -------
@@ -141,6 +164,7 @@ def gamma_shell(
         ram_available,
         quiet,
         interp_algo,
+        engine,
     )
 
     if options.local_gamma:
@@ -219,6 +243,7 @@ class GammaInternalFixedOptions:
     ram_available: Optional[int] = DEFAULT_RAM
     quiet: Any = None
     interp_algo: str = "pymedphys"
+    engine: str = "numpy"
 
     def __post_init__(self):
         self.set_defaults()
@@ -236,6 +261,16 @@ class GammaInternalFixedOptions:
     def global_dose_threshold(self):
         return self.dose_percent_threshold / 100 * self.global_normalisation
 
+    @cached_property
+    def evaluation_interpolator(self):
+        return pmp_interp.Interpolator(
+            self.axes_evaluation,
+            self.dose_evaluation,
+            bounds_error=False,
+            extrap_fill_value=np.inf,
+            skip_checks=True,
+        )
+
     @classmethod
     def from_user_inputs(
         cls,
@@ -255,14 +290,31 @@ class GammaInternalFixedOptions:
         ram_available=None,
         quiet=None,
         interp_algo="pymedphys",
+        engine="numpy",
     ):
         if max_gamma is None:
             max_gamma = np.inf
 
+        if engine not in ENGINES:
+            raise ValueError(f"Gamma engine '{engine}' not recognised")
+
+        if engine == "numba" and interp_algo.lower() != "pymedphys":
+            raise ValueError(
+                "The numba gamma engine only supports the 'pymedphys' "
+                "interpolation algorithm"
+            )
+
         axes_reference, axes_evaluation = run_input_checks(
             axes_reference, dose_reference, axes_evaluation, dose_evaluation
         )
 
+        # The compiled kernel interpolates with a single spacing per axis
+        if engine == "numba" and not _is_evenly_spaced(axes_evaluation):
+            raise ValueError(
+                "The numba gamma engine requires evenly spaced evaluation "
+                "axes, use engine='numpy' instead"
+            )
+
         dose_percent_threshold = expand_dims_to_1d(dose_percent_threshold)
         distance_mm_threshold = expand_dims_to_1d(distance_mm_threshold)
 
@@ -317,6 +369,7 @@ class GammaInternalFixedOptions:
             ram_available,
             quiet,
             interp_algo,
+            engine,
         )
 
 
@@ -339,6 +392,8 @@ def gamma_loop(options: GammaInternalFixedOptions):
 
     distance = 0.0
 
+    calculate = get_min_dose_difference_function(options.engine)
+
     force_search_distances = np.sort(options.distance_mm_threshold)
     while distance <= options.maximum_test_distance:
         logging.debug(
@@ -347,7 +402,7 @@ def gamma_loop(options: GammaInternalFixedOptions):
             np.sum(to_be_checked),
         )
 
-        min_relative_dose_difference = calculate_min_dose_difference(
+        min_relative_dose_difference = calculate(
             options, distance, to_be_checked, distance_step_size
         )
 
@@ -394,6 +449,13 @@ def gamma_loop(options: GammaInternalFixedOptions):
     return current_gamma
 
 
+def get_min_dose_difference_function(engine):
+    if engine == "numba":
+        return calculate_min_dose_difference_numba
+
+    return calculate_min_dose_difference
+
+
 def multi_thresholds_gamma_calc(
     options: GammaInternalFixedOptions,
     current_gamma,
@@ -510,6 +572,109 @@ def calculate_min_dose_difference(options, distance, to_be_checked, distance_ste
     return min_relative_dose_difference
 
 
+def calculate_min_dose_difference_numba(
+    options, distance, to_be_checked, distance_step_size
+):
+    """Determine the minimum dose difference within a compiled kernel.
+
+    Identical to :func:`calculate_min_dose_difference`, except the
+    evaluation dose at each shell point is interpolated and reduced as it
+    is needed, instead of being collected into an array for all of the
+    reference points at once.
+    """
+    num_dimensions = np.shape(options.flat_mesh_axes_reference)[0]
+
+    coordinates_at_distance_shell = np.array(
+        pymedphys._utilities.createshells.calculate_coordinates_shell(  # pylint: disable = protected-access
+            distance, num_dimensions, distance_step_size
+        ),
+        dtype=np.float64,
+    )
+
+    logging.debug(
+        "Points tested per reference point: %i",
+        np.shape(coordinates_at_distance_shell)[1],
+    )
+
+    min_dose_difference_kernel = _get_min_dose_difference_kernel()
+
+    return min_dose_difference_kernel(
+        tuple(
+            np.ascontiguousarray(axis, dtype=np.float64)
+            for axis in options.axes_evaluation
+        ),
+        np.ascontiguousarray(options.dose_evaluation, dtype=np.float64),
+        np.ascontiguousarray(options.flat_mesh_axes_reference, dtype=np.float64),
+        np.ascontiguousarray(options.flat_dose_reference, dtype=np.float64),
+        np.where(np.ravel(to_be_checked))[0],
+        coordinates_at_distance_shell,
+        float(options.global_normalisation),
+        bool(options.local_gamma),
+    )
+
+
+@cache
+def _get_min_dose_difference_kernel():
+    register_interp_point_linear()
+
+    # The numpy error model allows division by a zero local dose to give
+    # inf or nan, as it does within calculate_min_dose_difference.
+    @nb.njit(parallel=True, cache=True, error_model="numpy")
+    def _min_dose_difference(
+        axes_evaluation,
+        dose_evaluation,
+        flat_mesh_axes_reference,
+        flat_dose_reference,
+        reference_index,
+        coordinates_at_distance_shell,
+        global_normalisation,
+        local_gamma,
+    ):
+        num_dimensions, num_points_in_shell = coordinates_at_distance_shell.shape
+        min_relative_dose_difference = np.empty(reference_index.size)
+
+        # pylint: disable=not-an-iterable
+        for i in nb.prange(reference_index.size):
+            index = reference_index[i]
+            reference_dose = flat_dose_reference[index]
+
+            if local_gamma:
+                normalisation = reference_dose
+            else:
+                normalisation = global_normalisation
+
+            point = np.empty(num_dimensions)
+            minimum = np.inf
+
+            for j in range(num_points_in_shell):
+                for k in range(num_dimensions):
+                    point[k] = (
+                        flat_mesh_axes_reference[k, index]
+                        + coordinates_at_distance_shell[k, j]
+                    )
+
+                evaluation_dose = interp_point_linear(
+                    axes_evaluation, dose_evaluation, point, np.inf
+                )
+                relative_dose_difference = np.abs(
+                    (evaluation_dose - reference_dose) / normalisation
+                )
+
+                # Matching np.min, a single nan propagates
+                if np.isnan(relative_dose_difference):
+                    minimum = np.nan
+                    break
+
+                if relative_dose_difference < minimum:
+                    minimum = relative_dose_difference
+
+            min_relative_dose_difference[i] = minimum
+
+        return min_relative_dose_difference
+
+    return _min_dose_difference
+
+
 def interpolate_evaluation_dose_at_distance(
     options,
     axes_reference_to_be_checked,
@@ -534,18 +699,7 @@ def interpolate_evaluation_dose_at_distance(
 
 
 def _run_custom_interp(options, all_points):
-    points = np.column_stack(
-        [all_points[..., i].ravel() for i in range(all_points.shape[-1])]
-    )
-
-    return pmp_interp.interp(
-        axes_known=options.axes_evaluation,
-        values=options.dose_evaluation,
-        points_interp=points,
-        bounds_error=False,
-        extrap_fill_value=np.inf,
-        skip_checks=True,
-    ).reshape(all_points.shape[:-1])
+    return options.evaluation_interpolator(all_points)
 
 
 def _run_interp_with_scipy(options, all_points):
@@ -0,0 +1,230 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Calculate gamma for dose grids larger than memory, one slab at a time.
+
+The reference grid is split along its first axis into slabs. As no shell
+point is further than the maximum test distance from its reference point,
+only the evaluation planes within that distance of a slab, along with the
+planes which bound them for interpolation, are needed to calculate the
+gamma of that slab. Each slab is then read, calculated and written out in
+turn, so that neither the doses nor the reference coordinates are ever
+held in memory in full.
+"""
+
+import logging
+import os
+
+from pymedphys._imports import numpy as np
+
+from .shell import DEFAULT_RAM, GammaInternalFixedOptions, gamma_loop
+
+DEFAULT_SLAB_SIZE = 16
+
+
+def gamma_slabs(
+    axes_reference,
+    dose_reference,
+    axes_evaluation,
+    dose_evaluation,
+    dose_percent_threshold,
+    distance_mm_threshold,
+    max_gamma,
+    lower_percent_dose_cutoff=20,
+    interp_fraction=10,
+    local_gamma=False,
+    global_normalisation=None,
+    slab_size=DEFAULT_SLAB_SIZE,
+    output=None,
+    ram_available=DEFAULT_RAM,
+    interp_algo="pymedphys",
+    engine="numpy",
+):
+    """Calculate gamma one slab of the reference grid at a time.
+
+    The inputs are as for :func:`pymedphys.gamma`, with only a single dose
+    and distance threshold supported. The results are identical to those
+    of :func:`pymedphys.gamma`.
+
+    Parameters
+    ----------
+    dose_reference : np.ndarray, np.memmap, DoseFrames or str
+        The reference dose grid. Anything which can be sliced along its
+        first axis is accepted, such as a memory-mapped array or the
+        frames of an RT Dose file from
+        :func:`pymedphys.dicom.zyx_and_dose_frames_from_file`. A path to a
+        ``.npy`` file is opened as a memory-mapped array.
+    dose_evaluation : np.ndarray, np.memmap, DoseFrames or str
+        The evaluation dose grid, in the same forms as ``dose_reference``.
+    max_gamma : float
+        The maximum gamma searched for. This is required, as it determines
+        how many evaluation planes either side of a slab are read.
+    slab_size : int, optional
+        The number of reference planes, along the first axis, within each
+        slab.
+    output : np.ndarray or str, optional
+        Where the gamma of each slab is written. When given a path, a
+        ``.npy`` file is created there and memory-mapped. By default an
+        array is created in memory.
+
+    Returns
+    -------
+    gamma : np.ndarray or np.memmap
+        The gamma values, the same shape as ``dose_reference``.
+    """
+    if np.size(dose_percent_threshold) != 1 or np.size(distance_mm_threshold) != 1:
+        raise ValueError(
+            "Only a single dose and distance threshold is supported when "
+            "calculating gamma in slabs"
+        )
+
+    if max_gamma is None or not np.isfinite(max_gamma):
+        raise ValueError(
+            "A finite max_gamma is required to calculate gamma in slabs, as "
+            "it bounds the evaluation grid needed for each slab"
+        )
+
+    dose_reference = _open_dose(dose_reference)
+    dose_evaluation = _open_dose(dose_evaluation)
+
+    axes_reference = _as_axes_tuple(axes_reference)
+    axes_evaluation = _as_axes_tuple(axes_evaluation)
+
+    shape = tuple(np.shape(dose_reference))
+    number_of_planes = shape[0]
+    slab_size = max(int(slab_size), 1)
+    slab_starts = range(0, number_of_planes, slab_size)
+
+    if global_normalisation is None:
+        global_normalisation = np.max(
+            [np.max(dose_reference[start : start + slab_size]) for start in slab_starts]
+        )
+
+    lower_dose_cutoff = lower_percent_dose_cutoff / 100 * global_normalisation
+    halo = float(np.max(distance_mm_threshold)) * max_gamma
+
+    gamma = _create_output(output, shape)
+
+    for start in slab_starts:
+        stop = min(start + slab_size, number_of_planes)
+        logging.info(
+            "Calculating gamma for reference planes %i to %i of %i",
+            start,
+            stop - 1,
+            number_of_planes,
+        )
+
+        slab_dose_reference = np.asarray(dose_reference[start:stop], dtype=float)
+        slab_axes_reference = (axes_reference[0][start:stop],) + axes_reference[1:]
+
+        with np.errstate(invalid="ignore"):
+            if not np.any(slab_dose_reference >= lower_dose_cutoff):
+                gamma[start:stop] = np.nan
+                continue
+
+        evaluation_start, evaluation_stop = _evaluation_bounds(
+            axes_evaluation[0], slab_axes_reference[0], halo
+        )
+        slab_axes_evaluation = (
+            axes_evaluation[0][evaluation_start:evaluation_stop],
+        ) + axes_evaluation[1:]
+        slab_dose_evaluation = np.asarray(
+            dose_evaluation[evaluation_start:evaluation_stop], dtype=float
+        )
+
+        options = GammaInternalFixedOptions.from_user_inputs(
+            slab_axes_reference,
+            slab_dose_reference,
+            slab_axes_evaluation,
+            slab_dose_evaluation,
+            dose_percent_threshold,
+            distance_mm_threshold,
+            lower_percent_dose_cutoff=lower_percent_dose_cutoff,
+            interp_fraction=interp_fraction,
+            max_gamma=max_gamma,
+            local_gamma=local_gamma,
+            global_normalisation=global_normalisation,
+            ram_available=ram_available,
+            interp_algo=interp_algo,
+            engine=engine,
+        )
+
+        slab_gamma = gamma_loop(options)[:, 0, 0]
+        slab_gamma[np.isinf(slab_gamma)] = np.nan
+        with np.errstate(invalid="ignore"):
+            slab_gamma[slab_gamma > max_gamma] = max_gamma
+
+        gamma[start:stop] = np.reshape(slab_gamma, slab_dose_reference.shape)
+
+        if isinstance(gamma, np.memmap):
+            gamma.flush()
+
+    return gamma
+
+
+def _open_dose(dose):
+    if isinstance(dose, (str, os.PathLike)):
+        return np.load(dose, mmap_mode="r")
+
+    return dose
+
+
+def _as_axes_tuple(axes):
+    if isinstance(axes, np.ndarray) and axes.ndim == 1:
+        axes = (axes,)
+
+    return tuple(np.asarray(axis, dtype=float) for axis in axes)
+
+
+def _create_output(output, shape):
+    if output is None:
+        return np.full(shape, np.nan)
+
+    if isinstance(output, (str, os.PathLike)):
+        return np.lib.format.open_memmap(output, mode="w+", dtype=float, shape=shape)
+
+    if tuple(np.shape(output)) != shape:
+        raise ValueError(
+            f"The output shape {np.shape(output)} does not match the "
+            f"reference dose shape {shape}"
+        )
+
+    return output
+
+
+def _evaluation_bounds(axis_evaluation, slab_axis_reference, halo):
+    """The index range of the evaluation planes within ``halo`` of the
+    slab, extended by the planes that bound them for interpolation."""
+    lower = np.min(slab_axis_reference) - halo
+    upper = np.max(slab_axis_reference) + halo
+
+    number_of_planes = len(axis_evaluation)
+    is_ascending = axis_evaluation[-1] >= axis_evaluation[0]
+    sorted_axis = axis_evaluation if is_ascending else axis_evaluation[::-1]
+
+    start = max(int(np.searchsorted(sorted_axis, lower, side="right")) - 1, 0)
+    stop = min(
+        int(np.searchsorted(sorted_axis, upper, side="left")) + 1, number_of_planes
+    )
+
+    # Interpolation requires at least two planes along each axis.
+    if stop - start < 2:
+        start = max(min(start, number_of_planes - 2), 0)
+        stop = min(start + 2, number_of_planes)
+
+    if not is_ascending:
+        start, stop = number_of_planes - stop, number_of_planes - start
+
+    return start, stop
@@ -0,0 +1,440 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Calculate gamma for a whole table of criteria within a single search.
+
+The gamma shell search determines, for each reference point, the minimum
+dose difference found at each search distance. That curve of minimum dose
+difference against distance does not depend on the criteria, so here it
+is recorded once, in absolute dose, and gamma for every combination of
+dose threshold, distance threshold and normalisation is evaluated from it.
+"""
+
+import dataclasses
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+
+from ..utilities import calculate_pass_rate
+from .shell import (
+    DEFAULT_RAM,
+    GammaInternalFixedOptions,
+    get_min_dose_difference_function,
+)
+
+
+@dataclass(frozen=True)
+class GammaSweep:
+    """Gamma for every combination of the swept criteria.
+
+    ``gamma`` is indexed by ``dims``, namely the normalisation, the dose
+    threshold and the distance threshold, followed by the dimensions of
+    the reference dose. The values along each of the criteria dimensions
+    are given within ``coords``. ``curve`` is the
+    :class:`MinimumDoseDifferenceCurve` that gamma was evaluated from.
+    """
+
+    gamma: Any
+    coords: dict
+    curve: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def dims(self):
+        return tuple(self.coords.keys()) + tuple(
+            f"reference_{i}" for i in range(self.gamma.ndim - len(self.coords))
+        )
+
+    def sel(self, local_gamma, dose_percent_threshold, distance_mm_threshold):
+        """Return the gamma array for a single set of criteria."""
+        index = tuple(
+            _coord_index(self.coords[name], value)
+            for name, value in (
+                ("local_gamma", local_gamma),
+                ("dose_percent_threshold", dose_percent_threshold),
+                ("distance_mm_threshold", distance_mm_threshold),
+            )
+        )
+
+        return self.gamma[index]
+
+    def evaluate(
+        self, dose_percent_threshold, distance_mm_threshold, local_gamma=None
+    ) -> "GammaSweep":
+        """Evaluate gamma for further criteria from the recorded curve,
+        without searching again. See
+        :meth:`MinimumDoseDifferenceCurve.evaluate`."""
+        if local_gamma is None:
+            local_gamma = self.coords["local_gamma"]
+
+        return self.curve.evaluate(
+            dose_percent_threshold, distance_mm_threshold, local_gamma
+        )
+
+    def pass_rates(self):
+        """The percent of points passing for each set of criteria, indexed
+        by the criteria dimensions."""
+        criteria_shape = self.gamma.shape[: len(self.coords)]
+        pass_rates = np.full(criteria_shape, np.nan)
+
+        for index in np.ndindex(*criteria_shape):
+            pass_rates[index] = calculate_pass_rate(self.gamma[index])
+
+        return pass_rates
+
+    def pass_rate_table(self):
+        """The pass rates as a DataFrame, with one row per normalisation
+        and dose threshold, and one column per distance threshold."""
+        pass_rates = self.pass_rates()
+
+        index = pd.MultiIndex.from_product(
+            [
+                [
+                    "local" if local else "global"
+                    for local in self.coords["local_gamma"]
+                ],
+                self.coords["dose_percent_threshold"],
+            ],
+            names=["normalisation", "dose_percent_threshold"],
+        )
+        columns = pd.Index(
+            self.coords["distance_mm_threshold"], name="distance_mm_threshold"
+        )
+
+        return pd.DataFrame(
+            np.reshape(pass_rates, (len(index), len(columns))),
+            index=index,
+            columns=columns,
+        )
+
+
+@dataclass(frozen=True)
+class MinimumDoseDifferenceCurve:
+    """The running minimum of the absolute dose difference found for each
+    reference point at each searched radius.
+
+    ``min_dose_difference`` has one row per calculated reference point,
+    the flat index of which is given by ``to_calc_index``, and one column
+    per entry of ``radii``. A reference point stops being searched once
+    its gamma is resolved for the smallest dose criterion and the largest
+    distance threshold swept, after which gamma is resolved for every
+    criteria within the swept ranges, and the remainder of its row holds
+    the minimum found so far.
+    """
+
+    radii: Any
+    min_dose_difference: Any = field(repr=False)
+    reference_dose: Any = field(repr=False)
+    to_calc_index: Any = field(repr=False)
+    shape: tuple
+    global_normalisation: float
+    max_gamma: float
+    local_gamma: Any
+    dose_percent_threshold_range: tuple
+    distance_mm_threshold_range: tuple
+
+    def evaluate(
+        self, dose_percent_threshold, distance_mm_threshold, local_gamma
+    ) -> GammaSweep:
+        """Evaluate gamma for every combination of the given criteria.
+
+        Dose thresholds no smaller than, and distance thresholds within,
+        those swept, with the normalisations swept, are supported.
+        """
+        local_gamma = np.atleast_1d(np.array(local_gamma, dtype=bool))
+        dose_percent_threshold = np.atleast_1d(
+            np.array(dose_percent_threshold, dtype=float)
+        )
+        distance_mm_threshold = np.atleast_1d(
+            np.array(distance_mm_threshold, dtype=float)
+        )
+
+        if not np.all(np.isin(local_gamma, self.local_gamma)):
+            raise ValueError(
+                f"Only the normalisations swept, local_gamma={list(self.local_gamma)}, "
+                "can be evaluated."
+            )
+
+        minimum_dose_percent_threshold, _ = self.dose_percent_threshold_range
+        if np.any(dose_percent_threshold < minimum_dose_percent_threshold):
+            raise ValueError(
+                "Dose thresholds smaller than the smallest swept, "
+                f"{minimum_dose_percent_threshold}, can not be evaluated."
+            )
+
+        minimum_distance, maximum_distance = self.distance_mm_threshold_range
+        if np.any(distance_mm_threshold < minimum_distance) or np.any(
+            distance_mm_threshold > maximum_distance
+        ):
+            raise ValueError(
+                "Only distance thresholds within the range swept, "
+                f"{minimum_distance} to {maximum_distance} mm, can be evaluated."
+            )
+
+        dose_criterion = (
+            np.where(
+                local_gamma[None, :],
+                self.reference_dose[:, None],
+                self.global_normalisation,
+            )[:, :, None]
+            * dose_percent_threshold[None, None, :]
+            / 100
+        )
+
+        gamma = _gamma_from_curve(
+            self.radii, self.min_dose_difference, dose_criterion, distance_mm_threshold
+        )
+
+        gamma[np.isinf(gamma)] = np.nan
+        with np.errstate(invalid="ignore"):
+            gamma[gamma > self.max_gamma] = self.max_gamma
+
+        criteria_shape = gamma.shape[1:]
+        full_gamma = np.full(criteria_shape + (int(np.prod(self.shape)),), np.nan)
+        full_gamma[..., self.to_calc_index] = np.moveaxis(gamma, 0, -1)
+
+        return GammaSweep(
+            np.reshape(full_gamma, criteria_shape + tuple(self.shape)),
+            {
+                "local_gamma": local_gamma,
+                "dose_percent_threshold": dose_percent_threshold,
+                "distance_mm_threshold": distance_mm_threshold,
+            },
+            self,
+        )
+
+
+def _coord_index(coord, value):
+    matches = np.where(coord == value)[0]
+    if len(matches) == 0:
+        raise KeyError(f"{value} is not within {list(coord)}")
+
+    return matches[0]
+
+
+def gamma_sweep(
+    axes_reference,
+    dose_reference,
+    axes_evaluation,
+    dose_evaluation,
+    dose_percent_threshold,
+    distance_mm_threshold,
+    local_gamma=(False, True),
+    lower_percent_dose_cutoff=20,
+    interp_fraction=10,
+    max_gamma=None,
+    global_normalisation=None,
+    ram_available=DEFAULT_RAM,
+    interp_algo="pymedphys",
+    engine="numpy",
+) -> GammaSweep:
+    """Calculate gamma for every combination of the given dose thresholds,
+    distance thresholds and normalisations within a single search.
+
+    The inputs are as for :func:`pymedphys.gamma`, except that
+    ``dose_percent_threshold``, ``distance_mm_threshold`` and
+    ``local_gamma`` may each be a sequence.
+
+    The search records, for each reference point, the minimum absolute
+    dose difference at each searched radius, out to the largest distance
+    threshold multiplied by ``max_gamma``, and every set of criteria is
+    evaluated from that curve. The radii do not depend on which criteria
+    are resolved. Near the reference point they are spaced by the
+    smallest distance threshold divided by ``interp_fraction``, and that
+    spacing widens as the smaller distance thresholds can no longer give
+    a gamma below ``max_gamma``. With a single distance threshold the
+    radii are those searched by :func:`pymedphys.gamma`.
+
+    Returns
+    -------
+    GammaSweep
+        The gamma for each set of criteria, along with their pass rates
+        via :meth:`GammaSweep.pass_rates` and
+        :meth:`GammaSweep.pass_rate_table`. Gamma for further criteria
+        within the swept ranges is available from
+        :meth:`GammaSweep.evaluate`.
+    """
+    local_gamma = np.atleast_1d(np.array(local_gamma, dtype=bool))
+
+    options = GammaInternalFixedOptions.from_user_inputs(
+        axes_reference,
+        dose_reference,
+        axes_evaluation,
+        dose_evaluation,
+        dose_percent_threshold,
+        distance_mm_threshold,
+        lower_percent_dose_cutoff=lower_percent_dose_cutoff,
+        interp_fraction=interp_fraction,
+        max_gamma=max_gamma,
+        global_normalisation=global_normalisation,
+        ram_available=ram_available,
+        interp_algo=interp_algo,
+        engine=engine,
+    )
+
+    # With a normalisation of one the dose differences found by the shell
+    # search are absolute, from which both normalisations are derived.
+    absolute_options = dataclasses.replace(
+        options, global_normalisation=1.0, local_gamma=False
+    )
+
+    to_calc_index = np.where(options.reference_points_to_calc)[0]
+    reference_dose = options.flat_dose_reference[to_calc_index]
+
+    # The dose criterion which resolves last for each reference point
+    smallest_dose_criterion = (
+        np.min(
+            np.where(
+                local_gamma[None, :],
+                reference_dose[:, None],
+                options.global_normalisation,
+            ),
+            axis=1,
+        )
+        * np.min(options.dose_percent_threshold)
+        / 100
+    )
+
+    radii, min_dose_difference = _record_curve(
+        absolute_options, to_calc_index, smallest_dose_criterion
+    )
+
+    curve = MinimumDoseDifferenceCurve(
+        radii=radii,
+        min_dose_difference=min_dose_difference,
+        reference_dose=reference_dose,
+        to_calc_index=to_calc_index,
+        shape=np.shape(dose_reference),
+        global_normalisation=options.global_normalisation,
+        max_gamma=options.max_gamma,
+        local_gamma=local_gamma,
+        dose_percent_threshold_range=(
+            np.min(options.dose_percent_threshold),
+            np.max(options.dose_percent_threshold),
+        ),
+        distance_mm_threshold_range=(
+            np.min(options.distance_mm_threshold),
+            np.max(options.distance_mm_threshold),
+        ),
+    )
+
+    return curve.evaluate(
+        options.dose_percent_threshold, options.distance_mm_threshold, local_gamma
+    )
+
+
+def _record_curve(options, to_calc_index, smallest_dose_criterion):
+    """Step the shell search outwards, recording the running minimum of
+    the absolute dose difference for each reference point at each radius.
+
+    Returns the radii searched and the curve, with shape (points, radii).
+    """
+    calculate = get_min_dose_difference_function(options.engine)
+    distance_thresholds = np.sort(options.distance_mm_threshold)
+    largest_distance_threshold = distance_thresholds[-1]
+
+    running_minimum = np.full(len(to_calc_index), np.inf)
+    resolving_gamma = np.full(len(to_calc_index), np.inf)
+    still_searching = np.full(len(to_calc_index), True)
+
+    radii = []
+    curve = []
+
+    distance = 0.0
+    distance_step_size = distance_thresholds[0] / options.interp_fraction
+    force_search_distances = distance_thresholds
+
+    while distance <= options.maximum_test_distance:
+        checking = np.where(still_searching)[0]
+
+        logging.debug(
+            "Current distance: %.2f mm | Number of reference points remaining: %i",
+            distance,
+            len(checking),
+        )
+
+        to_be_checked = np.full(len(options.flat_dose_reference), False)
+        to_be_checked[to_calc_index[checking]] = True
+
+        min_dose_difference = calculate(
+            options, distance, to_be_checked, distance_step_size
+        )
+
+        running_minimum[checking] = np.fmin(
+            running_minimum[checking], min_dose_difference
+        )
+        radii.append(distance)
+        curve.append(running_minimum.copy())
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gamma_at_distance = np.sqrt(
+                (min_dose_difference / smallest_dose_criterion[checking]) ** 2
+                + (distance / largest_distance_threshold) ** 2
+            )
+
+        resolving_gamma[checking] = np.fmin(
+            resolving_gamma[checking], gamma_at_distance
+        )
+        still_searching[checking] = resolving_gamma[checking] > (
+            distance / largest_distance_threshold
+        )
+
+        if not np.any(still_searching):
+            break
+
+        # A distance threshold can only give a gamma below max_gamma
+        # within its own multiple of max_gamma, beyond which the radii
+        # no longer need to be fine enough to resolve it.
+        relevant_distances = distance_thresholds[
+            distance_thresholds * options.max_gamma >= distance
+        ]
+        if len(relevant_distances) == 0:
+            relevant_distances = distance_thresholds[-1:]
+
+        distance_step_size = np.min(relevant_distances) / options.interp_fraction
+        distance_step_size = np.max(
+            [distance / options.interp_fraction / options.max_gamma, distance_step_size]
+        )
+
+        distance += distance_step_size
+        if len(force_search_distances) != 0:
+            if distance >= force_search_distances[0]:
+                distance = force_search_distances[0]
+                force_search_distances = np.delete(force_search_distances, 0)
+
+    return np.array(radii), np.stack(curve, axis=-1)
+
+
+def _gamma_from_curve(radii, min_dose_difference, dose_criterion, distance_thresholds):
+    """Evaluate gamma from the curve for each set of criteria.
+
+    As the curve is a running minimum, the smallest gamma over the radii
+    is the same as that from the minimum dose difference at each shell.
+    Returns gamma with shape (points, normalisations, dose thresholds,
+    distance thresholds).
+    """
+    gamma = np.full(dose_criterion.shape + (len(distance_thresholds),), np.inf)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for radius, dose_difference in zip(radii, min_dose_difference.T):
+            gamma_at_radius = np.sqrt(
+                (dose_difference[:, None, None, None] / dose_criterion[..., None]) ** 2
+                + (radius / distance_thresholds[None, None, None, :]) ** 2
+            )
+            np.fmin(gamma, gamma_at_radius, out=gamma)
+
+    return gamma
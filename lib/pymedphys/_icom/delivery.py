@@ -16,7 +16,10 @@ from pymedphys._imports import numpy as np
 
 import pymedphys._base.delivery
 
-from . import extract
+from . import tokenise
+
+
+DELIVERY_FIELDS = ["delivery_mu", "gantry", "collimator", "mlc", "jaw"]
 
 
 def get_delivery_data_items(single_icom_stream: bytes):
@@ -42,38 +45,40 @@ def get_delivery_data_items(single_icom_stream: bytes):
         The Jaw positions adjusted to be in the ``pymedphys.Delivery``
         coordinate system.
     """
+    record = tokenise.decode_frame(single_icom_stream)
+    _check_all_fields_found(np.atleast_1d(record), ["mlc", "jaw"])
 
-    shrunk_stream, meterset = extract.extract(single_icom_stream, "Delivery MU")
-    shrunk_stream, gantry = extract.extract(shrunk_stream, "Gantry")
-    shrunk_stream, collimator = extract.extract(shrunk_stream, "Collimator")
-
-    shrunk_stream, raw_mlc = extract.extract_coll(shrunk_stream, b"MLCX", 160)
-    mlc = _convert_icom_mlc_to_delivery_coords(raw_mlc)
-
-    shrunk_stream, raw_jaw = extract.extract_coll(shrunk_stream, b"ASYMY", 2)
-    jaw = _convert_icom_jaw_to_delivery_coords(raw_jaw)
+    meterset, gantry, collimator = [
+        None if np.isnan(record[field]) else record[field]
+        for field in DELIVERY_FIELDS[0:3]
+    ]
 
-    return meterset, gantry, collimator, mlc, jaw
+    return meterset, gantry, collimator, record["mlc"], record["jaw"]
 
 
 def delivery_from_icom_stream(icom_stream):
-    icom_stream_points = extract.get_data_points(icom_stream)
-    delivery_raw = [
-        get_delivery_data_items(single_icom_stream)
-        for single_icom_stream in icom_stream_points
-    ]
+    records = tokenise.decode_stream(icom_stream)
+    _check_all_fields_found(records)
 
-    mu = np.array([item[0] for item in delivery_raw])
+    mu = records["delivery_mu"]
     diff_mu = np.concatenate([[0], np.diff(mu)])
     diff_mu[diff_mu < 0] = 0
     mu = np.cumsum(diff_mu)
 
-    gantry = np.array([item[1] for item in delivery_raw])
-    collimator = np.array([item[2] for item in delivery_raw])
-    mlc = np.array([item[3] for item in delivery_raw])
-    jaw = np.array([item[4] for item in delivery_raw])
+    return mu, records["gantry"], records["collimator"], records["mlc"], records["jaw"]
+
 
-    return mu, gantry, collimator, mlc, jaw
+def _check_all_fields_found(records, fields=None):
+    if fields is None:
+        fields = DELIVERY_FIELDS
+
+    for field in fields:
+        missing = np.isnan(records[field]).reshape(len(records), -1).any(axis=1)
+        if np.any(missing):
+            raise ValueError(
+                f"Unable to find the {field} field within "
+                f"{np.sum(missing)} of the {len(records)} iCOM stream timesteps."
+            )
 
 
 class DeliveryIcom(
@@ -84,20 +89,3 @@ class DeliveryIcom(
         return cls(  # pylint: disable = protected-access
             *delivery_from_icom_stream(icom_stream)
         )._filter_cps()
-
-
-def _convert_icom_mlc_to_delivery_coords(raw_mlc):
-    mlc = np.array(raw_mlc)
-    mlc = mlc.reshape((80, 2))
-    mlc = np.fliplr(np.flipud(mlc * 10))
-    mlc[:, 1] = -mlc[:, 1]
-    mlc = np.round(mlc, 10)
-
-    return mlc
-
-
-def _convert_icom_jaw_to_delivery_coords(raw_jaw):
-    jaw = np.round(np.array(raw_jaw) * 10, 10)
-    jaw = np.flipud(jaw)
-
-    return jaw
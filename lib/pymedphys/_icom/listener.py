@@ -1,3 +1,4 @@
+import datetime
 import logging
 import pathlib
 import re
@@ -7,9 +8,16 @@ import traceback
 
 from . import patients
 
-BUFFER_SIZE = 256
+BUFFER_SIZE = 65536
 ICOM_PORT = 1706
 
+DATE_PATTERN = re.compile(rb"\d\d\d\d-\d\d-\d\d\d\d:\d\d:\d\d")
+DATE_LENGTH = 18
+DATE_OFFSET = 8
+
+SESSION_FILE_SUFFIX = ".icom"
+DEFAULT_MAXIMUM_SESSION_STORAGE = 10 * 2**30  # 10 GiB
+
 
 def save_an_icom_batch(date_pattern, ip_directory, data_to_save):
     if not date_pattern.match(data_to_save[8:26]):
@@ -25,7 +33,198 @@ def save_an_icom_batch(date_pattern, ip_directory, data_to_save):
 
 
 def get_start_location_from_date_span(span):
-    return span[0] - 8
+    return span[0] - DATE_OFFSET
+
+
+class IcomStreamParser:
+    """Split a raw iCOM byte stream into its individual frames.
+
+    Each frame begins eight bytes prior to its timestamp. A frame is
+    only complete once the timestamp of the following frame has been
+    received. Incoming bytes are appended to a single buffer and only
+    the newly received bytes are searched for timestamps, so that the
+    cost of each ``feed`` is proportional to the data received, not the
+    data buffered.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._frame_start = None
+        self._search_from = 0
+
+    def feed(self, data) -> list[bytes]:
+        """Add received bytes to the stream, returning any frames that
+        have now been completed."""
+        self._buffer += data
+
+        frame_boundaries = []
+        for match in DATE_PATTERN.finditer(self._buffer, self._search_from):
+            frame_boundaries.append(max(match.start() - DATE_OFFSET, 0))
+            self._search_from = match.end()
+
+        # A timestamp may straddle the end of the buffer, so the tail
+        # of the buffer is searched again once more bytes arrive.
+        self._search_from = max(
+            self._search_from, len(self._buffer) - (DATE_LENGTH - 1)
+        )
+
+        if not frame_boundaries:
+            return []
+
+        if self._frame_start is None:
+            self._frame_start = frame_boundaries.pop(0)
+
+        frames = []
+        with memoryview(self._buffer) as view:
+            for boundary in frame_boundaries:
+                frames.append(bytes(view[self._frame_start : boundary]))
+                self._frame_start = boundary
+
+        # Discard everything prior to the incomplete frame. This leaves
+        # at most a single frame within the buffer.
+        del self._buffer[0 : self._frame_start]
+        self._search_from -= self._frame_start
+        self._frame_start = 0
+
+        return frames
+
+
+class IcomSessionWriter:
+    """Append iCOM frames to rolling files for a listening session.
+
+    Frames are buffered in memory and written out in batches, either
+    once ``flush_size`` bytes have accumulated or ``flush_interval``
+    seconds have passed since the last write. A new file is started once
+    the current one exceeds ``maximum_file_size`` bytes. The files
+    contain the raw iCOM stream, so any number of them can be
+    concatenated and read with ``pymedphys.Delivery.from_icom``.
+
+    Whenever a new file is started, the oldest session files within the
+    directory are deleted until those remaining total no more than
+    ``maximum_total_size`` bytes. If ``None`` no files are deleted.
+    """
+
+    def __init__(
+        self,
+        directory,
+        flush_size=65536,
+        flush_interval=1.0,
+        maximum_file_size=64 * 2**20,
+        maximum_total_size=DEFAULT_MAXIMUM_SESSION_STORAGE,
+    ):
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(exist_ok=True, parents=True)
+
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.maximum_file_size = maximum_file_size
+        self.maximum_total_size = maximum_total_size
+
+        self._session = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._part = 0
+        self._file = None
+        self._file_size = 0
+
+        self._pending = bytearray()
+        self._last_flush = time.monotonic()
+
+    @property
+    def filepath(self) -> pathlib.Path:
+        return self.directory.joinpath(
+            f"{self._session}_{str(self._part).zfill(3)}{SESSION_FILE_SUFFIX}"
+        )
+
+    def write(self, frame):
+        self._pending += frame
+
+        if (
+            len(self._pending) >= self.flush_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+
+        if not self._pending:
+            return
+
+        if self._file is not None and self._file_size >= self.maximum_file_size:
+            self._file.close()
+            self._file = None
+            self._part += 1
+
+        if self._file is None:
+            self._file = open(self.filepath, "ab")
+            self._file_size = self._file.tell()
+            self._prune()
+
+        self._file.write(self._pending)
+        self._file.flush()
+        self._file_size += len(self._pending)
+
+        logging.debug(
+            "Saved %(length)s bytes of stream to %(filepath)s",
+            {"length": len(self._pending), "filepath": self.filepath},
+        )
+
+        self._pending.clear()
+
+    def _prune(self):
+        if self.maximum_total_size is None:
+            return
+
+        # Session files are named by their start time, and so sort
+        # oldest first.
+        previous_files = sorted(
+            path
+            for path in self.directory.glob(f"*{SESSION_FILE_SUFFIX}")
+            if path != self.filepath
+        )
+        sizes = [path.stat().st_size for path in previous_files]
+        total_size = sum(sizes) + self._file_size
+
+        for path, size in zip(previous_files, sizes):
+            if total_size <= self.maximum_total_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
+            logging.info(
+                "Deleted %(filepath)s to remain within the session storage limit",
+                {"filepath": path},
+            )
+
+    def close(self):
+        self.flush()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class IcomFrameFileWriter:
+    """Save each iCOM frame within its own file, named by the frame
+    counter.
+
+    This is the format watched by ``pymedphys._icom.observer``.
+    """
+
+    def __init__(self, directory):
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(exist_ok=True, parents=True)
+
+    def write(self, frame):
+        save_an_icom_batch(DATE_PATTERN, self.directory, frame)
+
+    def close(self):
+        pass
 
 
 def initialise_socket(ip):
@@ -37,9 +236,12 @@ def initialise_socket(ip):
     return s
 
 
-def listen(ip, data_dir):
-    date_pattern = re.compile(rb"\d\d\d\d-\d\d-\d\d\d\d:\d\d:\d\d")
-
+def listen(
+    ip,
+    data_dir,
+    session_files=False,
+    maximum_session_storage=DEFAULT_MAXIMUM_SESSION_STORAGE,
+):
     data_dir = pathlib.Path(data_dir)
     live_dir = data_dir.joinpath("live")
     patients_dir = data_dir.joinpath("patients")
@@ -50,16 +252,22 @@ def listen(ip, data_dir):
         patient_icom_data.update_data(ip, data)
 
     ip_directory = live_dir.joinpath(ip)
-    ip_directory.mkdir(exist_ok=True, parents=True)
+
+    if session_files:
+        writer = IcomSessionWriter(
+            ip_directory, maximum_total_size=maximum_session_storage
+        )
+    else:
+        writer = IcomFrameFileWriter(ip_directory)
+
+    parser = IcomStreamParser()
 
     s = initialise_socket(ip)
 
     try:
-        data = b""
-
         while True:
             try:
-                data += s.recv(BUFFER_SIZE)
+                data = s.recv(BUFFER_SIZE)
             except socket.timeout:
                 logging.warning("Socket connection timed out, retrying connection")
                 logging.info(s)
@@ -68,25 +276,15 @@ def listen(ip, data_dir):
                 s = initialise_socket(ip)
                 continue
 
-            matches = date_pattern.finditer(data)
-            try:
-                span = next(matches).span()
-            except StopIteration:
-                continue
-
-            previous_start_location = get_start_location_from_date_span(span)
-            for match in matches:
-                new_start_location = get_start_location_from_date_span(match.span())
-                data_to_save = data[previous_start_location:new_start_location]
-
-                save_an_icom_batch(date_pattern, ip_directory, data_to_save)
-                archive_by_patient(ip, data_to_save)
-
-                previous_start_location = new_start_location
+            if not data:
+                raise ConnectionError("The iCOM stream was closed by the Linac")
 
-            data = data[previous_start_location::]
+            for frame in parser.feed(data):
+                writer.write(frame)
+                archive_by_patient(ip, frame)
 
     finally:
+        writer.close()
         s.close()
         logging.info(s)
 
@@ -94,7 +292,12 @@ def listen(ip, data_dir):
 def listen_cli(args):
     while True:
         try:
-            listen(args.ip, args.directory)
+            listen(
+                args.ip,
+                args.directory,
+                session_files=args.session_files,
+                maximum_session_storage=args.session_storage * 2**30,
+            )
         except KeyboardInterrupt:
             raise
         except:  # pylint: disable = bare-except  # noqa: E722
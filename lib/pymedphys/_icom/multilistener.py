@@ -0,0 +1,402 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Listen to the iCOM streams of many Linacs within a single process.
+
+Each Linac has its own connection, maintained by an asyncio task that
+reconnects with exponential backoff whenever the stream drops out.
+Received frames are handed over a per Linac queue to a second task which
+saves and archives them within a worker thread, so that a slow archive
+for one Linac never stalls the reading of any other stream.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import pathlib
+import time
+import traceback
+from dataclasses import dataclass, field
+
+from pymedphys import _config
+
+from . import listener, patients
+
+# Placed on a Linac's frame queue whenever its connection is re-established
+STREAM_RESTARTED = object()
+
+DEFAULT_MAXIMUM_QUEUED_FRAMES = 10000
+
+
+@dataclass
+class LinacMetrics:
+    """Counters describing the iCOM stream received from a single Linac."""
+
+    ip: str
+    bytes_received: int = 0
+    frames_received: int = 0
+    frames_dropped: int = 0
+    frames_not_saved: int = 0
+    reconnects: int = 0
+    connected: bool = False
+
+    _reported_at: float = field(default_factory=time.monotonic, repr=False)
+    _reported_bytes: int = field(default=0, repr=False)
+    _reported_frames: int = field(default=0, repr=False)
+
+    def rates(self):
+        """The bytes/s and frames/s received since the previous call."""
+        now = time.monotonic()
+        duration = max(now - self._reported_at, 1e-9)
+
+        bytes_per_second = (self.bytes_received - self._reported_bytes) / duration
+        frames_per_second = (self.frames_received - self._reported_frames) / duration
+
+        self._reported_at = now
+        self._reported_bytes = self.bytes_received
+        self._reported_frames = self.frames_received
+
+        return bytes_per_second, frames_per_second
+
+
+class MultiLinacListener:
+    """Listen to, save, and archive by patient the iCOM streams of many
+    Linacs.
+
+    Parameters
+    ----------
+    ips : Sequence[str]
+        The IP addresses of the Linacs.
+    data_dir : os.PathLike
+        The output directory, laid out identically to the one used by
+        ``pymedphys icom listen``.
+    port : int, optional
+        The iCOM port, by default 1706.
+    session_files : bool, optional
+        Save the frames within rolling session files, instead of each
+        frame within its own file.
+    maximum_session_storage : int, optional
+        The total size, in bytes, of the session files retained for each
+        Linac, see ``listener.IcomSessionWriter``.
+    timeout : float, optional
+        Seconds without receiving any data before a connection is
+        considered to have dropped out.
+    initial_backoff, maximum_backoff : float, optional
+        After each failed connection the delay before reconnecting is
+        doubled, starting at ``initial_backoff`` and capped at
+        ``maximum_backoff`` seconds. It is reset once a connection
+        successfully receives data.
+    maximum_queued_frames : int, optional
+        The number of frames from each Linac which may wait to be saved.
+        Should saving fall this far behind, further frames are dropped,
+        counted within ``LinacMetrics.frames_dropped``, and the delivery
+        currently being archived for that Linac is discarded.
+    """
+
+    def __init__(
+        self,
+        ips,
+        data_dir,
+        port=listener.ICOM_PORT,
+        session_files=False,
+        maximum_session_storage=listener.DEFAULT_MAXIMUM_SESSION_STORAGE,
+        timeout=10.0,
+        initial_backoff=1.0,
+        maximum_backoff=15 * 60.0,
+        maximum_queued_frames=DEFAULT_MAXIMUM_QUEUED_FRAMES,
+    ):
+        self.ips = list(ips)
+        self.data_dir = pathlib.Path(data_dir)
+        self.port = port
+        self.session_files = session_files
+        self.maximum_session_storage = maximum_session_storage
+        self.timeout = timeout
+        self.initial_backoff = initial_backoff
+        self.maximum_backoff = maximum_backoff
+
+        if maximum_queued_frames < 2:
+            raise ValueError("maximum_queued_frames needs to be at least 2")
+        self.maximum_queued_frames = maximum_queued_frames
+
+        self.metrics = {ip: LinacMetrics(ip) for ip in self.ips}
+        self._last_write_succeeded = {ip: True for ip in self.ips}
+
+        self._patient_icom_data = patients.PatientIcomData(
+            self.data_dir.joinpath("patients")
+        )
+        self._stop = None
+
+    async def run(self, report_interval=60.0):
+        """Listen until ``stop`` is called."""
+        self._stop = asyncio.Event()
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.ips), thread_name_prefix="icom-archive"
+        ) as executor:
+            tasks = [
+                asyncio.create_task(self._run_linac(ip, executor)) for ip in self.ips
+            ]
+            if report_interval is not None:
+                tasks.append(asyncio.create_task(self._report(report_interval)))
+
+            try:
+                await self._stop.wait()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    async def _report(self, report_interval):
+        while True:
+            await asyncio.sleep(report_interval)
+            for metrics in self.metrics.values():
+                bytes_per_second, frames_per_second = metrics.rates()
+                logging.info(
+                    "iCOM %(ip)s | connected: %(connected)s | "
+                    "%(bytes_per_second).0f bytes/s | "
+                    "%(frames_per_second).1f frames/s | "
+                    "dropped frames: %(frames_dropped)s | "
+                    "frames not saved: %(frames_not_saved)s | "
+                    "reconnects: %(reconnects)s",
+                    {
+                        "ip": metrics.ip,
+                        "connected": metrics.connected,
+                        "bytes_per_second": bytes_per_second,
+                        "frames_per_second": frames_per_second,
+                        "frames_dropped": metrics.frames_dropped,
+                        "frames_not_saved": metrics.frames_not_saved,
+                        "reconnects": metrics.reconnects,
+                    },
+                )
+
+    async def _run_linac(self, ip, executor):
+        ip_directory = self.data_dir.joinpath("live", ip)
+        if self.session_files:
+            writer = listener.IcomSessionWriter(
+                ip_directory, maximum_total_size=self.maximum_session_storage
+            )
+        else:
+            writer = listener.IcomFrameFileWriter(ip_directory)
+
+        queue = _FrameQueue(ip, self.maximum_queued_frames, self.metrics[ip])
+        archiver = asyncio.create_task(self._archive(ip, queue.queue, writer, executor))
+
+        try:
+            await self._connect_with_backoff(ip, queue)
+        finally:
+            # Saving the frames already queued is awaited, unless the
+            # archiver has itself stopped.
+            if not archiver.done():
+                await queue.queue.put(None)
+            try:
+                await archiver
+            finally:
+                writer.close()
+
+    async def _connect_with_backoff(self, ip, queue):
+        metrics = self.metrics[ip]
+        backoff = self.initial_backoff
+
+        while True:
+            bytes_received = metrics.bytes_received
+
+            try:
+                await self._receive(ip, queue)
+            except (OSError, asyncio.TimeoutError) as e:
+                logging.warning(
+                    "iCOM connection to %(ip)s dropped out: %(error)r",
+                    {"ip": ip, "error": e},
+                )
+            except Exception:  # pylint: disable = broad-except
+                # Such as from the parser. The connection is restarted
+                # instead of this Linac no longer being listened to.
+                logging.exception(
+                    "Unexpected error within the iCOM stream of %(ip)s", {"ip": ip}
+                )
+            finally:
+                metrics.connected = False
+
+            # The frame counter restarts with each connection
+            queue.restart()
+
+            if metrics.bytes_received > bytes_received:
+                backoff = self.initial_backoff
+
+            metrics.reconnects += 1
+            logging.info(
+                "Reconnecting to %(ip)s in %(backoff)s seconds",
+                {"ip": ip, "backoff": backoff},
+            )
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.maximum_backoff)
+
+    async def _receive(self, ip, queue):
+        metrics = self.metrics[ip]
+        parser = listener.IcomStreamParser()
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, self.port), self.timeout
+        )
+        metrics.connected = True
+        logging.info("Connected to the iCOM stream of %(ip)s", {"ip": ip})
+
+        try:
+            while True:
+                data = await asyncio.wait_for(
+                    reader.read(listener.BUFFER_SIZE), self.timeout
+                )
+                if not data:
+                    raise ConnectionError("The iCOM stream was closed by the Linac")
+
+                metrics.bytes_received += len(data)
+
+                for frame in parser.feed(data):
+                    metrics.frames_received += 1
+                    queue.put_frame(frame)
+        finally:
+            writer.close()
+
+    async def _archive(self, ip, queue, writer, executor):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            await loop.run_in_executor(executor, self._save_frame, ip, item, writer)
+
+    def _save_frame(self, ip, item, writer):
+        if item is STREAM_RESTARTED:
+            self._patient_icom_data.clear(ip)
+            return
+
+        metrics = self.metrics[ip]
+
+        try:
+            writer.write(item)
+        except Exception:  # pylint: disable = broad-except
+            # Such as a full disk. The archiver carries on so that saving
+            # resumes once writing succeeds again, and only the first of
+            # a run of failures is logged.
+            if self._last_write_succeeded[ip]:
+                logging.exception(
+                    "Unable to save the iCOM stream from %(ip)s, discarding "
+                    "the delivery currently being recorded.",
+                    {"ip": ip},
+                )
+
+            metrics.frames_not_saved += 1
+            self._last_write_succeeded[ip] = False
+            self._patient_icom_data.clear(ip)
+            return
+
+        self._last_write_succeeded[ip] = True
+
+        try:
+            self._patient_icom_data.update_data(ip, item)
+        except Exception:  # pylint: disable = broad-except
+            traceback.print_exc()
+            logging.warning(
+                "Unable to archive the iCOM stream from %(ip)s, discarding "
+                "the delivery currently being recorded.",
+                {"ip": ip},
+            )
+            self._patient_icom_data.clear(ip)
+
+
+class _FrameQueue:
+    """The bounded queue of a single Linac's frames awaiting saving.
+
+    Nothing placed onto the queue waits for room. Once the queue is full
+    frames are dropped, and as the delivery currently being archived is
+    then missing frames, a ``STREAM_RESTARTED`` marker is queued ahead
+    of the next frame for which there is room.
+    """
+
+    def __init__(self, ip, maxsize, metrics: LinacMetrics):
+        self.ip = ip
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.metrics = metrics
+        self._restart_pending = False
+
+    def put_frame(self, frame):
+        # Room is kept for the marker ahead of the frame
+        if self._room() < (2 if self._restart_pending else 1):
+            if not self._restart_pending:
+                logging.warning(
+                    "Saving the iCOM stream of %(ip)s has fallen behind, "
+                    "dropping frames",
+                    {"ip": self.ip},
+                )
+
+            self.metrics.frames_dropped += 1
+            self._restart_pending = True
+            return
+
+        if self._restart_pending:
+            self.queue.put_nowait(STREAM_RESTARTED)
+            self._restart_pending = False
+
+        self.queue.put_nowait(frame)
+
+    def restart(self):
+        if self._room() < 1:
+            self._restart_pending = True
+            return
+
+        self.queue.put_nowait(STREAM_RESTARTED)
+        self._restart_pending = False
+
+    def _room(self):
+        return self.queue.maxsize - self.queue.qsize()
+
+
+def get_linac_ips_from_config(config):
+    return [
+        linac_config["ip"]
+        for site_config in config["site"]
+        for linac_config in site_config.get("linac", [])
+        if "ip" in linac_config
+    ]
+
+
+def listen_many(ips, data_dir, report_interval=60.0, **kwargs):
+    multi_linac_listener = MultiLinacListener(ips, data_dir, **kwargs)
+    asyncio.run(multi_linac_listener.run(report_interval=report_interval))
+
+
+def listen_many_cli(args):
+    ips = list(args.ips)
+    if args.from_config:
+        ips += get_linac_ips_from_config(_config.get_config())
+
+    if not ips:
+        raise ValueError(
+            "No Linac IPs were provided, either pass them directly or "
+            "utilise --from-config."
+        )
+
+    listen_many(
+        ips,
+        args.directory,
+        report_interval=args.report_interval,
+        session_files=args.session_files,
+        maximum_session_storage=args.session_storage * 2**30,
+    )
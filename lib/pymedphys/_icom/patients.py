@@ -5,7 +5,7 @@ import traceback
 
 import pymedphys
 
-from . import extract, observer
+from . import extract, observer, tokenise
 
 # TODO: Convert logging to use lazy formatting
 # see https://docs.python.org/3/howto/logging.html#optimization
@@ -117,6 +117,13 @@ class PatientIcomData:
         self._current_patient_data = {}
         self._output_dir = pathlib.Path(output_dir)
 
+    def clear(self, ip):
+        """Forget the stream received from ``ip``, including any partially
+        collected delivery. To be called when the stream is interrupted,
+        as the frame counter does not continue across connections."""
+        for state in (self._data, self._usage_start, self._current_patient_data):
+            state.pop(ip, None)
+
     def update_data(self, ip, data):
         try:
             if self._data[ip][-1][26] == data[26]:
@@ -137,9 +144,10 @@ class PatientIcomData:
             self._data[ip] = [data]
 
         timestamp = data[8:26].decode()
-        shrunk_data, patient_id = extract.extract(data, "Patient ID")
-        shrunk_data, patient_name = extract.extract(shrunk_data, "Patient Name")
-        shrunk_data, machine_id = extract.extract(shrunk_data, "Machine ID")
+        record = tokenise.decode_frame(data)
+        patient_id = record["patient_id"]
+        patient_name = record["patient_name"]
+        machine_id = record["machine_id"]
         logging.info(  # pylint: disable = logging-fstring-interpolation
             f"IP: {ip} | Timestamp: {timestamp} | "
             f"Patient ID: {patient_id} | "
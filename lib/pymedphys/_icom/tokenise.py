@@ -0,0 +1,213 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Decode the delivery fields of an iCOM stream within a single pass.
+
+The functions within ``extract`` search a frame once per field, and then
+copy the frame with that field removed. Instead, here each field's key
+is located across the whole stream with a literal byte search, and the
+element at each candidate is then confirmed with the same regex that
+``extract`` uses. The found elements are assigned to their frames and
+decoded into a preallocated record array with NumPy.
+"""
+
+import re
+
+from pymedphys._imports import numpy as np
+
+from . import extract, mappings
+
+SCALAR_FIELDS = {
+    "patient_id": "Patient ID",
+    "patient_name": "Patient Name",
+    "machine_id": "Machine ID",
+    "delivery_mu": "Delivery MU",
+    "gantry": "Gantry",
+    "collimator": "Collimator",
+}
+
+# The collimation is a header element, holding the collimator label,
+# followed by one newline separated element per leaf or jaw position.
+COLLIMATION_FIELDS = {"mlc": (b"MLCX", 160), "jaw": (b"ASYMY", 2)}
+
+MISSING_VALUE = b"-32767"
+
+FRAME_DTYPE = np.dtype(
+    [
+        ("patient_id", object),
+        ("patient_name", object),
+        ("machine_id", object),
+        ("delivery_mu", float),
+        ("gantry", float),
+        ("collimator", float),
+        ("mlc", float, (80, 2)),
+        ("jaw", float, (2,)),
+    ]
+)
+
+
+def _unescape(key):
+    return re.sub(rb"\\(.)", rb"\1", key)
+
+
+_KEY_NAMES = {
+    _unescape(mappings.ICOM[label][0]): name for name, label in SCALAR_FIELDS.items()
+}
+
+_COLLIMATION_HEADER_KEY = b"\xb8\x00DS\x00R"
+
+# The frame timestamp ends with ``:MM:SS``. Searching for that literal
+# colon is far cheaper than searching for the leading digits.
+_DATE_SUFFIX_PATTERN = re.compile(rb":\d\d:\d\d")
+_DATE_SUFFIX_OFFSET = 12
+
+
+def empty_records(number_of_frames):
+    records = np.zeros(number_of_frames, dtype=FRAME_DTYPE)
+    for name in FRAME_DTYPE.names:
+        if FRAME_DTYPE[name] == object:
+            records[name] = None
+        else:
+            records[name] = np.nan
+
+    return records
+
+
+def decode_frame(frame: bytes, record=None):
+    """Decode the delivery fields of a single iCOM frame.
+
+    Parameters
+    ----------
+    frame : bytes
+        A single timestep of the iCOM stream.
+    record : np.void, optional
+        A preallocated record of ``FRAME_DTYPE`` to fill. Fields not
+        found within the frame are left untouched.
+
+    Returns
+    -------
+    record : np.void
+        Fields not found within the frame are ``None`` or ``NaN``.
+    """
+    records = empty_records(1)
+    found = _decode_into(frame, np.array([0]), records)
+
+    if record is None:
+        return records[0]
+
+    for name in found:
+        record[name] = records[name][0]
+
+    return record
+
+
+def decode_stream(icom_stream: bytes):
+    """Decode every frame within an iCOM stream.
+
+    Returns
+    -------
+    records : np.ndarray
+        A record array of ``FRAME_DTYPE`` with one row per frame, split
+        identically to ``extract.get_data_points``.
+    """
+    frame_starts = np.array(_find_frame_starts(icom_stream), dtype=int)
+    records = empty_records(len(frame_starts))
+
+    if len(frame_starts) != 0:
+        _decode_into(icom_stream, frame_starts, records)
+
+    return records
+
+
+def _find_frame_starts(data):
+    frame_starts = []
+    for match in _DATE_SUFFIX_PATTERN.finditer(data):
+        date_start = match.start() - _DATE_SUFFIX_OFFSET
+        if date_start >= 0 and extract.DATE_PATTERN.match(data, date_start):
+            frame_starts.append(date_start - 8)
+
+    return frame_starts
+
+
+def _find_elements(data, key, regex, start):
+    """Yield the position and match of every element with the given
+    key, where the key is preceded by the single byte element prefix."""
+    position = data.find(key, start + 1)
+    while position != -1:
+        match = regex.match(data, position - 1)
+        if match is not None:
+            yield match.start(), match
+
+        position = data.find(key, position + 1)
+
+
+def _decode_into(data, frame_starts, records):
+    """Fill ``records`` with the first occurrence of each field within
+    each frame, returning the names of the fields that were found."""
+    start = max(int(frame_starts[0]), 0)
+    positions = {name: [] for name in FRAME_DTYPE.names}
+    values = {name: [] for name in FRAME_DTYPE.names}
+
+    for key, name in _KEY_NAMES.items():
+        regex = extract.get_extraction_regex(mappings.ICOM[SCALAR_FIELDS[name]][0])
+        for position, match in _find_elements(data, key, regex, start):
+            value = match.group(1)
+            if value != MISSING_VALUE:
+                positions[name].append(position)
+                values[name].append(value)
+
+    for name, (label, number) in COLLIMATION_FIELDS.items():
+        regex = extract.get_coll_regex(label, number)
+        for position, match in _find_elements(
+            data, _COLLIMATION_HEADER_KEY, regex, start
+        ):
+            positions[name].append(position)
+            values[name].append(match.groups())
+
+    found = []
+    for name, field_positions in positions.items():
+        if not field_positions:
+            continue
+
+        found.append(name)
+
+        frame_index = np.searchsorted(frame_starts, field_positions, side="right") - 1
+        frames, first = np.unique(frame_index, return_index=True)
+        field_values = [values[name][i] for i in first]
+
+        if name in COLLIMATION_FIELDS:
+            raw = np.array(field_values, dtype=bytes).astype(float)
+            if name == "mlc":
+                records[name][frames] = _convert_icom_mlc_to_delivery_coords(raw)
+            else:
+                records[name][frames] = _convert_icom_jaw_to_delivery_coords(raw)
+        elif FRAME_DTYPE[name] == object:
+            records[name][frames] = [value.decode() for value in field_values]
+        else:
+            records[name][frames] = np.array(field_values, dtype=bytes).astype(float)
+
+    return found
+
+
+def _convert_icom_mlc_to_delivery_coords(raw_mlc):
+    mlc = raw_mlc.reshape((-1, 80, 2))
+    mlc = mlc[:, ::-1, ::-1] * 10
+    mlc[:, :, 1] = -mlc[:, :, 1]
+
+    return np.round(mlc, 10)
+
+
+def _convert_icom_jaw_to_delivery_coords(raw_jaw):
+    return np.round(raw_jaw * 10, 10)[:, ::-1]
@@ -17,6 +17,8 @@ from typing import Sequence
 
 from pymedphys._imports import numba as nb, numpy as np, plt, scipy
 
+from . import rectilinear
+
 
 def plot_interp_comparison_heatmap(
     values, values_interp, slice_axis: int, slice_number: int, slice_number_interp: int
@@ -88,9 +90,9 @@ def __check_inputs(
         )
 
     for i, axis_known in enumerate(axes_known):
-        if not axis_known.ndim == points_interp[i].ndim == 1:
+        if not axis_known.ndim == points_interp[:, i].ndim == 1:
             raise ValueError(
-                f"axes_known[{i}] (shape {[{axis_known.shape}]}) and interp_structure[{i}] (shape {[{points_interp[i].shape}]}) must be 1D arrays"
+                f"axes_known[{i}] (shape {[{axis_known.shape}]}) and points_interp[:, {i}] (shape {[{points_interp[:, i].shape}]}) must be 1D arrays"
             )
         if not axis_known.size == values.shape[i]:
             raise ValueError(
@@ -111,207 +113,361 @@ def __check_inputs(
     return axes_known, values
 
 
-@cache
-def _get_interp_linear_1d():
-    @nb.njit(parallel=True, fastmath=True, cache=True)
-    def _interp_linear_1d(axis_known, values, points_interp, extrap_fill_value=np.nan):
-        values_interp = np.zeros(points_interp.shape[0], dtype=np.float64)
-        diff = axis_known[1] - axis_known[0]
+def _interp_point_linear_1d(axes_known, values, point, extrap_fill_value):
+    axis_known = axes_known[0]
+    xpi = point[0]
 
-        # pylint: disable=not-an-iterable
-        for i in nb.prange(points_interp.shape[0]):
-            xpi = points_interp[i, 0]
+    if not axis_known[0] <= xpi <= axis_known[-1]:
+        return extrap_fill_value
 
-            if not axis_known[0] <= xpi <= axis_known[-1]:
-                values_interp[i] = extrap_fill_value
-                continue
+    x1_idx = np.searchsorted(axis_known, xpi)
+    x0_idx = x1_idx - 1
 
-            x1_idx = np.searchsorted(axis_known, xpi)
-            x0_idx = x1_idx - 1
+    if x0_idx < 0:
+        x0_idx = 0
+    if x1_idx >= axis_known.size:
+        x1_idx = axis_known.size - 1
 
-            if x0_idx < 0:
-                x0_idx = 0
-            if x1_idx >= axis_known.size:
-                x1_idx = axis_known.size - 1
+    wx = (xpi - axis_known[x0_idx]) / (axis_known[1] - axis_known[0])
 
-            wx = (xpi - axis_known[x0_idx]) / diff
+    return values[x0_idx] * (1 - wx) + values[x1_idx] * wx
 
-            values_interp[i] = values[x0_idx] * (1 - wx) + values[x1_idx] * wx
 
-        return values_interp
+def _interp_point_linear_2d(axes_known, values, point, extrap_fill_value):
+    x, y = axes_known[0], axes_known[1]
+    xpi, ypi = point[0], point[1]
 
-    return _interp_linear_1d
+    if not x[0] <= xpi <= x[-1] or not y[0] <= ypi <= y[-1]:
+        return extrap_fill_value
 
+    # Find the indices of the surrounding grid points
+    x1_idx = np.searchsorted(x, xpi)
+    x0_idx = x1_idx - 1
+    y1_idx = np.searchsorted(y, ypi)
+    y0_idx = y1_idx - 1
 
-def interp_linear_1d(axis_known, values, points_interp, extrap_fill_value=None):
-    _interp_linear_1d = _get_interp_linear_1d()
-    if extrap_fill_value is None:
-        extrap_fill_value = np.nan
-    return _interp_linear_1d(
-        axis_known=axis_known,
-        values=values,
-        points_interp=points_interp,
-        extrap_fill_value=extrap_fill_value,
-    )
+    if x0_idx < 0:
+        x0_idx = 0
+    if y0_idx < 0:
+        y0_idx = 0
+    if x1_idx >= x.size:
+        x1_idx = x.size - 1
+    if y1_idx >= y.size:
+        y1_idx = y.size - 1
 
+    c00 = values[x0_idx, y0_idx]
+    c01 = values[x0_idx, y1_idx]
+    c10 = values[x1_idx, y0_idx]
+    c11 = values[x1_idx, y1_idx]
 
-@cache
-def _get_interp_linear_2d():
-    @nb.njit(parallel=True, fastmath=True, cache=True)
-    def _interp_linear_2d(axes_known, values, points_interp, extrap_fill_value=np.nan):
-        values_interp = np.zeros((points_interp.shape[0]), dtype=np.float64)
-        diffs = np.zeros(2)
-        for i, axis in enumerate(axes_known):
-            diffs[i] = axis[1] - axis[0]
-        x, y = axes_known
+    wx = (xpi - x[x0_idx]) / (x[1] - x[0])
+    wy = (ypi - y[y0_idx]) / (y[1] - y[0])
 
-        # pylint: disable=not-an-iterable
-        for i in nb.prange(points_interp.shape[0]):
-            xpi, ypi = points_interp[i, 0], points_interp[i, 1]
+    c0 = c00 * (1 - wx) + c10 * wx
+    c1 = c01 * (1 - wx) + c11 * wx
+
+    return c0 * (1 - wy) + c1 * wy
+
+
+# pylint: disable=invalid-name
+def _interp_point_linear_3d(axes_known, values, point, extrap_fill_value):
+    x, y, z = axes_known[0], axes_known[1], axes_known[2]
+    xpi, ypi, zpi = point[0], point[1], point[2]
+
+    if not x[0] <= xpi <= x[-1] or not y[0] <= ypi <= y[-1] or not z[0] <= zpi <= z[-1]:
+        return extrap_fill_value
+
+    # Find the indices of the surrounding grid points
+    x1_idx = np.searchsorted(x, xpi)
+    x0_idx = x1_idx - 1
+    y1_idx = np.searchsorted(y, ypi)
+    y0_idx = y1_idx - 1
+    z1_idx = np.searchsorted(z, zpi)
+    z0_idx = z1_idx - 1
+
+    if x0_idx < 0:
+        x0_idx = 0
+    if y0_idx < 0:
+        y0_idx = 0
+    if z0_idx < 0:
+        z0_idx = 0
+    if x1_idx >= x.size:
+        x1_idx = x.size - 1
+    if y1_idx >= y.size:
+        y1_idx = y.size - 1
+    if z1_idx >= z.size:
+        z1_idx = z.size - 1
+
+    # Compute interpolation weights
+    wx = (xpi - x[x0_idx]) / (x[1] - x[0])
+    wy = (ypi - y[y0_idx]) / (y[1] - y[0])
+    wz = (zpi - z[z0_idx]) / (z[1] - z[0])
+
+    # Extract values values at corner points
+    c000 = values[x0_idx, y0_idx, z0_idx]
+    c001 = values[x0_idx, y0_idx, z1_idx]
+    c010 = values[x0_idx, y1_idx, z0_idx]
+    c011 = values[x0_idx, y1_idx, z1_idx]
+    c100 = values[x1_idx, y0_idx, z0_idx]
+    c101 = values[x1_idx, y0_idx, z1_idx]
+    c110 = values[x1_idx, y1_idx, z0_idx]
+    c111 = values[x1_idx, y1_idx, z1_idx]
+
+    # Perform trilinear interpolation
+    c00 = c000 * (1 - wx) + c100 * wx
+    c01 = c001 * (1 - wx) + c101 * wx
+    c10 = c010 * (1 - wx) + c110 * wx
+    c11 = c011 * (1 - wx) + c111 * wx
+
+    c0 = c00 * (1 - wy) + c10 * wy
+    c1 = c01 * (1 - wy) + c11 * wy
+
+    return c0 * (1 - wz) + c1 * wz
+
+
+_INTERP_POINT_LINEAR = {
+    1: _interp_point_linear_1d,
+    2: _interp_point_linear_2d,
+    3: _interp_point_linear_3d,
+}
+
+
+def interp_point_linear(axes_known, values, point, extrap_fill_value):
+    """Linearly interpolate a single point within 1D, 2D, or 3D data.
+
+    Once :func:`register_interp_point_linear` has been called, this can
+    be called from within other ``numba`` compiled functions, allowing
+    points to be interpolated without first being collected into an
+    array.
+
+    Parameters
+    ----------
+    axes_known : tuple of np.ndarray
+        The evenly spaced, ascending axes of the known data points.
+    values : np.ndarray
+        The known values at the points defined by `axes_known`.
+    point : np.ndarray
+        The coordinates of the point to interpolate, one per axis.
+    extrap_fill_value : float
+        The value returned for points outside the bounds of the data.
+    """
+    return _INTERP_POINT_LINEAR[len(axes_known)](
+        axes_known, values, point, extrap_fill_value
+    )
 
-            if not x[0] <= xpi <= x[-1] or not y[0] <= ypi <= y[-1]:
-                values_interp[i] = extrap_fill_value
-                continue
 
-            # Find the indices of the surrounding grid points
-            x1_idx = np.searchsorted(x, xpi)
-            x0_idx = x1_idx - 1
-            y1_idx = np.searchsorted(y, ypi)
-            y0_idx = y1_idx - 1
+@cache
+def register_interp_point_linear():
+    """Make :func:`interp_point_linear` callable from ``numba`` compiled
+    functions, compiling the implementation that matches the number of
+    axes given."""
 
-            if x0_idx < 0:
-                x0_idx = 0
-            if y0_idx < 0:
-                y0_idx = 0
-            if x1_idx >= x.size:
-                x1_idx = x.size - 1
-            if y1_idx >= y.size:
-                y1_idx = y.size - 1
+    @nb.extending.overload(interp_point_linear, jit_options={"fastmath": True})
+    def _interp_point_linear(axes_known, values, point, extrap_fill_value):
+        return _INTERP_POINT_LINEAR[len(axes_known)]
 
-            c00 = values[x0_idx, y0_idx]
-            c01 = values[x0_idx, y1_idx]
-            c10 = values[x1_idx, y0_idx]
-            c11 = values[x1_idx, y1_idx]
 
-            wx = (xpi - x[x0_idx]) / diffs[0]
-            wy = (ypi - y[y0_idx]) / diffs[1]
+@cache
+def _get_interp_linear():
+    register_interp_point_linear()
 
-            c0 = c00 * (1 - wx) + c10 * wx
-            c1 = c01 * (1 - wx) + c11 * wx
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def _interp_linear(axes_known, values, points_interp, extrap_fill_value=np.nan):
+        values_interp = np.zeros(points_interp.shape[0], dtype=np.float64)
 
-            values_interp[i] = c0 * (1 - wy) + c1 * wy
+        # pylint: disable=not-an-iterable
+        for i in nb.prange(points_interp.shape[0]):
+            values_interp[i] = interp_point_linear(
+                axes_known, values, points_interp[i], extrap_fill_value
+            )
 
         return values_interp
 
-    return _interp_linear_2d
+    return _interp_linear
+
+
+def interp_linear_1d(axis_known, values, points_interp, extrap_fill_value=None):
+    _interp_linear = _get_interp_linear()
+    if extrap_fill_value is None:
+        extrap_fill_value = np.nan
+    return _interp_linear(
+        axes_known=(axis_known,),
+        values=values,
+        points_interp=points_interp,
+        extrap_fill_value=extrap_fill_value,
+    )
 
 
 def interp_linear_2d(axes_known, values, points_interp, extrap_fill_value=None):
-    _interp_linear_2d = _get_interp_linear_2d()
+    _interp_linear = _get_interp_linear()
     if extrap_fill_value is None:
         extrap_fill_value = np.nan
-    return _interp_linear_2d(
-        axes_known=axes_known,
+    return _interp_linear(
+        axes_known=tuple(axes_known),
         values=values,
         points_interp=points_interp,
         extrap_fill_value=extrap_fill_value,
     )
 
 
+def interp_linear_3d(axes_known, values, points_interp, extrap_fill_value=None):
+    _interp_linear = _get_interp_linear()
+    if extrap_fill_value is None:
+        extrap_fill_value = np.nan
+    return _interp_linear(
+        axes_known=tuple(axes_known),
+        values=values,
+        points_interp=points_interp,
+        extrap_fill_value=extrap_fill_value,
+    )
+
+
+def _linear_axis_table(axis_known, axis_interp):
+    """The indices either side of, and the weight of the upper of these,
+    for each coordinate along one axis. These match those used by
+    :func:`interp_point_linear`."""
+    x1_idx = np.searchsorted(axis_known, axis_interp)
+    x0_idx = np.maximum(x1_idx - 1, 0)
+    x1_idx = np.minimum(x1_idx, axis_known.size - 1)
+
+    weight = (axis_interp - axis_known[x0_idx]) / (axis_known[1] - axis_known[0])
+    within_bounds = (axis_known[0] <= axis_interp) & (axis_interp <= axis_known[-1])
+
+    return x0_idx, x1_idx, weight, within_bounds
+
+
 @cache
-def _get_interp_linear_3d():
+def _get_interp_linear_separable_2d():
     @nb.njit(parallel=True, fastmath=True, cache=True)
-    # pylint: disable=invalid-name
-    def _interp_linear_3d(axes_known, values, points_interp, extrap_fill_value=np.nan):
-        x, y, z = axes_known[0], axes_known[1], axes_known[2]
+    def _interp_linear_separable_2d(
+        values, x_table, y_table, extrap_fill_value, values_interp
+    ):
+        x0_idx, x1_idx, wx, x_within = x_table
+        y0_idx, y1_idx, wy, y_within = y_table
 
-        values_interp = np.zeros(
-            points_interp.shape[0],
-            dtype=np.float64,
-        )
+        # pylint: disable=not-an-iterable
+        for i in nb.prange(x0_idx.size):
+            for j in range(y0_idx.size):
+                if not (x_within[i] and y_within[j]):
+                    values_interp[i, j] = extrap_fill_value
+                    continue
+
+                c00 = values[x0_idx[i], y0_idx[j]]
+                c01 = values[x0_idx[i], y1_idx[j]]
+                c10 = values[x1_idx[i], y0_idx[j]]
+                c11 = values[x1_idx[i], y1_idx[j]]
 
-        diffs = np.zeros(3)
-        for i, axis in enumerate(axes_known):
-            diffs[i] = axis[1] - axis[0]
+                c0 = c00 * (1 - wx[i]) + c10 * wx[i]
+                c1 = c01 * (1 - wx[i]) + c11 * wx[i]
+
+                values_interp[i, j] = c0 * (1 - wy[j]) + c1 * wy[j]
+
+    return _interp_linear_separable_2d
+
+
+@cache
+def _get_interp_linear_separable_3d():
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def _interp_linear_separable_3d(
+        values, x_table, y_table, z_table, extrap_fill_value, values_interp
+    ):
+        x0_idx, x1_idx, wx, x_within = x_table
+        y0_idx, y1_idx, wy, y_within = y_table
+        z0_idx, z1_idx, wz, z_within = z_table
 
         # pylint: disable=not-an-iterable
-        for i in nb.prange(points_interp.shape[0]):
-            xpi, ypi, zpi = (
-                points_interp[i, 0],
-                points_interp[i, 1],
-                points_interp[i, 2],
-            )
+        for i in nb.prange(x0_idx.size):
+            for j in range(y0_idx.size):
+                for k in range(z0_idx.size):
+                    if not (x_within[i] and y_within[j] and z_within[k]):
+                        values_interp[i, j, k] = extrap_fill_value
+                        continue
 
-            if (
-                not x[0] <= xpi <= x[-1]
-                or not y[0] <= ypi <= y[-1]
-                or not z[0] <= zpi <= z[-1]
-            ):
-                values_interp[i] = extrap_fill_value
-                continue
-
-            # Find the indices of the surrounding grid points
-            x1_idx = np.searchsorted(x, xpi)
-            x0_idx = x1_idx - 1
-            y1_idx = np.searchsorted(y, ypi)
-            y0_idx = y1_idx - 1
-            z1_idx = np.searchsorted(z, zpi)
-            z0_idx = z1_idx - 1
-
-            if x0_idx < 0:
-                x0_idx = 0
-            if y0_idx < 0:
-                y0_idx = 0
-            if z0_idx < 0:
-                z0_idx = 0
-            if x1_idx >= x.size:
-                x1_idx = x.size - 1
-            if y1_idx >= y.size:
-                y1_idx = y.size - 1
-            if z1_idx >= z.size:
-                z1_idx = z.size - 1
-
-            # Compute interpolation weights
-            wx = (xpi - x[x0_idx]) / diffs[0]
-            wy = (ypi - y[y0_idx]) / diffs[1]
-            wz = (zpi - z[z0_idx]) / diffs[2]
-
-            # Extract values values at corner points
-            c000 = values[x0_idx, y0_idx, z0_idx]
-            c001 = values[x0_idx, y0_idx, z1_idx]
-            c010 = values[x0_idx, y1_idx, z0_idx]
-            c011 = values[x0_idx, y1_idx, z1_idx]
-            c100 = values[x1_idx, y0_idx, z0_idx]
-            c101 = values[x1_idx, y0_idx, z1_idx]
-            c110 = values[x1_idx, y1_idx, z0_idx]
-            c111 = values[x1_idx, y1_idx, z1_idx]
-
-            # Perform trilinear interpolation
-            c00 = c000 * (1 - wx) + c100 * wx
-            c01 = c001 * (1 - wx) + c101 * wx
-            c10 = c010 * (1 - wx) + c110 * wx
-            c11 = c011 * (1 - wx) + c111 * wx
-
-            c0 = c00 * (1 - wy) + c10 * wy
-            c1 = c01 * (1 - wy) + c11 * wy
-
-            values_interp[i] = c0 * (1 - wz) + c1 * wz
+                    c000 = values[x0_idx[i], y0_idx[j], z0_idx[k]]
+                    c001 = values[x0_idx[i], y0_idx[j], z1_idx[k]]
+                    c010 = values[x0_idx[i], y1_idx[j], z0_idx[k]]
+                    c011 = values[x0_idx[i], y1_idx[j], z1_idx[k]]
+                    c100 = values[x1_idx[i], y0_idx[j], z0_idx[k]]
+                    c101 = values[x1_idx[i], y0_idx[j], z1_idx[k]]
+                    c110 = values[x1_idx[i], y1_idx[j], z0_idx[k]]
+                    c111 = values[x1_idx[i], y1_idx[j], z1_idx[k]]
 
-        return values_interp
+                    c00 = c000 * (1 - wx[i]) + c100 * wx[i]
+                    c01 = c001 * (1 - wx[i]) + c101 * wx[i]
+                    c10 = c010 * (1 - wx[i]) + c110 * wx[i]
+                    c11 = c011 * (1 - wx[i]) + c111 * wx[i]
 
-    return _interp_linear_3d
+                    c0 = c00 * (1 - wy[j]) + c10 * wy[j]
+                    c1 = c01 * (1 - wy[j]) + c11 * wy[j]
 
+                    values_interp[i, j, k] = c0 * (1 - wz[k]) + c1 * wz[k]
 
-def interp_linear_3d(axes_known, values, points_interp, extrap_fill_value=None):
-    _interp_linear_3d = _get_interp_linear_3d()
+    return _interp_linear_separable_3d
+
+
+def interp_linear_separable(
+    axes_known, values, axes_interp, extrap_fill_value=None, out=None
+):
+    """Linearly resample 2D or 3D data onto the grid defined by
+    `axes_interp`.
+
+    The indices and weights along each axis are found once, and the
+    tensor product interpolation is then evaluated directly into the
+    output grid. Unlike passing the points of the grid to
+    :func:`interp_linear_2d` or :func:`interp_linear_3d`, these points
+    are never created, so the memory required is only that of the output.
+
+    Parameters
+    ----------
+    axes_known : Sequence[np.ndarray]
+        The evenly spaced, ascending axes of the known data points.
+    values : np.ndarray
+        The known values at the points defined by `axes_known`.
+    axes_interp : Sequence[np.ndarray]
+        The axes of the grid to resample onto.
+    extrap_fill_value : float, optional
+        The value used for points of the grid outside the bounds of the
+        known data. Default is None, which results in using np.nan.
+    out : np.ndarray, optional
+        A ``float64`` array, with a shape of the lengths of the axes within
+        `axes_interp`, to write the resampled values into.
+
+    Returns
+    -------
+    np.ndarray
+        The resampled values, with a shape of the lengths of the axes
+        within `axes_interp`. This is `out` when provided.
+    """
     if extrap_fill_value is None:
         extrap_fill_value = np.nan
-    return _interp_linear_3d(
-        axes_known=axes_known,
-        values=values,
-        points_interp=points_interp,
-        extrap_fill_value=extrap_fill_value,
-    )
+
+    axes_known = [np.asarray(axis, dtype=np.float64) for axis in axes_known]
+    axes_interp = [np.asarray(axis, dtype=np.float64) for axis in axes_interp]
+    values = np.asarray(values, dtype=np.float64)
+
+    shape = tuple(axis.size for axis in axes_interp)
+    if out is None:
+        out = np.empty(shape, dtype=np.float64)
+    elif out.shape != shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {shape}")
+
+    tables = [
+        _linear_axis_table(axis_known, axis_interp)
+        for axis_known, axis_interp in zip(axes_known, axes_interp)
+    ]
+
+    if len(tables) == 2:
+        _interp_linear_separable = _get_interp_linear_separable_2d()
+    elif len(tables) == 3:
+        _interp_linear_separable = _get_interp_linear_separable_3d()
+    else:
+        raise ValueError(
+            f"axes_known (len {len(axes_known)}) must have a length of either 2 or 3"
+        )
+
+    _interp_linear_separable(values, *tables, float(extrap_fill_value), out)
+
+    return out
 
 
 def interp_linear_scipy(
@@ -415,11 +571,18 @@ def interp(
     It supports both grid-based interpolation (using `axes_interp`) and
     point-based interpolation (using `points_interp`).
 
-    The input axes must be monotonically increasing and evenly spaced.
+    The input axes must be monotonically increasing and evenly spaced. For axes
+    that are not evenly spaced, or for cubic interpolation, see
+    :class:`Interpolator`.
     """
+    separable = False
     if axes_interp is not None and points_interp is None:
-        mgrids = np.meshgrid(*axes_interp, indexing="ij")
-        points_interp = np.column_stack([mgrid.ravel() for mgrid in mgrids])
+        # A grid of 2D or 3D points is resampled one axis at a time, so
+        # that the points within it need not be created.
+        separable = len(axes_known) > 1
+        if not separable:
+            mgrids = np.meshgrid(*axes_interp, indexing="ij")
+            points_interp = np.column_stack([mgrid.ravel() for mgrid in mgrids])
     elif axes_interp is None and points_interp is not None:
         if keep_dims:
             raise ValueError(
@@ -430,8 +593,20 @@ def interp(
             "Exactly one of either `axes_interp` or `points_interp` must be specified"
         )
     if not skip_checks:
+        if separable:
+            # The bounds of the grid are checked in place of every point
+            axes_interp = [np.asarray(axis, dtype=np.float64) for axis in axes_interp]
+            points_to_check = np.array(
+                [
+                    [axis.min() for axis in axes_interp],
+                    [axis.max() for axis in axes_interp],
+                ]
+            )
+        else:
+            points_to_check = points_interp
+
         axes_known, values = __check_inputs(
-            axes_known, values, points_interp, bounds_error
+            axes_known, values, points_to_check, bounds_error
         )
 
         axes_known_diffs = [np.diff(axis) for axis in axes_known]
@@ -448,6 +623,15 @@ def interp(
     if extrap_fill_value is None:
         extrap_fill_value = np.nan
 
+    if separable:
+        values_interp = interp_linear_separable(
+            axes_known, values, axes_interp, extrap_fill_value
+        )
+        if not keep_dims:
+            values_interp = values_interp.ravel()
+
+        return values_interp
+
     if len(axes_known) == 1:
         # keep_dims has no effect for 1D interpolation
         return interp_linear_1d(
@@ -476,3 +660,287 @@ def interp(
         values_interp = values_interp.reshape([axis.size for axis in axes_interp])
 
     return values_interp
+
+
+@cache
+def _get_interp_linear_into():
+    register_interp_point_linear()
+
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def _interp_linear_into(
+        axes_known, values, points_interp, extrap_fill_value, values_interp
+    ):
+        # pylint: disable=not-an-iterable
+        for i in nb.prange(points_interp.shape[0]):
+            values_interp[i] = interp_point_linear(
+                axes_known, values, points_interp[i], extrap_fill_value
+            )
+
+    return _interp_linear_into
+
+
+def _check_axes_known(axes_known, values, minimum_axis_size=2):
+    if not 1 <= len(axes_known) == values.ndim <= 3:
+        raise ValueError(
+            f"axes_known (len {len(axes_known)}) must have one axis for each "
+            f"dimension of values (ndim {values.ndim}); either 1, 2, or 3"
+        )
+
+    for i, axis_known in enumerate(axes_known):
+        if not axis_known.ndim == 1:
+            raise ValueError(
+                f"axes_known[{i}] (shape {axis_known.shape}) must be a 1D array"
+            )
+        if not axis_known.size == values.shape[i]:
+            raise ValueError(
+                f"axes_known[{i}] (size {axis_known.size}) must match the size of the corresponding dimension of values ({values.shape[i]})"
+            )
+        if axis_known.size < minimum_axis_size:
+            raise ValueError(
+                f"axes_known[{i}] must contain at least {minimum_axis_size} points"
+            )
+
+        if not np.all(np.diff(axis_known) > 0):
+            raise ValueError(f"axes_known[{i}] is not monotonically ascending")
+
+
+def _is_evenly_spaced(axes_known):
+    for axis_known in axes_known:
+        diff = np.diff(axis_known)
+        if not np.allclose(diff, diff[0]):
+            return False
+
+    return True
+
+
+class Interpolator:
+    """A reusable interpolator of 1D, 2D, or 3D data on a rectilinear
+    grid.
+
+    The known axes are validated, and they and the values are converted
+    to contiguous ``float64`` buffers, only once on creation. For linear
+    interpolation on evenly spaced axes each call then goes straight to
+    the same ``numba`` kernel as :func:`interp`, giving identical results,
+    while optionally writing into a preallocated output buffer. This suits
+    repeated queries of the same data, such as interpolating the
+    evaluation dose at each distance step within gamma.
+
+    Axes that are not evenly spaced, such as those of a dose grid with an
+    irregular ``GridFrameOffsetVector``, are also supported, as are cubic
+    and monotone cubic interpolation. These utilise their own compiled
+    kernels, which match :class:`scipy.interpolate.RegularGridInterpolator`
+    with the same `method`.
+
+    Parameters
+    ----------
+    axes_known : Sequence[np.ndarray]
+        The ascending axes of the known data points.
+    values : np.ndarray
+        The known values at the points defined by `axes_known`.
+    bounds_error : bool, optional
+        If True, raise an error when interpolation is attempted outside the
+        bounds of the known data. Default is True.
+    extrap_fill_value : float, optional
+        The value to use for points outside the bounds of the known data
+        when `bounds_error` is False. Default is None, which results in
+        using np.nan.
+    skip_checks : bool, optional
+        If True, skip the validation of `axes_known`. Default is False.
+    method : str, optional
+        Either ``"linear"``, ``"cubic"`` for a not-a-knot cubic spline,
+        which requires at least four points along each axis, or
+        ``"pchip"`` for monotone cubic interpolation, which does not
+        overshoot the known values. Default is ``"linear"``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymedphys.interpolate import Interpolator
+    >>>
+    >>> x = np.linspace(0, 10, 11)
+    >>> y = np.linspace(0, 5, 6)
+    >>> interpolator = Interpolator((x, y), x[:, None] + 10 * y[None, :])
+    >>>
+    >>> interpolator([[0.5, 0.5], [9.5, 4.25]])
+    array([ 5.5, 52. ])
+    >>>
+    >>> values_interp = np.empty(2)
+    >>> _ = interpolator([[1, 1], [2, 2]], out=values_interp)
+    >>> values_interp
+    array([11., 22.])
+    >>>
+    >>> interpolator.grid([[0.5, 1.5], [1]])
+    array([[10.5],
+           [11.5]])
+    >>>
+    >>> z = np.array([0, 1, 2, 4, 8])
+    >>> cubic = Interpolator((z,), z**3, method="cubic")
+    >>> cubic([3, 6])
+    array([ 27., 216.])
+    """
+
+    def __init__(
+        self,
+        axes_known: Sequence["np.ndarray"],
+        values: "np.ndarray",
+        bounds_error=True,
+        extrap_fill_value=None,
+        skip_checks=False,
+        method="linear",
+    ):
+        if method not in rectilinear.METHODS:
+            raise ValueError(
+                f"Interpolation method '{method}' not recognised, must be one of "
+                f"{rectilinear.METHODS}"
+            )
+
+        self.axes_known = tuple(
+            np.ascontiguousarray(axis, dtype=np.float64) for axis in axes_known
+        )
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.method = method
+
+        if not skip_checks:
+            _check_axes_known(
+                self.axes_known,
+                self.values,
+                minimum_axis_size=rectilinear.MINIMUM_AXIS_SIZE[method],
+            )
+
+        self.origin = np.array([axis[0] for axis in self.axes_known])
+        self.end = np.array([axis[-1] for axis in self.axes_known])
+
+        self.bounds_error = bounds_error
+        if extrap_fill_value is None:
+            extrap_fill_value = np.nan
+        self.extrap_fill_value = float(extrap_fill_value)
+
+        self._knots = None
+        self._coefficients = None
+
+        # Linear interpolation on evenly spaced axes is that of interp
+        self._regular_linear = method == "linear" and _is_evenly_spaced(self.axes_known)
+
+        if self._regular_linear:
+            self._interp_into = self._interp_linear_into
+        else:
+            if method == "cubic":
+                self._knots, self._coefficients = rectilinear.bspline_coefficients(
+                    self.axes_known, self.values
+                )
+            self._interp_into = self._interp_rectilinear_into
+
+    @property
+    def ndim(self) -> int:
+        return len(self.axes_known)
+
+    def __call__(self, points_interp, out=None) -> "np.ndarray":
+        """Interpolate the values at a set of points.
+
+        Parameters
+        ----------
+        points_interp : np.ndarray
+            The coordinates of the points, with shape ``(..., d)``, where
+            d is the number of dimensions. For 1D data a shape of ``(n,)``
+            is also accepted.
+        out : np.ndarray, optional
+            A C-contiguous ``float64`` array, with the shape of
+            `points_interp` excluding its last axis, to write the
+            interpolated values into.
+
+        Returns
+        -------
+        np.ndarray
+            The interpolated values, with the shape of `points_interp`
+            excluding its last axis. This is `out` when provided.
+        """
+        points_interp = np.asarray(points_interp, dtype=np.float64)
+        if self.ndim == 1 and (points_interp.ndim == 1 or points_interp.shape[-1] != 1):
+            points_interp = points_interp[..., None]
+
+        if points_interp.shape[-1] != self.ndim:
+            raise ValueError(
+                f"points_interp (shape {points_interp.shape}) must have a last "
+                f"dimension of size {self.ndim}, one coordinate per axis"
+            )
+
+        shape = points_interp.shape[:-1]
+        flat_points_interp = np.ascontiguousarray(points_interp.reshape(-1, self.ndim))
+
+        if self.bounds_error and flat_points_interp.size != 0:
+            self._check_bounds(
+                flat_points_interp.min(axis=0), flat_points_interp.max(axis=0)
+            )
+
+        if out is None:
+            out = np.empty(shape, dtype=np.float64)
+        elif (
+            out.shape != shape or out.dtype != np.float64 or not out.flags.c_contiguous
+        ):
+            raise ValueError(
+                f"out must be a C-contiguous float64 array of shape {shape}"
+            )
+
+        self._interp_into(flat_points_interp, out.reshape(-1))
+
+        return out
+
+    def grid(self, axes_interp: Sequence["np.ndarray"], out=None) -> "np.ndarray":
+        """Interpolate the values on the grid defined by `axes_interp`.
+
+        Returns
+        -------
+        np.ndarray
+            The interpolated values, with a shape of the lengths of the
+            axes within `axes_interp`.
+        """
+        axes_interp = [np.asarray(axis, dtype=np.float64) for axis in axes_interp]
+
+        if not self._regular_linear or self.ndim == 1:
+            mgrids = np.meshgrid(*axes_interp, indexing="ij")
+
+            return self(np.stack(mgrids, axis=-1), out=out)
+
+        if len(axes_interp) != self.ndim:
+            raise ValueError(
+                f"axes_interp (len {len(axes_interp)}) must have one axis for "
+                f"each of the {self.ndim} dimensions"
+            )
+
+        if self.bounds_error and all(axis.size != 0 for axis in axes_interp):
+            self._check_bounds(
+                np.array([axis.min() for axis in axes_interp]),
+                np.array([axis.max() for axis in axes_interp]),
+            )
+
+        return interp_linear_separable(
+            self.axes_known, self.values, axes_interp, self.extrap_fill_value, out=out
+        )
+
+    def _check_bounds(self, minimum, maximum):
+        for i in np.where((minimum < self.origin) | (maximum > self.end))[0]:
+            raise ValueError(
+                f"""points_interp[:, {i}] must be within the range of axes_known[{i}]\n
+                ({minimum[i]}, {maximum[i]}) vs. ({self.origin[i]}, {self.end[i]})"""
+            )
+
+    def _interp_linear_into(self, points_interp, values_interp):
+        _get_interp_linear_into()(
+            self.axes_known,
+            self.values,
+            points_interp,
+            self.extrap_fill_value,
+            values_interp,
+        )
+
+    def _interp_rectilinear_into(self, points_interp, values_interp):
+        rectilinear.interp_into(
+            self.method,
+            self.axes_known,
+            self.values,
+            self._knots,
+            self._coefficients,
+            points_interp,
+            self.extrap_fill_value,
+            values_interp,
+        )
@@ -0,0 +1,438 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compiled interpolation of 1D, 2D, or 3D data on a rectilinear grid,
+where the known axes need not be evenly spaced.
+
+Linear and cubic interpolation are both a weighted sum of the known
+values, or spline coefficients, surrounding each point. The interval
+containing each coordinate is found by a binary search of its axis, and
+the weights are the products of a set of 1D weights along each axis.
+
+For cubic interpolation the coefficients of the tensor product, not-a-knot,
+cubic B-spline through the known values are solved for once, after which
+each point is a sum over its 4 x 4 x 4 neighbourhood of coefficients.
+
+Monotone cubic (PCHIP) interpolation is not linear in the known values,
+so it is instead applied as a 1D interpolation along each axis in turn,
+from the last axis to the first, over the neighbourhood of known values
+surrounding each point. The derivatives at each known value only depend
+upon its neighbours, so this gives the same result as interpolating each
+whole line of the grid, as is undertaken by
+:class:`scipy.interpolate.RegularGridInterpolator`.
+"""
+
+from functools import cache
+
+from pymedphys._imports import numba as nb, numpy as np, scipy
+
+METHODS = ("linear", "cubic", "pchip")
+
+# The minimum number of points along each axis required by each method
+MINIMUM_AXIS_SIZE = {"linear": 2, "cubic": 4, "pchip": 2}
+
+# The number of points handed to each thread at a time, so that the
+# scratch buffers are allocated once per chunk rather than once per point.
+_CHUNK_SIZE = 1024
+
+
+def bspline_coefficients(axes_known, values):
+    """Solve for the tensor product, not-a-knot, cubic B-spline that
+    passes through the known values.
+
+    Returns
+    -------
+    knots : tuple of np.ndarray
+        The knots along each axis.
+    coefficients : np.ndarray
+        The B-spline coefficients, with the same shape as `values`.
+    """
+    knots = []
+    coefficients = values
+
+    # Each pass solves along the leading axis, and then moves it to the
+    # end, so that after a pass for every axis they are back in order.
+    for axis_known in axes_known:
+        spline = scipy.interpolate.make_interp_spline(axis_known, coefficients, k=3)
+        knots.append(np.ascontiguousarray(spline.t, dtype=np.float64))
+        coefficients = np.moveaxis(spline.c, 0, -1)
+
+    return tuple(knots), np.ascontiguousarray(coefficients, dtype=np.float64)
+
+
+def interp_into(
+    method,
+    axes_known,
+    values,
+    knots,
+    coefficients,
+    points_interp,
+    extrap_fill_value,
+    values_interp,
+):
+    """Interpolate `points_interp`, with shape ``(n, d)``, writing the
+    results into `values_interp`.
+
+    `knots` and `coefficients` are only utilised by the ``"cubic"`` method,
+    and are those returned by :func:`bspline_coefficients`.
+    """
+    if method == "pchip":
+        _get_interp_pchip_into()(
+            axes_known,
+            values.ravel(),
+            _element_strides(values),
+            points_interp,
+            extrap_fill_value,
+            values_interp,
+        )
+    elif method == "cubic":
+        _get_interp_weighted_into()(
+            axes_known,
+            knots,
+            coefficients.ravel(),
+            _element_strides(coefficients),
+            True,
+            points_interp,
+            extrap_fill_value,
+            values_interp,
+        )
+    elif method == "linear":
+        _get_interp_weighted_into()(
+            axes_known,
+            axes_known,
+            values.ravel(),
+            _element_strides(values),
+            False,
+            points_interp,
+            extrap_fill_value,
+            values_interp,
+        )
+    else:
+        raise ValueError(
+            f"Interpolation method '{method}' not recognised, must be one of {METHODS}"
+        )
+
+
+def _element_strides(array):
+    return np.array(array.strides, dtype=np.int64) // array.itemsize
+
+
+@cache
+def _get_find_interval():
+    @nb.njit(cache=True)
+    def find_interval(axis, point, lowest, highest):
+        """Binary search for the index ``i`` of an ascending axis for which
+        ``axis[i] <= point < axis[i + 1]``, clipped to within
+        ``[lowest, highest]``."""
+        low = lowest
+        high = highest + 1
+        while high - low > 1:
+            middle = (low + high) // 2
+            if axis[middle] <= point:
+                low = middle
+            else:
+                high = middle
+
+        return low
+
+    return find_interval
+
+
+@cache
+def _get_interp_weighted_into():
+    find_interval = _get_find_interval()
+
+    @nb.njit(cache=True)
+    def linear_weights(axis, point, weights):
+        index = find_interval(axis, point, 0, axis.size - 2)
+
+        weight = (point - axis[index]) / (axis[index + 1] - axis[index])
+        weights[0] = 1 - weight
+        weights[1] = weight
+
+        return index
+
+    @nb.njit(cache=True)
+    def cubic_bspline_weights(knots, point, weights, left, right):
+        """The four non-zero cubic B-spline basis functions at `point`,
+        by the Cox-de Boor recursion."""
+        number_of_coefficients = knots.size - 4
+
+        interval = find_interval(knots, point, 3, number_of_coefficients - 1)
+
+        weights[0] = 1.0
+        for j in range(1, 4):
+            left[j] = point - knots[interval + 1 - j]
+            right[j] = knots[interval + j] - point
+            saved = 0.0
+            for r in range(j):
+                term = weights[r] / (right[r + 1] + left[j - r])
+                weights[r] = saved + right[r + 1] * term
+                saved = left[j - r] * term
+            weights[j] = saved
+
+        return interval - 3
+
+    @nb.njit(parallel=True, cache=True)
+    def _interp_weighted_into(
+        axes_known,
+        knots,
+        coefficients,
+        strides,
+        cubic,
+        points_interp,
+        extrap_fill_value,
+        values_interp,
+    ):
+        number_of_points, ndim = points_interp.shape
+        stencil_size = 4 if cubic else 2
+        number_of_chunks = (number_of_points + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+
+        # pylint: disable=not-an-iterable
+        for chunk in nb.prange(number_of_chunks):
+            starts = np.empty(ndim, dtype=np.int64)
+            flat_offsets = np.empty((ndim, 4), dtype=np.int64)
+            weights = np.empty((ndim, 4))
+            left = np.empty(4)
+            right = np.empty(4)
+
+            for i in range(
+                chunk * _CHUNK_SIZE, min((chunk + 1) * _CHUNK_SIZE, number_of_points)
+            ):
+                within_bounds = True
+                for axis_index in range(ndim):
+                    axis = axes_known[axis_index]
+                    point = points_interp[i, axis_index]
+                    if not axis[0] <= point <= axis[-1]:
+                        within_bounds = False
+                        break
+
+                    if cubic:
+                        starts[axis_index] = cubic_bspline_weights(
+                            knots[axis_index], point, weights[axis_index], left, right
+                        )
+                    else:
+                        starts[axis_index] = linear_weights(
+                            axis, point, weights[axis_index]
+                        )
+
+                if not within_bounds:
+                    values_interp[i] = extrap_fill_value
+                    continue
+
+                for axis_index in range(ndim):
+                    for offset in range(stencil_size):
+                        flat_offsets[axis_index, offset] = (
+                            starts[axis_index] + offset
+                        ) * strides[axis_index]
+
+                total = 0.0
+                if ndim == 1:
+                    for a in range(stencil_size):
+                        total += weights[0, a] * coefficients[flat_offsets[0, a]]
+                elif ndim == 2:
+                    for a in range(stencil_size):
+                        partial = 0.0
+                        for b in range(stencil_size):
+                            partial += (
+                                weights[1, b]
+                                * coefficients[flat_offsets[0, a] + flat_offsets[1, b]]
+                            )
+                        total += weights[0, a] * partial
+                else:
+                    for a in range(stencil_size):
+                        partial = 0.0
+                        for b in range(stencil_size):
+                            row = flat_offsets[0, a] + flat_offsets[1, b]
+                            innermost = 0.0
+                            for c in range(stencil_size):
+                                innermost += (
+                                    weights[2, c]
+                                    * coefficients[row + flat_offsets[2, c]]
+                                )
+                            partial += weights[1, b] * innermost
+                        total += weights[0, a] * partial
+
+                values_interp[i] = total
+
+    return _interp_weighted_into
+
+
+@cache
+def _get_interp_pchip_into():
+    find_interval = _get_find_interval()
+
+    @nb.njit(cache=True)
+    def sign(value):
+        if value > 0:
+            return 1
+        if value < 0:
+            return -1
+        return 0
+
+    @nb.njit(cache=True)
+    def edge_derivative(h0, h1, m0, m1):
+        """The one-sided three point estimate of the derivative at the
+        end of an axis, limited so as to preserve its shape."""
+        derivative = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+
+        if sign(derivative) != sign(m0):
+            return 0.0
+        if sign(m0) != sign(m1) and abs(derivative) > 3 * abs(m0):
+            return 3 * m0
+
+        return derivative
+
+    @nb.njit(cache=True)
+    def derivative(axis, y, base, k):
+        """The derivative at ``axis[k]``, where the known value there is
+        ``y[base + k]``."""
+        axis_size = axis.size
+        if axis_size == 2:
+            return (y[base + 1] - y[base]) / (axis[1] - axis[0])
+
+        if k == 0:
+            h0 = axis[1] - axis[0]
+            h1 = axis[2] - axis[1]
+            return edge_derivative(
+                h0, h1, (y[base + 1] - y[base]) / h0, (y[base + 2] - y[base + 1]) / h1
+            )
+
+        if k == axis_size - 1:
+            h0 = axis[k] - axis[k - 1]
+            h1 = axis[k - 1] - axis[k - 2]
+            return edge_derivative(
+                h0,
+                h1,
+                (y[base + k] - y[base + k - 1]) / h0,
+                (y[base + k - 1] - y[base + k - 2]) / h1,
+            )
+
+        h_before = axis[k] - axis[k - 1]
+        h_after = axis[k + 1] - axis[k]
+        m_before = (y[base + k] - y[base + k - 1]) / h_before
+        m_after = (y[base + k + 1] - y[base + k]) / h_after
+
+        if m_before == 0 or m_after == 0 or sign(m_before) != sign(m_after):
+            return 0.0
+
+        w1 = 2 * h_after + h_before
+        w2 = h_after + 2 * h_before
+
+        return (w1 + w2) / (w1 / m_before + w2 / m_after)
+
+    @nb.njit(cache=True)
+    def pchip_1d(axis, interval, point, y, base):
+        """Interpolate `point` within ``axis[interval:interval + 2]``,
+        where the known value at ``axis[k]`` is ``y[base + k]``."""
+        d0 = derivative(axis, y, base, interval)
+        d1 = derivative(axis, y, base, interval + 1)
+
+        h = axis[interval + 1] - axis[interval]
+        t = (point - axis[interval]) / h
+        t2 = t * t
+        t3 = t2 * t
+
+        return (
+            (2 * t3 - 3 * t2 + 1) * y[base + interval]
+            + (t3 - 2 * t2 + t) * h * d0
+            + (-2 * t3 + 3 * t2) * y[base + interval + 1]
+            + (t3 - t2) * h * d1
+        )
+
+    @nb.njit(parallel=True, cache=True)
+    def _interp_pchip_into(
+        axes_known, values, strides, points_interp, extrap_fill_value, values_interp
+    ):
+        number_of_points, ndim = points_interp.shape
+        number_of_chunks = (number_of_points + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+
+        # pylint: disable=not-an-iterable
+        for chunk in nb.prange(number_of_chunks):
+            intervals = np.empty(ndim, dtype=np.int64)
+            starts = np.empty(ndim, dtype=np.int64)
+            counts = np.empty(ndim, dtype=np.int64)
+            flat_offsets = np.empty((ndim, 4), dtype=np.int64)
+            neighbourhood = np.empty(4**ndim)
+
+            for i in range(
+                chunk * _CHUNK_SIZE, min((chunk + 1) * _CHUNK_SIZE, number_of_points)
+            ):
+                within_bounds = True
+                size = 1
+                for axis_index in range(ndim):
+                    axis = axes_known[axis_index]
+                    point = points_interp[i, axis_index]
+                    if not axis[0] <= point <= axis[-1]:
+                        within_bounds = False
+                        break
+
+                    interval = find_interval(axis, point, 0, axis.size - 2)
+
+                    start = max(interval - 1, 0)
+                    stop = min(interval + 2, axis.size - 1)
+
+                    intervals[axis_index] = interval
+                    starts[axis_index] = start
+                    counts[axis_index] = stop - start + 1
+                    size *= stop - start + 1
+
+                if not within_bounds:
+                    values_interp[i] = extrap_fill_value
+                    continue
+
+                # Gather the known values surrounding the point, with the
+                # last axis varying fastest.
+                for axis_index in range(ndim):
+                    for offset in range(counts[axis_index]):
+                        flat_offsets[axis_index, offset] = (
+                            starts[axis_index] + offset
+                        ) * strides[axis_index]
+
+                if ndim == 1:
+                    for a in range(counts[0]):
+                        neighbourhood[a] = values[flat_offsets[0, a]]
+                elif ndim == 2:
+                    for a in range(counts[0]):
+                        for b in range(counts[1]):
+                            neighbourhood[a * counts[1] + b] = values[
+                                flat_offsets[0, a] + flat_offsets[1, b]
+                            ]
+                else:
+                    for a in range(counts[0]):
+                        for b in range(counts[1]):
+                            row = flat_offsets[0, a] + flat_offsets[1, b]
+                            first = (a * counts[1] + b) * counts[2]
+                            for c in range(counts[2]):
+                                neighbourhood[first + c] = values[
+                                    row + flat_offsets[2, c]
+                                ]
+
+                # Then collapse them one axis at a time, from the last.
+                for axis_index in range(ndim - 1, -1, -1):
+                    count = counts[axis_index]
+                    size //= count
+                    for line in range(size):
+                        neighbourhood[line] = pchip_1d(
+                            axes_known[axis_index],
+                            intervals[axis_index],
+                            points_interp[i, axis_index],
+                            neighbourhood,
+                            line * count - starts[axis_index],
+                        )
+
+                values_interp[i] = neighbourhood[0]
+
+    return _interp_pchip_into
@@ -0,0 +1,224 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Accumulate a MetersetMap as the control points of a delivery arrive."""
+
+import threading
+
+from pymedphys._imports import numpy as np
+
+from pymedphys._icom.delivery import get_delivery_data_items
+
+from .metersetmap import __DEFAULT_GRID_RESOLUTION as DEFAULT_GRID_RESOLUTION
+from .metersetmap import __DEFAULT_LEAF_PAIR_WIDTHS as DEFAULT_LEAF_PAIR_WIDTHS
+from .metersetmap import __DEFAULT_MAX_LEAF_GAP as DEFAULT_MAX_LEAF_GAP
+from .metersetmap import __DEFAULT_MIN_STEP_PER_PIXEL as DEFAULT_MIN_STEP_PER_PIXEL
+from .metersetmap import (
+    _check_max_leaf_gap,
+    _check_mlc_within_max_leaf_gap,
+    calc_single_control_point,
+    get_grid,
+)
+
+
+class MetersetMapAccumulator:
+    """A MetersetMap that is updated as each control point arrives.
+
+    Each new control point only requires the MetersetMap of the segment
+    between it and the previous control point to be calculated, which is
+    added in place to the full grid. This allows the MetersetMap of a
+    delivery to be followed live, for example from an iCOM stream, with
+    the complete MetersetMap available as soon as the beam ends.
+
+    The result, once all control points have been added, is the same as
+    that of :func:`pymedphys.metersetmap.calculate`. As with iCOM
+    deliveries, a decrease in the meterset, such as when the Linac resets
+    it for a new beam, is treated as no MU being delivered.
+
+    Snapshots may be taken from a different thread than the one adding
+    control points.
+
+    Parameters
+    ----------
+    grid_resolution, max_leaf_gap, leaf_pair_widths, min_step_per_pixel : optional
+        As for :func:`pymedphys.metersetmap.calculate`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymedphys.experimental import MetersetMapAccumulator
+    >>>
+    >>> accumulator = MetersetMapAccumulator(
+    ...     max_leaf_gap=10, leaf_pair_widths=(5, 5, 5))
+    >>> accumulator.add(0, [[1, 1], [2, 2], [3, 3]], [7.5, 7.5])
+    >>> accumulator.add(2, [[2, 2], [3, 3], [4, 4]], [7.5, 7.5])
+    >>> accumulator.mu
+    2.0
+    >>> metersetmap = accumulator.snapshot()
+    >>> metersetmap.shape
+    (17, 11)
+    """
+
+    def __init__(
+        self,
+        grid_resolution=None,
+        max_leaf_gap=None,
+        leaf_pair_widths=None,
+        min_step_per_pixel=None,
+    ):
+        if grid_resolution is None:
+            grid_resolution = DEFAULT_GRID_RESOLUTION
+
+        if max_leaf_gap is None:
+            max_leaf_gap = DEFAULT_MAX_LEAF_GAP
+
+        if leaf_pair_widths is None:
+            leaf_pair_widths = DEFAULT_LEAF_PAIR_WIDTHS
+
+        if min_step_per_pixel is None:
+            min_step_per_pixel = DEFAULT_MIN_STEP_PER_PIXEL
+
+        _check_max_leaf_gap(max_leaf_gap, grid_resolution)
+
+        self.grid_resolution = grid_resolution
+        self.max_leaf_gap = max_leaf_gap
+        self.leaf_pair_widths = np.array(leaf_pair_widths)
+        self.min_step_per_pixel = min_step_per_pixel
+
+        self.grid = get_grid(max_leaf_gap, grid_resolution, self.leaf_pair_widths)
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all of the control points added so far."""
+        with self._lock:
+            self._metersetmap = np.zeros((len(self.grid["jaw"]), len(self.grid["mlc"])))
+            self._mu = 0.0
+            self._previous = None
+            self._number_of_control_points = 0
+
+    @property
+    def mu(self):
+        """The MU delivered across the control points added so far."""
+        return float(self._mu)
+
+    def __len__(self):
+        return self._number_of_control_points
+
+    def add(self, mu, mlc, jaw):
+        """Add one or more control points.
+
+        Parameters
+        ----------
+        mu : float or numpy.ndarray
+            The meterset of each control point, as reported by the Linac.
+        mlc : numpy.ndarray
+            The MLC positions, either of a single control point with
+            the shape (mlc pair, leaf bank), or with an additional
+            leading control point axis.
+        jaw : numpy.ndarray
+            The jaw positions, either of a single control point with the
+            shape (jaw bank,), or with an additional leading control
+            point axis.
+        """
+        mu = np.atleast_1d(np.asarray(mu, dtype=float))
+        mlc = np.asarray(mlc, dtype=float)
+        jaw = np.asarray(jaw, dtype=float)
+
+        if mlc.ndim == 2:
+            mlc = mlc[None, :, :]
+        if jaw.ndim == 1:
+            jaw = jaw[None, :]
+
+        if not len(mu) == len(mlc) == len(jaw):
+            raise ValueError(
+                "The number of control points within mu, mlc, and jaw differ"
+            )
+
+        _check_mlc_within_max_leaf_gap(mlc, self.max_leaf_gap)
+
+        for control_point in zip(mu, mlc, jaw):
+            self._add_control_point(*control_point)
+
+    def add_icom_frame(self, single_icom_stream: bytes):
+        """Add the control point within a single iCOM frame.
+
+        Frames which do not report a meterset are skipped.
+        """
+        meterset, _, _, mlc, jaw = get_delivery_data_items(single_icom_stream)
+
+        if meterset is not None:
+            self.add(meterset, mlc, jaw)
+
+    def snapshot(self):
+        """A copy of the MetersetMap of the control points added so far.
+
+        Returns
+        -------
+        metersetmap : numpy.ndarray
+            Indexed by the ``"jaw"`` and ``"mlc"`` axes of
+            :attr:`grid`.
+        """
+        with self._lock:
+            return self._metersetmap.copy()
+
+    def _add_control_point(self, mu, mlc, jaw):
+        delivered_mu = 0.0
+        location = None
+
+        if self._previous is not None:
+            previous_mu, previous_mlc, previous_jaw = self._previous
+            delivered_mu = max(mu - previous_mu, 0.0)
+
+            if delivered_mu != 0:
+                grid, metersetmap_of_segment = calc_single_control_point(
+                    np.stack([previous_mlc, mlc]),
+                    np.stack([previous_jaw, jaw]),
+                    delivered_mu,
+                    leaf_pair_widths=self.leaf_pair_widths,
+                    grid_resolution=self.grid_resolution,
+                    min_step_per_pixel=self.min_step_per_pixel,
+                )
+                location = self._segment_location(grid, metersetmap_of_segment.shape)
+
+        with self._lock:
+            if location is not None:
+                full_grid_slices, segment_slices = location
+                self._metersetmap[full_grid_slices] += metersetmap_of_segment[
+                    segment_slices
+                ]
+
+            self._mu += delivered_mu
+            self._previous = (mu, mlc, jaw)
+            self._number_of_control_points += 1
+
+    def _segment_location(self, grid, shape):
+        """The slices of the full grid, and of a segment's grid, over
+        which the two overlap."""
+        full_grid_slices = []
+        segment_slices = []
+
+        for axis, length in zip(("jaw", "mlc"), shape):
+            offset = int(
+                np.round((grid[axis][0] - self.grid[axis][0]) / self.grid_resolution)
+            )
+            start = min(max(offset, 0), len(self.grid[axis]))
+            stop = max(min(offset + length, len(self.grid[axis])), start)
+
+            full_grid_slices.append(slice(start, stop))
+            segment_slices.append(slice(start - offset, stop - offset))
+
+        return tuple(full_grid_slices), tuple(segment_slices)
@@ -0,0 +1,335 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A two tier cache of calculated MetersetMaps.
+
+Each MetersetMap is keyed by the SHA1 hash of the delivery arrays it was
+calculated from, the calculation parameters, and the PyMedPhys version.
+Recently used MetersetMaps are held within an in-memory least recently
+used cache, backed by ``.npy`` files on disk which persist between
+sessions. Disk entries are evicted least recently used first, by file
+modification time, once the directory exceeds its maximum size.
+"""
+
+import collections
+import hashlib
+import logging
+import os
+import pathlib
+import threading
+from typing import Any, Dict
+
+from pymedphys._imports import numpy as np
+
+from pymedphys import _config as pmp_config
+from pymedphys._version import __version__
+
+from .metersetmap import __DEFAULT_GRID_RESOLUTION as DEFAULT_GRID_RESOLUTION
+from .metersetmap import __DEFAULT_LEAF_PAIR_WIDTHS as DEFAULT_LEAF_PAIR_WIDTHS
+from .metersetmap import __DEFAULT_MAX_LEAF_GAP as DEFAULT_MAX_LEAF_GAP
+from .metersetmap import __DEFAULT_MIN_STEP_PER_PIXEL as DEFAULT_MIN_STEP_PER_PIXEL
+from .metersetmap import calc_metersetmap
+
+DEFAULT_MAXIMUM_MEMORY_SIZE = 256 * 2**20  # 256 MiB
+DEFAULT_MAXIMUM_SIZE = 2**30  # 1 GiB
+
+
+def get_cache_directory() -> pathlib.Path:
+    cache_directory = pmp_config.get_config_dir().joinpath("cache", "metersetmap")
+    cache_directory.mkdir(parents=True, exist_ok=True)
+
+    return cache_directory
+
+
+class MetersetMapCache:
+    """Calculate MetersetMaps, reusing any previously calculated from
+    identical delivery arrays and parameters.
+
+    Parameters
+    ----------
+    directory : os.PathLike, optional
+        Where the ``.npy`` files are stored. Defaults to
+        ``~/.pymedphys/cache/metersetmap``.
+    maximum_memory_size : int, optional
+        The size in bytes above which least recently used MetersetMaps are
+        dropped from memory. Defaults to 256 MiB.
+    maximum_size : int, optional
+        The size in bytes above which least recently used ``.npy`` files
+        are removed from the directory. Defaults to 1 GiB.
+
+    Examples
+    --------
+    >>> import pymedphys
+    >>> from pymedphys.experimental import MetersetMapCache
+    >>>
+    >>> def cached_metersetmap(trf_path):
+    ...     cache = MetersetMapCache()
+    ...     delivery = pymedphys.Delivery.from_trf(trf_path)
+    ...
+    ...     return delivery.metersetmap(cache=cache)
+    >>>
+    >>> cached_metersetmap("a/path/goes/here.trf")  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        directory=None,
+        maximum_memory_size: int = DEFAULT_MAXIMUM_MEMORY_SIZE,
+        maximum_size: int = DEFAULT_MAXIMUM_SIZE,
+    ):
+        if directory is None:
+            directory = get_cache_directory()
+        else:
+            directory = pathlib.Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self.directory = directory
+        self.maximum_memory_size = maximum_memory_size
+        self.maximum_size = maximum_size
+
+        self._memory: "collections.OrderedDict[str, np.ndarray]" = (
+            collections.OrderedDict()
+        )
+        self._memory_size = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def metersetmap(
+        self,
+        mu,
+        mlc,
+        jaw,
+        grid_resolution=None,
+        max_leaf_gap=None,
+        leaf_pair_widths=None,
+        min_step_per_pixel=None,
+        engine="numpy",
+    ):
+        """As :func:`pymedphys.metersetmap.calculate`, reusing any cached
+        result.
+
+        Returns
+        -------
+        metersetmap : numpy.ndarray
+            A copy of the cached MetersetMap, so that it may be modified
+            without affecting the cache.
+        """
+        parameters = _resolve_parameters(
+            grid_resolution, max_leaf_gap, leaf_pair_widths, min_step_per_pixel
+        )
+        key = _hash_inputs(mu, mlc, jaw, parameters, engine)
+
+        metersetmap = self._get(key)
+        if metersetmap is None:
+            metersetmap = calc_metersetmap(
+                mu, mlc, jaw, **parameters, engine=engine
+            ).astype(np.float64, copy=False)
+            self._put(key, metersetmap)
+
+        return metersetmap.copy()
+
+    def stats(self) -> Dict[str, Any]:
+        """The hit and miss counts, and the contents of each tier."""
+        disk_entries = self._list_disk_entries()
+
+        with self._lock:
+            return {
+                "directory": str(self.directory),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "memory_size": self._memory_size,
+                "disk_entries": len(disk_entries),
+                "disk_size": sum(path.stat().st_size for path in disk_entries),
+            }
+
+    def clear(self, disk=True):
+        """Remove every cached MetersetMap, and reset the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self.memory_hits = self.disk_hits = self.misses = 0
+
+        if disk:
+            for path in self._list_disk_entries():
+                path.unlink(missing_ok=True)
+
+    def prune(self):
+        """Remove the least recently used ``.npy`` files until the
+        directory is no larger than ``maximum_size``.
+
+        Returns
+        -------
+        evicted : List[pathlib.Path]
+            The files that were removed.
+        """
+        paths = []
+        for path in self._list_disk_entries():
+            try:
+                paths.append((path.stat(), path))
+            except FileNotFoundError:
+                pass
+
+        paths.sort(key=lambda item: item[0].st_mtime)
+        total_size = sum(stat.st_size for stat, _ in paths)
+        evicted = []
+
+        for stat, path in paths:
+            if total_size <= self.maximum_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
+            evicted.append(path)
+
+        return evicted
+
+    def _get(self, key):
+        with self._lock:
+            try:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                logging.debug("MetersetMap memory cache hit for %(key)s", {"key": key})
+
+                return self._memory[key]
+            except KeyError:
+                pass
+
+        path = self._disk_path(key)
+        try:
+            metersetmap = np.load(path)
+        except (FileNotFoundError, ValueError, EOFError):
+            with self._lock:
+                self.misses += 1
+            logging.debug("MetersetMap cache miss for %(key)s", {"key": key})
+
+            return None
+
+        # The file modification time records when it was last used,
+        # providing the ordering for least recently used eviction.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            self.disk_hits += 1
+        logging.debug("MetersetMap disk cache hit for %(key)s", {"key": key})
+
+        self._put_in_memory(key, metersetmap)
+
+        return metersetmap
+
+    def _put(self, key, metersetmap):
+        path = self._disk_path(key)
+        temporary_path = path.with_name(f".{path.name}.{os.getpid()}")
+
+        # Files are written under a temporary name and then moved into
+        # place so that a partially written file is never read.
+        with open(temporary_path, "wb") as f:
+            np.save(f, metersetmap)
+        os.replace(temporary_path, path)
+
+        self.prune()
+        self._put_in_memory(key, metersetmap)
+
+    def _put_in_memory(self, key, metersetmap):
+        if metersetmap.nbytes > self.maximum_memory_size:
+            return
+
+        with self._lock:
+            if key in self._memory:
+                return
+
+            self._memory[key] = metersetmap
+            self._memory_size += metersetmap.nbytes
+
+            while self._memory_size > self.maximum_memory_size:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= evicted.nbytes
+
+    def _disk_path(self, key) -> pathlib.Path:
+        return self.directory.joinpath(f"{key}.npy")
+
+    def _list_disk_entries(self):
+        return [
+            path
+            for path in self.directory.glob("*.npy")
+            if not path.name.startswith(".")
+        ]
+
+
+_DEFAULT_CACHE = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_default_cache() -> MetersetMapCache:
+    """The cache utilised by ``Delivery.metersetmap(cache=True)``, shared
+    across the process and stored within the default directory."""
+    global _DEFAULT_CACHE  # pylint: disable = global-statement
+
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = MetersetMapCache()
+
+    return _DEFAULT_CACHE
+
+
+def _resolve_parameters(
+    grid_resolution, max_leaf_gap, leaf_pair_widths, min_step_per_pixel
+):
+    """Fill in the default parameters, so that passing a default value
+    explicitly gives the same cache key as leaving it out."""
+    if grid_resolution is None:
+        grid_resolution = DEFAULT_GRID_RESOLUTION
+
+    if max_leaf_gap is None:
+        max_leaf_gap = DEFAULT_MAX_LEAF_GAP
+
+    if leaf_pair_widths is None:
+        leaf_pair_widths = DEFAULT_LEAF_PAIR_WIDTHS
+
+    if min_step_per_pixel is None:
+        min_step_per_pixel = DEFAULT_MIN_STEP_PER_PIXEL
+
+    return {
+        "grid_resolution": grid_resolution,
+        "max_leaf_gap": max_leaf_gap,
+        "leaf_pair_widths": leaf_pair_widths,
+        "min_step_per_pixel": min_step_per_pixel,
+    }
+
+
+def _hash_inputs(mu, mlc, jaw, parameters, engine) -> str:
+    sha1 = hashlib.sha1()
+    sha1.update(__version__.encode())
+
+    for array in (mu, mlc, jaw):
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        sha1.update(str(array.shape).encode())
+        sha1.update(array.tobytes())
+
+    described_parameters = {
+        key: np.asarray(value, dtype=np.float64).tolist()
+        for key, value in parameters.items()
+    }
+    sha1.update(repr(sorted(described_parameters.items())).encode())
+    sha1.update(engine.encode())
+
+    return sha1.hexdigest()
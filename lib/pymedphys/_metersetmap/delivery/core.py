@@ -16,6 +16,7 @@
 from pymedphys._base.delivery import DeliveryBase
 from pymedphys._vendor.deprecated import deprecated as _deprecated
 
+from ..cache import get_default_cache
 from ..metersetmap import calc_metersetmap
 
 
@@ -29,7 +30,30 @@ class DeliveryMetersetMap(DeliveryBase):
         leaf_pair_widths=None,
         min_step_per_pixel=None,
         output_always_list=False,
+        engine="numpy",
+        cache=False,
     ):
+        """Calculate the MetersetMap of the delivery, see
+        :func:`pymedphys.metersetmap.calculate`.
+
+        Parameters
+        ----------
+        cache : bool or MetersetMapCache, optional
+            Reuse any MetersetMap previously calculated from identical
+            delivery data and parameters. If ``True`` the shared on-disk
+            cache from ``~/.pymedphys/cache/metersetmap`` is utilised,
+            alternatively a specific
+            :class:`pymedphys.experimental.MetersetMapCache` may be
+            provided. Defaults to ``False``.
+        """
+        if cache is True:
+            cache = get_default_cache()
+
+        if cache:
+            calculate = cache.metersetmap
+        else:
+            calculate = calc_metersetmap
+
         if gantry_angles is None:
             gantry_angles = 0
             gantry_tolerance = 500
@@ -45,7 +69,7 @@ class DeliveryMetersetMap(DeliveryBase):
         metersetmaps = []
         for delivery_data in masked_by_gantry:
             metersetmaps.append(
-                calc_metersetmap(
+                calculate(
                     delivery_data.monitor_units,
                     delivery_data.mlc,
                     delivery_data.jaw,
@@ -53,6 +77,7 @@ class DeliveryMetersetMap(DeliveryBase):
                     max_leaf_gap=max_leaf_gap,
                     leaf_pair_widths=leaf_pair_widths,
                     min_step_per_pixel=min_step_per_pixel,
+                    engine=engine,
                 )
             )
 
@@ -14,6 +14,9 @@
 
 # pylint: disable=C0103,C1801
 
+from functools import cache
+
+from pymedphys._imports import numba as nb
 from pymedphys._imports import numpy as np
 from pymedphys._imports import plt
 
@@ -27,6 +30,8 @@ __DEFAULT_GRID_RESOLUTION = 1
 __DEFAULT_MAX_LEAF_GAP = 400
 __DEFAULT_MIN_STEP_PER_PIXEL = 10
 
+ENGINES = ("numpy", "numba", "analytic")
+
 
 def calc_metersetmap(
     mu,
@@ -36,6 +41,7 @@ def calc_metersetmap(
     max_leaf_gap=None,
     leaf_pair_widths=None,
     min_step_per_pixel=None,
+    engine="numpy",
 ):
     """Determine the MetersetMap.
 
@@ -77,6 +83,24 @@ def calc_metersetmap(
         The minimum number of time steps
         used per pixel for each control point. Defaults to 10.
 
+    engine : str, optional
+        One of ``"numpy"``, ``"numba"`` or ``"analytic"``. The
+        ``"numpy"`` engine calculates each pair of control points on its
+        own grid, which is then placed within the full grid and summed.
+        The ``"numba"`` engine instead accumulates every pair of control
+        points directly into the full grid within a compiled kernel, only
+        visiting the pixels between each leaf pair at each time step.
+        Both engines sample the same time steps and give the same result
+        to within floating point precision.
+
+        The ``"analytic"`` engine does not sample time steps at all. As
+        the leaves and jaws travel linearly between control points, the
+        fraction of each pixel left open by a device is piecewise linear
+        in time. The open fraction of each pixel is therefore integrated
+        exactly, and ``min_step_per_pixel`` is ignored. The sampled
+        engines converge to this result as ``min_step_per_pixel``
+        increases. Defaults to ``"numpy"``.
+
     Returns
     -------
     metersetmap : numpy.ndarray
@@ -198,32 +222,31 @@ def calc_metersetmap(
     if min_step_per_pixel is None:
         min_step_per_pixel = __DEFAULT_MIN_STEP_PER_PIXEL
 
-    divisibility_of_max_leaf_gap = np.array(max_leaf_gap / 2 / grid_resolution)
-    max_leaf_gap_is_divisible = (
-        divisibility_of_max_leaf_gap.astype(int) == divisibility_of_max_leaf_gap
-    )
+    if engine not in ENGINES:
+        raise ValueError(f"MetersetMap engine '{engine}' not recognised")
 
-    if not max_leaf_gap_is_divisible:
-        raise ValueError(
-            "The grid resolution needs to be able to divide the max leaf gap exactly by"
-            " four"
-        )
+    _check_max_leaf_gap(max_leaf_gap, grid_resolution)
 
     leaf_pair_widths = np.array(leaf_pair_widths)
 
-    if not np.max(np.abs(mlc)) <= max_leaf_gap / 2:  # pylint: disable = unneeded-not
-        first_failing_control_point = np.where(np.abs(mlc) > max_leaf_gap / 2)[0][0]
-
-        raise ValueError(
-            "The mlc should not travel further out than half the maximum leaf gap.\n"
-            "The first failing control point has the following positions:\n"
-            f"{np.array(mlc)[first_failing_control_point, :, :]}"
-        )
+    _check_mlc_within_max_leaf_gap(mlc, max_leaf_gap)
 
     mu, mlc, jaw = remove_irrelevant_control_points(mu, mlc, jaw)
 
     full_grid = get_grid(max_leaf_gap, grid_resolution, leaf_pair_widths)
 
+    if engine != "numpy":
+        return _calc_metersetmap_compiled(
+            mu,
+            mlc,
+            jaw,
+            full_grid,
+            leaf_pair_widths,
+            grid_resolution,
+            min_step_per_pixel,
+            engine,
+        )
+
     metersetmap = np.zeros((len(full_grid["jaw"]), len(full_grid["mlc"])))
 
     for i in range(len(mu) - 1):
@@ -300,21 +323,7 @@ def calc_single_control_point(
     jaw = np.array(jaw, copy=False)
 
     leaf_pair_widths = np.array(leaf_pair_widths)
-    leaf_division = leaf_pair_widths / grid_resolution
-
-    if not np.all(leaf_division.astype(int) == leaf_division):
-        raise ValueError(
-            "The grid resolution needs to exactly divide every leaf pair width."
-        )
-
-    if (
-        not np.max(np.abs(jaw))  # pylint: disable = unneeded-not
-        <= np.sum(leaf_pair_widths) / 2
-    ):
-        raise ValueError(
-            "The jaw should not travel further out than the maximum leaf limits. "
-            f"Max travel was {np.max(np.abs(jaw))}"
-        )
+    _check_leaf_pair_widths_and_jaw(jaw, leaf_pair_widths, grid_resolution)
 
     (grid, grid_leaf_map, mlc) = _determine_calc_grid_and_adjustments(
         mlc, jaw, leaf_pair_widths, grid_resolution
@@ -344,6 +353,505 @@ def calc_single_control_point(
     return grid, metersetmap
 
 
+def _check_max_leaf_gap(max_leaf_gap, grid_resolution):
+    divisibility_of_max_leaf_gap = np.array(max_leaf_gap / 2 / grid_resolution)
+    max_leaf_gap_is_divisible = (
+        divisibility_of_max_leaf_gap.astype(int) == divisibility_of_max_leaf_gap
+    )
+
+    if not max_leaf_gap_is_divisible:
+        raise ValueError(
+            "The grid resolution needs to be able to divide the max leaf gap exactly by"
+            " four"
+        )
+
+
+def _check_mlc_within_max_leaf_gap(mlc, max_leaf_gap):
+    if not np.max(np.abs(mlc)) <= max_leaf_gap / 2:  # pylint: disable = unneeded-not
+        first_failing_control_point = np.where(np.abs(mlc) > max_leaf_gap / 2)[0][0]
+
+        raise ValueError(
+            "The mlc should not travel further out than half the maximum leaf gap.\n"
+            "The first failing control point has the following positions:\n"
+            f"{np.array(mlc)[first_failing_control_point, :, :]}"
+        )
+
+
+def _check_leaf_pair_widths_and_jaw(jaw, leaf_pair_widths, grid_resolution):
+    leaf_division = leaf_pair_widths / grid_resolution
+
+    if not np.all(leaf_division.astype(int) == leaf_division):
+        raise ValueError(
+            "The grid resolution needs to exactly divide every leaf pair width."
+        )
+
+    if (
+        not np.max(np.abs(jaw))  # pylint: disable = unneeded-not
+        <= np.sum(leaf_pair_widths) / 2
+    ):
+        raise ValueError(
+            "The jaw should not travel further out than the maximum leaf limits. "
+            f"Max travel was {np.max(np.abs(jaw))}"
+        )
+
+
+def _calc_metersetmap_compiled(
+    mu,
+    mlc,
+    jaw,
+    full_grid,
+    leaf_pair_widths,
+    grid_resolution,
+    min_step_per_pixel,
+    engine,
+):
+    """Accumulate every pair of control points directly into the full grid.
+
+    The calculation grid, and the number of time steps, of each pair of
+    control points are determined as they are within
+    :func:`calc_single_control_point`, with all pairs handled at once.
+    """
+    mu = np.asarray(mu, dtype=np.float64)
+    mlc = np.asarray(mlc, dtype=np.float64)
+    jaw = np.asarray(jaw, dtype=np.float64)
+
+    metersetmap = np.zeros((len(full_grid["jaw"]), len(full_grid["mlc"])))
+
+    if len(mu) < 2:
+        return metersetmap
+
+    _check_leaf_pair_widths_and_jaw(jaw, leaf_pair_widths, grid_resolution)
+
+    left = np.ascontiguousarray(-mlc[:, :, 0])
+    right = np.ascontiguousarray(mlc[:, :, 1])
+    bottom = np.ascontiguousarray(-jaw[:, 0])
+    top = np.ascontiguousarray(jaw[:, 1])
+
+    leaf_centres, top_of_reference_leaf = _determine_leaf_centres(leaf_pair_widths)
+    grid_reference_position = _determine_reference_grid_position(
+        top_of_reference_leaf, grid_resolution
+    )
+    full_grid_leaf_map = np.argmin(
+        np.abs(full_grid["jaw"][:, None] - leaf_centres[None, :]), axis=1
+    )
+
+    # The rows of each calculation grid, as given by
+    # _determine_calc_grid_and_adjustments, located within the full grid.
+    min_y = np.minimum(bottom[:-1], bottom[1:])
+    max_y = np.maximum(top[:-1], top[1:])
+    top_grid_pos = (
+        np.round((max_y - grid_reference_position) / grid_resolution)
+    ) * grid_resolution + grid_reference_position
+    bot_grid_pos = (
+        grid_reference_position
+        - (np.round((-min_y + grid_reference_position) / grid_resolution))
+        * grid_resolution
+    )
+    row_start, row_stop = _calc_grid_range_within_full_grid(
+        bot_grid_pos, top_grid_pos, full_grid["jaw"], grid_resolution
+    )
+    calc_rows = row_stop > row_start
+
+    leaf_start = full_grid_leaf_map[np.minimum(row_start, len(full_grid["jaw"]) - 1)]
+    leaf_stop = full_grid_leaf_map[np.maximum(row_stop - 1, 0)] + 1
+
+    min_left, max_right, max_leaf_travel = _get_leaf_extents_kernel()(
+        left, right, leaf_start, leaf_stop
+    )
+
+    min_x = np.round(min_left / grid_resolution) * grid_resolution
+    max_x = np.round(max_right / grid_resolution) * grid_resolution
+    column_start, column_stop = _calc_grid_range_within_full_grid(
+        min_x, max_x, full_grid["mlc"], grid_resolution
+    )
+
+    delivered_mu = np.diff(mu)
+    to_calc = calc_rows & (column_stop > column_start) & (delivered_mu != 0)
+
+    kernel_args = (
+        np.where(to_calc)[0],
+        delivered_mu,
+        left,
+        right,
+        bottom,
+        top,
+        np.asarray(full_grid["jaw"], dtype=np.float64),
+        np.asarray(full_grid["mlc"], dtype=np.float64),
+        full_grid_leaf_map,
+        row_start,
+        row_stop,
+        column_start,
+        column_stop,
+    )
+
+    if engine == "analytic":
+        _get_analytic_metersetmap_kernel()(
+            *kernel_args, float(grid_resolution), metersetmap
+        )
+
+        return metersetmap
+
+    maximum_travel = np.maximum(
+        max_leaf_travel,
+        np.maximum(np.abs(np.diff(bottom)), np.abs(np.diff(top))),
+    )
+    time_steps = np.ceil(maximum_travel / grid_resolution) * min_step_per_pixel
+    time_steps[time_steps < 10] = 10
+
+    _get_metersetmap_kernel()(
+        *kernel_args, time_steps, float(grid_resolution), metersetmap
+    )
+
+    return metersetmap
+
+
+def _calc_grid_range_within_full_grid(start, stop, full_grid_axis, grid_resolution):
+    """The index range within the full grid of the points
+    ``np.arange(start, stop + grid_resolution, grid_resolution)``, clipped
+    to the extent of the full grid."""
+    number_of_points = np.ceil((stop + grid_resolution - start) / grid_resolution)
+    index_start = np.round((start - full_grid_axis[0]) / grid_resolution)
+    index_stop = index_start + number_of_points
+
+    index_start = np.clip(index_start, 0, len(full_grid_axis)).astype(np.int64)
+    index_stop = np.clip(index_stop, 0, len(full_grid_axis)).astype(np.int64)
+
+    return index_start, index_stop
+
+
+@cache
+def _get_leaf_extents_kernel():
+    @nb.njit(cache=True)
+    def _leaf_extents(left, right, leaf_start, leaf_stop):
+        number_of_segments = left.shape[0] - 1
+        min_left = np.empty(number_of_segments)
+        max_right = np.empty(number_of_segments)
+        max_leaf_travel = np.empty(number_of_segments)
+
+        for i in range(number_of_segments):
+            minimum = np.inf
+            maximum = -np.inf
+            travel = 0.0
+
+            for leaf in range(leaf_start[i], leaf_stop[i]):
+                for j in range(i, i + 2):
+                    minimum = min(minimum, left[j, leaf])
+                    maximum = max(maximum, right[j, leaf])
+
+                travel = max(travel, abs(left[i + 1, leaf] - left[i, leaf]))
+                travel = max(travel, abs(right[i + 1, leaf] - right[i, leaf]))
+
+            min_left[i] = minimum
+            max_right[i] = maximum
+            max_leaf_travel[i] = travel
+
+        return min_left, max_right, max_leaf_travel
+
+    return _leaf_extents
+
+
+@cache
+def _get_metersetmap_kernel():
+    @nb.njit(parallel=True, cache=True)
+    def _accumulate_metersetmap(
+        segments,
+        delivered_mu,
+        left,
+        right,
+        bottom,
+        top,
+        grid_jaw,
+        grid_mlc,
+        grid_leaf_map,
+        row_start,
+        row_stop,
+        column_start,
+        column_stop,
+        time_steps,
+        grid_resolution,
+        metersetmap,
+    ):
+        half_resolution = grid_resolution / 2
+
+        def blocked(travel_diff):
+            if travel_diff <= -half_resolution:
+                return 1.0
+            if travel_diff >= half_resolution:
+                return 0.0
+            return (-travel_diff + half_resolution) / grid_resolution
+
+        # Each row of the full grid is only written to by its own thread.
+        # pylint: disable=not-an-iterable
+        for row in nb.prange(grid_jaw.size):
+            y = grid_jaw[row]
+            leaf = grid_leaf_map[row]
+            open_sum = np.zeros(grid_mlc.size)
+
+            for i in segments:
+                if row < row_start[i] or row >= row_stop[i]:
+                    continue
+
+                number_of_steps = time_steps[i]
+                bottom_dt = (bottom[i + 1] - bottom[i]) / (number_of_steps - 1)
+                top_dt = (top[i + 1] - top[i]) / (number_of_steps - 1)
+                left_dt = (left[i + 1, leaf] - left[i, leaf]) / (number_of_steps - 1)
+                right_dt = (right[i + 1, leaf] - right[i, leaf]) / (number_of_steps - 1)
+
+                touched_start = column_stop[i]
+                touched_stop = column_start[i]
+
+                for t in range(int(number_of_steps)):
+                    jaw_open = 1 - (
+                        blocked(y - (bottom[i] + t * bottom_dt))
+                        + blocked((top[i] + t * top_dt) - y)
+                    )
+                    if jaw_open == 0:
+                        continue
+
+                    left_position = left[i, leaf] + t * left_dt
+                    right_position = right[i, leaf] + t * right_dt
+
+                    # Beyond half a pixel outside of both leaves one leaf
+                    # fully blocks while the other is fully open.
+                    lower = min(left_position, right_position) - half_resolution
+                    upper = max(left_position, right_position) + half_resolution
+                    start = max(
+                        column_start[i],
+                        int(np.floor((lower - grid_mlc[0]) / grid_resolution)),
+                    )
+                    stop = min(
+                        column_stop[i],
+                        int(np.ceil((upper - grid_mlc[0]) / grid_resolution)) + 1,
+                    )
+
+                    for column in range(start, stop):
+                        x = grid_mlc[column]
+                        mlc_open = 1 - (
+                            blocked(x - left_position) + blocked(right_position - x)
+                        )
+                        open_sum[column] += mlc_open * jaw_open
+
+                    touched_start = min(touched_start, start)
+                    touched_stop = max(touched_stop, stop)
+
+                for column in range(touched_start, touched_stop):
+                    metersetmap[row, column] += (
+                        open_sum[column] / number_of_steps * delivered_mu[i]
+                    )
+                    open_sum[column] = 0
+
+    return _accumulate_metersetmap
+
+
+@cache
+def _get_analytic_metersetmap_kernel():
+    @nb.njit(cache=True)
+    def blocked(travel_diff, grid_resolution):
+        half_resolution = grid_resolution / 2
+        if travel_diff <= -half_resolution:
+            return 1.0
+        if travel_diff >= half_resolution:
+            return 0.0
+        return (-travel_diff + half_resolution) / grid_resolution
+
+    @nb.njit(cache=True)
+    def add_breakpoints(breakpoints, count, position, travel, pixel, grid_resolution):
+        """Append the fractions of the time between two control points at
+        which a device's travel relative to a pixel crosses either edge of
+        the pixel. Between these, the fraction blocked by the device is
+        linear in time."""
+        if travel == 0:
+            return count
+
+        for edge in (-grid_resolution / 2, grid_resolution / 2):
+            t = (pixel + edge - position) / travel
+            if 0 < t < 1:
+                breakpoints[count] = t
+                count += 1
+
+        return count
+
+    @nb.njit(cache=True)
+    def jaw_open(y, bottom, bottom_travel, top, top_travel, t, grid_resolution):
+        return 1 - (
+            blocked(y - (bottom + t * bottom_travel), grid_resolution)
+            + blocked((top + t * top_travel) - y, grid_resolution)
+        )
+
+    @nb.njit(cache=True)
+    def mlc_open(x, left, left_travel, right, right_travel, t, grid_resolution):
+        return 1 - (
+            blocked(x - (left + t * left_travel), grid_resolution)
+            + blocked((right + t * right_travel) - x, grid_resolution)
+        )
+
+    @nb.njit(parallel=True, cache=True)
+    def _accumulate_analytic_metersetmap(
+        segments,
+        delivered_mu,
+        left,
+        right,
+        bottom,
+        top,
+        grid_jaw,
+        grid_mlc,
+        grid_leaf_map,
+        row_start,
+        row_stop,
+        column_start,
+        column_stop,
+        grid_resolution,
+        metersetmap,
+    ):
+        half_resolution = grid_resolution / 2
+
+        # Each row of the full grid is only written to by its own thread.
+        # pylint: disable=not-an-iterable
+        for row in nb.prange(grid_jaw.size):
+            y = grid_jaw[row]
+            leaf = grid_leaf_map[row]
+            breakpoints = np.empty(10)
+
+            for i in segments:
+                if row < row_start[i] or row >= row_stop[i]:
+                    continue
+
+                bottom_travel = bottom[i + 1] - bottom[i]
+                top_travel = top[i + 1] - top[i]
+                left_travel = left[i + 1, leaf] - left[i, leaf]
+                right_travel = right[i + 1, leaf] - right[i, leaf]
+
+                breakpoints[0] = 0.0
+                breakpoints[1] = 1.0
+                number_of_jaw_breakpoints = add_breakpoints(
+                    breakpoints, 2, bottom[i], bottom_travel, y, grid_resolution
+                )
+                number_of_jaw_breakpoints = add_breakpoints(
+                    breakpoints,
+                    number_of_jaw_breakpoints,
+                    top[i],
+                    top_travel,
+                    y,
+                    grid_resolution,
+                )
+
+                # The jaw open fraction is piecewise linear between its
+                # breakpoints, so it is zero throughout if zero at each.
+                is_jaw_closed = True
+                for j in range(number_of_jaw_breakpoints):
+                    if (
+                        jaw_open(
+                            y,
+                            bottom[i],
+                            bottom_travel,
+                            top[i],
+                            top_travel,
+                            breakpoints[j],
+                            grid_resolution,
+                        )
+                        != 0
+                    ):
+                        is_jaw_closed = False
+                        break
+
+                if is_jaw_closed:
+                    continue
+
+                # Beyond half a pixel outside of both leaves, at both
+                # control points, one leaf fully blocks while the other is
+                # fully open.
+                lower = (
+                    min(
+                        left[i, leaf],
+                        left[i + 1, leaf],
+                        right[i, leaf],
+                        right[i + 1, leaf],
+                    )
+                    - half_resolution
+                )
+                upper = (
+                    max(
+                        left[i, leaf],
+                        left[i + 1, leaf],
+                        right[i, leaf],
+                        right[i + 1, leaf],
+                    )
+                    + half_resolution
+                )
+                start = max(
+                    column_start[i],
+                    int(np.floor((lower - grid_mlc[0]) / grid_resolution)),
+                )
+                stop = min(
+                    column_stop[i],
+                    int(np.ceil((upper - grid_mlc[0]) / grid_resolution)) + 1,
+                )
+
+                for column in range(start, stop):
+                    x = grid_mlc[column]
+
+                    number_of_breakpoints = add_breakpoints(
+                        breakpoints,
+                        number_of_jaw_breakpoints,
+                        left[i, leaf],
+                        left_travel,
+                        x,
+                        grid_resolution,
+                    )
+                    number_of_breakpoints = add_breakpoints(
+                        breakpoints,
+                        number_of_breakpoints,
+                        right[i, leaf],
+                        right_travel,
+                        x,
+                        grid_resolution,
+                    )
+                    times = np.sort(breakpoints[:number_of_breakpoints])
+
+                    # Between breakpoints the open fraction is the product
+                    # of two linear functions of time, which Simpson's rule
+                    # integrates exactly.
+                    open_fraction = 0.0
+                    for j in range(number_of_breakpoints - 1):
+                        interval = times[j + 1] - times[j]
+                        if interval == 0:
+                            continue
+
+                        integrand = 0.0
+                        for t, weight in (
+                            (times[j], 1.0),
+                            ((times[j] + times[j + 1]) / 2, 4.0),
+                            (times[j + 1], 1.0),
+                        ):
+                            integrand += (
+                                weight
+                                * mlc_open(
+                                    x,
+                                    left[i, leaf],
+                                    left_travel,
+                                    right[i, leaf],
+                                    right_travel,
+                                    t,
+                                    grid_resolution,
+                                )
+                                * jaw_open(
+                                    y,
+                                    bottom[i],
+                                    bottom_travel,
+                                    top[i],
+                                    top_travel,
+                                    t,
+                                    grid_resolution,
+                                )
+                            )
+
+                        open_fraction += integrand * interval / 6
+
+                    metersetmap[row, column] += open_fraction * delivered_mu[i]
+
+    return _accumulate_analytic_metersetmap
+
+
 def single_mlc_pair(
     left_mlc,
     right_mlc,
@@ -161,14 +161,127 @@ def get_mosaiq_delivery_details(
             )
         )
 
+    return _create_delivery_details(sql_result[0])
+
+
+def _create_delivery_details(sql_row):
     OISDeliveryDetails = create_ois_delivery_details_class()
-    delivery_details = OISDeliveryDetails(*sql_result[0])
+    delivery_details = OISDeliveryDetails(*sql_row)
 
     delivery_details.field_type = constants.FIELD_TYPES[delivery_details.field_type]
 
     return delivery_details
 
 
+def get_mosaiq_treatments(connection, machine, start, end):
+    """Retrieve all treatments recorded on a machine within a time window.
+
+    This is a set based counterpart to ``get_mosaiq_delivery_details``.
+    A single query retrieves every treatment record that overlaps the
+    window so that many deliveries, such as all logfiles from a single
+    day, can be identified with ``identify_mosaiq_delivery_details``
+    without a separate round trip for each one.
+
+    Args:
+        connection: A connection pointing to the Mosaiq SQL server
+        machine: The name of the machine the deliveries occurred on
+        start: The beginning of the time window
+        end: The end of the time window
+    Returns:
+        treatments: A list of ``(create_time, edit_time, field_label,
+            field_name, delivery_details_row)`` tuples.
+    """
+
+    execute_string = """
+        SELECT
+            TrackTreatment.Create_DtTm,
+            TrackTreatment.Edit_DtTm,
+            TxField.Field_Label,
+            TxField.Field_Name,
+            Ident.IDA,
+            TxField.FLD_ID,
+            Patient.Last_Name,
+            Patient.First_Name,
+            Tracktreatment.WasQAMode,
+            TxField.Type_Enum,
+            Tracktreatment.WasBeamComplete
+        FROM TrackTreatment, Ident, Patient, TxField, Staff
+        WHERE
+            TrackTreatment.Pat_ID1 = Ident.Pat_ID1 AND
+            Patient.Pat_ID1 = Ident.Pat_ID1 AND
+            TrackTreatment.FLD_ID = TxField.FLD_ID AND
+            Staff.Staff_ID = TrackTreatment.Machine_ID_Staff_ID AND
+            REPLACE(Staff.Last_Name, ' ', '') = %(machine)s AND
+            TrackTreatment.Create_DtTm <= %(end)s AND
+            TrackTreatment.Edit_DtTm >= %(start)s
+        """
+
+    parameters = {
+        "machine": machine,
+        "start": pd.Timestamp(start).strftime("%Y-%m-%d %H:%M:%S"),
+        "end": pd.Timestamp(end).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+    sql_result = api.execute(connection, execute_string, parameters)
+
+    return [
+        (pd.Timestamp(row[0]), pd.Timestamp(row[1]), row[2], row[3], tuple(row[4:]))
+        for row in sql_result
+    ]
+
+
+def identify_mosaiq_delivery_details(
+    treatments, delivery_time, field_label, field_name, buffer=0
+):
+    """Identifies the patient details for a given delivery time from a
+    set of treatments retrieved with ``get_mosaiq_treatments``.
+
+    The matching logic, including the fallback to a zero buffer when
+    disagreeing entries are found, is identical to that of
+    ``get_mosaiq_delivery_details``. The treatments provided need to
+    cover the delivery time widened by the buffer.
+    """
+    delivery_time = pd.Timestamp(delivery_time)
+    time_buffer = pd.Timedelta(seconds=buffer)
+    field = (_as_sql_comparable(field_label), _as_sql_comparable(field_name))
+
+    matches = [
+        details_row
+        for create_time, edit_time, label, name, details_row in treatments
+        if create_time <= delivery_time + time_buffer
+        and edit_time >= delivery_time - time_buffer
+        and (_as_sql_comparable(label), _as_sql_comparable(name)) == field
+    ]
+
+    for match in matches[1::]:
+        if match != matches[0]:
+            if buffer != 0:
+                return identify_mosaiq_delivery_details(
+                    treatments, delivery_time, field_label, field_name, buffer=0
+                )
+
+            raise MultipleMosaiqEntries("Disagreeing entries were found.")
+
+    if not matches:
+        raise NoMosaiqEntries(
+            "No Mosaiq entries were found for {}/{} at {}".format(
+                field_label, field_name, delivery_time
+            )
+        )
+
+    return _create_delivery_details(matches[0])
+
+
+def _as_sql_comparable(value):
+    """Normalise a string as Mosaiq's SQL Server compares them with
+    ``=``, ignoring both case, under its default collation, and any
+    trailing spaces."""
+    if value is None:
+        return None
+
+    return str(value).rstrip(" ").casefold()
+
+
 def mosaiq_mlc_missing_byte_workaround(raw_bytes_list):
     """This function checks if there is an odd number of bytes in the mlc list
     and appends a \\x00 if the byte number is odd.
@@ -345,6 +345,7 @@ def calculate_metersetmap(delivery):
         max_leaf_gap=MAX_LEAF_GAP,
         grid_resolution=GRID_RESOLUTION,
         leaf_pair_widths=LEAF_PAIR_WIDTHS,
+        cache=True,
     )
 
 
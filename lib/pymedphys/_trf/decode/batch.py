@@ -0,0 +1,76 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Decode many TRF files across a pool of processes."""
+
+import functools
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from pymedphys._utilities.parallel import BatchResult, map_many
+
+from pymedphys._delivery import Delivery
+
+from .trf2pandas import trf2pandas
+
+
+def read_many(
+    paths: Iterable[Any],
+    workers: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    delivery: bool = False,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """Read many Elekta Linac Agility Head TRFs in parallel.
+
+    Each file is decoded within a separate worker process, with results
+    yielded as soon as they are available. A failure to decode a given
+    file does not abort the batch, instead its exception is returned
+    within that file's result.
+
+    Parameters
+    ----------
+    paths : Iterable[os.PathLike]
+        The TRF files to be read.
+    workers : int, optional
+        The number of worker processes to utilise. Defaults to the
+        number of processors on the machine. If ``1``, the files are
+        read serially within the current process.
+    columns : Sequence[str], optional
+        Only decode these table columns, see ``pymedphys.trf.read``.
+        Ignored when ``delivery`` is ``True``.
+    delivery : bool, optional
+        Create a ``pymedphys.Delivery`` object for each file instead of
+        returning the header and table DataFrames. Defaults to
+        ``False``.
+    ordered : bool, optional
+        If ``True`` (the default) the results are yielded in the order
+        of ``paths``. Otherwise they are yielded in the order in which
+        they complete.
+
+    Yields
+    ------
+    BatchResult
+        A named tuple of ``(path, result, error)``. On success,
+        ``result`` is either a ``(header, table)`` tuple or a
+        ``pymedphys.Delivery`` and ``error`` is ``None``. On failure,
+        ``result`` is ``None`` and ``error`` is the raised exception.
+
+    """
+    if delivery:
+        function = Delivery.from_trf
+    else:
+        function = functools.partial(trf2pandas, columns=columns, mmap=True)
+
+    return map_many(function, paths, workers=workers, ordered=ordered)
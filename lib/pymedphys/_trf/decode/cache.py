@@ -0,0 +1,389 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A content addressed, on-disk cache of decoded TRF files.
+
+Each cache entry is a directory named by the SHA1 hash of the TRF file
+and the version of the decoder that decoded it. The table is stored column
+major as one ``.npy`` block per dtype so that it, and any ``Delivery``
+arrays stored alongside, can be memory-mapped straight back in.
+Entries are evicted least recently used first once the cache exceeds
+its maximum size.
+"""
+
+import functools
+import json
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+from glob import glob
+from typing import Any, Dict, Optional, Sequence
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+
+from pymedphys import _config as pmp_config
+from pymedphys._utilities.filehash import hash_file
+from pymedphys._utilities.parallel import map_many
+
+from .constants import DELIVERY_COLUMNS
+from .header import Header
+from .trf2pandas import trf2pandas
+
+DEFAULT_MAXIMUM_SIZE = 10 * 2**30  # 10 GiB
+
+# Increment whenever a change to the decoding, or to the layout of the
+# cache entries, alters what is stored, so that stale entries are
+# no longer used.
+DECODER_VERSION = 1
+
+DELIVERY_FIELDS = ["monitor_units", "gantry", "collimator", "mlc", "jaw"]
+
+
+def get_cache_directory() -> pathlib.Path:
+    cache_directory = pmp_config.get_config_dir().joinpath("cache", "trf")
+    cache_directory.mkdir(parents=True, exist_ok=True)
+
+    return cache_directory
+
+
+def read_cached(
+    path,
+    columns: Optional[Sequence[str]] = None,
+    as_dataframe: bool = True,
+    cache_directory=None,
+    maximum_size: int = DEFAULT_MAXIMUM_SIZE,
+):
+    """Read an Elekta Linac Agility Head TRF utilising an on-disk cache.
+
+    The first read of a given file decodes it and stores the result
+    within the cache. Subsequent reads of a file with identical
+    contents are memory-mapped directly from the cache.
+
+    Parameters
+    ----------
+    path : os.PathLike
+        The path to the TRF file.
+    columns : Sequence[str], optional
+        Only return these table columns. Defaults to all columns.
+    as_dataframe : bool, optional
+        If ``False`` the table is returned as a dictionary mapping each
+        column name to a NumPy array. Defaults to ``True``.
+    cache_directory : os.PathLike, optional
+        Defaults to ``~/.pymedphys/cache/trf``.
+    maximum_size : int, optional
+        The size in bytes above which least recently used entries are
+        evicted. Defaults to 10 GiB.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, Union[pd.DataFrame, Dict[str, np.ndarray]]]
+        The same header and table as ``pymedphys.trf.read``.
+
+    """
+    entry = _get_entry(path, cache_directory, maximum_size)
+
+    header_dataframe = _load_header(entry)
+    table = _load_table(entry, columns)
+
+    if not as_dataframe:
+        return header_dataframe, table
+
+    return header_dataframe, _table_as_dataframe(entry, table)
+
+
+def read_cached_delivery_arrays(
+    path,
+    arrays_from_table,
+    cache_directory=None,
+    maximum_size: int = DEFAULT_MAXIMUM_SIZE,
+):
+    """Return the ``Delivery`` arrays for a TRF file, utilising the
+    cache.
+
+    ``arrays_from_table`` converts a decoded table into the
+    ``(monitor_units, gantry, collimator, mlc, jaw)`` arrays, and is
+    only called on a cache miss.
+    """
+    entry = _get_entry(path, cache_directory, maximum_size)
+
+    try:
+        return [
+            np.load(entry.joinpath(f"delivery_{field}.npy"), mmap_mode="r")
+            for field in DELIVERY_FIELDS
+        ]
+    except FileNotFoundError:
+        pass
+
+    table = _load_table(entry, DELIVERY_COLUMNS)
+    arrays = [np.asarray(item) for item in arrays_from_table(table)]
+
+    for field, array in zip(DELIVERY_FIELDS, arrays):
+        _atomic_save(entry.joinpath(f"delivery_{field}.npy"), array)
+
+    return arrays
+
+
+def warm(path, cache_directory=None):
+    """Decode a TRF file into the cache if it is not already there.
+
+    Eviction is not undertaken, so that many files can be warmed in
+    parallel followed by a single call to ``prune``.
+    """
+    _get_entry(path, cache_directory, maximum_size=None)
+
+
+def prune(cache_directory=None, maximum_size: int = DEFAULT_MAXIMUM_SIZE):
+    """Evict the least recently used entries until the total size of
+    the cache is no greater than ``maximum_size`` bytes.
+
+    Returns
+    -------
+    evicted : List[pathlib.Path]
+        The cache entries that were removed.
+    """
+    cache_directory = _resolve_cache_directory(cache_directory)
+    entries = sorted(_list_entries(cache_directory), key=lambda e: e.stat().st_mtime)
+    sizes = {entry: _entry_size(entry) for entry in entries}
+
+    total_size = sum(sizes.values())
+    evicted = []
+
+    for entry in entries:
+        if total_size <= maximum_size:
+            break
+
+        shutil.rmtree(entry, ignore_errors=True)
+        total_size -= sizes[entry]
+        evicted.append(entry)
+
+    return evicted
+
+
+def stats(cache_directory=None) -> Dict[str, Any]:
+    """Summarise the contents of the cache."""
+    cache_directory = _resolve_cache_directory(cache_directory)
+    entries = _list_entries(cache_directory)
+
+    return {
+        "directory": str(cache_directory),
+        "entries": len(entries),
+        "size": sum(_entry_size(entry) for entry in entries),
+        "current_version_entries": len(
+            [entry for entry in entries if entry.name.endswith(_entry_suffix())]
+        ),
+    }
+
+
+def _resolve_cache_directory(cache_directory) -> pathlib.Path:
+    if cache_directory is None:
+        return get_cache_directory()
+
+    cache_directory = pathlib.Path(cache_directory)
+    cache_directory.mkdir(parents=True, exist_ok=True)
+
+    return cache_directory
+
+
+def _list_entries(cache_directory: pathlib.Path):
+    return [
+        path
+        for path in cache_directory.iterdir()
+        if path.is_dir() and not path.name.startswith(".")
+    ]
+
+
+def _entry_size(entry: pathlib.Path) -> int:
+    return sum(path.stat().st_size for path in entry.iterdir())
+
+
+def _entry_suffix():
+    return f"-decoder{DECODER_VERSION}"
+
+
+def _get_entry(path, cache_directory, maximum_size) -> pathlib.Path:
+    cache_directory = _resolve_cache_directory(cache_directory)
+    entry = cache_directory.joinpath(f"{hash_file(path)}{_entry_suffix()}")
+
+    if entry.exists():
+        logging.debug("TRF cache hit for %(path)s", {"path": path})
+
+        # The entry modification time records when it was last used,
+        # providing the ordering for least recently used eviction.
+        os.utime(entry)
+
+        return entry
+
+    logging.debug("TRF cache miss for %(path)s", {"path": path})
+
+    # Pruning before storing guarantees that the entry about to be
+    # returned is never itself evicted.
+    if maximum_size is not None:
+        prune(cache_directory, maximum_size)
+
+    _store(path, cache_directory, entry)
+
+    return entry
+
+
+def _store(path, cache_directory: pathlib.Path, entry: pathlib.Path):
+    header_dataframe, table_dataframe = trf2pandas(path, mmap=True)
+
+    # Entries are built within a temporary directory and then moved into
+    # place so that a partially written entry is never read.
+    temporary_entry = pathlib.Path(tempfile.mkdtemp(prefix=".", dir=cache_directory))
+
+    try:
+        header = {
+            key: value.tolist()
+            if isinstance(value, (np.ndarray, np.generic))
+            else value
+            for key, value in header_dataframe.iloc[0].items()
+        }
+        with open(temporary_entry.joinpath("header.json"), "w") as f:
+            json.dump(header, f)
+
+        np.save(temporary_entry.joinpath("index.npy"), table_dataframe.index.to_numpy())
+
+        columns = []
+        blocks: Dict[str, list] = {}
+        for name in table_dataframe.columns:
+            values = table_dataframe[name].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+
+            block = blocks.setdefault(values.dtype.str, [])
+            columns.append(
+                {
+                    "name": name,
+                    "block": list(blocks).index(values.dtype.str),
+                    "index": len(block),
+                }
+            )
+            block.append(values)
+
+        for i, block in enumerate(blocks.values()):
+            np.save(temporary_entry.joinpath(f"block_{i}.npy"), np.stack(block))
+
+        with open(temporary_entry.joinpath("columns.json"), "w") as f:
+            json.dump(columns, f)
+
+        try:
+            os.rename(temporary_entry, entry)
+        except OSError:
+            # Another process has stored this entry in the meantime
+            if not entry.exists():
+                raise
+    finally:
+        shutil.rmtree(temporary_entry, ignore_errors=True)
+
+
+def _atomic_save(path: pathlib.Path, array):
+    temporary_path = path.with_name(f".{path.name}.{os.getpid()}")
+    with open(temporary_path, "wb") as f:
+        np.save(f, array)
+
+    os.replace(temporary_path, path)
+
+
+def _load_header(entry: pathlib.Path) -> "pd.DataFrame":
+    with open(entry.joinpath("header.json")) as f:
+        header = json.load(f)
+
+    header["item_parts"] = np.array(header["item_parts"], dtype=np.int16)
+
+    return pd.DataFrame([Header(**header)], columns=Header._fields)
+
+
+def _load_table(entry: pathlib.Path, columns=None) -> Dict[str, "np.ndarray"]:
+    with open(entry.joinpath("columns.json")) as f:
+        column_locations = {item["name"]: item for item in json.load(f)}
+
+    if columns is None:
+        columns = list(column_locations.keys())
+
+    unavailable_columns = [
+        column for column in columns if column not in column_locations
+    ]
+    if unavailable_columns:
+        raise ValueError(
+            "The following columns are not available within this TRF file:\n"
+            f"{unavailable_columns}"
+        )
+
+    blocks: Dict[int, "np.ndarray"] = {}
+    table = {}
+    for column in columns:
+        location = column_locations[column]
+
+        try:
+            block = blocks[location["block"]]
+        except KeyError:
+            block = np.load(
+                entry.joinpath(f"block_{location['block']}.npy"), mmap_mode="r"
+            )
+            blocks[location["block"]] = block
+
+        table[column] = block[location["index"]]
+
+    return table
+
+
+def _table_as_dataframe(entry: pathlib.Path, table) -> "pd.DataFrame":
+    index = np.load(entry.joinpath("index.npy"))
+
+    return pd.DataFrame(table, index=index, columns=list(table.keys()))
+
+
+def cache_warm_cli(args):
+    filepaths = []
+    for glob_string in args.filepaths:
+        filepaths += glob(glob_string)
+
+    failed_filepaths = [
+        result.path
+        for result in map_many(
+            functools.partial(warm, cache_directory=args.directory),
+            filepaths,
+            workers=args.jobs,
+            ordered=False,
+        )
+        if result.error is not None
+    ]
+
+    _cache_prune(args)
+
+    if failed_filepaths:
+        raise ValueError(
+            "The following files failed to be cached:\n{}".format(
+                "\n".join(failed_filepaths)
+            )
+        )
+
+
+def cache_prune_cli(args):
+    evicted = _cache_prune(args)
+    print(f"Evicted {len(evicted)} cache entries")
+
+
+def cache_stats_cli(args):
+    for key, value in stats(args.directory).items():
+        print(f"{key}: {value}")
+
+
+def _cache_prune(args):
+    return prune(args.directory, int(args.max_size * 2**30))
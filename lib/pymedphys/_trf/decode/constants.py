@@ -33,3 +33,12 @@ JAW_NAMES = ["X1 Diaphragm/Scaled Actual (mm)", "X2 Diaphragm/Scaled Actual (mm)
 
 GANTRY_NAME = "Step Gantry/Scaled Actual (deg)"
 COLLIMATOR_NAME = "Step Collimator/Scaled Actual (deg)"
+
+MONITOR_UNITS_NAME = "Step Dose/Actual Value (Mu)"
+
+DELIVERY_COLUMNS = (
+    [MONITOR_UNITS_NAME, GANTRY_NAME, COLLIMATOR_NAME]
+    + Y1_LEAF_BANK_NAMES
+    + Y2_LEAF_BANK_NAMES
+    + JAW_NAMES
+)
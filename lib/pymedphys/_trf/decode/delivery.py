@@ -19,10 +19,13 @@ from pymedphys._imports import numpy as np
 from pymedphys._base.delivery import DeliveryBase, DeliveryGeneric
 from pymedphys._vendor.deprecated import deprecated as _deprecated
 
+from . import cache as _cache
 from .constants import (
     COLLIMATOR_NAME,
+    DELIVERY_COLUMNS,
     GANTRY_NAME,
     JAW_NAMES,
+    MONITOR_UNITS_NAME,
     Y1_LEAF_BANK_NAMES,
     Y2_LEAF_BANK_NAMES,
 )
@@ -31,7 +34,7 @@ from .trf2pandas import read_trf
 
 class DeliveryLogfile(DeliveryBase):
     @classmethod
-    def from_trf(cls, filepath):
+    def from_trf(cls, filepath, cache=False):
         """Create a ``pymedphys.Delivery`` object from a Elekta Agility
         TRF logfile.
 
@@ -39,13 +42,23 @@ class DeliveryLogfile(DeliveryBase):
         ----------
         filepath
             The full path of the TRF logfile.
+        cache : bool, optional
+            Utilise the on-disk TRF decode cache, see
+            ``pymedphys.trf.read_cached``. Defaults to ``False``.
 
         Returns
         -------
         delivery : pymedphys.Delivery
 
         """
-        _, dataframe = read_trf(filepath)
+        if cache:
+            return cls._from_arrays(
+                *_cache.read_cached_delivery_arrays(
+                    filepath, _delivery_arrays_from_table
+                )
+            )
+
+        _, dataframe = read_trf(filepath, columns=DELIVERY_COLUMNS, mmap=True)
         delivery = cls._from_pandas(dataframe)
 
         return delivery
@@ -62,24 +75,28 @@ class DeliveryLogfile(DeliveryBase):
 
     @classmethod
     def _from_pandas(cls: Type[DeliveryGeneric], table) -> DeliveryGeneric:
-        raw_monitor_units = table["Step Dose/Actual Value (Mu)"]
+        return cls(*_delivery_arrays_from_table(table))
 
-        diff = np.append([0], np.diff(raw_monitor_units))
-        diff[diff < 0] = 0
 
-        monitor_units = np.cumsum(diff)
+def _delivery_arrays_from_table(table):
+    raw_monitor_units = table[MONITOR_UNITS_NAME]
 
-        gantry = table[GANTRY_NAME]
-        collimator = table[COLLIMATOR_NAME]
+    diff = np.append([0], np.diff(raw_monitor_units))
+    diff[diff < 0] = 0
 
-        y1_bank = [table[name] for name in Y1_LEAF_BANK_NAMES]
+    monitor_units = np.cumsum(diff)
 
-        y2_bank = [table[name] for name in Y2_LEAF_BANK_NAMES]
+    gantry = np.asarray(table[GANTRY_NAME])
+    collimator = np.asarray(table[COLLIMATOR_NAME])
 
-        mlc = [y1_bank, y2_bank]
-        mlc = np.swapaxes(mlc, 0, 2)
+    y1_bank = [table[name] for name in Y1_LEAF_BANK_NAMES]
 
-        jaw = [table[name] for name in JAW_NAMES]
-        jaw = np.swapaxes(jaw, 0, 1)
+    y2_bank = [table[name] for name in Y2_LEAF_BANK_NAMES]
 
-        return cls(monitor_units, gantry, collimator, mlc, jaw)
+    mlc = [y1_bank, y2_bank]
+    mlc = np.swapaxes(mlc, 0, 2)
+
+    jaw = [table[name] for name in JAW_NAMES]
+    jaw = np.swapaxes(jaw, 0, 1)
+
+    return monitor_units, gantry, collimator, mlc, jaw
@@ -18,6 +18,11 @@ from collections import namedtuple
 
 from pymedphys._imports import numpy as np
 
+# The header is only ever a few kilobytes long. Limiting the regex search
+# to the start of the file avoids scanning (or, when memory-mapped,
+# paging in) the whole table.
+HEADER_SEARCH_LENGTH = 16384
+
 Header = namedtuple(
     "Header",
     [
@@ -44,6 +49,8 @@ def determine_header_length(trf_contents: bytes) -> int:
     Parameters
     ----------
     trf_contents : bytes
+        Either the full TRF contents or any bytes-like object (such as a
+        memory-mapped array) starting with the TRF header.
 
     Returns
     -------
@@ -75,7 +82,7 @@ def determine_header_length(trf_contents: bytes) -> int:
     # The field is likely to change the number of bytes.
 
     start_header_length = 0
-    match = re.match(regex_trf, trf_contents)
+    match = re.match(regex_trf, bytes(trf_contents[0:HEADER_SEARCH_LENGTH]))
 
     if match:
         groups = match.groups()
@@ -85,7 +92,7 @@ def determine_header_length(trf_contents: bytes) -> int:
         raise ValueError("Unexpected header content found")
 
     item_parts_number = np.frombuffer(groups[4][12:16], dtype=np.int32).item()
-    final_header_length = len(groups[4][0 : 16 + 4 * item_parts_number])
+    final_header_length = 16 + 4 * item_parts_number
 
     header_length = start_header_length + final_header_length
 
@@ -184,7 +191,7 @@ def decode_header(trf_header_contents: bytes) -> Header:
 
 def _raw_header_from_file(filepath):
     with open(filepath, "rb") as file:
-        trf_contents = file.read()
+        trf_contents = file.read(HEADER_SEARCH_LENGTH)
 
     header_length = determine_header_length(trf_contents)
     trf_header_contents = trf_contents[0:header_length]
@@ -40,49 +40,175 @@ def decode_trf_table(trf_table_contents, header_table_contents):
     return table_dataframe
 
 
-def decode_rows(trf_table_contents, version, item_parts_length, item_parts):
+def decode_trf_table_columns(
+    trf_table_contents, header_table_contents, columns, as_dataframe=True
+):
+    """Decode and convert only the requested columns of a TRF table.
+
+    The conversions applied are identical to those undertaken by
+    ``decode_trf_table``, however each column is read directly out of
+    the (potentially memory-mapped) table contents without decoding
+    the remainder of the table.
+    """
+    version = header_table_contents["version"].values[0].astype(int)
+    item_parts_length = header_table_contents["item_parts_length"].values[0].astype(int)
+    item_parts = header_table_contents["item_parts"].values[0]
+
+    records = decode_records(trf_table_contents, version, item_parts_length)
+    column_names = item_part_column_names(item_parts_length, item_parts)
+
+    unknown_column_names = []
+    if version > 1:
+        unknown_column_names = [f"unknown{i}" for i in range(1, 5)]
+
+    unavailable_columns = [
+        column
+        for column in columns
+        if column not in column_names and column not in unknown_column_names
+    ]
+    if unavailable_columns:
+        raise ValueError(
+            f"The following columns are not available within this version {version} "
+            f"TRF file:\n{unavailable_columns}"
+        )
+
+    column_start_index = column_names.index("Step Gantry/Scaled Actual (deg)")
+    if int(version) == 4:
+        column_end_index = column_names.index("Mlc Status/Actual Value (None)")
+    else:
+        column_end_index = len(column_names)
+
+    decoded_columns = {}
+    for column in columns:
+        if column in unknown_column_names:
+            timestamp = records["timestamp"].astype("<i8")
+            unknown_index = unknown_column_names.index(column)
+            decoded_columns[column] = timestamp.view("<u2")[unknown_index::4].astype(
+                np.int64
+            )
+            continue
+
+        column_index = column_names.index(column)
+        values = records["values"][:, column_index]
+
+        if column == "Linac State/Actual Value (None)":
+            values = convert_numbers_to_string(
+                "linac state", CONFIG["linac_state_codes"], values
+            )
+        elif column == "Wedge Position/Actual Value (None)":
+            values = convert_numbers_to_string("wedge", CONFIG["wedge_codes"], values)
+        elif column == "Step Dose/Actual Value (Mu)":
+            values = values / 10
+        elif column == "Dose/Raw value (1/64th Mu)":
+            values = values.astype(np.int64)
+            values = np.where(values < 0, values + 2**16, values)
+        elif column_start_index <= column_index < column_end_index:
+            values = values / 10
+
+            if column == "Table Isocentric/Scaled Actual (deg)":
+                values = (values / 0.1).astype(int)
+            elif ("Y2 Leaf" in column) and ("Scaled Actual" in column):
+                values = -values
+        elif version > 1:
+            values = values.astype(np.int64)
+        else:
+            values = values.copy()
+
+        decoded_columns[column] = values
+
+    if not as_dataframe:
+        return decoded_columns
+
+    return create_dataframe(
+        decoded_columns, list(decoded_columns.keys()), CONFIG["time_increment"]
+    )
+
+
+def row_dtype(version, item_parts_length):
+    """Build the structured NumPy dtype describing a single TRF table row.
+
+    Parameters
+    ----------
+    version : int
+        The TRF version as decoded from the header.
+    item_parts_length : int
+        The number of item part identifiers within the header. Each
+        column within the table is described by a pair of these.
+
+    Returns
+    -------
+    dtype : np.dtype
+        A structured dtype with a ``values`` sub-array field holding one
+        entry per column. For TRF versions greater than 1 each row is
+        prefixed by a ``timestamp`` field.
+    """
+    version_config = CONFIG["version_row"][str(version)]
+
+    value_dtype = np.dtype(version_config["dtype"])
+    offset = version_config["offset"]
+    lg_scale = version_config["lg_scale"]
+
+    line_grouping = lg_scale * item_parts_length + offset
+    number_of_columns = (line_grouping - offset) // value_dtype.itemsize
+
+    values_format = (value_dtype, (number_of_columns,))
+
+    if version == 1:
+        return np.dtype(
+            {
+                "names": ["values"],
+                "formats": [values_format],
+                "offsets": [offset],
+                "itemsize": line_grouping,
+            }
+        )
+
+    return np.dtype(
+        {
+            "names": ["timestamp", "values"],
+            "formats": [np.int64, values_format],
+            "offsets": [0, offset],
+            "itemsize": line_grouping,
+        }
+    )
+
+
+def decode_records(trf_table_contents, version, item_parts_length):
+    """Decode the whole TRF table in a single pass.
+
+    The returned record array is a zero-copy view over
+    ``trf_table_contents``.
+    """
+    dtype = row_dtype(version, item_parts_length)
+
+    return np.frombuffer(trf_table_contents, dtype=dtype)
+
+
+def item_part_column_names(item_parts_length, item_parts):
     column_names_from_dict = CONFIG["item_part_names"]
     column_names_from_data = [
         str(item_parts[i]) + "_" + str(item_parts[i + 1])
         for i in range(0, item_parts_length, 2)
     ]
 
-    dtype = CONFIG["version_row"][str(version)]["dtype"]
-    offset = CONFIG["version_row"][str(version)]["offset"]
-    lg_scale = CONFIG["version_row"][str(version)]["lg_scale"]
-    line_grouping = lg_scale * item_parts_length + offset
+    return [column_names_from_dict[c] for c in column_names_from_data]
 
-    if version == 1:
-        decoded_rows = [
-            np.frombuffer(
-                trf_table_contents[i : i + line_grouping],
-                offset=offset,
-                dtype=np.dtype(dtype),
-            )
-            for i in range(0, len(trf_table_contents), line_grouping)
-        ]
-        column_names = [column_names_from_dict[c] for c in column_names_from_data]
 
+def decode_rows(trf_table_contents, version, item_parts_length, item_parts):
+    column_names = item_part_column_names(item_parts_length, item_parts)
+
+    records = decode_records(trf_table_contents, version, item_parts_length)
+
+    if version == 1:
+        decoded_rows = records["values"]
     else:
-        timestamps = [
-            np.frombuffer(trf_table_contents[i : i + 8], offset=0, dtype=np.int64)
-            for i in range(0, len(trf_table_contents), line_grouping)
-        ]
-        item_part_values_data = [
-            np.frombuffer(
-                trf_table_contents[i : i + line_grouping],
-                offset=offset,
-                dtype=np.dtype(dtype),
-            )
-            for i in range(0, len(trf_table_contents), line_grouping)
-        ]
-        decoded_rows = [
-            np.concatenate((timestamps[i], item_parts))
-            for i, item_parts in enumerate(item_part_values_data)
-        ]
-        column_names = ["Timestamp Data"] + [
-            column_names_from_dict[c] for c in column_names_from_data
-        ]
+        values = records["values"]
+
+        decoded_rows = np.empty((len(records), values.shape[-1] + 1), dtype=np.int64)
+        decoded_rows[:, 0] = records["timestamp"]
+        decoded_rows[:, 1:] = values
+
+        column_names = ["Timestamp Data"] + column_names
 
     return decoded_rows, column_names
 
@@ -96,18 +222,19 @@ def create_dataframe(data, column_names, time_increment):
 
 
 def convert_numbers_to_string(name, lookup, column):
-    dtype = np.array([item for _, item in lookup.items()]).dtype
-    result = np.empty_like(column).astype(dtype)  # pylint: disable = no-member
-    result[:] = ""
-
-    for i, item in lookup.items():
-        result[column.values == int(i)] = item
-
-    if np.any(result == ""):
-        print(lookup)
-        print(np.where(result == ""))
-        print(column[result == ""].values)
-        unconverted_entries = np.unique(column[result == ""])
+    codes = np.array([int(i) for i in lookup.keys()])
+    strings = np.array(list(lookup.values()))
+
+    sort_order = np.argsort(codes)
+    codes = codes[sort_order]
+    strings = strings[sort_order]
+
+    values = np.asarray(column)
+    lookup_index = np.clip(np.searchsorted(codes, values), 0, len(codes) - 1)
+    unconverted = codes[lookup_index] != values
+
+    if np.any(unconverted):
+        unconverted_entries = np.unique(values[unconverted])
         raise ValueError(
             "The conversion lookup list for converting {} is incomplete. "
             "The following data numbers were not converted:\n"
@@ -116,7 +243,7 @@ def convert_numbers_to_string(name, lookup, column):
             "in its definitions.".format(name, unconverted_entries)
         )
 
-    return result
+    return np.take(strings, lookup_index)
 
 
 def convert_linac_state_codes(dataframe, linac_state_codes):
@@ -164,9 +291,10 @@ def convert_positional_items(
         "Step Dose/Actual Value (Mu)"
     ].divide(10)
 
-    dataframe["Dose/Raw value (1/64th Mu)"] = dataframe[
-        "Dose/Raw value (1/64th Mu)"
-    ].apply(lambda x: x + 2**16 if x < 0 else x)
+    raw_dose = dataframe["Dose/Raw value (1/64th Mu)"].to_numpy(dtype=np.int64)
+    dataframe["Dose/Raw value (1/64th Mu)"] = np.where(
+        raw_dose < 0, raw_dose + 2**16, raw_dose
+    )
 
     # Depending on the version (Versions < 3) do not have 'Mlc Status/Actual Value (None)'.
     # We get the index location of the columns that need to be divided by 10.
@@ -179,49 +307,52 @@ def convert_positional_items(
     else:
         column_end_index = len(column_names)
 
-    # In order to speed up the conversion, will split the dataframe into the columns up to 'Step Gantry/Scaled Actual (deg)'
-    # dataframe1 = dataframe.iloc[:, np.r_[0:column_start_index, column_end_index:-1]] # Useful to slice non continuously.
-    dataframe1 = dataframe.iloc[:, 0:column_start_index]
-
-    # Divide the remaining columns until 'Mlc Status/Actual Value (None)'.
+    # Divide the columns from 'Step Gantry/Scaled Actual (deg)' until
+    # 'Mlc Status/Actual Value (None)' within a single NumPy array.
     # This include Gantry, Collimator, Couch as well as Diaphragms Leaves and DLGs (in Agility).
-    dataframe2 = dataframe.iloc[:, column_start_index:column_end_index].divide(10)
-
-    ### SOME Rollbacks to ensure regression passes:
-    dataframe2["Table Isocentric/Scaled Actual (deg)"] = (
-        dataframe2["Table Isocentric/Scaled Actual (deg)"].divide(0.1).astype(int)
+    positional_column_names = column_names[column_start_index:column_end_index]
+    positional_items = dataframe.iloc[:, column_start_index:column_end_index].to_numpy(
+        dtype=np.float64, copy=True
     )
-
-    # Remaining columns post 'Mlc Status/Actual Value (None)'.
-    dataframe3 = dataframe.iloc[:, column_end_index:]
-
-    dataframe = pd.concat([dataframe1, dataframe2, dataframe3], axis=1)
+    positional_items /= 10
 
     # Y2 Leaves Scaled Actual need to be multiplied by -1
-    y2_leaf_column_names = [
-        name
-        for name in column_names
-        if ("Y2 Leaf" in name) and ("Scaled Actual" in name)
+    y2_leaf_columns = [
+        ("Y2 Leaf" in name) and ("Scaled Actual" in name)
+        for name in positional_column_names
+    ]
+    positional_items[:, y2_leaf_columns] *= -1
+
+    dataframes = [
+        dataframe.iloc[:, 0:column_start_index],
+        pd.DataFrame(
+            positional_items, index=dataframe.index, columns=positional_column_names
+        ),
+        dataframe.iloc[:, column_end_index:],
     ]
-    dataframe.loc[:, y2_leaf_column_names] = -dataframe.loc[:, y2_leaf_column_names]
 
     if int(version) > 1:
-        dataframe["unknown1"] = dataframe["Timestamp Data"].apply(
-            lambda x: int.from_bytes(np.int64(x).tobytes()[0:2], "little")
-        )
-        dataframe["unknown2"] = dataframe["Timestamp Data"].apply(
-            lambda x: int.from_bytes(np.int64(x).tobytes()[2:4], "little")
-        )
-        dataframe["unknown3"] = dataframe["Timestamp Data"].apply(
-            lambda x: int.from_bytes(np.int64(x).tobytes()[4:6], "little")
-        )
-        dataframe["unknown4"] = dataframe["Timestamp Data"].apply(
-            lambda x: int.from_bytes(np.int64(x).tobytes()[6:8], "little")
+        # The timestamp is made up of four little endian unsigned 16 bit
+        # integers, of which the meaning is currently unknown.
+        timestamp = dataframe["Timestamp Data"].to_numpy(dtype="<i8")
+        unknowns = timestamp.view("<u2").reshape(-1, 4).astype(np.int64)
+
+        dataframes[0] = dataframes[0].drop("Timestamp Data", axis=1)
+        dataframes.insert(
+            0,
+            pd.DataFrame(
+                unknowns,
+                index=dataframe.index,
+                columns=[f"unknown{i}" for i in range(1, 5)],
+            ),
         )
-        dataframe = dataframe.drop("Timestamp Data", axis=1)
-        dataframe = dataframe[
-            dataframe.columns.to_list()[-4:] + dataframe.columns.to_list()[0:-4]
-        ]
+
+    dataframe = pd.concat(dataframes, axis=1)
+
+    ### SOME Rollbacks to ensure regression passes:
+    dataframe["Table Isocentric/Scaled Actual (deg)"] = (
+        dataframe["Table Isocentric/Scaled Actual (deg)"].divide(0.1).astype(int)
+    )
 
     return dataframe
 
@@ -20,6 +20,8 @@ import os
 import pathlib
 from glob import glob
 
+from pymedphys._utilities.parallel import map_many
+
 from .trf2pandas import trf2pandas
 
 
@@ -68,6 +70,7 @@ def trf2csv(trf_filepath, output_directory=None):
 
 
 def trf2csv_cli(args):
+    filepaths = []
     for glob_string in args.filepaths:
         glob_string = glob_string.replace("[", "<[>")
         glob_string = glob_string.replace("]", "<]>")
@@ -76,7 +79,17 @@ def trf2csv_cli(args):
         glob_string = glob_string.replace("<[>", "[[]")
         glob_string = glob_string.replace("<]>", "[]]")
 
-        filepaths = glob(glob_string)
+        filepaths += glob(glob_string)
+
+    failed_filepaths = [
+        result.path
+        for result in map_many(trf2csv, filepaths, workers=args.jobs, ordered=False)
+        if result.error is not None
+    ]
 
-        for filepath in filepaths:
-            trf2csv(filepath)
+    if failed_filepaths:
+        raise ValueError(
+            "The following files failed to convert:\n{}".format(
+                "\n".join(failed_filepaths)
+            )
+        )
@@ -16,18 +16,33 @@
 """Decodes trf file."""
 
 import os  # pylint: disable = unused-import
-from typing import Any, BinaryIO, Tuple, Union, cast  # pylint: disable = unused-import
-
+from typing import (  # pylint: disable = unused-import
+    Any,
+    BinaryIO,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from pymedphys._imports import numpy as np
 from pymedphys._imports import pandas as pd
 
 from .header import Header, decode_header
 from .partition import split_into_header_table
-from .table import decode_trf_table
+from .table import decode_trf_table, decode_trf_table_columns
 
 path_or_binary_file = Union[BinaryIO, "os.PathLike[Any]"]
 
 
-def trf2pandas(trf: path_or_binary_file) -> Tuple["pd.DataFrame", "pd.DataFrame"]:
+def trf2pandas(
+    trf: path_or_binary_file,
+    columns: Optional[Sequence[str]] = None,
+    mmap: bool = False,
+    as_dataframe: bool = True,
+) -> Tuple["pd.DataFrame", Union["pd.DataFrame", Dict[str, "np.ndarray"]]]:
     """Read an Elekta Linac Agility Head TRF into a Pandas DataFrame.
 
     Parameters
@@ -36,30 +51,65 @@ def trf2pandas(trf: path_or_binary_file) -> Tuple["pd.DataFrame", "pd.DataFrame"
         Either a file-like object or a pathlike object pointing to
         either the file location on disk, or the binary contents of a
         given TRF.
+    columns : Sequence[str], optional
+        The table columns to decode, for example
+        ``["Step Gantry/Scaled Actual (deg)"]``. Only these columns are
+        decoded and converted, the remainder of the table is skipped.
+        Defaults to decoding all columns.
+    mmap : bool, optional
+        Memory-map the file instead of reading it into memory. Combined
+        with ``columns`` only the parts of the file that are needed are
+        read from disk. Only applies when ``trf`` is a pathlike object.
+        Defaults to ``False``.
+    as_dataframe : bool, optional
+        If ``False`` the table is returned as a dictionary mapping each
+        column name to a NumPy array. Defaults to ``True``.
 
     Returns
     -------
-    Tuple[pd.DataFrame, pd.DataFrame]
-        Two DataFrames, the first being the TRF header information, the
-        second being the TRF table content.
+    Tuple[pd.DataFrame, Union[pd.DataFrame, Dict[str, np.ndarray]]]
+        Two items, the first being the TRF header information as a
+        DataFrame, the second being the TRF table content.
 
     """
+    trf_contents = _read_trf_contents(trf, mmap)
+
+    trf_header_contents, trf_table_contents = split_into_header_table(trf_contents)
+    header_dataframe = header_as_dataframe(bytes(trf_header_contents))
+
+    if columns is not None:
+        table = decode_trf_table_columns(
+            trf_table_contents, header_dataframe, columns, as_dataframe=as_dataframe
+        )
+
+        return header_dataframe, table
+
+    table_dataframe = decode_trf_table(trf_table_contents, header_dataframe)
+
+    if not as_dataframe:
+        return header_dataframe, {
+            column: table_dataframe[column].to_numpy()
+            for column in table_dataframe.columns
+        }
+
+    return header_dataframe, table_dataframe
+
+
+def _read_trf_contents(trf: path_or_binary_file, mmap: bool):
     binary_file_trf = cast(BinaryIO, trf)
     path_like_trf = cast("os.PathLike[Any]", trf)
 
     try:
         binary_file_trf.seek(0)
-        trf_contents = binary_file_trf.read()
+        return binary_file_trf.read()
     except AttributeError:
-        with open(path_like_trf, "rb") as f:
-            trf_contents = f.read()
+        pass
 
-    trf_header_contents, trf_table_contents = split_into_header_table(trf_contents)
-    header_dataframe = header_as_dataframe(trf_header_contents)
-    # table_dataframe = decode_trf_table(trf_table_contents)
-    table_dataframe = decode_trf_table(trf_table_contents, header_dataframe)
+    if mmap:
+        return np.memmap(path_like_trf, dtype=np.uint8, mode="r")
 
-    return header_dataframe, table_dataframe
+    with open(path_like_trf, "rb") as f:
+        return f.read()
 
 
 read_trf = trf2pandas
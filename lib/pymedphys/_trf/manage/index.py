@@ -15,7 +15,9 @@
 
 """Index logfiles."""
 
-import json
+import collections
+import concurrent.futures
+import datetime
 import os
 import pathlib
 import traceback
@@ -24,12 +26,20 @@ from glob import glob
 from pymedphys._imports import attr
 
 import pymedphys._mosaiq.api as _pp_mosaiq
-from pymedphys._mosaiq.delivery import NoMosaiqEntries, get_mosaiq_delivery_details
+from pymedphys._mosaiq.delivery import (
+    NoMosaiqEntries,
+    get_mosaiq_delivery_details,
+    get_mosaiq_treatments,
+    identify_mosaiq_delivery_details,
+)
 from pymedphys._trf.decode.header import Header, decode_header_from_file
 from pymedphys._utilities.filehash import hash_file
 from pymedphys._utilities.filesystem import make_a_valid_directory_name
 
 from .identify import date_convert
+from .indexdb import open_index
+
+MOSAIQ_TIME_BUFFER = 240  # seconds
 
 
 def create_logfile_directory_name(
@@ -143,7 +153,88 @@ def get_logfile_mosaiq_info(
     return attr.asdict(delivery_details)
 
 
-# TODO Split this function up into smaller functions for easier reuse.
+def _prepare_logfile_for_indexing(
+    filepath,
+    unknown_error_in_logfile,
+    no_field_label_in_logfile,
+    machine_map,
+    centre_details,
+    header=None,
+):
+    """Decode a logfile's header and determine its centre and local
+    delivery time.
+
+    A header that has already been decoded, or the exception raised
+    when attempting to decode it, can be provided via ``header``.
+
+    Logfiles that cannot be prepared are moved into the relevant
+    directory and ``None`` is returned.
+    """
+    logfile_basename = os.path.basename(filepath)
+
+    try:
+        if header is None:
+            header = decode_header_from_file(filepath)
+        if isinstance(header, Exception):
+            raise header
+
+        print("\n{}".format(header))
+        if header.field_label == "":
+            print("No field label in logfile")
+            new_filepath = os.path.join(no_field_label_in_logfile, logfile_basename)
+            rename_and_handle_fileexists(filepath, new_filepath)
+            return None
+
+        centre = machine_map[header.machine]["centre"]
+
+        mosaiq_string_time, path_string_time = date_convert(
+            header.date, centre_details[centre]["timezone"]
+        )
+    except Exception:  # pylint: disable = broad-except
+        traceback.print_exc()
+        new_filepath = os.path.join(unknown_error_in_logfile, logfile_basename)
+        rename_and_handle_fileexists(filepath, new_filepath)
+        return None
+
+    return header, centre, mosaiq_string_time, path_string_time
+
+
+def _move_logfile_into_index(
+    filehash,
+    filepath,
+    indexed_directory,
+    index,
+    centre,
+    delivery_details,
+    header: Header,
+    mosaiq_string_time,
+    path_string_time,
+):
+    logfile_directory_name = create_logfile_directory_name(
+        centre, delivery_details, header, path_string_time
+    )
+
+    abs_logfile_directory_name = os.path.abspath(
+        os.path.join(indexed_directory, logfile_directory_name)
+    )
+
+    pathlib.Path(abs_logfile_directory_name).mkdir(parents=True, exist_ok=True)
+
+    new_filepath = os.path.join(logfile_directory_name, os.path.basename(filepath))
+
+    # Each index entry is committed within its own transaction, so
+    # the index is only ever a single row behind the files on disk.
+    index[filehash] = create_index_entry(
+        new_filepath, delivery_details, header, mosaiq_string_time
+    )
+
+    abs_new_filepath = os.path.abspath(os.path.join(indexed_directory, new_filepath))
+
+    os.rename(filepath, abs_new_filepath)
+
+    print("Indexed logfile:\n    {} -->\n    {}".format(filepath, abs_new_filepath))
+
+
 def file_ready_to_be_indexed(
     connections,
     filehash_list,
@@ -152,36 +243,27 @@ def file_ready_to_be_indexed(
     no_mosaiq_record_found,
     no_field_label_in_logfile,
     indexed_directory,
-    index_filepath,
     index,
     machine_map,
     centre_details,
     centre_server_map,
 ):
     for filehash in filehash_list:
-        logfile_basename = os.path.basename(to_be_indexed_dict[filehash])
+        filepath = to_be_indexed_dict[filehash]
 
-        try:
-            header = decode_header_from_file(to_be_indexed_dict[filehash])
-            print("\n{}".format(header))
-            if header.field_label == "":
-                print("No field label in logfile")
-                new_filepath = os.path.join(no_field_label_in_logfile, logfile_basename)
-                rename_and_handle_fileexists(to_be_indexed_dict[filehash], new_filepath)
-                continue
-
-            centre = machine_map[header.machine]["centre"]
-            server = centre_server_map[centre]
-
-            mosaiq_string_time, path_string_time = date_convert(
-                header.date, centre_details[centre]["timezone"]
-            )
-        except Exception:  # pylint: disable = broad-except
-            traceback.print_exc()
-            new_filepath = os.path.join(unknown_error_in_logfile, logfile_basename)
-            rename_and_handle_fileexists(to_be_indexed_dict[filehash], new_filepath)
+        prepared = _prepare_logfile_for_indexing(
+            filepath,
+            unknown_error_in_logfile,
+            no_field_label_in_logfile,
+            machine_map,
+            centre_details,
+        )
+        if prepared is None:
             continue
 
+        header, centre, mosaiq_string_time, path_string_time = prepared
+        server = centre_server_map[centre]
+
         try:
             delivery_details = get_mosaiq_delivery_details(
                 connections[server],
@@ -189,51 +271,126 @@ def file_ready_to_be_indexed(
                 mosaiq_string_time,
                 header.field_label,
                 header.field_name,
-                buffer=240,
+                buffer=MOSAIQ_TIME_BUFFER,
             )
         except NoMosaiqEntries as e:
             print(e)
-            new_filepath = os.path.join(no_mosaiq_record_found, logfile_basename)
-            rename_and_handle_fileexists(to_be_indexed_dict[filehash], new_filepath)
+            new_filepath = os.path.join(
+                no_mosaiq_record_found, os.path.basename(filepath)
+            )
+            rename_and_handle_fileexists(filepath, new_filepath)
             continue
 
-        logfile_directory_name = create_logfile_directory_name(
-            centre, delivery_details, header, path_string_time
+        _move_logfile_into_index(
+            filehash,
+            filepath,
+            indexed_directory,
+            index,
+            centre,
+            delivery_details,
+            header,
+            mosaiq_string_time,
+            path_string_time,
         )
 
-        abs_logfile_directory_name = os.path.abspath(
-            os.path.join(indexed_directory, logfile_directory_name)
-        )
 
-        pathlib.Path(abs_logfile_directory_name).mkdir(parents=True, exist_ok=True)
+class MosaiqTreatmentCache:
+    """Retrieves and caches a whole day of Mosaiq treatment records per
+    machine for the duration of an indexing run.
+
+    All logfiles delivered on a given machine on a given day are then
+    identified from a single query, instead of one query per logfile.
+    """
+
+    def __init__(self, connections, buffer=MOSAIQ_TIME_BUFFER):
+        self.connections = connections
+        self.buffer = buffer
+        self._treatments = {}
+
+    def get_treatments(self, server, machine, day):
+        key = (server, machine, day)
+
+        try:
+            return self._treatments[key]
+        except KeyError:
+            pass
 
-        new_filepath = os.path.join(logfile_directory_name, logfile_basename)
+        time_buffer = datetime.timedelta(seconds=self.buffer)
+        start = datetime.datetime.combine(day, datetime.time()) - time_buffer
+        end = start + datetime.timedelta(days=1) + 2 * time_buffer
 
-        index[filehash] = create_index_entry(
-            new_filepath, delivery_details, header, mosaiq_string_time
+        treatments = get_mosaiq_treatments(
+            self.connections[server], machine, start, end
         )
+        self._treatments[key] = treatments
+
+        return treatments
 
-        abs_new_filepath = os.path.abspath(
-            os.path.join(indexed_directory, new_filepath)
+    def get_delivery_details(
+        self, server, machine, mosaiq_string_time, field_label, field_name
+    ):
+        delivery_time = datetime.datetime.strptime(
+            mosaiq_string_time, "%Y-%m-%d %H:%M:%S"
         )
+        treatments = self.get_treatments(server, machine, delivery_time.date())
 
-        index_extension_split = os.path.splitext(index_filepath)
-        temp_index_path = "{}_temp{}".format(
-            index_extension_split[0], index_extension_split[1]
+        return identify_mosaiq_delivery_details(
+            treatments, delivery_time, field_label, field_name, buffer=self.buffer
         )
 
-        with open(temp_index_path, "w") as json_data_file:
-            json.dump(index, json_data_file, indent=2)
 
-        os.replace(temp_index_path, index_filepath)
+def files_ready_to_be_indexed_batched(
+    treatment_cache: MosaiqTreatmentCache,
+    prepared_logfiles,
+    no_mosaiq_record_found,
+    indexed_directory,
+    index,
+    centre_server_map,
+):
+    """Index a set of logfiles that have already been prepared with
+    ``_prepare_logfile_for_indexing``.
 
-        os.rename(to_be_indexed_dict[filehash], abs_new_filepath)
+    The logfiles are grouped by server, machine and day so that each
+    group of deliveries is identified from a single cached Mosaiq query.
+    """
+    groups = collections.defaultdict(list)
+    for filehash, (filepath, prepared) in prepared_logfiles.items():
+        header, centre, mosaiq_string_time, _ = prepared
+        groups[
+            (centre_server_map[centre], header.machine, mosaiq_string_time[0:10])
+        ].append((filehash, filepath, prepared))
+
+    for (server, machine, _), logfiles in groups.items():
+        for filehash, filepath, prepared in logfiles:
+            header, centre, mosaiq_string_time, path_string_time = prepared
+
+            try:
+                delivery_details = treatment_cache.get_delivery_details(
+                    server,
+                    machine,
+                    mosaiq_string_time,
+                    header.field_label,
+                    header.field_name,
+                )
+            except NoMosaiqEntries as e:
+                print(e)
+                new_filepath = os.path.join(
+                    no_mosaiq_record_found, os.path.basename(filepath)
+                )
+                rename_and_handle_fileexists(filepath, new_filepath)
+                continue
 
-        print(
-            "Indexed logfile:\n    {} -->\n    {}".format(
-                to_be_indexed_dict[filehash], abs_new_filepath
+            _move_logfile_into_index(
+                filehash,
+                filepath,
+                indexed_directory,
+                index,
+                centre,
+                delivery_details,
+                header,
+                mosaiq_string_time,
+                path_string_time,
             )
-        )
 
 
 def _separate_server_port_string(sql_server_and_port):
@@ -266,9 +423,36 @@ def _separate_server_port_string(sql_server_and_port):
     return server, port
 
 
-def index_logfiles(centre_map, machine_map, logfile_data_directory):
+def _hash_and_decode_headers(filepaths):
+    hashlist = [hash_file(filename, dot_feedback=True) for filename in filepaths]
+
+    headers = []
+    for filepath in filepaths:
+        try:
+            headers.append(decode_header_from_file(filepath))
+        except Exception as e:  # pylint: disable = broad-except
+            headers.append(e)
+
+    return hashlist, headers
+
+
+def index_logfiles(centre_map, machine_map, logfile_data_directory, batched=False):
+    """Index the logfiles within the ``to_be_indexed`` directory.
+
+    Parameters
+    ----------
+    centre_map : dict
+    machine_map : dict
+    logfile_data_directory : os.PathLike
+    batched : bool, optional
+        If ``True``, Mosaiq is queried once per machine per day and the
+        results are reused for every logfile delivered on that day.
+        Hashing and header decoding of the next chunk of logfiles is
+        also undertaken while the current chunk's Mosaiq queries are in
+        flight. Defaults to ``False``, where each logfile is identified
+        with its own query.
+    """
     data_directory = logfile_data_directory
-    index_filepath = os.path.abspath(os.path.join(data_directory, "index.json"))
     to_be_indexed_directory = os.path.abspath(
         os.path.join(data_directory, "to_be_indexed")
     )
@@ -295,13 +479,7 @@ def index_logfiles(centre_map, machine_map, logfile_data_directory):
         for _, details in centre_details.items()
     ]
 
-    try:
-        with open(index_filepath) as json_data_file:
-            index = json.load(json_data_file)
-    except FileNotFoundError:
-        index = {}
-
-    indexset = set(index.keys())
+    index = open_index(data_directory)
 
     print("\nConnecting to Mosaiq SQL servers...")
 
@@ -322,41 +500,134 @@ def index_logfiles(centre_map, machine_map, logfile_data_directory):
         for i in range(0, number_to_be_indexed, chunk_size)
     ]
 
-    for i, a_to_be_indexed_chunk in enumerate(to_be_indexed_chunked):
-        print(
-            "\nHashing a chunk of logfiles ({}/{})".format(
-                i + 1, len(to_be_indexed_chunked)
-            )
-        )
-        hashlist = [
-            hash_file(filename, dot_feedback=True) for filename in a_to_be_indexed_chunk
-        ]
-
-        print(" ")
-
-        to_be_indexed_dict = dict(zip(hashlist, a_to_be_indexed_chunk))
-
-        hashset = set(hashlist)
-
-        for filehash in list(hashset.intersection(indexset)):
-            file_already_in_index(
-                os.path.join(indexed_directory, index[filehash]["filepath"]),
-                to_be_indexed_dict[filehash],
-                filehash,
-            )
-
-        file_ready_to_be_indexed(
+    if batched:
+        _index_chunks_batched(
+            to_be_indexed_chunked,
             connections,
-            list(hashset.difference(indexset)),
-            to_be_indexed_dict,
             unknown_error_in_logfile,
             no_mosaiq_record_found,
             no_field_label_in_logfile,
             indexed_directory,
-            index_filepath,
             index,
             machine_map,
             centre_details,
             centre_server_map,
         )
+    else:
+        for i, a_to_be_indexed_chunk in enumerate(to_be_indexed_chunked):
+            print(
+                "\nHashing a chunk of logfiles ({}/{})".format(
+                    i + 1, len(to_be_indexed_chunked)
+                )
+            )
+            hashlist = [
+                hash_file(filename, dot_feedback=True)
+                for filename in a_to_be_indexed_chunk
+            ]
+
+            print(" ")
+
+            to_be_indexed_dict = dict(zip(hashlist, a_to_be_indexed_chunk))
+            not_yet_indexed = _remove_already_indexed(
+                to_be_indexed_dict, index, indexed_directory
+            )
+
+            file_ready_to_be_indexed(
+                connections,
+                not_yet_indexed,
+                to_be_indexed_dict,
+                unknown_error_in_logfile,
+                no_mosaiq_record_found,
+                no_field_label_in_logfile,
+                indexed_directory,
+                index,
+                machine_map,
+                centre_details,
+                centre_server_map,
+            )
+
+    index.close()
     print("Complete")
+
+
+def _remove_already_indexed(to_be_indexed_dict, index, indexed_directory):
+    not_yet_indexed = []
+    for filehash, filepath in to_be_indexed_dict.items():
+        if filehash in index:
+            file_already_in_index(
+                os.path.join(indexed_directory, index[filehash]["filepath"]),
+                filepath,
+                filehash,
+            )
+        else:
+            not_yet_indexed.append(filehash)
+
+    return not_yet_indexed
+
+
+def _index_chunks_batched(
+    to_be_indexed_chunked,
+    connections,
+    unknown_error_in_logfile,
+    no_mosaiq_record_found,
+    no_field_label_in_logfile,
+    indexed_directory,
+    index,
+    machine_map,
+    centre_details,
+    centre_server_map,
+):
+    treatment_cache = MosaiqTreatmentCache(connections)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        futures = [
+            executor.submit(_hash_and_decode_headers, chunk)
+            for chunk in to_be_indexed_chunked[0:1]
+        ]
+
+        for i, a_to_be_indexed_chunk in enumerate(to_be_indexed_chunked):
+            print(
+                "\nHashing a chunk of logfiles ({}/{})".format(
+                    i + 1, len(to_be_indexed_chunked)
+                )
+            )
+            hashlist, headers = futures[i].result()
+            print(" ")
+
+            # Begin reading the next chunk while this chunk's Mosaiq
+            # queries are undertaken.
+            if i + 1 < len(to_be_indexed_chunked):
+                futures.append(
+                    executor.submit(
+                        _hash_and_decode_headers, to_be_indexed_chunked[i + 1]
+                    )
+                )
+
+            to_be_indexed_dict = dict(zip(hashlist, a_to_be_indexed_chunk))
+            headers_by_hash = dict(zip(hashlist, headers))
+            not_yet_indexed = _remove_already_indexed(
+                to_be_indexed_dict, index, indexed_directory
+            )
+
+            prepared_logfiles = {}
+            for filehash in not_yet_indexed:
+                filepath = to_be_indexed_dict[filehash]
+                prepared = _prepare_logfile_for_indexing(
+                    filepath,
+                    unknown_error_in_logfile,
+                    no_field_label_in_logfile,
+                    machine_map,
+                    centre_details,
+                    header=headers_by_hash[filehash],
+                )
+                if prepared is not None:
+                    prepared_logfiles[filehash] = (filepath, prepared)
+
+            files_ready_to_be_indexed_batched(
+                treatment_cache,
+                prepared_logfiles,
+                no_mosaiq_record_found,
+                indexed_directory,
+                index,
+                centre_server_map,
+            )
@@ -0,0 +1,256 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""An SQLite backed index of the logfiles within the logfile archive.
+
+This replaces the ``index.json`` file, which needed to be rewritten in
+full every time a single logfile was indexed. Each entry is stored
+within its own row, keyed by the logfile hash, with the patient ID,
+machine and local delivery time pulled out into indexed columns so
+that they can be queried directly.
+"""
+
+import collections.abc
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymedphys._imports import numpy as np
+
+INDEX_FILENAME = "index.sqlite"
+LEGACY_INDEX_FILENAME = "index.json"
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS logfiles (
+        hash TEXT PRIMARY KEY,
+        filepath TEXT,
+        patient_id TEXT,
+        machine TEXT,
+        local_time TEXT,
+        entry TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS logfiles_patient_id ON logfiles (patient_id);
+    CREATE INDEX IF NOT EXISTS logfiles_machine_time ON logfiles (machine, local_time);
+    CREATE INDEX IF NOT EXISTS logfiles_local_time ON logfiles (local_time);
+"""
+
+
+class LogfileIndex(collections.abc.MutableMapping):
+    """A dictionary like index of logfiles, mapping a logfile hash to
+    its index entry.
+
+    Each assignment is committed within its own transaction, so the
+    index on disk is always in a consistent state even if the indexing
+    process is interrupted.
+
+    Parameters
+    ----------
+    path : os.PathLike
+        The path to the SQLite database file. It is created if it does
+        not already exist.
+    """
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self._connection = sqlite3.connect(str(self.path))
+
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getitem__(self, filehash: str) -> Dict[str, Any]:
+        row = self._connection.execute(
+            "SELECT entry FROM logfiles WHERE hash = ?", (filehash,)
+        ).fetchone()
+
+        if row is None:
+            raise KeyError(filehash)
+
+        return json.loads(row[0])
+
+    def __setitem__(self, filehash: str, entry: Dict[str, Any]):
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO logfiles VALUES (?, ?, ?, ?, ?, ?)",
+                _row(filehash, entry),
+            )
+
+    def __delitem__(self, filehash: str):
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM logfiles WHERE hash = ?", (filehash,)
+            )
+
+        if cursor.rowcount == 0:
+            raise KeyError(filehash)
+
+    def __contains__(self, filehash):
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM logfiles WHERE hash = ?", (filehash,)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self):
+        return iter(
+            [row[0] for row in self._connection.execute("SELECT hash FROM logfiles")]
+        )
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM logfiles").fetchone()[0]
+
+    def update_many(self, entries: Dict[str, Dict[str, Any]]):
+        """Insert many entries within a single transaction."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO logfiles VALUES (?, ?, ?, ?, ?, ?)",
+                [_row(filehash, entry) for filehash, entry in entries.items()],
+            )
+
+    def query(
+        self,
+        patient_id: Optional[str] = None,
+        machine: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Find the logfiles matching all of the provided criteria.
+
+        Parameters
+        ----------
+        patient_id : str, optional
+        machine : str, optional
+        start, end : str, optional
+            An inclusive range of local delivery times, formatted as
+            ``YYYY-MM-DD HH:MM:SS``. A date alone, such as
+            ``YYYY-MM-DD``, may be provided for ``start``.
+
+        Returns
+        -------
+        List[Tuple[str, dict]]
+            The ``(hash, entry)`` pairs, ordered by delivery time.
+        """
+        conditions = []
+        parameters: List[str] = []
+
+        for column, value in [("patient_id", patient_id), ("machine", machine)]:
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+
+        if start is not None:
+            conditions.append("local_time >= ?")
+            parameters.append(start)
+
+        if end is not None:
+            conditions.append("local_time <= ?")
+            parameters.append(end)
+
+        statement = "SELECT hash, entry FROM logfiles"
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+        statement += " ORDER BY local_time"
+
+        return [
+            (filehash, json.loads(entry))
+            for filehash, entry in self._connection.execute(statement, parameters)
+        ]
+
+    def migrate_from_json(self, json_path):
+        """Copy all entries from a legacy ``index.json`` file into this
+        index."""
+        with open(json_path) as json_data_file:
+            legacy_index = json.load(json_data_file)
+
+        self.update_many(legacy_index)
+
+
+def open_index(data_directory) -> LogfileIndex:
+    """Open the logfile index within a logfile data directory.
+
+    Should only a legacy ``index.json`` exist within the data directory,
+    its entries are migrated into a new SQLite index.
+    """
+    data_directory = pathlib.Path(data_directory)
+    index_path = data_directory.joinpath(INDEX_FILENAME)
+    legacy_index_path = data_directory.joinpath(LEGACY_INDEX_FILENAME)
+
+    if not index_path.exists() and legacy_index_path.exists():
+        _migrate(legacy_index_path, index_path)
+
+    return LogfileIndex(index_path)
+
+
+def _migrate(legacy_index_path, index_path):
+    """Migrate a legacy index into a temporary database, only moving it
+    into place once complete. An interrupted or failed migration leaves
+    no ``index.sqlite`` behind, and so is retried upon the next start.
+    """
+    logging.info("Migrating %s to %s", legacy_index_path, index_path)
+
+    temporary_path = index_path.with_name(f".{index_path.name}.migrating")
+    _remove_database(temporary_path)
+
+    try:
+        with LogfileIndex(temporary_path) as index:
+            index.migrate_from_json(legacy_index_path)
+
+        os.replace(temporary_path, index_path)
+    finally:
+        _remove_database(temporary_path)
+
+
+def _remove_database(path: pathlib.Path):
+    for suffix in ["", "-wal", "-shm"]:
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def _row(filehash: str, entry: Dict[str, Any]):
+    delivery_details = entry.get("delivery_details", {})
+    logfile_header = entry.get("logfile_header", {})
+
+    return (
+        filehash,
+        entry.get("filepath"),
+        delivery_details.get("patient_id"),
+        logfile_header.get("machine"),
+        entry.get("local_time"),
+        json.dumps(entry, default=_json_default),
+    )
+
+
+def _json_default(item):
+    # The decoded logfile header contains NumPy types, such as the
+    # item parts array.
+    if isinstance(item, (np.ndarray, np.generic)):
+        return item.tolist()
+
+    if isinstance(item, os.PathLike):
+        return os.fspath(item)
+
+    raise TypeError(f"Object of type {type(item).__name__} is not JSON serializable")
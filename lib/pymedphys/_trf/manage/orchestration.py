@@ -32,7 +32,7 @@ from .diagnostics_zips import (
 from .index import index_logfiles
 
 
-def orchestration(config):
+def orchestration(config, batched=False):
     logfile_data_directory = pathlib.Path(config["trf_logfiles"]["root_directory"])
     print("Data directory used:\n    {}\n".format(logfile_data_directory))
 
@@ -74,9 +74,9 @@ def orchestration(config):
     extract_diagnostic_zips_and_archive(logfile_data_directory)
 
     print("Indexing logfiles...")
-    index_logfiles(mosaiq_sql, linac_details, logfile_data_directory)
+    index_logfiles(mosaiq_sql, linac_details, logfile_data_directory, batched=batched)
 
 
-def orchestration_cli(_):
+def orchestration_cli(args):
     config = _config.get_config()
-    orchestration(config)
+    orchestration(config, batched=args.batched)
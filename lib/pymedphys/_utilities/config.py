@@ -13,7 +13,6 @@
 # limitations under the License.
 
 
-import json
 import os
 
 
@@ -51,11 +50,10 @@ def get_metersetmap_parameters(config):
 
 
 def get_index(config):
-    index_filepath = os.path.join(get_data_directory(config), "index.json")
-    with open(index_filepath) as json_data_file:
-        index = json.load(json_data_file)
+    # pylint: disable = import-outside-toplevel
+    from pymedphys._trf.manage.indexdb import open_index
 
-    return index
+    return open_index(get_data_directory(config))
 
 
 def get_centre(config, file_info):
@@ -0,0 +1,153 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Apply a function to many files across a pool of processes."""
+
+import collections
+import concurrent.futures
+import concurrent.futures.process
+import logging
+import multiprocessing
+import os
+from collections import namedtuple
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+BatchResult = namedtuple("BatchResult", ["path", "result", "error"])
+
+
+def map_many(
+    function: Callable[[Any], Any],
+    paths: Iterable[Any],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """Apply ``function`` to each path within a process pool, yielding
+    a ``BatchResult`` for each path.
+
+    Should a worker process die, such as by running out of memory, the
+    pool is restarted and the batch continues. The paths which were
+    being processed at the time are each retried within a process of
+    their own, and those which fail again are given a
+    ``BrokenProcessPool`` error.
+    """
+    paths = list(paths)
+
+    if workers == 1:
+        for path in paths:
+            yield _call(function, path)
+
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    pending = collections.deque(range(len(paths)))
+    results = {}
+    next_index = 0
+
+    while pending:
+        suspects = []
+
+        # Only as many paths as there are workers are submitted at a
+        # time, so that should the pool break, the paths which may have
+        # caused it are known.
+        with _process_pool(workers) as executor:
+            running = {}
+            while (pending or running) and not suspects:
+                while pending and len(running) < workers:
+                    index = pending.popleft()
+                    future = executor.submit(_call, function, paths[index])
+                    running[future] = index
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                if any(_is_broken_pool(future.exception()) for future in done):
+                    done, _ = concurrent.futures.wait(running)
+
+                for future in done:
+                    index = running.pop(future)
+                    error = future.exception()
+                    if _is_broken_pool(error):
+                        suspects.append(index)
+                    elif error is not None:
+                        results[index] = BatchResult(paths[index], None, error)
+                    else:
+                        results[index] = future.result()
+
+                next_index, ready = _take_ready(results, next_index, ordered)
+                yield from ready
+
+        if suspects:
+            logging.warning(
+                "A worker process died, retrying %(count)i paths individually",
+                {"count": len(suspects)},
+            )
+
+        for index in sorted(suspects):
+            results[index] = _call_isolated(function, paths[index])
+
+            next_index, ready = _take_ready(results, next_index, ordered)
+            yield from ready
+
+
+def _process_pool(workers):
+    # Workers are spawned instead of forked, as forking a process after
+    # numba's parallel kernels have started their threads deadlocks.
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _is_broken_pool(error):
+    return isinstance(error, concurrent.futures.process.BrokenProcessPool)
+
+
+def _take_ready(results, next_index, ordered):
+    """Remove the results which are ready to be yielded."""
+    if not ordered:
+        ready = list(results.values())
+        results.clear()
+
+        return next_index, ready
+
+    ready = []
+    while next_index in results:
+        ready.append(results.pop(next_index))
+        next_index += 1
+
+    return next_index, ready
+
+
+def _call_isolated(function, path) -> BatchResult:
+    with _process_pool(1) as executor:
+        try:
+            return executor.submit(_call, function, path).result()
+        except concurrent.futures.process.BrokenProcessPool as e:
+            logging.warning(
+                "A worker process died while processing %(path)s",
+                {"path": path},
+            )
+            return BatchResult(path, None, e)
+
+
+def _call(function, path) -> BatchResult:
+    try:
+        return BatchResult(path, function(path), None)
+    except Exception as e:  # pylint: disable = broad-except
+        logging.warning(
+            "Failed to process %(path)s: %(error)s", {"path": path, "error": e}
+        )
+        return BatchResult(path, None, e)
@@ -22,6 +22,7 @@ from pymedphys._vendor.patchlogging import apply_logging_patch
 from .dev import dev_cli
 from .dicom import dicom_cli
 from .experimental import experimental_cli
+from .gamma import gamma_cli
 from .gui import gui_cli
 from .icom import icom_cli
 from .pinnacle import pinnacle_cli
@@ -42,6 +43,7 @@ def define_parser():
 
     dicom_cli(subparsers)
     experimental_cli(subparsers)
+    gamma_cli(subparsers)
     pinnacle_cli(subparsers)
     trf_cli(subparsers)
     dev_cli(subparsers)
@@ -0,0 +1,89 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A command line interface for gamma comparisons of DICOM dose files."""
+
+from pymedphys._gamma.api.batch import gamma_batch_cli
+from pymedphys._gamma.implementation.shell import DEFAULT_RAM, ENGINES
+
+
+def gamma_cli(subparsers):
+    gamma_parser = subparsers.add_parser(
+        "gamma", help="Compare DICOM RT Dose files with the gamma index."
+    )
+    gamma_subparsers = gamma_parser.add_subparsers(dest="gamma")
+    gamma_batch(gamma_subparsers)
+
+    return gamma_parser
+
+
+def gamma_batch(gamma_subparsers):
+    parser = gamma_subparsers.add_parser(
+        "batch",
+        help=(
+            "Calculate gamma for each reference and evaluation pair within a "
+            "manifest across a pool of processes, writing a summary of the "
+            "pass rates. Rerunning with the same summary skips the "
+            "comparisons which have already completed."
+        ),
+    )
+
+    parser.add_argument(
+        "manifest",
+        type=str,
+        help=(
+            "A CSV file with the columns ``reference``, ``evaluation``, "
+            "``dose_percent_threshold`` and ``distance_mm_threshold``, and "
+            "optionally ``job_id``, ``lower_percent_dose_cutoff``, "
+            "``local_gamma``, ``max_gamma`` and ``interp_fraction``."
+        ),
+    )
+    parser.add_argument(
+        "summary",
+        type=str,
+        help="The ``.csv`` or ``.parquet`` file to write the summary to.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "The number of processes to calculate gamma with. Defaults to "
+            "the number of processors."
+        ),
+    )
+    parser.add_argument(
+        "--ram-available",
+        type=float,
+        default=DEFAULT_RAM / 2**30,
+        help=(
+            "The RAM in GiB available to the whole batch, shared equally "
+            "between the processes. Defaults to 1.5."
+        ),
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Overwrite any existing summary instead of resuming from it.",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="numpy",
+        help="The gamma engine to use. Defaults to numpy.",
+    )
+
+    parser.set_defaults(func=gamma_batch_cli)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import pymedphys._icom.listener
+import pymedphys._icom.multilistener
 
 
 def icom_cli(subparsers):
@@ -22,6 +23,7 @@ def icom_cli(subparsers):
     icom_subparsers = icom_parser.add_subparsers(dest="icom")
 
     icom_listen(icom_subparsers)
+    icom_listen_many(icom_subparsers)
 
     return icom_parser
 
@@ -44,6 +46,60 @@ def icom_listen(icom_subparsers):
     parser.add_argument(
         "directory", help="The output directory to store the iCom records."
     )
+    _add_session_file_arguments(parser)
     parser.set_defaults(
         func=pymedphys._icom.listener.listen_cli  # pylint: disable = protected-access
     )
+
+
+def icom_listen_many(icom_subparsers):
+    parser = icom_subparsers.add_parser(
+        "listen-many",
+        help=(
+            "Connect to the Elekta iCom streams of many Linacs within a "
+            "single process. Records are stored and indexed as per "
+            "``pymedphys icom listen``. Dropped connections are retried "
+            "with an exponential backoff."
+        ),
+    )
+
+    parser.add_argument(
+        "directory", help="The output directory to store the iCom records."
+    )
+    parser.add_argument("ips", nargs="*", help="The IP addresses of the Linacs.")
+    parser.add_argument(
+        "--from-config",
+        action="store_true",
+        help="Also listen to each Linac ``ip`` listed within the PyMedPhys config.",
+    )
+    parser.add_argument(
+        "--report-interval",
+        type=float,
+        default=60,
+        help="Seconds between logging the metrics of each Linac's stream.",
+    )
+    _add_session_file_arguments(parser)
+    parser.set_defaults(
+        func=pymedphys._icom.multilistener.listen_many_cli  # pylint: disable = protected-access
+    )
+
+
+def _add_session_file_arguments(parser):
+    parser.add_argument(
+        "--session-files",
+        action="store_true",
+        help=(
+            "Buffer the iCom records and append them to rolling per session "
+            "files, instead of storing each record within its own file named "
+            "by its counter. The iCom observer requires the per record files."
+        ),
+    )
+    parser.add_argument(
+        "--session-storage",
+        type=float,
+        default=10,
+        help=(
+            "The total size, in GB, of the session files retained for each "
+            "Linac. Beyond this the oldest session files are deleted."
+        ),
+    )
@@ -15,6 +15,12 @@
 
 """A command line interface for the conversion of Elekta binary log files."""
 
+from pymedphys._trf.decode.cache import (
+    DEFAULT_MAXIMUM_SIZE,
+    cache_prune_cli,
+    cache_stats_cli,
+    cache_warm_cli,
+)
 from pymedphys._trf.decode.detect import detect_cli
 from pymedphys._trf.decode.trf2csv import trf2csv_cli
 from pymedphys._trf.manage.orchestration import orchestration_cli
@@ -29,6 +35,7 @@ def trf_cli(subparsers):
     trf_to_csv(trf_subparsers)
     trf_detect(trf_subparsers)
     trf_orchestration(trf_subparsers)
+    trf_cache(trf_subparsers)
 
     return trf_parser
 
@@ -50,6 +57,17 @@ def trf_to_csv(trf_subparsers):
         ),
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "The number of processes to use to convert the files in parallel. "
+            "Defaults to 1."
+        ),
+    )
+
     parser.set_defaults(func=trf2csv_cli)
 
 
@@ -68,5 +86,66 @@ def trf_orchestration(trf_subparsers):
         "orchestrate",
         help=("A command line interface for the management of trf files."),
     )
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help=(
+            "Identify logfiles with one Mosaiq query per machine per day, "
+            "instead of one query per logfile."
+        ),
+    )
 
     parser.set_defaults(func=orchestration_cli)
+
+
+def trf_cache(trf_subparsers):
+    cache_parser = trf_subparsers.add_parser(
+        "cache", help="Manage the on-disk cache of decoded ``.trf`` files."
+    )
+    cache_subparsers = cache_parser.add_subparsers(dest="cache")
+    cache_parser.set_defaults(func=lambda _: cache_parser.print_help())
+
+    warm_parser = cache_subparsers.add_parser(
+        "warm", help="Decode ``.trf`` files into the cache."
+    )
+    warm_parser.add_argument(
+        "filepaths",
+        type=str,
+        nargs="+",
+        help="A list of ``.trf`` filepaths. Use of the glob wildcard * is enabled.",
+    )
+    warm_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of processes to decode the files with. Defaults to 1.",
+    )
+    warm_parser.set_defaults(func=cache_warm_cli)
+
+    prune_parser = cache_subparsers.add_parser(
+        "prune",
+        help="Evict the least recently used entries until under the maximum size.",
+    )
+    prune_parser.set_defaults(func=cache_prune_cli)
+
+    stats_parser = cache_subparsers.add_parser(
+        "stats", help="Print a summary of the cache contents."
+    )
+    stats_parser.set_defaults(func=cache_stats_cli)
+
+    for parser in [warm_parser, prune_parser, stats_parser]:
+        parser.add_argument(
+            "--directory",
+            type=str,
+            default=None,
+            help="The cache directory. Defaults to ``~/.pymedphys/cache/trf``.",
+        )
+
+    for parser in [warm_parser, prune_parser]:
+        parser.add_argument(
+            "--max-size",
+            type=float,
+            default=DEFAULT_MAXIMUM_SIZE / 2**30,
+            help="The maximum cache size in GiB. Defaults to 10.",
+        )
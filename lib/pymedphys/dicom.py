@@ -8,6 +8,8 @@ from ._dicom.dose import (
     depth_dose,
     dicom_dose_interpolate,
     profile,
+    zyx_and_dose_frames_from_file,
     zyx_and_dose_from_dataset,
 )
+from ._dicom.dvh import DVH, clear_dvh_cache, dvh, dvh_directory
 from ._dicom.structure.merge import merge_contours
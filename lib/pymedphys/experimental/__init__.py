@@ -2,5 +2,13 @@
 # ruff: noqa: F401
 
 from pymedphys._experimental.cube import align_cube_to_structure, cubify
+from pymedphys._gamma.api.batch import GammaJob, gamma_batch
+from pymedphys._gamma.api.batch import read_manifest as read_gamma_manifest
+from pymedphys._gamma.implementation.passrate import gamma_pass_rate
+from pymedphys._gamma.implementation.points import gamma_point_cloud
+from pymedphys._gamma.implementation.slab import gamma_slabs
+from pymedphys._gamma.implementation.sweep import gamma_sweep
+from pymedphys._metersetmap.accumulator import MetersetMapAccumulator
+from pymedphys._metersetmap.cache import MetersetMapCache
 
 from . import fileformats, pseudonymisation, quickcheck
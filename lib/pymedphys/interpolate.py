@@ -28,7 +28,9 @@ Key Features:
 
 Main Functions:
     - :func:`interp`: High-level interface for linear interpolation
+    - :class:`Interpolator`: Reusable interpolator for repeated queries of the same data
     - :func:`interp_linear_1d`, :func:`interp_linear_2d`, :func:`interp_linear_3d`: Dimension-specific interpolation
+    - :func:`interp_linear_separable`: Resample 2D or 3D data onto another grid without creating its points
     - :func:`plot_interp_comparison_heatmap`: Visualize original vs interpolated data
 
 Dependencies:
@@ -63,9 +65,11 @@ For more detailed information, refer to the individual function docstrings.
 # pylint: disable=unused-import
 # ruff: noqa: F401
 from ._interp.interp import (
+    Interpolator,
     interp,
     interp_linear_1d,
     interp_linear_2d,
     interp_linear_3d,
+    interp_linear_separable,
     plot_interp_comparison_heatmap,
 )
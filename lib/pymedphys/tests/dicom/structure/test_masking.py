@@ -18,7 +18,10 @@ from pymedphys._imports import shapely
 
 from pymedphys._dicom.coords import xyz_axes_from_dataset
 from pymedphys._dicom.create import dicom_dataset_from_dict
-from pymedphys._dicom.dose import get_dose_grid_structure_mask
+from pymedphys._dicom.dose import (
+    get_dose_grid_structure_mask,
+    get_dose_grid_structure_masks,
+)
 
 
 @pytest.mark.pydicom
@@ -77,7 +80,7 @@ def _get_grid_spacing(array):
     dx = np.unique(np.round(np.diff(array), 4))
     assert len(dx) == 1
 
-    return dx
+    return float(dx[0])
 
 
 def _convert_contours_to_dummy_dicom_files(
@@ -166,3 +169,161 @@ def _loop_based_mask_approach(xx, yy, points_within_contour):
         mask[np.logical_and(xx == coord[0], yy == coord[1])] = True
 
     return mask
+
+
+def _create_datasets(structures, x_grid, y_grid, z_grid):
+    """Create an RT Structure Set from a dictionary mapping each structure
+    name to its list of (x, y, z) contours, along with an RT Dose grid."""
+    structure_dataset = dicom_dataset_from_dict(
+        {
+            "StructureSetROISequence": [
+                {"ROINumber": number, "ROIName": name}
+                for number, name in enumerate(structures, start=1)
+            ],
+            "ROIContourSequence": [
+                {
+                    "ReferencedROINumber": number,
+                    "ContourSequence": [
+                        {
+                            "ContourGeometricType": "CLOSED_PLANAR",
+                            "ContourData": np.column_stack([x, y, np.full(len(x), z)])
+                            .ravel()
+                            .tolist(),
+                        }
+                        for x, y, z in contours
+                    ],
+                }
+                for number, contours in enumerate(structures.values(), start=1)
+            ],
+        }
+    )
+
+    dose_dataset = dicom_dataset_from_dict(
+        {
+            "Columns": len(x_grid),
+            "Rows": len(y_grid),
+            "PixelSpacing": [
+                float(y_grid[1] - y_grid[0]),
+                float(x_grid[1] - x_grid[0]),
+            ],
+            "ImagePositionPatient": [
+                float(x_grid[0]),
+                float(y_grid[0]),
+                float(z_grid[0]),
+            ],
+            "ImageOrientationPatient": [1, 0, 0, 0, 1, 0],
+            "GridFrameOffsetVector": [float(z - z_grid[0]) for z in z_grid],
+        }
+    )
+
+    return structure_dataset, dose_dataset
+
+
+def _square(centre, half_width, z):
+    x = centre[0] + half_width * np.array([-1, 1, 1, -1])
+    y = centre[1] + half_width * np.array([-1, -1, 1, 1])
+
+    return x, y, z
+
+
+def _circle(radius, z, number_of_points=200):
+    theta = np.linspace(0, 2 * np.pi, number_of_points, endpoint=False)
+
+    return radius * np.cos(theta), radius * np.sin(theta), z
+
+
+@pytest.mark.pydicom
+def test_multiple_contours_per_slice():
+    grid = np.arange(-10, 10.5, 0.5)
+    xx, yy = np.meshgrid(grid, grid)
+
+    # A square with a square hole within it, and a separate island
+    structures = {
+        "ring": [
+            _square((0, 0), 6.2, 0),
+            _square((0, 0), 2.2, 0),
+            _square((-8, -8), 1.2, 0),
+        ]
+    }
+    structure_dataset, dose_dataset = _create_datasets(structures, grid, grid, [0])
+
+    mask = get_dose_grid_structure_mask("ring", structure_dataset, dose_dataset)
+
+    within_outer = (np.abs(xx) < 6.2) & (np.abs(yy) < 6.2)
+    within_hole = (np.abs(xx) < 2.2) & (np.abs(yy) < 2.2)
+    within_island = (np.abs(xx + 8) < 1.2) & (np.abs(yy + 8) < 1.2)
+
+    assert np.array_equal(mask[0], (within_outer & ~within_hole) | within_island)
+
+
+@pytest.mark.pydicom
+def test_interpolation_between_contour_planes():
+    grid = np.arange(-20, 20.25, 0.25)
+    xx, yy = np.meshgrid(grid, grid)
+    radius = np.hypot(xx, yy)
+
+    # A cone, contoured every 4 mm, upon a dose grid offset from it
+    structures = {"cone": [_circle(14.1 - z, z) for z in (0, 4, 8)]}
+    z_dose = [-3, -1, 2, 6, 9, 11]
+    structure_dataset, dose_dataset = _create_datasets(structures, grid, grid, z_dose)
+
+    mask = get_dose_grid_structure_mask("cone", structure_dataset, dose_dataset)
+
+    # Within half a plane spacing of the end planes their contour is used
+    assert not np.any(mask[0])
+    assert np.array_equal(mask[1], radius < 14.1)
+    assert np.array_equal(mask[4], radius < 6.1)
+    assert not np.any(mask[5])
+
+    # Between planes the interpolated circle lies between the two
+    for dose_index, expected_radius in ((2, 12.1), (3, 8.1)):
+        assert np.all(mask[dose_index][radius < expected_radius - 0.5])
+        assert not np.any(mask[dose_index][radius > expected_radius + 0.5])
+
+
+@pytest.mark.pydicom
+def test_partial_volume_supersampling():
+    grid = np.arange(-5, 5.5, 1.0)
+
+    # The edges of the square pass through the middle of the voxels
+    structures = {"square": [_square((0, 0), 3, 0), _square((0, 0), 3, 1)]}
+    structure_dataset, dose_dataset = _create_datasets(structures, grid, grid, [0, 1])
+
+    fraction = get_dose_grid_structure_mask(
+        "square", structure_dataset, dose_dataset, supersampling=4, partial_volume=True
+    )
+
+    assert np.allclose(np.sum(fraction[0]), 6 * 6)
+    assert fraction[0, 5, 5] == 1
+    assert fraction[0, 5, 2] == 0.5
+    assert fraction[0, 2, 2] == 0.25
+    assert np.array_equal(fraction[0], fraction[1])
+
+    mask = get_dose_grid_structure_mask(
+        "square", structure_dataset, dose_dataset, supersampling=4
+    )
+
+    assert np.array_equal(mask, fraction >= 0.5)
+
+
+@pytest.mark.pydicom
+def test_all_structures_at_once():
+    grid = np.arange(-10, 10.5, 0.5)
+    structures = {
+        "circle": [_circle(5, z) for z in (0, 2, 4)],
+        "square": [_square((1, 2), 3, z) for z in (2, 4)],
+        "empty": [],
+    }
+    structure_dataset, dose_dataset = _create_datasets(
+        structures, grid, grid, [0, 1, 2, 3, 4]
+    )
+
+    masks = get_dose_grid_structure_masks(structure_dataset, dose_dataset)
+
+    assert list(masks) == list(structures)
+    assert not np.any(masks["empty"])
+    for name in ("circle", "square"):
+        assert np.array_equal(
+            masks[name],
+            get_dose_grid_structure_mask(name, structure_dataset, dose_dataset),
+        )
@@ -0,0 +1,208 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom
+
+import pymedphys
+from pymedphys._dicom.create import dicom_dataset_from_dict
+
+from .structure.test_masking import _create_datasets, _square
+
+GRID = np.arange(-10, 11, 1.0)
+Z_GRID = np.arange(0, 5, 1.0)
+DOSE_SCALING = 1e-4
+
+
+def _create_plan(patient_id="test"):
+    """An RT Dose, which increases from 5 Gy to 15 Gy across a box with
+    a volume of 11 x 11 x 5 voxels of 1 mm, along with its RT Structure
+    Set and RT Plan."""
+    structures = {
+        "box": [_square((0, 0), 5.5, z) for z in Z_GRID],
+        "left": [_square((-6, 0), 2.5, z) for z in Z_GRID],
+    }
+    structure_dataset, dose_dataset = _create_datasets(structures, GRID, GRID, Z_GRID)
+
+    dose = np.broadcast_to(GRID + 10, (len(Z_GRID), len(GRID), len(GRID)))
+
+    structure_uid = pydicom.uid.generate_uid()
+    plan = dicom_dataset_from_dict(
+        {
+            "Modality": "RTPLAN",
+            "PatientID": patient_id,
+            "SOPClassUID": pydicom.uid.RTPlanStorage,
+            "SOPInstanceUID": pydicom.uid.generate_uid(),
+            "ReferencedStructureSetSequence": [
+                {"ReferencedSOPInstanceUID": structure_uid}
+            ],
+        }
+    )
+
+    structure_dataset.update(
+        dicom_dataset_from_dict(
+            {
+                "Modality": "RTSTRUCT",
+                "PatientID": patient_id,
+                "SOPClassUID": pydicom.uid.RTStructureSetStorage,
+                "SOPInstanceUID": structure_uid,
+            }
+        )
+    )
+
+    dose_dataset.update(
+        dicom_dataset_from_dict(
+            {
+                "Modality": "RTDOSE",
+                "PatientID": patient_id,
+                "SOPClassUID": pydicom.uid.RTDoseStorage,
+                "SOPInstanceUID": pydicom.uid.generate_uid(),
+                "ReferencedRTPlanSequence": [
+                    {"ReferencedSOPInstanceUID": plan.SOPInstanceUID}
+                ],
+                "BitsAllocated": 32,
+                "BitsStored": 32,
+                "HighBit": 31,
+                "NumberOfFrames": len(Z_GRID),
+                "PixelRepresentation": 0,
+                "SamplesPerPixel": 1,
+                "PhotometricInterpretation": "MONOCHROME2",
+                "PixelData": np.round(dose / DOSE_SCALING).astype(np.uint32).tobytes(),
+                "DoseGridScaling": DOSE_SCALING,
+            }
+        )
+    )
+
+    for dataset in (dose_dataset, structure_dataset, plan):
+        dataset.file_meta = pydicom.dataset.FileMetaDataset()
+        dataset.file_meta.TransferSyntaxUID = pydicom.uid.ImplicitVRLittleEndian
+
+    return dose_dataset, structure_dataset, plan
+
+
+@pytest.mark.pydicom
+def test_dvh_metrics():
+    dose_dataset, structure_dataset, _ = _create_plan()
+    dvhs = pymedphys.dicom.dvh(dose_dataset, structure_dataset, cache=False)
+
+    assert list(dvhs) == ["box", "left"]
+    box = dvhs["box"]
+
+    assert box.bin_width == pytest.approx(0.01)
+    assert box.dose[0] == 0
+    assert box.volume[-1] == 0
+    assert np.all(np.diff(box.volume) <= 0)
+    assert np.sum(box.differential) == pytest.approx(box.total_volume)
+
+    assert box.total_volume == pytest.approx(11 * 11 * 5 / 1000)
+    assert box.metric("Dmin") == pytest.approx(5)
+    assert box.metric("Dmean") == pytest.approx(10)
+    assert box.metric("Dmax") == pytest.approx(15)
+
+    # Each column of the box is a further 1 Gy, and is 1/11 of its volume
+    assert box.metric("V10") == pytest.approx(100 * 6 / 11)
+    assert box.metric("V10Gy") == box.metric("V10")
+    assert box.metric("V10cc") == pytest.approx(6 * 11 * 5 / 1000)
+    assert box.metric("V4") == pytest.approx(100)
+    assert box.metric("V16") == 0
+
+    assert box.metric("D50") == pytest.approx(10, abs=box.bin_width)
+    assert box.metric("D95%") == pytest.approx(5, abs=box.bin_width)
+    assert box.metric("D0.055cc") == pytest.approx(15, abs=box.bin_width)
+    assert box.metric("D100") == pytest.approx(5, abs=box.bin_width)
+    assert np.isnan(box.metric("D1cc"))
+
+    assert dvhs["left"].metric("Dmean") == pytest.approx(4)
+
+    with pytest.raises(ValueError, match="not recognised"):
+        box.metric("E95")
+
+
+@pytest.mark.pydicom
+def test_dvh_cache():
+    dose_dataset, structure_dataset, _ = _create_plan()
+    pymedphys.dicom.clear_dvh_cache()
+
+    first = pymedphys.dicom.dvh(dose_dataset, structure_dataset)
+    second = pymedphys.dicom.dvh(dose_dataset, structure_dataset)
+    assert second["box"] is first["box"]
+
+    # Different parameters, or not using the cache, recalculate the DVHs
+    coarse = pymedphys.dicom.dvh(dose_dataset, structure_dataset, bin_width=0.1)
+    assert coarse["box"].bin_width == pytest.approx(0.1)
+
+    uncached = pymedphys.dicom.dvh(dose_dataset, structure_dataset, cache=False)
+    assert uncached["box"] is not first["box"]
+    assert np.array_equal(uncached["box"].volume, first["box"].volume)
+
+    pymedphys.dicom.clear_dvh_cache()
+    assert (
+        pymedphys.dicom.dvh(dose_dataset, structure_dataset)["box"] is not first["box"]
+    )
+
+
+@pytest.mark.pydicom
+def test_dvh_directory(tmp_path):
+    for patient_id in ("patient_a", "patient_b"):
+        patient_directory = tmp_path / patient_id
+        patient_directory.mkdir()
+
+        for name, dataset in zip(
+            ("dose", "structure", "plan"), _create_plan(patient_id)
+        ):
+            dataset.save_as(patient_directory / f"{name}.dcm", enforce_file_format=True)
+
+    (tmp_path / "notes.txt").write_text("Not a DICOM file")
+
+    summary = pymedphys.dicom.dvh_directory(
+        tmp_path,
+        structure_names=["box", "missing"],
+        metrics=["Dmean", "V10"],
+        workers=1,
+    )
+
+    assert list(summary["patient_id"]) == ["patient_a", "patient_b"]
+    assert list(summary["structure"]) == ["box", "box"]
+    assert np.allclose(summary["Dmean"], 10)
+    assert np.allclose(summary["V10"], 100 * 6 / 11)
+    assert summary["error"].isna().all()
+
+
+@pytest.mark.pydicom
+def test_dvh_rasterised_in_batches(monkeypatch):
+    dose_dataset, structure_dataset, _ = _create_plan()
+    expected = pymedphys.dicom.dvh(dose_dataset, structure_dataset, cache=False)
+
+    rasterised_planes = []
+    rasterise_contours = pymedphys._dicom.dose.rasterise_contours
+
+    def _recording_rasterise_contours(contours_by_plane, *args, **kwargs):
+        rasterised_planes.append(len(contours_by_plane))
+        return rasterise_contours(contours_by_plane, *args, **kwargs)
+
+    # Allow only three of the five planes of each structure per batch
+    monkeypatch.setattr(
+        pymedphys._dicom.dose, "MAXIMUM_RASTERISED_PIXELS", 3 * len(GRID) ** 2
+    )
+    monkeypatch.setattr(
+        pymedphys._dicom.dose, "rasterise_contours", _recording_rasterise_contours
+    )
+
+    batched = pymedphys.dicom.dvh(dose_dataset, structure_dataset, cache=False)
+
+    assert rasterised_planes == [5, 5]
+    for name, dvh in expected.items():
+        assert np.array_equal(batched[name].volume, dvh.volume)
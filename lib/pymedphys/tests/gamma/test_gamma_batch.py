@@ -0,0 +1,171 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable = redefined-outer-name
+
+import subprocess
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys import experimental
+from pymedphys._gamma.api import gamma_dicom
+from pymedphys._utilities import test as pmp_test_utils
+
+from .utilities import create_dicom_dose_file, create_dose_pair
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    rows = ["job_id,reference,evaluation,dose_percent_threshold,distance_mm_threshold"]
+
+    for i in range(3):
+        _, dose_reference, _, dose_evaluation = create_dose_pair((6, 5, 4), seed=i)
+        create_dicom_dose_file(tmp_path / f"reference_{i}.dcm", dose_reference)
+        create_dicom_dose_file(tmp_path / f"evaluation_{i}.dcm", dose_evaluation)
+
+        rows.append(f"plan_{i},reference_{i}.dcm,evaluation_{i}.dcm,3,2")
+
+    (tmp_path / "corrupt.dcm").write_bytes(b"not a dicom file")
+    rows.append("corrupt,reference_0.dcm,corrupt.dcm,3,2")
+
+    path = tmp_path / "manifest.csv"
+    path.write_text("\n".join(rows) + "\n")
+
+    return path
+
+
+def _expected_pass_rate(job):
+    gamma = gamma_dicom(
+        pydicom.dcmread(job.reference),
+        pydicom.dcmread(job.evaluation),
+        job.dose_percent_threshold,
+        job.distance_mm_threshold,
+    )
+
+    return 100 * np.sum(gamma[~np.isnan(gamma)] <= 1) / np.sum(~np.isnan(gamma))
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("workers", [1, 2])
+def test_gamma_batch(manifest_path, tmp_path, workers):
+    jobs = experimental.read_gamma_manifest(manifest_path)
+    summary = experimental.gamma_batch(
+        jobs, tmp_path / "summary.csv", workers=workers
+    ).set_index("job_id")
+
+    assert sorted(summary.index) == sorted(job.job_id for job in jobs)
+    assert summary.loc["corrupt", "status"] == "failed"
+    assert "ImagePositionPatient" in summary.loc["corrupt", "error"]
+
+    for job in jobs[:3]:
+        assert summary.loc[job.job_id, "status"] == "ok"
+        assert summary.loc[job.job_id, "pass_rate"] == pytest.approx(
+            _expected_pass_rate(job)
+        )
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "summary.csv", keep_default_na=False, na_values=[""])
+        .set_index("job_id")
+        .drop(columns="error"),
+        summary.drop(columns="error"),
+    )
+
+
+@pytest.mark.pydicom
+def test_gamma_batch_resume(manifest_path, tmp_path):
+    jobs = experimental.read_gamma_manifest(manifest_path)
+    summary_path = tmp_path / "summary.csv"
+
+    first = experimental.gamma_batch(jobs[:2], summary_path, workers=1)
+
+    # Emulate an interruption part way through writing a row
+    with open(summary_path, "a") as f:
+        f.write("plan_2,reference_2.dcm,evaluation_2.dcm,3,2,20,False,,ok,98.")
+
+    second = experimental.gamma_batch(jobs, summary_path, workers=1)
+    assert list(second["job_id"]) == ["plan_0", "plan_1", "plan_2", "corrupt"]
+
+    # The completed comparisons are not recalculated
+    pd.testing.assert_frame_equal(second.iloc[:2], first, check_dtype=False)
+
+    third = experimental.gamma_batch(jobs, summary_path, workers=1)
+    assert list(third["job_id"]) == ["plan_0", "plan_1", "plan_2", "corrupt"]
+    pd.testing.assert_frame_equal(third.iloc[:3], second.iloc[:3])
+
+    fresh = experimental.gamma_batch(jobs[:1], summary_path, workers=1, resume=False)
+    assert list(fresh["job_id"]) == ["plan_0"]
+
+
+@pytest.mark.pydicom
+def test_gamma_batch_parquet(manifest_path, tmp_path):
+    pytest.importorskip("pyarrow")
+
+    jobs = experimental.read_gamma_manifest(manifest_path)
+    summary_path = tmp_path / "summary.parquet"
+
+    summary = experimental.gamma_batch(jobs, summary_path, workers=1)
+
+    assert not (tmp_path / "summary.parquet.partial.csv").exists()
+    pd.testing.assert_frame_equal(pd.read_parquet(summary_path), summary)
+
+    resumed = experimental.gamma_batch(jobs, summary_path, workers=1)
+    assert list(resumed["job_id"]) == ["plan_0", "plan_1", "plan_2", "corrupt"]
+
+
+def test_manifest_defaults(tmp_path):
+    path = tmp_path / "manifest.csv"
+    path.write_text(
+        "reference,evaluation,dose_percent_threshold,distance_mm_threshold,"
+        "local_gamma,max_gamma\n"
+        "a.dcm,b.dcm,3,2,,\n"
+        "a.dcm,b.dcm,2,2,true,1.5\n"
+    )
+
+    first, second = experimental.read_gamma_manifest(path)
+
+    assert first.reference == str(tmp_path / "a.dcm")
+    assert first.job_id != second.job_id
+    assert first.local_gamma is False and first.max_gamma is None
+    assert second.local_gamma is True and second.max_gamma == 1.5
+
+    path.write_text("reference,evaluation\na.dcm,b.dcm\n")
+    with pytest.raises(ValueError, match="dose_percent_threshold"):
+        experimental.read_gamma_manifest(path)
+
+
+@pytest.mark.pydicom
+def test_gamma_batch_cli(manifest_path, tmp_path):
+    summary_path = tmp_path / "summary.csv"
+    command = [
+        str(pmp_test_utils.get_executable_even_when_embedded()),
+        "-m",
+        "pymedphys",
+        "gamma",
+        "batch",
+        str(manifest_path),
+        str(summary_path),
+        "--jobs",
+        "2",
+    ]
+
+    completed = subprocess.run(command, capture_output=True, check=False)
+
+    assert completed.returncode != 0
+    assert b"corrupt" in completed.stderr
+
+    summary = pd.read_csv(summary_path)
+    assert sorted(summary["job_id"]) == ["corrupt", "plan_0", "plan_1", "plan_2"]
+    assert list(summary["status"]).count("ok") == 3
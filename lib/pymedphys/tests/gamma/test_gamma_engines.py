@@ -0,0 +1,155 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the gamma shell engines against one another."""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys import experimental
+
+from .utilities import create_dose_pair
+
+
+def _gamma_both_engines(
+    axes_reference, dose_reference, axes_evaluation, dose_evaluation, **kwargs
+):
+    return [
+        pymedphys.gamma(
+            axes_reference,
+            dose_reference,
+            axes_evaluation,
+            dose_evaluation,
+            engine=engine,
+            **kwargs,
+        )
+        for engine in ("numpy", "numba")
+    ]
+
+
+@pytest.mark.parametrize("shape", [(41,), (31, 25), (15, 13, 11)])
+@pytest.mark.parametrize("local_gamma", [False, True])
+def test_numba_engine_matches_numpy(shape, local_gamma):
+    gamma_numpy, gamma_numba = _gamma_both_engines(
+        *create_dose_pair(shape),
+        dose_percent_threshold=3,
+        distance_mm_threshold=2,
+        local_gamma=local_gamma,
+        max_gamma=2,
+    )
+
+    assert np.array_equal(gamma_numpy, gamma_numba, equal_nan=True)
+
+
+def test_numba_engine_multiple_thresholds():
+    axes, reference, _, evaluation = create_dose_pair((21, 17))
+
+    gamma_numpy, gamma_numba = _gamma_both_engines(
+        axes,
+        reference,
+        axes,
+        evaluation,
+        dose_percent_threshold=[2, 3],
+        distance_mm_threshold=[1, 2, 3],
+    )
+
+    assert gamma_numpy.keys() == gamma_numba.keys()
+    for key, gamma in gamma_numpy.items():
+        assert np.array_equal(gamma, gamma_numba[key], equal_nan=True)
+
+
+def test_unknown_engine():
+    axes, reference, _, evaluation = create_dose_pair((11,))
+
+    with pytest.raises(ValueError, match="engine"):
+        pymedphys.gamma(axes, reference, axes, evaluation, 3, 2, engine="fortran")
+
+    with pytest.raises(ValueError, match="numba"):
+        pymedphys.gamma(
+            axes,
+            reference,
+            axes,
+            evaluation,
+            3,
+            2,
+            engine="numba",
+            interp_algo="scipy",
+        )
+
+
+def test_numba_engine_uneven_evaluation_axes():
+    axes_reference = (np.arange(-10, 10.5, 1.0),)
+    axes_evaluation = (np.concatenate([np.arange(-12, 0, 0.5), np.arange(0, 13, 2.0)]),)
+
+    def dose(axis):
+        return np.exp(-(axis**2) / 50)
+
+    dose_pair = (
+        axes_reference,
+        dose(axes_reference[0]),
+        axes_evaluation,
+        1.02 * dose(axes_evaluation[0] - 0.5),
+    )
+    kwargs = dict(dose_percent_threshold=2, distance_mm_threshold=1, max_gamma=2)
+
+    # The numpy engine handles the uneven spacing as scipy does
+    assert np.allclose(
+        pymedphys.gamma(*dose_pair, **kwargs),
+        pymedphys.gamma(*dose_pair, interp_algo="scipy", **kwargs),
+        equal_nan=True,
+    )
+
+    # The numba engine can not, so refuses instead of disagreeing
+    with pytest.raises(ValueError, match="evenly spaced"):
+        pymedphys.gamma(*dose_pair, engine="numba", **kwargs)
+
+    with pytest.raises(ValueError, match="evenly spaced"):
+        experimental.gamma_pass_rate(*dose_pair, 2, 1, engine="numba")
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "shape", [(2001,), (201, 201), (61, 61, 61)], ids=["1d", "2d", "3d"]
+)
+@pytest.mark.parametrize("local_gamma", [False, True], ids=["global", "local"])
+def test_benchmark_gamma_engines(shape, local_gamma):
+    dose_pair = create_dose_pair(shape)
+    kwargs = dict(
+        dose_percent_threshold=3,
+        distance_mm_threshold=2,
+        local_gamma=local_gamma,
+        max_gamma=2,
+    )
+
+    # Exclude the JIT compilation from the timings
+    pymedphys.gamma(*create_dose_pair((5,) * len(shape)), engine="numba", **kwargs)
+
+    durations = {}
+    results = {}
+    for engine in ("numpy", "numba"):
+        start = time.perf_counter()
+        results[engine] = pymedphys.gamma(*dose_pair, engine=engine, **kwargs)
+        durations[engine] = time.perf_counter() - start
+
+    assert np.array_equal(results["numpy"], results["numba"], equal_nan=True)
+
+    print(
+        f"\n{len(shape)}D {shape} | "
+        f"numpy: {durations['numpy']:.2f} s | "
+        f"numba: {durations['numba']:.2f} s | "
+        f"speedup: {durations['numpy'] / durations['numba']:.1f}x"
+    )
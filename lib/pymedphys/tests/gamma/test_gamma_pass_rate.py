@@ -0,0 +1,99 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the pass rate only gamma."""
+
+import time
+
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys import experimental
+from pymedphys._gamma.utilities import calculate_pass_rate
+
+from .utilities import create_dose_pair
+
+
+@pytest.mark.parametrize("shape", [(101,), (41, 37), (15, 13, 11)])
+@pytest.mark.parametrize("local_gamma", [False, True])
+def test_matches_full_gamma(shape, local_gamma):
+    dose_pair = create_dose_pair(shape)
+
+    expected = calculate_pass_rate(
+        pymedphys.gamma(*dose_pair, 2, 1, local_gamma=local_gamma)
+    )
+    result = experimental.gamma_pass_rate(*dose_pair, 2, 1, local_gamma=local_gamma)
+
+    assert result.pass_rate == expected
+    assert result.lower == result.upper == result.pass_rate
+    assert result.points_evaluated == result.points_total
+    assert 0 < result.pass_rate < 100
+
+
+def test_sampling_stops_within_tolerance():
+    dose_pair = create_dose_pair((121, 121), grid_spacing=1.0)
+    expected = experimental.gamma_pass_rate(*dose_pair, 2, 1)
+
+    result = experimental.gamma_pass_rate(
+        *dose_pair, 2, 1, tolerance=2, initial_sample_size=200, random_state=0
+    )
+
+    assert result.uncertainty <= 2
+    assert result.points_evaluated < result.points_total
+    assert result.lower <= expected.pass_rate <= result.upper
+
+
+def test_sampling_evaluates_everything_when_needed():
+    dose_pair = create_dose_pair((41, 37))
+    expected = experimental.gamma_pass_rate(*dose_pair, 2, 1)
+
+    result = experimental.gamma_pass_rate(
+        *dose_pair, 2, 1, tolerance=0, initial_sample_size=10, random_state=0
+    )
+
+    assert result == expected
+
+
+def test_single_threshold_only():
+    with pytest.raises(ValueError, match="single"):
+        experimental.gamma_pass_rate(*create_dose_pair((11,)), [2, 3], 1)
+
+
+@pytest.mark.slow
+def test_benchmark_pass_rate():
+    dose_pair = create_dose_pair((61, 61, 61))
+
+    start = time.perf_counter()
+    expected = calculate_pass_rate(pymedphys.gamma(*dose_pair, 2, 1, max_gamma=2))
+    full_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = experimental.gamma_pass_rate(*dose_pair, 2, 1)
+    pass_rate_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sampled = experimental.gamma_pass_rate(
+        *dose_pair, 2, 1, tolerance=1, random_state=0
+    )
+    sampled_duration = time.perf_counter() - start
+
+    assert result.pass_rate == expected
+    assert sampled.lower <= expected <= sampled.upper
+
+    print(
+        f"\nFull gamma: {full_duration:.2f} s | "
+        f"pass rate only: {pass_rate_duration:.2f} s | "
+        f"sampled to within 1%: {sampled_duration:.2f} s "
+        f"({sampled.points_evaluated} of {sampled.points_total} points)"
+    )
@@ -0,0 +1,200 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the KD-tree based point cloud gamma."""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys import experimental
+
+from .utilities import create_dose_pair
+
+
+def brute_force_gamma(
+    points_reference,
+    dose_reference,
+    points_evaluation,
+    dose_evaluation,
+    dose_percent_threshold,
+    distance_mm_threshold,
+    lower_percent_dose_cutoff=20,
+    max_gamma=np.inf,
+    local_gamma=False,
+    global_normalisation=None,
+):
+    """An all pairs gamma over the evaluation points."""
+    if global_normalisation is None:
+        global_normalisation = np.max(dose_reference)
+    if local_gamma:
+        dose_criterion = dose_percent_threshold / 100 * dose_reference[:, None]
+    else:
+        dose_criterion = dose_percent_threshold / 100 * global_normalisation
+
+    distance = np.sqrt(
+        np.sum(
+            (points_reference[:, None, :] - points_evaluation[None, :, :]) ** 2,
+            axis=-1,
+        )
+    )
+    gamma = np.min(
+        np.sqrt(
+            ((dose_evaluation[None, :] - dose_reference[:, None]) / dose_criterion) ** 2
+            + (distance / distance_mm_threshold) ** 2
+        ),
+        axis=1,
+    )
+
+    gamma[dose_reference < lower_percent_dose_cutoff / 100 * global_normalisation] = (
+        np.nan
+    )
+    gamma[gamma > max_gamma] = max_gamma
+
+    return gamma
+
+
+def create_point_clouds(num_reference, num_evaluation, num_dimensions, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def dose(points):
+        return np.exp(-np.sum(points**2, axis=-1) / (2 * 30**2))
+
+    points_reference = rng.uniform(-50, 50, (num_reference, num_dimensions))
+    points_evaluation = rng.uniform(-50, 50, (num_evaluation, num_dimensions))
+    dose_evaluation = 1.02 * dose(points_evaluation + 0.5) + rng.normal(
+        0, 0.01, num_evaluation
+    )
+
+    return points_reference, dose(points_reference), points_evaluation, dose_evaluation
+
+
+@pytest.mark.parametrize("num_dimensions", [1, 2, 3])
+@pytest.mark.parametrize("local_gamma", [False, True])
+@pytest.mark.parametrize("max_gamma", [None, 1.5])
+def test_matches_brute_force(num_dimensions, local_gamma, max_gamma):
+    clouds = create_point_clouds(300, 2000, num_dimensions)
+
+    gamma = experimental.gamma_point_cloud(
+        *clouds, 3, 2, local_gamma=local_gamma, max_gamma=max_gamma
+    )
+    expected = brute_force_gamma(
+        *clouds,
+        3,
+        2,
+        local_gamma=local_gamma,
+        max_gamma=np.inf if max_gamma is None else max_gamma,
+    )
+
+    assert np.allclose(gamma, expected, equal_nan=True)
+    assert np.sum(np.isnan(gamma)) < len(gamma)
+
+
+def test_detector_array_against_grid():
+    """A detector array as the reference, compared with a TPS grid."""
+    axes, grid_dose, _, _ = create_dose_pair((41, 37), grid_spacing=2.5)
+
+    rng = np.random.default_rng(1)
+    detectors = rng.uniform(-40, 40, (200, 2))
+    mesh = np.meshgrid(*axes, indexing="ij")
+    grid_points = np.column_stack([np.ravel(item) for item in mesh])
+
+    nearest = np.argmin(
+        np.sum((detectors[:, None, :] - grid_points[None, :, :]) ** 2, axis=-1), axis=1
+    )
+    detector_dose = np.ravel(grid_dose)[nearest]
+
+    gamma = experimental.gamma_point_cloud(
+        detectors, detector_dose, axes, grid_dose, 3, 2, lower_percent_dose_cutoff=0
+    )
+    expected = brute_force_gamma(
+        detectors, detector_dose, grid_points, np.ravel(grid_dose), 3, 2, 0
+    )
+
+    assert np.allclose(gamma, expected)
+
+    # Reversing the roles returns gamma on the TPS grid
+    grid_gamma = experimental.gamma_point_cloud(
+        axes, grid_dose, detectors, detector_dose, 3, 2, max_gamma=2
+    )
+    assert grid_gamma.shape == grid_dose.shape
+
+
+def test_invalid_evaluation_points_are_ignored():
+    points_reference, dose_reference, points_evaluation, dose_evaluation = (
+        create_point_clouds(100, 500, 2)
+    )
+    dose_evaluation[::2] = np.nan
+
+    gamma = experimental.gamma_point_cloud(
+        points_reference, dose_reference, points_evaluation, dose_evaluation, 3, 2
+    )
+    expected = brute_force_gamma(
+        points_reference,
+        dose_reference,
+        points_evaluation[1::2],
+        dose_evaluation[1::2],
+        3,
+        2,
+    )
+
+    assert np.allclose(gamma, expected, equal_nan=True)
+
+
+def test_mismatched_inputs():
+    with pytest.raises(ValueError, match="dimensions"):
+        experimental.gamma_point_cloud(
+            np.zeros((3, 2)), np.ones(3), np.zeros((3, 3)), np.ones(3), 3, 2
+        )
+
+    with pytest.raises(ValueError, match="dose points"):
+        experimental.gamma_point_cloud(
+            np.zeros((3, 2)), np.ones(4), np.zeros((3, 2)), np.ones(3), 3, 2
+        )
+
+
+@pytest.mark.slow
+def test_benchmark_against_brute_force():
+    clouds = create_point_clouds(20000, 20000, 2)
+
+    points_reference, dose_reference, points_evaluation, dose_evaluation = clouds
+
+    start = time.perf_counter()
+    expected = np.concatenate(
+        [
+            brute_force_gamma(
+                points_reference[i : i + 1000],
+                dose_reference[i : i + 1000],
+                points_evaluation,
+                dose_evaluation,
+                3,
+                2,
+                global_normalisation=np.max(dose_reference),
+            )
+            for i in range(0, len(dose_reference), 1000)
+        ]
+    )
+    brute_force_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gamma = experimental.gamma_point_cloud(*clouds, 3, 2)
+    duration = time.perf_counter() - start
+
+    assert np.allclose(gamma, expected, equal_nan=True)
+
+    print(
+        f"\n20000 x 20000 points | all pairs: {brute_force_duration:.2f} s | "
+        f"KD-tree: {duration:.2f} s"
+    )
@@ -0,0 +1,158 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare gamma calculated in slabs against the full gamma shell."""
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+import pymedphys
+from pymedphys import experimental
+from pymedphys._dicom import create
+
+from .utilities import create_dose_pair
+
+GAMMA_OPTIONS = dict(
+    dose_percent_threshold=3,
+    distance_mm_threshold=2,
+    max_gamma=2,
+)
+
+
+@pytest.mark.parametrize("slab_size", [1, 3, 100])
+@pytest.mark.parametrize("local_gamma", [False, True])
+def test_slabs_match_gamma_shell(slab_size, local_gamma):
+    dose_pair = create_dose_pair((13, 11, 9))
+
+    expected = pymedphys.gamma(*dose_pair, local_gamma=local_gamma, **GAMMA_OPTIONS)
+    gamma = experimental.gamma_slabs(
+        *dose_pair, slab_size=slab_size, local_gamma=local_gamma, **GAMMA_OPTIONS
+    )
+
+    assert np.array_equal(gamma, expected, equal_nan=True)
+
+
+def test_slabs_with_differing_grids():
+    axes_reference, dose_reference, _, _ = create_dose_pair((15, 11), grid_spacing=2)
+    axes_evaluation, _, _, dose_evaluation = create_dose_pair((41, 29), grid_spacing=1)
+
+    dose_pair = (axes_reference, dose_reference, axes_evaluation, dose_evaluation)
+
+    expected = pymedphys.gamma(*dose_pair, **GAMMA_OPTIONS)
+    gamma = experimental.gamma_slabs(*dose_pair, slab_size=2, **GAMMA_OPTIONS)
+
+    assert np.array_equal(gamma, expected, equal_nan=True)
+
+
+def test_slabs_memory_mapped(tmp_path):
+    axes_reference, dose_reference, axes_evaluation, dose_evaluation = create_dose_pair(
+        (11, 9, 7)
+    )
+
+    np.save(tmp_path / "reference.npy", dose_reference)
+    np.save(tmp_path / "evaluation.npy", dose_evaluation)
+
+    gamma = experimental.gamma_slabs(
+        axes_reference,
+        tmp_path / "reference.npy",
+        axes_evaluation,
+        np.load(tmp_path / "evaluation.npy", mmap_mode="r"),
+        slab_size=4,
+        output=tmp_path / "gamma.npy",
+        **GAMMA_OPTIONS,
+    )
+
+    assert isinstance(gamma, np.memmap)
+
+    expected = pymedphys.gamma(
+        axes_reference,
+        dose_reference,
+        axes_evaluation,
+        dose_evaluation,
+        **GAMMA_OPTIONS,
+    )
+    assert np.array_equal(np.load(tmp_path / "gamma.npy"), expected, equal_nan=True)
+
+
+@pytest.mark.pydicom
+def test_slabs_from_dicom_frames(tmp_path):
+    _, dose_reference, _, dose_evaluation = create_dose_pair((6, 5, 4))
+
+    filepaths = []
+    for name, dose in (("reference", dose_reference), ("evaluation", dose_evaluation)):
+        scaling = np.max(dose) / 2**16
+        ds = create.dicom_dataset_from_dict(
+            {
+                "Modality": "RTDOSE",
+                "SOPClassUID": pydicom.uid.RTDoseStorage,
+                "SOPInstanceUID": pydicom.uid.generate_uid(),
+                "ImagePositionPatient": [-4.0, -5.0, -6.0],
+                "ImageOrientationPatient": [1, 0, 0, 0, 1, 0],
+                "BitsAllocated": 32,
+                "BitsStored": 32,
+                "HighBit": 31,
+                "Rows": 5,
+                "Columns": 4,
+                "NumberOfFrames": 6,
+                "PixelRepresentation": 0,
+                "SamplesPerPixel": 1,
+                "PhotometricInterpretation": "MONOCHROME2",
+                "PixelSpacing": [2.0, 2.0],
+                "GridFrameOffsetVector": [0, 2, 4, 6, 8, 10],
+                "PixelData": np.round(np.clip(dose, 0, None) / scaling)
+                .astype(np.uint32)
+                .tobytes(),
+                "DoseGridScaling": scaling,
+            }
+        )
+        ds.file_meta = pydicom.dataset.FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = pydicom.uid.ImplicitVRLittleEndian
+
+        filepaths.append(tmp_path / f"{name}.dcm")
+        ds.save_as(filepaths[-1], enforce_file_format=True)
+
+    coords, frames_reference = pymedphys.dicom.zyx_and_dose_frames_from_file(
+        filepaths[0]
+    )
+    _, frames_evaluation = pymedphys.dicom.zyx_and_dose_frames_from_file(filepaths[1])
+
+    full_reference = np.asarray(frames_reference)
+    full_evaluation = np.asarray(frames_evaluation)
+    assert full_reference.shape == (6, 5, 4)
+    assert np.allclose(frames_reference[2:4, 1], full_reference[2:4, 1])
+    assert np.allclose(frames_reference[-1], full_reference[5])
+
+    expected = pymedphys.gamma(
+        coords, full_reference, coords, full_evaluation, **GAMMA_OPTIONS
+    )
+    gamma = experimental.gamma_slabs(
+        coords,
+        frames_reference,
+        coords,
+        frames_evaluation,
+        slab_size=2,
+        **GAMMA_OPTIONS,
+    )
+
+    assert np.array_equal(gamma, expected, equal_nan=True)
+
+
+def test_slabs_require_finite_max_gamma():
+    dose_pair = create_dose_pair((5, 5))
+
+    with pytest.raises(ValueError, match="max_gamma"):
+        experimental.gamma_slabs(*dose_pair, 3, 2, max_gamma=None)
+
+    with pytest.raises(ValueError, match="single"):
+        experimental.gamma_slabs(*dose_pair, [2, 3], 2, max_gamma=2)
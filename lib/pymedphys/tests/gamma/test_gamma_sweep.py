@@ -0,0 +1,182 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the multi-criteria gamma sweep."""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys import experimental
+from pymedphys._gamma.utilities import calculate_pass_rate
+
+from .utilities import create_dose_pair
+
+DOSE_THRESHOLDS = [1, 2, 3]
+DISTANCE_THRESHOLDS = [1, 2, 3]
+
+
+@pytest.mark.parametrize("shape", [(61,), (41, 37), (13, 11, 9)])
+@pytest.mark.parametrize("local_gamma", [False, True])
+def test_matches_gamma_shell(shape, local_gamma):
+    dose_pair = create_dose_pair(shape)
+
+    # With a single distance threshold the radii searched are those of
+    # gamma_shell, so gamma matches exactly.
+    sweep = experimental.gamma_sweep(
+        *dose_pair,
+        DOSE_THRESHOLDS,
+        2,
+        local_gamma=local_gamma,
+        max_gamma=2,
+    )
+    expected = pymedphys.gamma(
+        *dose_pair,
+        DOSE_THRESHOLDS,
+        [2],
+        local_gamma=local_gamma,
+        max_gamma=2,
+    )
+
+    assert sweep.gamma.shape == (1, 3, 1) + shape
+    for (dose_threshold, distance_threshold), gamma in expected.items():
+        assert np.allclose(
+            sweep.sel(local_gamma, dose_threshold, distance_threshold),
+            gamma,
+            atol=1e-12,
+            equal_nan=True,
+        )
+
+
+def test_both_normalisations_within_one_sweep():
+    dose_pair = create_dose_pair((41, 37))
+    sweep = experimental.gamma_sweep(
+        *dose_pair, DOSE_THRESHOLDS, DISTANCE_THRESHOLDS, max_gamma=2
+    )
+
+    assert sweep.dims[:3] == (
+        "local_gamma",
+        "dose_percent_threshold",
+        "distance_mm_threshold",
+    )
+
+    for local_gamma in (False, True):
+        expected = pymedphys.gamma(
+            *dose_pair,
+            DOSE_THRESHOLDS,
+            DISTANCE_THRESHOLDS,
+            local_gamma=local_gamma,
+            max_gamma=2,
+        )
+
+        # The radii searched do not depend on which criteria are still
+        # being resolved, so can differ slightly from those of gamma_shell.
+        for (dose_threshold, distance_threshold), gamma in expected.items():
+            assert (
+                np.abs(
+                    calculate_pass_rate(
+                        sweep.sel(local_gamma, dose_threshold, distance_threshold)
+                    )
+                    - calculate_pass_rate(gamma)
+                )
+                < 1
+            )
+
+    table = sweep.pass_rate_table()
+    assert table.shape == (6, 3)
+    assert table.loc[("global", 3), 3] == calculate_pass_rate(sweep.sel(False, 3, 3))
+    assert np.array_equal(table.to_numpy(), np.reshape(sweep.pass_rates(), (6, 3)))
+
+
+def test_unknown_criteria():
+    sweep = experimental.gamma_sweep(*create_dose_pair((21,)), [2, 3], [2, 3])
+
+    with pytest.raises(KeyError):
+        sweep.sel(False, 1, 2)
+
+
+def test_evaluate_from_curve():
+    dose_pair = create_dose_pair((41, 37))
+    sweep = experimental.gamma_sweep(
+        *dose_pair, DOSE_THRESHOLDS, DISTANCE_THRESHOLDS, max_gamma=2
+    )
+
+    assert sweep.curve.min_dose_difference.shape == (
+        len(sweep.curve.to_calc_index),
+        len(sweep.curve.radii),
+    )
+    assert np.all(np.diff(sweep.curve.min_dose_difference, axis=1) <= 0)
+
+    again = sweep.evaluate(DOSE_THRESHOLDS, DISTANCE_THRESHOLDS)
+    assert np.array_equal(again.gamma, sweep.gamma, equal_nan=True)
+
+    between = sweep.evaluate([1.5, 2.5], [1.5, 2.5], local_gamma=False)
+    for dose_threshold in (1.5, 2.5):
+        for distance_threshold in (1.5, 2.5):
+            expected = pymedphys.gamma(
+                *dose_pair, dose_threshold, distance_threshold, max_gamma=2
+            )
+            assert (
+                np.abs(
+                    calculate_pass_rate(
+                        between.sel(False, dose_threshold, distance_threshold)
+                    )
+                    - calculate_pass_rate(expected)
+                )
+                < 1
+            )
+
+    with pytest.raises(ValueError, match="Dose thresholds"):
+        sweep.evaluate(0.5, 2)
+    with pytest.raises(ValueError, match="distance thresholds"):
+        sweep.evaluate(2, 4)
+
+    global_only = experimental.gamma_sweep(
+        *dose_pair, DOSE_THRESHOLDS, DISTANCE_THRESHOLDS, local_gamma=False
+    )
+    with pytest.raises(ValueError, match="normalisations"):
+        global_only.evaluate(2, 2, local_gamma=True)
+
+
+@pytest.mark.slow
+def test_benchmark_five_by_five_table():
+    dose_pair = create_dose_pair((31, 31, 31))
+    thresholds = [1, 1.5, 2, 2.5, 3]
+
+    start = time.perf_counter()
+    sweep = experimental.gamma_sweep(
+        *dose_pair, thresholds, thresholds, max_gamma=2, engine="numba"
+    )
+    sweep_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for local_gamma in (False, True):
+        pymedphys.gamma(
+            *dose_pair,
+            thresholds,
+            thresholds,
+            local_gamma=local_gamma,
+            max_gamma=2,
+            engine="numba",
+        )
+    shell_duration = time.perf_counter() - start
+
+    print(
+        f"\n5x5 criteria, global and local | one sweep: {sweep_duration:.2f} s | "
+        f"gamma_shell with threshold arrays, once per normalisation: "
+        f"{shell_duration:.2f} s"
+    )
+    print(sweep.pass_rate_table().round(1))
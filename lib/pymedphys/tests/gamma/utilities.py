@@ -0,0 +1,92 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Helpers for building synthetic dose grids within the gamma tests."""
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom
+
+from pymedphys._dicom import create
+
+
+def create_dose_pair(shape, grid_spacing=2.0, seed=0):
+    """Create a smooth reference dose along with an evaluation dose which
+    has been shifted, scaled and made noisy."""
+    rng = np.random.default_rng(seed)
+
+    axes = tuple(
+        grid_spacing * np.arange(size) - grid_spacing * size / 2 for size in shape
+    )
+    mesh = np.meshgrid(*axes, indexing="ij")
+
+    def blobs(offset):
+        dose = np.zeros(shape)
+        for centre, width, weight in zip(
+            rng.uniform(-20, 20, (4, len(shape))),
+            rng.uniform(10, 30, 4),
+            rng.uniform(0.5, 1, 4),
+        ):
+            distance_squared = sum(
+                (coord - c - offset) ** 2 for coord, c in zip(mesh, centre)
+            )
+            dose += weight * np.exp(-distance_squared / (2 * width**2))
+
+        return dose
+
+    state = rng.bit_generator.state
+    reference = blobs(0)
+    rng.bit_generator.state = state
+    evaluation = 1.02 * blobs(1.0) + rng.normal(0, 0.005, shape)
+
+    return axes, reference, axes, evaluation
+
+
+def create_dicom_dose_file(filepath, dose, grid_spacing=2.0):
+    """Write a dose grid, indexed (z, y, x), to an RT Dose file."""
+    scaling = np.max(dose) / 2**16
+    number_of_frames, rows, columns = np.shape(dose)
+
+    ds = create.dicom_dataset_from_dict(
+        {
+            "Modality": "RTDOSE",
+            "SOPClassUID": pydicom.uid.RTDoseStorage,
+            "SOPInstanceUID": pydicom.uid.generate_uid(),
+            "ImagePositionPatient": [
+                -grid_spacing * columns / 2,
+                -grid_spacing * rows / 2,
+                -grid_spacing * number_of_frames / 2,
+            ],
+            "ImageOrientationPatient": [1, 0, 0, 0, 1, 0],
+            "BitsAllocated": 32,
+            "BitsStored": 32,
+            "HighBit": 31,
+            "Rows": rows,
+            "Columns": columns,
+            "NumberOfFrames": number_of_frames,
+            "PixelRepresentation": 0,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+            "PixelSpacing": [grid_spacing, grid_spacing],
+            "GridFrameOffsetVector": list(grid_spacing * np.arange(number_of_frames)),
+            "PixelData": np.round(np.clip(dose, 0, None) / scaling)
+            .astype(np.uint32)
+            .tobytes(),
+            "DoseGridScaling": scaling,
+        }
+    )
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ImplicitVRLittleEndian
+
+    ds.save_as(filepath, enforce_file_format=True)
@@ -0,0 +1,94 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A local iCOM server that replays a recorded stream over a socket."""
+
+import socket
+import threading
+import time
+
+from pymedphys._icom import extract
+
+
+def create_synthetic_icom_stream(number_of_frames=1000, payload_size=1000) -> bytes:
+    """Create an iCOM-like stream of frames, each containing a timestamp
+    and an incrementing counter, but no delivery data."""
+    frames = []
+    for i in range(number_of_frames):
+        timestamp = "2026-10-18{:02d}:{:02d}:{:02d}".format(
+            (i // 3600) % 24, (i // 60) % 60, i % 60
+        )
+        frames.append(
+            b"ICOM"
+            + payload_size.to_bytes(4, "little")
+            + timestamp.encode()
+            + bytes([i % 256])
+            + b"x" * payload_size
+        )
+
+    return b"".join(frames)
+
+
+class ReplayServer:
+    """Serve a single connection that replays ``data``.
+
+    Parameters
+    ----------
+    data : bytes
+        The raw iCOM stream to replay.
+    chunk_size : int, optional
+        The number of bytes handed to each ``send`` call.
+    speedup : float, optional
+        How many times faster than real time to replay the stream,
+        assuming a Linac emits one frame every ``frame_interval``
+        seconds. If ``None`` (the default), the stream is sent as fast as
+        the listener can receive it.
+    frame_interval : float, optional
+    """
+
+    def __init__(self, data, chunk_size=4096, speedup=None, frame_interval=0.1):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.speedup = speedup
+        self.frame_interval = frame_interval
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen()
+
+        self.port = self._socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self):
+        connection, _ = self._socket.accept()
+        with connection:
+            if self.speedup is None:
+                for i in range(0, len(self.data), self.chunk_size):
+                    connection.sendall(self.data[i : i + self.chunk_size])
+                return
+
+            delay = self.frame_interval / self.speedup
+            for frame in extract.get_data_points(self.data):
+                connection.sendall(frame)
+                time.sleep(delay)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self._thread.join()
+        self._socket.close()
@@ -0,0 +1,148 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._icom import extract, listener
+
+from .replay import ReplayServer, create_synthetic_icom_stream
+
+
+def test_parser_matches_whole_stream_split():
+    stream = create_synthetic_icom_stream(number_of_frames=300, payload_size=200)
+    expected = extract.get_data_points(stream)
+
+    rng = np.random.default_rng(0)
+    parser = listener.IcomStreamParser()
+
+    frames = []
+    position = 0
+    while position < len(stream):
+        # Chunks smaller than a timestamp exercise timestamps that are
+        # split across multiple receives.
+        chunk_size = int(rng.integers(1, 600))
+        frames += parser.feed(stream[position : position + chunk_size])
+        position += chunk_size
+
+    # The final frame is only complete once the next one begins
+    assert frames == expected[:-1]
+
+
+def test_session_writer_batches_and_rolls(tmp_path):
+    frame = b"a" * 100
+
+    writer = listener.IcomSessionWriter(
+        tmp_path, flush_size=1000, flush_interval=60, maximum_file_size=2500
+    )
+    with writer:
+        for _ in range(9):
+            writer.write(frame)
+        assert not list(tmp_path.iterdir())
+
+        for _ in range(41):
+            writer.write(frame)
+
+    files = sorted(tmp_path.iterdir())
+    assert [path.suffix for path in files] == [".icom"] * 2
+    assert b"".join(path.read_bytes() for path in files) == frame * 50
+    assert files[0].stat().st_size == 3000
+
+
+def test_session_writer_retention(tmp_path):
+    frame = b"a" * 100
+
+    # A previous session, which is the oldest by name
+    tmp_path.joinpath("20000101_000000_000.icom").write_bytes(frame * 20)
+
+    writer = listener.IcomSessionWriter(
+        tmp_path,
+        flush_size=1,
+        maximum_file_size=1000,
+        maximum_total_size=2500,
+    )
+    with writer:
+        for _ in range(50):
+            writer.write(frame)
+
+    files = sorted(tmp_path.iterdir())
+    assert "20000101_000000_000.icom" not in [path.name for path in files]
+    assert sum(path.stat().st_size for path in files) <= 2500 + 1000
+
+    # The file currently being written to is never removed
+    assert files[-1] == writer.filepath
+    assert files[-1].read_bytes().endswith(frame)
+
+
+def test_listener_defaults_to_per_frame_files(tmp_path, monkeypatch):
+    stream = create_synthetic_icom_stream(number_of_frames=300)
+    frames = extract.get_data_points(stream)
+
+    with ReplayServer(stream) as server:
+        monkeypatch.setattr(listener, "ICOM_PORT", server.port)
+        with pytest.raises(ConnectionError):
+            listener.listen("127.0.0.1", tmp_path)
+
+    ip_directory = tmp_path.joinpath("live", "127.0.0.1")
+    assert not list(ip_directory.glob("*.icom"))
+
+    # The counter is a single byte, and so the files form a ring
+    saved = sorted(ip_directory.glob("[0-2][0-9][0-9].txt"))
+    assert len(saved) == min(len(frames) - 1, 256)
+    assert saved[0].read_bytes() in frames
+
+
+def _replay_into_listener(tmp_path, monkeypatch, stream, **server_kwargs):
+    with ReplayServer(stream, **server_kwargs) as server:
+        monkeypatch.setattr(listener, "ICOM_PORT", server.port)
+
+        start = time.perf_counter()
+        with pytest.raises(ConnectionError):
+            listener.listen("127.0.0.1", tmp_path, session_files=True)
+        duration = time.perf_counter() - start
+
+    frames_per_second = (len(extract.get_data_points(stream)) - 1) / duration
+    print(f"Sustained {frames_per_second:.0f} frames/sec")
+
+    session_files = sorted(tmp_path.joinpath("live", "127.0.0.1").glob("*.icom"))
+
+    return b"".join(path.read_bytes() for path in session_files), frames_per_second
+
+
+def test_replay_synthetic_stream(tmp_path, monkeypatch):
+    stream = create_synthetic_icom_stream(number_of_frames=2000)
+    final_frame = extract.get_data_points(stream)[-1]
+
+    saved, frames_per_second = _replay_into_listener(tmp_path, monkeypatch, stream)
+
+    assert saved == stream[: -len(final_frame)]
+    assert frames_per_second > 100
+
+
+@pytest.mark.slow
+def test_replay_recorded_stream(tmp_path, monkeypatch):
+    from .test_icom_cli import (  # pylint: disable = import-outside-toplevel
+        download_files,
+    )
+
+    stream = download_files()
+    final_frame = extract.get_data_points(stream)[-1]
+
+    saved, _ = _replay_into_listener(
+        tmp_path, monkeypatch, stream, chunk_size=1024, speedup=100
+    )
+
+    assert saved.endswith(stream[: -len(final_frame)])
@@ -0,0 +1,297 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import sys
+import threading
+
+import pytest
+
+from pymedphys._icom import extract, listener, multilistener
+
+from .replay import create_synthetic_icom_stream
+
+pytestmark = pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="Binding to the 127.0.0.x loopback range requires Linux",
+)
+
+
+async def _start_fake_icom_servers(ips, stream, close_after_sending):
+    """One fake Linac per IP, all served on the same port."""
+
+    async def handle(_, writer):
+        writer.write(stream)
+        await writer.drain()
+
+        if close_after_sending:
+            writer.close()
+        else:
+            await asyncio.sleep(3600)
+
+    servers = [await asyncio.start_server(handle, ips[0], 0)]
+    port = servers[0].sockets[0].getsockname()[1]
+    for ip in ips[1:]:
+        servers.append(await asyncio.start_server(handle, ip, port))
+
+    return servers, port
+
+
+async def _listen_until(multi_linac_listener, condition, timeout=10):
+    task = asyncio.create_task(multi_linac_listener.run(report_interval=0.05))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition() and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+
+    multi_linac_listener.stop()
+    await task
+
+
+def _saved_stream(tmp_path, ip):
+    return b"".join(
+        path.read_bytes()
+        for path in sorted(tmp_path.joinpath("live", ip).glob("*.icom"))
+    )
+
+
+def test_many_linacs_in_one_process(tmp_path):
+    ips = ["127.0.0.1", "127.0.0.2", "127.0.0.3"]
+    stream = create_synthetic_icom_stream(number_of_frames=500)
+    frames = extract.get_data_points(stream)
+
+    async def main():
+        servers, port = await _start_fake_icom_servers(
+            ips, stream, close_after_sending=False
+        )
+        multi_linac_listener = multilistener.MultiLinacListener(
+            ips, tmp_path, port=port, session_files=True
+        )
+
+        def all_received():
+            return all(
+                metrics.frames_received == len(frames) - 1
+                for metrics in multi_linac_listener.metrics.values()
+            )
+
+        await _listen_until(multi_linac_listener, all_received)
+
+        for server in servers:
+            server.close()
+
+        return multi_linac_listener.metrics
+
+    metrics = asyncio.run(main())
+
+    for ip in ips:
+        assert metrics[ip].bytes_received == len(stream)
+        assert metrics[ip].frames_received == len(frames) - 1
+        assert metrics[ip].reconnects == 0
+        assert _saved_stream(tmp_path, ip) == stream[: -len(frames[-1])]
+
+
+def test_reconnects_with_backoff(tmp_path):
+    stream = create_synthetic_icom_stream(number_of_frames=50)
+    frames = extract.get_data_points(stream)
+
+    async def main():
+        servers, port = await _start_fake_icom_servers(
+            ["127.0.0.1"], stream, close_after_sending=True
+        )
+
+        # Nothing is listening at 127.0.0.4, which must not hold up the
+        # Linac which is available.
+        multi_linac_listener = multilistener.MultiLinacListener(
+            ["127.0.0.1", "127.0.0.4"],
+            tmp_path,
+            port=port,
+            session_files=True,
+            initial_backoff=0.01,
+            maximum_backoff=0.08,
+        )
+
+        def reconnected():
+            return multi_linac_listener.metrics["127.0.0.1"].reconnects >= 3
+
+        await _listen_until(multi_linac_listener, reconnected)
+
+        for server in servers:
+            server.close()
+
+        return multi_linac_listener.metrics
+
+    metrics = asyncio.run(main())
+
+    available = metrics["127.0.0.1"]
+    assert available.reconnects >= 3
+    assert available.frames_received == available.reconnects * (len(frames) - 1)
+
+    saved = _saved_stream(tmp_path, "127.0.0.1")
+    assert saved.startswith((stream[: -len(frames[-1])]) * 3)
+
+    unavailable = metrics["127.0.0.4"]
+    assert unavailable.bytes_received == 0
+    assert unavailable.reconnects >= 1
+
+
+def test_reconnects_after_unexpected_errors(tmp_path, monkeypatch):
+    stream = create_synthetic_icom_stream(number_of_frames=50)
+    frames = extract.get_data_points(stream)
+
+    feed = listener.IcomStreamParser.feed
+    calls = []
+
+    def failing_feed(self, data):
+        calls.append(data)
+        if len(calls) == 1:
+            raise RuntimeError("Unexpected iCOM data")
+
+        return feed(self, data)
+
+    monkeypatch.setattr(listener.IcomStreamParser, "feed", failing_feed)
+
+    async def main():
+        servers, port = await _start_fake_icom_servers(
+            ["127.0.0.1"], stream, close_after_sending=True
+        )
+        multi_linac_listener = multilistener.MultiLinacListener(
+            ["127.0.0.1"], tmp_path, port=port, initial_backoff=0.01
+        )
+
+        def recovered():
+            metrics = multi_linac_listener.metrics["127.0.0.1"]
+            return metrics.frames_received >= len(frames) - 1
+
+        await _listen_until(multi_linac_listener, recovered)
+
+        for server in servers:
+            server.close()
+
+        return multi_linac_listener.metrics["127.0.0.1"]
+
+    metrics = asyncio.run(main())
+
+    assert metrics.reconnects >= 1
+    assert metrics.frames_received >= len(frames) - 1
+
+
+def test_frames_dropped_when_saving_stalls(tmp_path, monkeypatch):
+    stream = create_synthetic_icom_stream(number_of_frames=200)
+    frames = extract.get_data_points(stream)
+
+    saved_items = []
+    release = threading.Event()
+
+    def stalled_save_frame(self, ip, item, writer):
+        release.wait()
+        saved_items.append(item)
+
+    monkeypatch.setattr(
+        multilistener.MultiLinacListener, "_save_frame", stalled_save_frame
+    )
+
+    async def main():
+        servers, port = await _start_fake_icom_servers(
+            ["127.0.0.1"], stream, close_after_sending=False
+        )
+        multi_linac_listener = multilistener.MultiLinacListener(
+            ["127.0.0.1"], tmp_path, port=port, maximum_queued_frames=10
+        )
+
+        def all_received():
+            metrics = multi_linac_listener.metrics["127.0.0.1"]
+            if metrics.frames_received < len(frames) - 1:
+                return False
+
+            release.set()
+            return True
+
+        try:
+            await _listen_until(multi_linac_listener, all_received)
+        finally:
+            release.set()
+
+        for server in servers:
+            server.close()
+
+        return multi_linac_listener.metrics["127.0.0.1"]
+
+    metrics = asyncio.run(main())
+
+    # Only the frame being saved and a full queue are retained
+    assert metrics.frames_received == len(frames) - 1
+    assert metrics.frames_dropped >= len(frames) - 1 - 11
+    assert 0 < len(saved_items) <= 11
+
+
+def test_saving_resumes_after_write_errors(tmp_path, monkeypatch):
+    stream = create_synthetic_icom_stream(number_of_frames=50)
+    frames = extract.get_data_points(stream)
+    failures = 10
+
+    write = listener.IcomFrameFileWriter.write
+    calls = []
+
+    def full_disk_write(self, frame):
+        calls.append(frame)
+        if len(calls) <= failures:
+            raise OSError(28, "No space left on device")
+
+        return write(self, frame)
+
+    monkeypatch.setattr(listener.IcomFrameFileWriter, "write", full_disk_write)
+
+    async def main():
+        servers, port = await _start_fake_icom_servers(
+            ["127.0.0.1"], stream, close_after_sending=False
+        )
+        multi_linac_listener = multilistener.MultiLinacListener(
+            ["127.0.0.1"], tmp_path, port=port
+        )
+
+        def all_attempted():
+            return len(calls) >= len(frames) - 1
+
+        await _listen_until(multi_linac_listener, all_attempted)
+
+        for server in servers:
+            server.close()
+
+        return multi_linac_listener.metrics["127.0.0.1"]
+
+    metrics = asyncio.run(main())
+
+    assert metrics.frames_not_saved == failures
+    assert metrics.frames_dropped == 0
+    assert len(calls) == len(frames) - 1
+
+    # Each frame written after the disk has space again is saved
+    saved = list(tmp_path.joinpath("live", "127.0.0.1").glob("*.txt"))
+    assert len(saved) == len(frames) - 1 - failures
+
+
+def test_linac_ips_from_config():
+    config = {
+        "site": [
+            {"name": "a", "linac": [{"name": "1", "ip": "10.0.0.1"}, {"name": "2"}]},
+            {"name": "b"},
+            {"name": "c", "linac": [{"name": "3", "ip": "10.0.0.3"}]},
+        ]
+    }
+
+    assert multilistener.get_linac_ips_from_config(config) == [
+        "10.0.0.1",
+        "10.0.0.3",
+    ]
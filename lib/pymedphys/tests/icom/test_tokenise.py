@@ -0,0 +1,168 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._icom import delivery, extract, tokenise
+
+from .utilities import (
+    create_synthetic_icom_delivery_stream,
+    create_synthetic_icom_frame,
+)
+
+
+def _reference_delivery_data_items(single_icom_stream):
+    """The regex-and-slice extraction that the tokeniser replaced."""
+    shrunk_stream, meterset = extract.extract(single_icom_stream, "Delivery MU")
+    shrunk_stream, gantry = extract.extract(shrunk_stream, "Gantry")
+    shrunk_stream, collimator = extract.extract(shrunk_stream, "Collimator")
+
+    shrunk_stream, raw_mlc = extract.extract_coll(shrunk_stream, b"MLCX", 160)
+    mlc = np.array(raw_mlc).reshape((80, 2))
+    mlc = np.fliplr(np.flipud(mlc * 10))
+    mlc[:, 1] = -mlc[:, 1]
+    mlc = np.round(mlc, 10)
+
+    shrunk_stream, raw_jaw = extract.extract_coll(shrunk_stream, b"ASYMY", 2)
+    jaw = np.flipud(np.round(np.array(raw_jaw) * 10, 10))
+
+    return meterset, gantry, collimator, mlc, jaw
+
+
+def _reference_delivery_from_icom_stream(icom_stream):
+    delivery_raw = [
+        _reference_delivery_data_items(single_icom_stream)
+        for single_icom_stream in extract.get_data_points(icom_stream)
+    ]
+
+    mu = np.array([item[0] for item in delivery_raw])
+    diff_mu = np.concatenate([[0], np.diff(mu)])
+    diff_mu[diff_mu < 0] = 0
+
+    return (
+        np.cumsum(diff_mu),
+        np.array([item[1] for item in delivery_raw]),
+        np.array([item[2] for item in delivery_raw]),
+        np.array([item[3] for item in delivery_raw]),
+        np.array([item[4] for item in delivery_raw]),
+    )
+
+
+def test_frame_matches_reference():
+    rng = np.random.default_rng(0)
+
+    for counter in range(50):
+        frame = create_synthetic_icom_frame(counter, rng)
+
+        for result, reference in zip(
+            delivery.get_delivery_data_items(frame),
+            _reference_delivery_data_items(frame),
+        ):
+            assert np.array_equal(result, reference)
+
+        record = tokenise.decode_frame(frame)
+        for name, label in [
+            ("patient_id", "Patient ID"),
+            ("patient_name", "Patient Name"),
+            ("machine_id", "Machine ID"),
+        ]:
+            assert record[name] == extract.extract(frame, label)[1]
+
+
+def test_decode_into_preallocated_record():
+    rng = np.random.default_rng(1)
+    records = tokenise.empty_records(2)
+
+    tokenise.decode_frame(create_synthetic_icom_frame(0, rng), records[1])
+    tokenise.decode_frame(
+        create_synthetic_icom_frame(1, rng, patient=False), records[1]
+    )
+
+    assert records[0]["patient_id"] is None
+    assert np.all(np.isnan(records[0]["mlc"]))
+
+    # Fields missing from the second frame are retained from the first
+    assert records[1]["machine_id"] == "2619"
+    assert not np.any(np.isnan(records[1]["mlc"]))
+
+
+def test_missing_patient_fields():
+    frame = create_synthetic_icom_frame(0, np.random.default_rng(2), patient=False)
+    record = tokenise.decode_frame(frame)
+
+    assert record["patient_id"] is None
+    assert extract.extract(frame, "Patient ID")[1] is None
+
+
+def test_stream_matches_reference():
+    stream = create_synthetic_icom_delivery_stream(number_of_frames=200)
+
+    for result, reference in zip(
+        delivery.delivery_from_icom_stream(stream),
+        _reference_delivery_from_icom_stream(stream),
+    ):
+        assert np.array_equal(result, reference)
+
+
+def test_missing_mlc_raises():
+    rng = np.random.default_rng(3)
+    stream = create_synthetic_icom_delivery_stream(number_of_frames=10)
+    broken_frame = create_synthetic_icom_frame(10, rng).replace(b"MLCX", b"MLCY")
+
+    with pytest.raises(ValueError, match="mlc"):
+        delivery.delivery_from_icom_stream(stream + broken_frame)
+
+    with pytest.raises(ValueError, match="mlc"):
+        delivery.get_delivery_data_items(broken_frame)
+
+
+def _benchmark(stream):
+    start = time.perf_counter()
+    reference = _reference_delivery_from_icom_stream(stream)
+    reference_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = delivery.delivery_from_icom_stream(stream)
+    duration = time.perf_counter() - start
+
+    for a, b in zip(result, reference):
+        assert np.allclose(a, b)
+
+    print(
+        f"\n{len(extract.get_data_points(stream))} frames | "
+        f"regex-and-slice: {reference_duration:.3f} s | "
+        f"single pass: {duration:.3f} s | "
+        f"speedup: {reference_duration / duration:.1f}x"
+    )
+
+
+@pytest.mark.slow
+def test_benchmark_synthetic_stream():
+    _benchmark(create_synthetic_icom_delivery_stream(number_of_frames=2000))
+
+
+@pytest.mark.slow
+def test_benchmark_sample_stream():
+    from .test_icom_cli import (  # pylint: disable = import-outside-toplevel
+        download_files,
+    )
+
+    stream = download_files()
+    _benchmark(stream)
+
+    assert isinstance(pymedphys.Delivery.from_icom(stream), pymedphys.Delivery)
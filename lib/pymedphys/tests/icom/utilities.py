@@ -0,0 +1,94 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Helpers for building synthetic iCOM frames within the tests."""
+
+from pymedphys._imports import numpy as np
+
+PATIENT_ID_KEY = b" \x00LO\x00P"
+PATIENT_NAME_KEY = b"\x10\x00PN\x00P"
+MACHINE_ID_KEY = b"\xb2\x00SH\x00P"
+DELIVERY_MU_KEY = b"2\x00DS\x00R"
+TOTAL_MU_KEY = b"\t\x10DS\x00R"
+GANTRY_KEY = b"\x1e\x01DS\x00R"
+COLLIMATOR_KEY = b" \x01DS\x00R"
+COLLIMATION_HEADER_KEY = b"\xb8\x00DS\x00R"
+COLLIMATION_ITEM_KEY = b"\x1c\x01DS\x00R"
+
+
+def create_element(key, value, prefix=b"0"):
+    if isinstance(value, str):
+        value = value.encode()
+
+    return prefix + key + bytes([len(value)]) + b"\x00\x00\x00" + value
+
+
+def create_collimation(label, positions):
+    return b"\n".join(
+        [create_element(COLLIMATION_HEADER_KEY, label)]
+        + [create_element(COLLIMATION_ITEM_KEY, f"{value:.2f}") for value in positions]
+    )
+
+
+def create_synthetic_icom_frame(
+    counter, rng, patient=True, shuffle=True, meterset=None, mlcx=None, asymy=None
+):
+    """Create an iCOM-like frame containing randomised delivery fields,
+    along with some distracting elements. The meterset, and the raw MLCX
+    and ASYMY positions in cm, are randomised unless provided."""
+    if meterset is None:
+        meterset = rng.uniform(0, 300)
+    if mlcx is None:
+        mlcx = rng.uniform(-20, 20, 160)
+    if asymy is None:
+        asymy = rng.uniform(-20, 20, 2)
+
+    elements = [
+        create_element(DELIVERY_MU_KEY, f"{meterset:.3f}"),
+        create_element(TOTAL_MU_KEY, f"{rng.uniform(0, 300):.3f}"),
+        create_element(GANTRY_KEY, "-32767"),
+        create_element(GANTRY_KEY, f"{rng.uniform(0, 360):.1f}"),
+        create_element(COLLIMATOR_KEY, f"{rng.uniform(0, 360):.1f}"),
+        create_element(COLLIMATION_HEADER_KEY, "MLCX"),
+        create_collimation("MLCX", mlcx),
+        create_collimation("ASYMY", asymy),
+    ]
+
+    if patient:
+        elements += [
+            create_element(PATIENT_ID_KEY, f"{rng.integers(0, 999999):06d}", b"\x00"),
+            create_element(PATIENT_NAME_KEY, "PHANTOM^DELTA4", b"P"),
+            create_element(MACHINE_ID_KEY, "2619", b"p"),
+        ]
+
+    if shuffle:
+        elements = [elements[i] for i in rng.permutation(len(elements))]
+
+    second = counter % 60
+    return (
+        b"ICOM\x00\x00\x00\x00"
+        + f"2026-10-1812:00:{second:02d}".encode()
+        + bytes([counter % 256])
+        + b"\n".join(elements)
+        + b"\n"
+    )
+
+
+def create_synthetic_icom_delivery_stream(number_of_frames=100, seed=0) -> bytes:
+    rng = np.random.default_rng(seed)
+
+    return b"".join(
+        create_synthetic_icom_frame(i, rng) for i in range(number_of_frames)
+    )
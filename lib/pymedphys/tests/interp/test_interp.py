@@ -14,7 +14,10 @@
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-from pymedphys._imports import numpy as np, pytest
+import time
+import tracemalloc
+
+from pymedphys._imports import numpy as np, pytest, scipy
 
 from pymedphys._interp import interp
 
@@ -200,3 +203,249 @@ def test_1d_vs_scipy(setup_interp):
     )
 
     assert np.allclose(values_interp, values_interp_linear_scipy)
+
+
+def test_interpolator_matches_interp(setup_interp):
+    (x, y, z), values, (xi, yi, zi), values_interp = setup_interp
+
+    interpolator = interp.Interpolator((x, y, z), values)
+    assert np.array_equal(interpolator.grid((xi, yi, zi)).ravel(), values_interp)
+
+    interpolator_2d = interp.Interpolator((x, y), values[:, :, 0])
+    assert np.array_equal(
+        interpolator_2d.grid((xi, yi)),
+        interp.interp((x, y), values[:, :, 0], axes_interp=(xi, yi), keep_dims=True),
+    )
+
+    interpolator_1d = interp.Interpolator((x,), values[:, 0, 0])
+    assert np.array_equal(
+        interpolator_1d(xi),
+        interp.interp((x,), values[:, 0, 0], axes_interp=(xi,)),
+    )
+
+
+def test_interpolator_batched_points_and_out(setup_interp):
+    (x, y, z), values, _, _ = setup_interp
+    interpolator = interp.Interpolator(
+        (x, y, z), values, bounds_error=False, extrap_fill_value=np.inf
+    )
+
+    rng = np.random.default_rng(0)
+    points = rng.uniform(
+        [x[0] - 1, y[0] - 1, z[0] - 1], [x[-1] + 1, y[-1] + 1, z[-1] + 1], (4, 5, 3)
+    )
+    expected = interp.interp(
+        (x, y, z),
+        values,
+        points_interp=points.reshape(-1, 3),
+        bounds_error=False,
+        extrap_fill_value=np.inf,
+    ).reshape(4, 5)
+
+    out = np.empty((4, 5))
+    result = interpolator(points, out=out)
+
+    assert result is out
+    assert np.array_equal(out, expected)
+    assert np.any(np.isinf(out))
+
+    with pytest.raises(ValueError, match="out"):
+        interpolator(points, out=np.empty(20))
+
+
+def test_interpolator_checks(setup_interp):
+    (x, y, z), values, _, _ = setup_interp
+
+    with pytest.raises(ValueError, match="ascending"):
+        interp.Interpolator((x[::-1], y, z), values)
+
+    with pytest.raises(ValueError, match="size"):
+        interp.Interpolator((x, y, z[1:]), values)
+
+    interpolator = interp.Interpolator((x, y, z), values)
+    with pytest.raises(ValueError, match="range"):
+        interpolator([[x[0], y[0], z[-1] + 1]])
+
+    with pytest.raises(ValueError, match="last dimension"):
+        interpolator([[x[0], y[0]]])
+
+
+@pytest.mark.parametrize("bounds_error", [True, False])
+def test_separable_resampling_matches_points(setup_interp, bounds_error):
+    (x, y, z), values, (xi, yi, zi), _ = setup_interp
+    if not bounds_error:
+        xi = np.linspace(x[0] - 2, x[-1] + 2, xi.size)
+
+    options = dict(bounds_error=bounds_error, extrap_fill_value=-1)
+    resampled = interp.interp(
+        (x, y, z), values, axes_interp=(xi, yi, zi), keep_dims=True, **options
+    )
+
+    points = np.stack(np.meshgrid(xi, yi, zi, indexing="ij"), axis=-1)
+    expected = interp.interp(
+        (x, y, z), values, points_interp=points.reshape(-1, 3), **options
+    ).reshape(resampled.shape)
+
+    assert np.allclose(resampled, expected)
+    assert np.any(resampled == -1) != bounds_error
+
+    resampled_2d = interp.interp(
+        (x, y), values[:, :, 0], axes_interp=(xi, yi), **options
+    )
+    expected_2d = interp.interp(
+        (x, y),
+        values[:, :, 0],
+        points_interp=points[:, :, 0, :2].reshape(-1, 2),
+        **options,
+    )
+
+    assert np.allclose(resampled_2d, expected_2d)
+
+
+def test_separable_resampling_bounds(setup_interp):
+    (x, y, z), values, (xi, yi, zi), _ = setup_interp
+
+    with pytest.raises(ValueError, match="range"):
+        interp.interp((x, y, z), values, axes_interp=(xi, yi + 1, zi))
+
+    with pytest.raises(ValueError, match="range"):
+        interp.Interpolator((x, y, z), values).grid((xi, yi, zi - 1))
+
+
+def test_separable_resampling_memory():
+    """Only the output grid is allocated, rather than every point within
+    it."""
+    axes_known = [np.linspace(0, 10, 51)] * 3
+    values = np.random.default_rng(0).normal(size=(51, 51, 51))
+    axes_interp = [np.linspace(0, 10, 201)] * 3
+
+    interp.interp(axes_known, values, axes_interp=[axis[:2] for axis in axes_interp])
+
+    tracemalloc.start()
+    resampled = interp.interp(axes_known, values, axes_interp=axes_interp)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < 1.5 * resampled.nbytes
+
+
+def create_uneven_grid(sizes, seed=0):
+    rng = np.random.default_rng(seed)
+    axes_known = tuple(np.cumsum(rng.uniform(0.5, 2, size)) for size in sizes)
+    values = rng.normal(size=sizes)
+
+    return axes_known, values
+
+
+@pytest.mark.parametrize("method", ["linear", "pchip"])
+@pytest.mark.parametrize("sizes", [(7,), (7, 5), (7, 5, 9)])
+def test_interpolator_uneven_axes_vs_scipy(method, sizes):
+    axes_known, values = create_uneven_grid(sizes)
+
+    rng = np.random.default_rng(1)
+    points = np.column_stack(
+        [rng.uniform(axis[0] - 1, axis[-1] + 1, 1000) for axis in axes_known]
+    )
+    points[:2] = [[axis[0] for axis in axes_known], [axis[-1] for axis in axes_known]]
+
+    expected = scipy.interpolate.RegularGridInterpolator(
+        axes_known, values, method=method, bounds_error=False, fill_value=np.nan
+    )(points)
+    interpolator = interp.Interpolator(
+        axes_known, values, bounds_error=False, method=method
+    )
+
+    assert np.allclose(interpolator(points), expected, equal_nan=True)
+
+
+def test_interpolator_cubic():
+    axes_known, _ = create_uneven_grid((6, 5, 7))
+    x, y, z = np.meshgrid(*axes_known, indexing="ij")
+
+    # Not-a-knot cubic splines reproduce cubic polynomials exactly
+    def polynomial(x, y, z):
+        return x**3 - 2 * x * y**2 + y * z**3 + 5
+
+    interpolator = interp.Interpolator(axes_known, polynomial(x, y, z), method="cubic")
+
+    rng = np.random.default_rng(0)
+    points = np.column_stack(
+        [rng.uniform(axis[0], axis[-1], 1000) for axis in axes_known]
+    )
+
+    assert np.allclose(interpolator(points), polynomial(*points.T))
+
+    axis_known = axes_known[0]
+    values = np.sin(axis_known)
+    points_1d = np.linspace(axis_known[0], axis_known[-1], 101)
+
+    assert np.allclose(
+        interp.Interpolator((axis_known,), values, method="cubic")(points_1d),
+        scipy.interpolate.CubicSpline(axis_known, values)(points_1d),
+    )
+
+
+def test_interpolator_pchip_is_monotone():
+    axis_known = np.array([0, 1, 2, 2.5, 3, 6])
+    values = np.array([0, 0, 0, 1, 1, 1])
+
+    points = np.linspace(0, 6, 601)
+    cubic = interp.Interpolator((axis_known,), values, method="cubic")(points)
+    pchip = interp.Interpolator((axis_known,), values, method="pchip")(points)
+
+    assert np.min(cubic) < 0 and np.max(cubic) > 1
+    assert np.all(np.diff(pchip) >= 0)
+    assert np.min(pchip) == 0 and np.max(pchip) == 1
+
+
+def test_interpolator_uneven_linear_matches_interp(setup_interp):
+    """Linear interpolation on axes which happen to be evenly spaced is
+    unchanged by the rectilinear kernel."""
+    (x, y, z), values, (xi, yi, zi), values_interp = setup_interp
+
+    interpolator = interp.Interpolator((x, y, z), values)
+    interpolator._interp_into = (  # pylint: disable = protected-access
+        interpolator._interp_rectilinear_into  # pylint: disable = protected-access
+    )
+
+    assert np.allclose(interpolator.grid((xi, yi, zi)).ravel(), values_interp)
+
+
+def test_interpolator_method_checks(setup_interp):
+    (x, y, z), values, _, _ = setup_interp
+
+    with pytest.raises(ValueError, match="not recognised"):
+        interp.Interpolator((x, y, z), values, method="quintic")
+
+    with pytest.raises(ValueError, match="at least 4 points"):
+        interp.Interpolator((x[:3], y, z), values[:3], method="cubic")
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("method", ["linear", "cubic"])
+def test_interpolator_benchmark_vs_scipy(method):
+    axes_known, values = create_uneven_grid((100, 100, 60))
+
+    rng = np.random.default_rng(1)
+    points = np.column_stack(
+        [rng.uniform(axis[0], axis[-1], 10**6) for axis in axes_known]
+    )
+
+    interpolator = interp.Interpolator(axes_known, values, method=method)
+    interpolator(points[:10])
+
+    start = time.perf_counter()
+    values_interp = interpolator(points)
+    duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = scipy.interpolate.RegularGridInterpolator(
+        axes_known, values, method=method
+    )(points)
+    scipy_duration = time.perf_counter() - start
+
+    print(f"{method}: numba {duration:.2f} s, scipy {scipy_duration:.2f} s")
+
+    # scipy's default cubic spline is solved iteratively, so only agrees
+    # to within its tolerance.
+    assert np.allclose(values_interp, expected, atol=1e-2)
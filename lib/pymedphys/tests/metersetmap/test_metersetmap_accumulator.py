@@ -0,0 +1,132 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compare the incrementally accumulated MetersetMap against the MetersetMap
+of the whole delivery."""
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._icom import extract
+from pymedphys.experimental import MetersetMapAccumulator
+
+from ..icom.utilities import create_synthetic_icom_frame
+from .utilities import create_delivery
+
+
+def test_accumulator_matches_calculate():
+    mu, mlc, jaw = create_delivery(8)
+    expected = pymedphys.metersetmap.calculate(mu, mlc, jaw)
+
+    accumulator = MetersetMapAccumulator()
+    snapshots = []
+    for control_point in zip(mu, mlc, jaw):
+        accumulator.add(*control_point)
+        snapshots.append(accumulator.snapshot())
+
+    assert np.allclose(accumulator.snapshot(), expected, atol=1e-10)
+    assert accumulator.mu == pytest.approx(mu[-1] - mu[0])
+    assert len(accumulator) == len(mu)
+
+    # Each snapshot is the MetersetMap of the delivery up to that point
+    assert np.all(snapshots[0] == 0)
+    assert np.allclose(
+        snapshots[4], pymedphys.metersetmap.calculate(mu[:5], mlc[:5], jaw[:5])
+    )
+
+    # Snapshots are not modified by later control points
+    snapshots[-1][:] = 0
+    assert np.allclose(accumulator.snapshot(), expected, atol=1e-10)
+
+
+def test_accumulator_in_batches():
+    mu, mlc, jaw = create_delivery(6, seed=1)
+
+    one_at_a_time = MetersetMapAccumulator()
+    for control_point in zip(mu, mlc, jaw):
+        one_at_a_time.add(*control_point)
+
+    in_batches = MetersetMapAccumulator()
+    in_batches.add(mu[:1], mlc[:1], jaw[:1])
+    in_batches.add(mu[1:4], mlc[1:4], jaw[1:4])
+    in_batches.add(mu[4:], mlc[4:], jaw[4:])
+
+    assert np.array_equal(in_batches.snapshot(), one_at_a_time.snapshot())
+
+    in_batches.reset()
+    assert len(in_batches) == 0
+    assert np.all(in_batches.snapshot() == 0)
+
+
+def test_accumulator_meterset_reset():
+    mu, mlc, jaw = create_delivery(5, seed=2)
+
+    accumulator = MetersetMapAccumulator()
+    accumulator.add(mu[:3], mlc[:3], jaw[:3])
+    before_reset = accumulator.snapshot()
+
+    # The Linac restarting its meterset delivers no MU
+    accumulator.add(0, mlc[3], jaw[3])
+    assert np.array_equal(accumulator.snapshot(), before_reset)
+
+    accumulator.add(mu[4] - mu[3], mlc[4], jaw[4])
+    expected = before_reset + pymedphys.metersetmap.calculate(
+        [0, mu[4] - mu[3]], mlc[3:], jaw[3:]
+    )
+
+    assert np.allclose(accumulator.snapshot(), expected, atol=1e-10)
+
+
+def test_accumulator_validation():
+    with pytest.raises(ValueError, match="max leaf gap"):
+        MetersetMapAccumulator(max_leaf_gap=10, grid_resolution=3)
+
+    mu, mlc, jaw = create_delivery(3)
+    accumulator = MetersetMapAccumulator()
+
+    with pytest.raises(ValueError, match="half the maximum leaf gap"):
+        accumulator.add(mu[0], mlc[0] + 500, jaw[0])
+
+    with pytest.raises(ValueError, match="differ"):
+        accumulator.add(mu[:2], mlc[:3], jaw[:3])
+
+
+def test_accumulator_from_icom_frames():
+    rng = np.random.default_rng(0)
+    number_of_frames = 5
+
+    icom_stream = b"".join(
+        create_synthetic_icom_frame(
+            counter,
+            rng,
+            meterset=2 * counter,
+            mlcx=rng.uniform(-1, 2, 160),
+            asymy=rng.uniform(1, 5, 2),
+        )
+        for counter in range(number_of_frames)
+    )
+
+    accumulator = MetersetMapAccumulator()
+    for frame in extract.get_data_points(icom_stream):
+        accumulator.add_icom_frame(frame)
+
+    assert len(accumulator) == number_of_frames
+    assert accumulator.mu == pytest.approx(2 * (number_of_frames - 1))
+    assert np.allclose(
+        accumulator.snapshot(),
+        pymedphys.Delivery.from_icom(icom_stream).metersetmap(),
+        atol=1e-10,
+    )
@@ -0,0 +1,129 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable = redefined-outer-name
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys.experimental import MetersetMapCache
+
+from .utilities import create_delivery
+
+OPTIONS = dict(max_leaf_gap=200, grid_resolution=2.5)
+
+
+@pytest.fixture
+def delivery():
+    return create_delivery(4, number_of_leaves=80)
+
+
+def test_memory_and_disk_tiers(tmp_path, delivery):
+    expected = pymedphys.metersetmap.calculate(*delivery, **OPTIONS)
+
+    cache = MetersetMapCache(tmp_path)
+    first = cache.metersetmap(*delivery, **OPTIONS)
+    second = cache.metersetmap(*delivery, **OPTIONS)
+
+    assert np.array_equal(first, expected)
+    assert np.array_equal(second, expected)
+
+    stats = cache.stats()
+    assert (stats["misses"], stats["memory_hits"], stats["disk_hits"]) == (1, 1, 0)
+    assert stats["memory_entries"] == stats["disk_entries"] == 1
+    assert stats["memory_size"] == expected.nbytes
+
+    # The returned MetersetMaps are copies
+    first[:] = 0
+    assert np.array_equal(cache.metersetmap(*delivery, **OPTIONS), expected)
+
+    # A new cache, such as within a later session, reads from the disk
+    new_session = MetersetMapCache(tmp_path)
+    assert np.array_equal(new_session.metersetmap(*delivery, **OPTIONS), expected)
+    assert np.array_equal(new_session.metersetmap(*delivery, **OPTIONS), expected)
+
+    stats = new_session.stats()
+    assert (stats["misses"], stats["memory_hits"], stats["disk_hits"]) == (0, 1, 1)
+
+
+def test_cache_keys(tmp_path, delivery):
+    cache = MetersetMapCache(tmp_path)
+    cache.metersetmap(*delivery, **OPTIONS)
+
+    # Providing a default explicitly is the same calculation
+    cache.metersetmap(*delivery, min_step_per_pixel=10, **OPTIONS)
+    assert cache.stats()["misses"] == 1
+
+    mu, mlc, jaw = delivery
+    moved_mlc = mlc.copy()
+    moved_mlc[1, 40, 0] += 1
+
+    cache.metersetmap(mu, moved_mlc, jaw, **OPTIONS)
+    cache.metersetmap(*delivery, min_step_per_pixel=2, **OPTIONS)
+    cache.metersetmap(*delivery, engine="numba", **OPTIONS)
+
+    assert cache.stats()["misses"] == 4
+    assert cache.stats()["disk_entries"] == 4
+
+
+def test_size_limits(tmp_path, delivery):
+    entry_size = pymedphys.metersetmap.calculate(*delivery, **OPTIONS).nbytes
+    mu, mlc, jaw = delivery
+
+    cache = MetersetMapCache(
+        tmp_path,
+        maximum_memory_size=2 * entry_size,
+        maximum_size=int(2.5 * (entry_size + 128)),
+    )
+
+    for i in range(4):
+        cache.metersetmap(mu * (i + 1), mlc, jaw, **OPTIONS)
+
+    stats = cache.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_size"] <= 2 * entry_size
+    assert stats["disk_entries"] == 2
+    assert stats["disk_size"] <= cache.maximum_size
+
+    # The most recently used entries are retained
+    cache.metersetmap(mu * 4, mlc, jaw, **OPTIONS)
+    assert cache.stats()["memory_hits"] == 1
+
+    cache.clear()
+    stats = cache.stats()
+    assert stats["memory_entries"] == stats["disk_entries"] == stats["misses"] == 0
+
+
+def test_delivery_metersetmap_cache(tmp_path, delivery):
+    mu, mlc, jaw = delivery
+    number_of_control_points = len(mu)
+    pymedphys_delivery = pymedphys.Delivery(
+        mu,
+        np.zeros(number_of_control_points),
+        np.zeros(number_of_control_points),
+        mlc,
+        jaw,
+    )
+
+    cache = MetersetMapCache(tmp_path)
+    expected = pymedphys_delivery.metersetmap(**OPTIONS)
+
+    for _ in range(2):
+        assert np.array_equal(
+            pymedphys_delivery.metersetmap(cache=cache, **OPTIONS), expected
+        )
+
+    stats = cache.stats()
+    assert (stats["misses"], stats["memory_hits"]) == (1, 1)
@@ -0,0 +1,176 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compare the numba MetersetMap engine against the numpy engine."""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._metersetmap.metersetmap import calc_metersetmap
+
+from .utilities import create_delivery
+
+LEAF_PAIR_WIDTHS = (5, 5, 5)
+MAX_LEAF_GAP = 10
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_engines_match_random_delivery(seed):
+    mu, mlc, jaw = create_delivery(6, seed=seed)
+
+    expected = calc_metersetmap(mu, mlc, jaw)
+    metersetmap = calc_metersetmap(mu, mlc, jaw, engine="numba")
+
+    assert np.allclose(metersetmap, expected, atol=1e-10)
+
+
+@pytest.mark.parametrize("grid_resolution", [0.5, 1])
+def test_engines_match_docstring_example(grid_resolution):
+    mu = np.array([0, 2, 5, 10])
+    mlc = np.array(
+        [
+            [[1, 1], [2, 2], [3, 3]],
+            [[2, 2], [3, 3], [4, 4]],
+            [[-2, 3], [-2, 4], [-2, 5]],
+            [[0, 0], [0, 0], [0, 0]],
+        ]
+    )
+    jaw = np.array([[7.5, 7.5], [7.5, 7.5], [-2, 7.5], [0, 0]])
+
+    options = dict(
+        grid_resolution=grid_resolution,
+        max_leaf_gap=MAX_LEAF_GAP,
+        leaf_pair_widths=LEAF_PAIR_WIDTHS,
+    )
+
+    expected = calc_metersetmap(mu, mlc, jaw, **options)
+    metersetmap = calc_metersetmap(mu, mlc, jaw, engine="numba", **options)
+
+    assert np.allclose(metersetmap, expected, atol=1e-10)
+
+
+def test_engine_with_a_single_control_point():
+    mu, mlc, jaw = create_delivery(3)
+
+    metersetmap = calc_metersetmap(mu[:1], mlc[:1], jaw[:1], engine="numba")
+
+    assert metersetmap.shape == calc_metersetmap(mu[:1], mlc[:1], jaw[:1]).shape
+    assert np.all(metersetmap == 0)
+
+
+def test_unknown_engine():
+    mu, mlc, jaw = create_delivery(3)
+
+    with pytest.raises(ValueError, match="not recognised"):
+        calc_metersetmap(mu, mlc, jaw, engine="not_an_engine")
+
+
+@pytest.mark.slow
+def test_engines_on_logfile_deliveries():
+    """Benchmark the engines on the logfiles within the delivery test
+    data."""
+    trf_paths = [
+        path
+        for path in pymedphys.zip_data_paths("delivery_test_data.zip")
+        if path.suffix == ".trf"
+    ]
+    assert trf_paths
+
+    # Compile the numba kernels outside of the timings
+    calc_metersetmap(*create_delivery(3), engine="numba")
+
+    for path in trf_paths:
+        delivery = pymedphys.Delivery.from_logfile(path)
+
+        durations = {}
+        metersetmaps = {}
+        for engine in ("numpy", "numba"):
+            start = time.perf_counter()
+            metersetmaps[engine] = delivery.metersetmap(engine=engine)
+            durations[engine] = time.perf_counter() - start
+
+        print(
+            f"{path.parent.name}/{path.name}: "
+            f"{len(delivery.monitor_units)} control points, "
+            f"numpy {durations['numpy']:.2f} s, numba {durations['numba']:.2f} s"
+        )
+
+        assert np.allclose(metersetmaps["numba"], metersetmaps["numpy"], atol=1e-10)
+
+
+def test_analytic_engine_with_static_devices():
+    """Without any travel there is nothing for time sampling to
+    approximate."""
+    mu, mlc, jaw = create_delivery(4)
+    mlc[:] = mlc[0]
+    jaw[:] = jaw[0]
+
+    expected = calc_metersetmap(mu, mlc, jaw)
+    metersetmap = calc_metersetmap(mu, mlc, jaw, engine="analytic")
+
+    assert np.allclose(metersetmap, expected, atol=1e-10)
+
+
+def test_analytic_engine_sweeping_leaf():
+    """A pixel a distance ``x`` from the start of a leaf sweeping across
+    ``L`` at a constant speed is open for ``1 - x / L`` of the time."""
+    number_of_leaves = 3
+    mu = np.array([0, 4])
+    mlc = np.zeros((2, number_of_leaves, 2))
+    mlc[:, :, 0] = 10
+    mlc[:, :, 1] = [[-5], [5]]
+    jaw = np.array([[7.5, 7.5], [7.5, 7.5]])
+
+    grid = pymedphys.metersetmap.grid(
+        max_leaf_gap=20, leaf_pair_widths=LEAF_PAIR_WIDTHS
+    )
+    metersetmap = calc_metersetmap(
+        mu,
+        mlc,
+        jaw,
+        max_leaf_gap=20,
+        leaf_pair_widths=LEAF_PAIR_WIDTHS,
+        engine="analytic",
+    )
+
+    columns = np.abs(grid["mlc"]) <= 4
+    rows = np.abs(grid["jaw"]) <= 7
+    expected = 4 * (5 - grid["mlc"][columns]) / 10
+
+    assert np.allclose(metersetmap[np.ix_(rows, columns)], expected[None, :])
+
+
+def test_sampled_engines_converge_to_analytic():
+    mu, mlc, jaw = create_delivery(6)
+
+    analytic = calc_metersetmap(mu, mlc, jaw, engine="analytic")
+
+    errors = [
+        np.max(
+            np.abs(
+                calc_metersetmap(
+                    mu, mlc, jaw, min_step_per_pixel=min_step_per_pixel, engine="numba"
+                )
+                - analytic
+            )
+        )
+        for min_step_per_pixel in (10, 100)
+    ]
+
+    assert errors[1] < errors[0] / 5
+    assert errors[1] < 1e-3 * np.max(analytic)
@@ -0,0 +1,35 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Helpers for building synthetic deliveries within the MetersetMap tests."""
+
+from pymedphys._imports import numpy as np
+
+
+def create_delivery(number_of_control_points, number_of_leaves=80, seed=0):
+    """A random delivery with jaws and leaves that move between each
+    control point, and a beam hold within it."""
+    rng = np.random.default_rng(seed)
+
+    mu = np.cumsum(rng.uniform(0, 3, number_of_control_points))
+    mu[2] = mu[1]
+
+    centre = rng.uniform(-50, 50, (number_of_control_points, number_of_leaves))
+    gap = rng.uniform(0, 40, (number_of_control_points, number_of_leaves))
+    mlc = np.stack([-(centre - gap / 2), centre + gap / 2], axis=-1)
+
+    jaw = rng.uniform(0, 100, (number_of_control_points, 2))
+
+    return mu, mlc, jaw
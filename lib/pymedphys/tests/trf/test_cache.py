@@ -0,0 +1,165 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable = redefined-outer-name
+
+import os
+import subprocess
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._trf.decode import cache
+from pymedphys._utilities import test as pmp_test_utils
+
+from .utilities import create_synthetic_trf
+
+
+@pytest.fixture
+def trf_paths(tmp_path):
+    paths = []
+    for version in [1, 2, 3, 4]:
+        path = tmp_path / f"version_{version}.trf"
+        path.write_bytes(
+            create_synthetic_trf(version=version, number_of_rows=200, seed=version)
+        )
+        paths.append(path)
+
+    return paths
+
+
+def test_cached_read_matches(trf_paths, tmp_path):
+    cache_directory = tmp_path / "cache"
+
+    for path in trf_paths:
+        header, table = pymedphys.trf.read(path)
+
+        for _ in range(2):
+            cached_header, cached_table = pymedphys.trf.read_cached(
+                path, cache_directory=cache_directory
+            )
+            pd.testing.assert_frame_equal(header, cached_header)
+            pd.testing.assert_frame_equal(table, cached_table)
+
+        columns = list(table.columns[-3:])
+        _, arrays = pymedphys.trf.read_cached(
+            path, columns=columns, as_dataframe=False, cache_directory=cache_directory
+        )
+        assert list(arrays.keys()) == columns
+        for column in columns:
+            np.testing.assert_array_equal(arrays[column], table[column].to_numpy())
+
+    assert cache.stats(cache_directory)["entries"] == len(trf_paths)
+
+
+def test_identical_contents_share_an_entry(trf_paths, tmp_path):
+    cache_directory = tmp_path / "cache"
+
+    copied_path = tmp_path / "copy.trf"
+    copied_path.write_bytes(trf_paths[0].read_bytes())
+
+    pymedphys.trf.read_cached(trf_paths[0], cache_directory=cache_directory)
+    pymedphys.trf.read_cached(copied_path, cache_directory=cache_directory)
+
+    assert cache.stats(cache_directory)["entries"] == 1
+
+
+def test_cached_delivery(trf_paths, tmp_path, monkeypatch):
+    cache_directory = tmp_path / "cache"
+    monkeypatch.setattr(cache, "get_cache_directory", lambda: cache_directory)
+
+    for path in trf_paths:
+        reference = pymedphys.Delivery.from_trf(path)
+
+        for _ in range(2):
+            delivery = pymedphys.Delivery.from_trf(path, cache=True)
+            assert isinstance(delivery, pymedphys.Delivery)
+
+            for reference_item, item in zip(reference, delivery):
+                np.testing.assert_array_equal(reference_item, item)
+
+            assert delivery == reference
+            assert hash(delivery) == hash(reference)
+
+
+def test_decoder_version_invalidates(trf_paths, tmp_path, monkeypatch):
+    cache_directory = tmp_path / "cache"
+    pymedphys.trf.read_cached(trf_paths[0], cache_directory=cache_directory)
+
+    monkeypatch.setattr(cache, "DECODER_VERSION", cache.DECODER_VERSION + 1)
+    assert cache.stats(cache_directory)["current_version_entries"] == 0
+
+    pymedphys.trf.read_cached(trf_paths[0], cache_directory=cache_directory)
+
+    stats = cache.stats(cache_directory)
+    assert (stats["entries"], stats["current_version_entries"]) == (2, 1)
+
+
+def test_least_recently_used_eviction(trf_paths, tmp_path):
+    cache_directory = tmp_path / "cache"
+
+    for path in trf_paths:
+        cache.warm(path, cache_directory=cache_directory)
+
+    entries = sorted(cache_directory.iterdir())
+    for i, entry in enumerate(entries):
+        os.utime(entry, (i, i))
+
+    # Using the first entry makes it the most recently used
+    first_path = [
+        path for path in trf_paths if entries[0].name.startswith(cache.hash_file(path))
+    ][0]
+    pymedphys.trf.read_cached(first_path, cache_directory=cache_directory)
+
+    entry_size = max(cache._entry_size(entry) for entry in entries)  # pylint: disable = protected-access
+    evicted = cache.prune(cache_directory, maximum_size=int(entry_size * 1.5))
+
+    assert evicted == entries[1:]
+    assert list(cache_directory.iterdir()) == [entries[0]]
+
+
+def test_cache_cli(trf_paths, tmp_path):
+    cache_directory = tmp_path / "cache"
+    base_command = [
+        str(pmp_test_utils.get_executable_even_when_embedded()),
+        "-m",
+        "pymedphys",
+        "trf",
+        "cache",
+    ]
+
+    subprocess.check_call(
+        base_command
+        + [
+            "warm",
+            "--jobs",
+            "2",
+            "--directory",
+            str(cache_directory),
+            str(tmp_path / "*.trf"),
+        ]
+    )
+    assert cache.stats(cache_directory)["entries"] == len(trf_paths)
+
+    stats_output = subprocess.check_output(
+        base_command + ["stats", "--directory", str(cache_directory)]
+    )
+    assert f"entries: {len(trf_paths)}".encode() in stats_output
+
+    subprocess.check_call(
+        base_command + ["prune", "--directory", str(cache_directory), "--max-size", "0"]
+    )
+    assert cache.stats(cache_directory)["entries"] == 0
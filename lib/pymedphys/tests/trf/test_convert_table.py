@@ -0,0 +1,99 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Verify the vectorised post processing of the decoded TRF table."""
+
+import io
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._trf.decode.constants import CONFIG, Y2_LEAF_BANK_NAMES
+from pymedphys._trf.decode.header import decode_header
+from pymedphys._trf.decode.partition import split_into_header_table
+from pymedphys._trf.decode.table import convert_numbers_to_string, decode_rows
+
+from .utilities import create_synthetic_trf
+
+
+def _raw_and_converted(version):
+    trf_contents = create_synthetic_trf(version=version, number_of_rows=200)
+
+    trf_header_contents, trf_table_contents = split_into_header_table(trf_contents)
+    header = decode_header(trf_header_contents)
+    decoded_rows, column_names = decode_rows(
+        trf_table_contents, header.version, header.item_parts_length, header.item_parts
+    )
+    raw = pd.DataFrame(decoded_rows.astype(np.int64), columns=column_names)
+
+    _, table = pymedphys.trf.read(io.BytesIO(trf_contents))
+
+    return raw, table
+
+
+@pytest.mark.parametrize("version", [1, 2, 3, 4])
+def test_positional_items(version):
+    raw, table = _raw_and_converted(version)
+
+    raw_dose = raw["Dose/Raw value (1/64th Mu)"].to_numpy()
+    converted_dose = table["Dose/Raw value (1/64th Mu)"].to_numpy()
+    assert np.all(converted_dose >= 0)
+    np.testing.assert_array_equal(converted_dose % 2**16, raw_dose % 2**16)
+
+    np.testing.assert_allclose(
+        table["Step Dose/Actual Value (Mu)"], raw["Step Dose/Actual Value (Mu)"] / 10
+    )
+    np.testing.assert_allclose(
+        table["Step Gantry/Scaled Actual (deg)"],
+        raw["Step Gantry/Scaled Actual (deg)"] / 10,
+    )
+    np.testing.assert_allclose(
+        table[Y2_LEAF_BANK_NAMES], -raw[Y2_LEAF_BANK_NAMES].to_numpy() / 10
+    )
+
+    linac_state = table["Linac State/Actual Value (None)"].to_numpy()
+    for code, name in CONFIG["linac_state_codes"].items():
+        assert np.all(
+            linac_state[raw["Linac State/Actual Value (None)"] == int(code)] == name
+        )
+
+
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_timestamp_split_into_unknowns(version):
+    raw, table = _raw_and_converted(version)
+
+    assert list(table.columns[0:4]) == ["unknown1", "unknown2", "unknown3", "unknown4"]
+    assert "Timestamp Data" not in table.columns
+
+    unknowns = table[["unknown1", "unknown2", "unknown3", "unknown4"]].to_numpy()
+    timestamp = sum(unknowns[:, i].astype(np.uint64) << (16 * i) for i in range(4))
+
+    np.testing.assert_array_equal(
+        timestamp, raw["Timestamp Data"].to_numpy().astype(np.uint64)
+    )
+
+
+def test_incomplete_lookup_raises():
+    column = pd.Series([0, 1, 2, 5, 2])
+
+    np.testing.assert_array_equal(
+        convert_numbers_to_string("wedge", CONFIG["wedge_codes"], column[0:3]),
+        ["Moving", "In", "Out"],
+    )
+
+    with pytest.raises(ValueError, match=r"\[5\]"):
+        convert_numbers_to_string("wedge", CONFIG["wedge_codes"], column)
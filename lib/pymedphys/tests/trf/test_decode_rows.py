@@ -0,0 +1,128 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Verify the single pass table decoder against a row by row decode."""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._trf.decode.constants import CONFIG
+from pymedphys._trf.decode.header import decode_header
+from pymedphys._trf.decode.partition import split_into_header_table
+from pymedphys._trf.decode.table import decode_rows
+
+from .utilities import create_synthetic_trf
+
+
+def decode_rows_row_by_row(trf_table_contents, version, item_parts_length):
+    """The original row by row implementation of ``decode_rows``, kept
+    here as a reference."""
+    dtype = CONFIG["version_row"][str(version)]["dtype"]
+    offset = CONFIG["version_row"][str(version)]["offset"]
+    lg_scale = CONFIG["version_row"][str(version)]["lg_scale"]
+    line_grouping = lg_scale * item_parts_length + offset
+
+    item_part_values_data = [
+        np.frombuffer(
+            trf_table_contents[i : i + line_grouping],
+            offset=offset,
+            dtype=np.dtype(dtype),
+        )
+        for i in range(0, len(trf_table_contents), line_grouping)
+    ]
+
+    if version == 1:
+        return item_part_values_data
+
+    timestamps = [
+        np.frombuffer(trf_table_contents[i : i + 8], offset=0, dtype=np.int64)
+        for i in range(0, len(trf_table_contents), line_grouping)
+    ]
+
+    return [
+        np.concatenate((timestamps[i], item_parts))
+        for i, item_parts in enumerate(item_part_values_data)
+    ]
+
+
+def _decode_both_ways(trf_contents):
+    trf_header_contents, trf_table_contents = split_into_header_table(trf_contents)
+    header = decode_header(trf_header_contents)
+
+    start = time.perf_counter()
+    reference = decode_rows_row_by_row(
+        trf_table_contents, header.version, header.item_parts_length
+    )
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded_rows, _ = decode_rows(
+        trf_table_contents,
+        header.version,
+        header.item_parts_length,
+        header.item_parts,
+    )
+    decoded_time = time.perf_counter() - start
+
+    reference = np.array(reference)
+    assert decoded_rows.dtype == reference.dtype
+    np.testing.assert_array_equal(decoded_rows, reference)
+
+    return reference_time, decoded_time
+
+
+@pytest.mark.parametrize("version", [1, 2, 3, 4])
+def test_synthetic_decode_rows(version):
+    _decode_both_ways(create_synthetic_trf(version=version, number_of_rows=500))
+
+
+def test_incomplete_row_raises():
+    trf_contents = create_synthetic_trf(version=4, number_of_rows=10)
+    trf_header_contents, trf_table_contents = split_into_header_table(trf_contents)
+    header = decode_header(trf_header_contents)
+
+    with pytest.raises(ValueError):
+        decode_rows(
+            trf_table_contents[:-1],
+            header.version,
+            header.item_parts_length,
+            header.item_parts,
+        )
+
+
+@pytest.mark.slow
+def test_decode_rows_benchmark():
+    data_paths = pymedphys.zip_data_paths("trf-references-and-baselines.zip")
+    trf_paths = [path for path in data_paths if path.suffix == ".trf"]
+
+    total_reference_time = 0
+    total_decoded_time = 0
+
+    for path in trf_paths:
+        reference_time, decoded_time = _decode_both_ways(path.read_bytes())
+
+        total_reference_time += reference_time
+        total_decoded_time += decoded_time
+
+    print(
+        f"Row by row decode: {total_reference_time:.3f} s, "
+        f"single pass decode: {total_decoded_time:.3f} s, "
+        f"speed up: {total_reference_time / total_decoded_time:.1f}x"
+    )
+
+    assert total_decoded_time < total_reference_time
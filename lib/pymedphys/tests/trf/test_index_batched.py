@@ -0,0 +1,179 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batched logfile indexing tested against an in-process SQLite stand-in
+for the Mosaiq database."""
+
+# pylint: disable = redefined-outer-name
+
+import re
+import sqlite3
+
+from pymedphys._imports import pytest
+
+from pymedphys._mosaiq import delivery as _delivery
+from pymedphys._trf.manage import index as _index
+from pymedphys._trf.manage import indexdb
+
+from .utilities import create_synthetic_trf
+
+SCHEMA = """
+    CREATE TABLE Ident (Pat_ID1 INTEGER, IDA TEXT);
+    CREATE TABLE Patient (Pat_ID1 INTEGER, Last_Name TEXT, First_Name TEXT);
+    CREATE TABLE Staff (Staff_ID INTEGER, Last_Name TEXT);
+    CREATE TABLE TxField (
+        FLD_ID INTEGER, Field_Label TEXT, Field_Name TEXT, Type_Enum INTEGER
+    );
+    CREATE TABLE TrackTreatment (
+        Pat_ID1 INTEGER, FLD_ID INTEGER, Machine_ID_Staff_ID INTEGER,
+        Create_DtTm TEXT, Edit_DtTm TEXT, WasQAMode INTEGER,
+        WasBeamComplete INTEGER
+    );
+
+    INSERT INTO Ident VALUES (1, '123456'), (2, '654321');
+    INSERT INTO Patient VALUES (1, 'PHANTOM', 'DELTA4'), (2, 'PHANTOM', 'RW3');
+    INSERT INTO Staff VALUES (10, '2619'), (11, '2694');
+    INSERT INTO TxField VALUES
+        (100, '1-1', 'AP G0', 1),
+        (101, '1-2', 'PA G180', 1),
+        (200, '1-1', 'AP G0', 2);
+    INSERT INTO TrackTreatment VALUES
+        (1, 100, 10, '2020-09-24 06:28:00', '2020-09-24 06:31:00', 0, 1),
+        (1, 101, 10, '2020-09-24 06:33:00', '2020-09-24 06:36:00', 0, 1),
+        (2, 200, 11, '2020-09-25 10:00:00', '2020-09-25 10:03:00', 1, 1);
+"""
+
+
+class StandInCursor:
+    def __init__(self, connection):
+        self._connection = connection
+        self._results = None
+
+    def execute(self, query, parameters=None):
+        self._connection.queries.append(query)
+        query = re.sub(r"%\((\w+)\)s", r":\1", query)
+        self._results = self._connection.sqlite.execute(
+            query, parameters or {}
+        ).fetchall()
+
+    def fetchall(self):
+        return self._results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+class StandInConnection:
+    def __init__(self):
+        self.sqlite = sqlite3.connect(":memory:", check_same_thread=False)
+        self.sqlite.executescript(SCHEMA)
+        self.queries = []
+
+    def cursor(self):
+        return StandInCursor(self)
+
+
+@pytest.fixture
+def connection():
+    return StandInConnection()
+
+
+def test_identify_from_a_day_of_treatments(connection):
+    treatments = _delivery.get_mosaiq_treatments(
+        connection, "2619", "2020-09-24 00:00:00", "2020-09-25 00:00:00"
+    )
+    assert len(treatments) == 2
+
+    details = _delivery.identify_mosaiq_delivery_details(
+        treatments, "2020-09-24 06:35:00", "1-2", "PA G180", buffer=240
+    )
+    assert details.patient_id == "123456"
+    assert details.field_id == 101
+    assert details.field_type == "Static"
+
+    with pytest.raises(_delivery.NoMosaiqEntries):
+        _delivery.identify_mosaiq_delivery_details(
+            treatments, "2020-09-24 08:00:00", "1-2", "PA G180", buffer=240
+        )
+
+
+def test_identify_compares_fields_as_sql_server(connection):
+    connection.sqlite.execute(
+        "UPDATE TxField SET Field_Name = 'pa g180  ' WHERE FLD_ID = 101"
+    )
+    treatments = _delivery.get_mosaiq_treatments(
+        connection, "2619", "2020-09-24 00:00:00", "2020-09-25 00:00:00"
+    )
+
+    # SQL Server's default collation ignores case and trailing spaces
+    for field_label, field_name in [("1-2", "PA G180"), ("1-2 ", "Pa G180 ")]:
+        details = _delivery.identify_mosaiq_delivery_details(
+            treatments, "2020-09-24 06:35:00", field_label, field_name, buffer=240
+        )
+        assert details.field_id == 101
+
+    with pytest.raises(_delivery.NoMosaiqEntries):
+        _delivery.identify_mosaiq_delivery_details(
+            treatments, "2020-09-24 06:35:00", "1-2", " PA G180", buffer=240
+        )
+
+
+def test_batched_index_logfiles(tmp_path, connection, monkeypatch):
+    monkeypatch.setattr(_index._pp_mosaiq, "connect", lambda *_: connection)
+
+    to_be_indexed = tmp_path / "to_be_indexed"
+    to_be_indexed.mkdir()
+
+    logfiles = {
+        "first.trf": dict(date="20/09/24 06:29:58 Z", field="1-1/AP G0"),
+        "second.trf": dict(date="20/09/24 06:34:10 Z", field="1-2/PA G180"),
+        "other_machine.trf": dict(
+            date="20/09/25 10:01:00 Z", field="1-1/AP G0", machine="2694"
+        ),
+        "no_record.trf": dict(date="20/09/24 12:00:00 Z", field="1-1/AP G0"),
+    }
+    for i, (filename, header) in enumerate(logfiles.items()):
+        (to_be_indexed / filename).write_bytes(
+            create_synthetic_trf(number_of_rows=20, seed=i, **header)
+        )
+
+    centre_map = {"centre": {"timezone": "UTC", "mosaiq_sql_server": "msq:1433"}}
+    machine_map = {"2619": {"centre": "centre"}, "2694": {"centre": "centre"}}
+
+    _index.index_logfiles(centre_map, machine_map, tmp_path, batched=True)
+
+    # One query per machine per day, regardless of the number of logfiles
+    assert len(connection.queries) == 2
+
+    assert not list(to_be_indexed.glob("*.trf"))
+    assert (tmp_path / "no_mosaiq_record_found" / "no_record.trf").exists()
+
+    with indexdb.open_index(tmp_path) as index:
+        assert len(index) == 3
+
+        field_ids = sorted(
+            entry["delivery_details"]["field_id"] for entry in index.values()
+        )
+        assert field_ids == [100, 101, 200]
+
+        for entry in index.values():
+            assert (tmp_path / "indexed" / entry["filepath"]).exists()
+
+        assert [
+            entry["delivery_details"]["field_id"]
+            for _, entry in index.query(machine="2619")
+        ] == [100, 101]
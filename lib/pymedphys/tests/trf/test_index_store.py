@@ -0,0 +1,143 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._trf.manage import indexdb
+
+
+def _entry(patient_id, machine, local_time):
+    return {
+        "filepath": f"centre/{patient_id}/{local_time[:10]}_{machine}.trf",
+        "delivery_details": {"patient_id": patient_id, "field_id": 1},
+        "logfile_header": {
+            "machine": machine,
+            "item_parts": np.array([1, 2, 3], dtype=np.int16),
+            "line_grouping": np.int64(2),
+        },
+        "local_time": local_time,
+    }
+
+
+ENTRIES = {
+    "hash_a": _entry("123", "2619", "2020-01-01 09:00:00"),
+    "hash_b": _entry("123", "2694", "2020-01-02 09:00:00"),
+    "hash_c": _entry("456", "2619", "2020-01-03 09:00:00"),
+}
+
+
+def test_insert_and_lookup(tmp_path):
+    with indexdb.LogfileIndex(tmp_path / "index.sqlite") as index:
+        for filehash, entry in ENTRIES.items():
+            index[filehash] = entry
+
+        assert len(index) == 3
+        assert set(index.keys()) == set(ENTRIES)
+        assert "hash_b" in index
+        assert "not_a_hash" not in index
+
+        stored = index["hash_a"]
+        assert stored["filepath"] == ENTRIES["hash_a"]["filepath"]
+        assert stored["logfile_header"]["item_parts"] == [1, 2, 3]
+
+        with pytest.raises(KeyError):
+            index["not_a_hash"]  # pylint: disable = pointless-statement
+
+        del index["hash_a"]
+        assert "hash_a" not in index
+
+    # Entries are persisted as soon as they are assigned
+    with indexdb.LogfileIndex(tmp_path / "index.sqlite") as index:
+        assert set(index.keys()) == {"hash_b", "hash_c"}
+
+
+def test_query(tmp_path):
+    with indexdb.LogfileIndex(tmp_path / "index.sqlite") as index:
+        index.update_many(ENTRIES)
+
+        def hashes(**kwargs):
+            return [filehash for filehash, _ in index.query(**kwargs)]
+
+        assert hashes() == ["hash_a", "hash_b", "hash_c"]
+        assert hashes(patient_id="123") == ["hash_a", "hash_b"]
+        assert hashes(machine="2619") == ["hash_a", "hash_c"]
+        assert hashes(patient_id="123", machine="2619") == ["hash_a"]
+        assert hashes(start="2020-01-02") == ["hash_b", "hash_c"]
+        assert hashes(start="2020-01-01", end="2020-01-02 12:00:00") == [
+            "hash_a",
+            "hash_b",
+        ]
+
+
+def test_migration_from_json(tmp_path):
+    legacy_index = json.loads(
+        json.dumps(ENTRIES, default=indexdb._json_default)  # pylint: disable = protected-access
+    )
+    with open(tmp_path / "index.json", "w") as f:
+        json.dump(legacy_index, f)
+
+    index = indexdb.open_index(tmp_path)
+    try:
+        assert dict(index.items()) == legacy_index
+    finally:
+        index.close()
+
+    # A migration is only undertaken when first creating the index
+    (tmp_path / "index.json").write_text("{}")
+    index = indexdb.open_index(tmp_path)
+    try:
+        assert len(index) == 3
+    finally:
+        index.close()
+
+
+def test_failed_migration_is_retried(tmp_path, monkeypatch):
+    legacy_index = json.loads(
+        json.dumps(ENTRIES, default=indexdb._json_default)  # pylint: disable = protected-access
+    )
+    (tmp_path / "index.json").write_text("{ not json")
+
+    with pytest.raises(json.JSONDecodeError):
+        indexdb.open_index(tmp_path)
+
+    assert not (tmp_path / "index.sqlite").exists()
+
+    with open(tmp_path / "index.json", "w") as f:
+        json.dump(legacy_index, f)
+
+    def interrupted_update_many(self, entries):
+        self[next(iter(entries))] = next(iter(entries.values()))
+        raise KeyboardInterrupt()
+
+    with monkeypatch.context() as m:
+        m.setattr(indexdb.LogfileIndex, "update_many", interrupted_update_many)
+        with pytest.raises(KeyboardInterrupt):
+            indexdb.open_index(tmp_path)
+
+    assert not (tmp_path / "index.sqlite").exists()
+
+    index = indexdb.open_index(tmp_path)
+    try:
+        assert dict(index.items()) == legacy_index
+    finally:
+        index.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "index.json",
+        "index.sqlite",
+    ]
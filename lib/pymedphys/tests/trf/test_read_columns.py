@@ -0,0 +1,88 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Verify memory-mapped and column projected TRF reads against a full
+read."""
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._trf.decode.constants import DELIVERY_COLUMNS
+from pymedphys._trf.decode.delivery import DeliveryLogfile
+
+from .utilities import create_synthetic_trf
+
+
+@pytest.fixture(params=[1, 2, 3, 4])
+def trf_path(request, tmp_path):
+    path = tmp_path / f"version_{request.param}.trf"
+    path.write_bytes(
+        create_synthetic_trf(version=request.param, number_of_rows=300, seed=5)
+    )
+
+    return path
+
+
+def check_projected_read(path):
+    header, table = pymedphys.trf.read(path)
+
+    mmap_header, mmap_table = pymedphys.trf.read(path, mmap=True)
+    pd.testing.assert_frame_equal(header, mmap_header)
+    pd.testing.assert_frame_equal(table, mmap_table)
+
+    columns = list(table.columns[::-1])
+    _, projected_table = pymedphys.trf.read(path, columns=columns, mmap=True)
+    pd.testing.assert_frame_equal(table[columns], projected_table)
+
+    _, arrays = pymedphys.trf.read(path, columns=columns[0:5], as_dataframe=False)
+    assert list(arrays.keys()) == columns[0:5]
+    for column, values in arrays.items():
+        assert isinstance(values, np.ndarray)
+        np.testing.assert_array_equal(values, table[column].to_numpy())
+
+
+def test_projected_read(trf_path):
+    check_projected_read(trf_path)
+
+
+def test_unavailable_column_raises(trf_path):
+    with pytest.raises(ValueError, match="not a column"):
+        pymedphys.trf.read(trf_path, columns=["not a column"])
+
+
+def test_delivery_from_projected_read(trf_path):
+    _, table = pymedphys.trf.read(trf_path)
+    reference = DeliveryLogfile._from_pandas(table)  # pylint: disable = protected-access
+
+    _, projected_table = pymedphys.trf.read(
+        trf_path, columns=DELIVERY_COLUMNS, mmap=True
+    )
+    assert list(projected_table.columns) == DELIVERY_COLUMNS
+
+    delivery = pymedphys.Delivery.from_trf(trf_path)
+
+    for reference_item, item in zip(reference, delivery):
+        np.testing.assert_array_equal(reference_item, item)
+
+
+@pytest.mark.slow
+def test_projected_read_of_reference_files():
+    data_paths = pymedphys.zip_data_paths("trf-references-and-baselines.zip")
+    trf_paths = [path for path in data_paths if path.suffix == ".trf"]
+
+    for path in trf_paths:
+        check_projected_read(path)
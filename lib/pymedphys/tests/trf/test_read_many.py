@@ -0,0 +1,130 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable = redefined-outer-name
+
+import os
+import subprocess
+from concurrent.futures.process import BrokenProcessPool
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._utilities import test as pmp_test_utils
+from pymedphys._utilities.parallel import map_many
+
+from .utilities import create_synthetic_trf
+
+
+@pytest.fixture
+def trf_paths(tmp_path):
+    paths = []
+    for i, version in enumerate([1, 2, 3, 4, 4]):
+        path = tmp_path / f"logfile_{i}.trf"
+        path.write_bytes(
+            create_synthetic_trf(version=version, number_of_rows=100, seed=i)
+        )
+        paths.append(path)
+
+    corrupt_path = tmp_path / "corrupt.trf"
+    corrupt_path.write_bytes(b"not a trf file")
+    paths.insert(2, corrupt_path)
+
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_many(trf_paths, workers):
+    results = list(pymedphys.trf.read_many(trf_paths, workers=workers))
+
+    assert [result.path for result in results] == trf_paths
+
+    for result in results:
+        if result.path.name == "corrupt.trf":
+            assert result.result is None
+            assert isinstance(result.error, ValueError)
+            continue
+
+        assert result.error is None
+
+        header, table = pymedphys.trf.read(result.path)
+        pd.testing.assert_frame_equal(header, result.result[0])
+        pd.testing.assert_frame_equal(table, result.result[1])
+
+
+def test_read_many_deliveries_unordered(trf_paths):
+    results = list(
+        pymedphys.trf.read_many(trf_paths, workers=2, delivery=True, ordered=False)
+    )
+
+    assert sorted(result.path for result in results) == sorted(trf_paths)
+
+    for result in results:
+        if result.error is not None:
+            assert result.path.name == "corrupt.trf"
+            continue
+
+        assert isinstance(result.result, pymedphys.Delivery)
+
+        reference = pymedphys.Delivery.from_trf(result.path)
+        for reference_item, item in zip(reference, result.result):
+            np.testing.assert_array_equal(reference_item, item)
+
+
+def test_to_csv_jobs_cli(trf_paths, tmp_path):
+    command = [
+        str(pmp_test_utils.get_executable_even_when_embedded()),
+        "-m",
+        "pymedphys",
+        "trf",
+        "to-csv",
+        "--jobs",
+        "2",
+        str(tmp_path / "*.trf"),
+    ]
+
+    completed = subprocess.run(command, capture_output=True, check=False)
+
+    assert completed.returncode != 0
+    assert b"corrupt.trf" in completed.stderr
+
+    for path in trf_paths:
+        if path.name == "corrupt.trf":
+            continue
+
+        assert path.with_name(f"{path.stem}_table.csv").exists()
+        assert path.with_name(f"{path.stem}_header.csv").exists()
+
+
+def _exit_on_crash(path):
+    if path == "crash":
+        os._exit(1)  # pylint: disable = protected-access
+
+    return path
+
+
+def test_map_many_worker_death():
+    paths = ["a", "b", "crash", "c", "d", "e"]
+    results = list(map_many(_exit_on_crash, paths, workers=2))
+
+    assert [result.path for result in results] == paths
+
+    for result in results:
+        if result.path == "crash":
+            assert isinstance(result.error, BrokenProcessPool)
+        else:
+            assert result.error is None
+            assert result.result == result.path
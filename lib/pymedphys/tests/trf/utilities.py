@@ -0,0 +1,102 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Helpers for building small synthetic TRF files within the tests."""
+
+from pymedphys._imports import numpy as np
+
+from pymedphys._trf.decode.constants import CONFIG
+
+LINAC_STATE_CODES = [int(key) for key in CONFIG["linac_state_codes"]]
+WEDGE_CODES = [int(key) for key in CONFIG["wedge_codes"]]
+
+
+def create_synthetic_trf(
+    version=4,
+    number_of_rows=1000,
+    seed=0,
+    date="20/09/24 06:29:58 Z",
+    field="1-1/AP G0",
+    machine="2619",
+) -> bytes:
+    """Create the binary contents of a TRF file filled with random
+    values.
+
+    The header's UTC ``date``, ``field`` label and name (separated by a
+    ``/``) and ``machine`` can be customised.
+
+    All item parts within the decoding config are included as columns,
+    with the linac state, wedge and raw dose columns filled with values
+    that the decoder is able to convert.
+    """
+    rng = np.random.default_rng(seed)
+
+    item_part_names = CONFIG["item_part_names"]
+    item_part_keys = [
+        key
+        for key, name in item_part_names.items()
+        if version == 4 or name != "Mlc Status/Actual Value (None)"
+    ]
+    column_names = [item_part_names[key] for key in item_part_keys]
+
+    item_parts = np.array(
+        [int(part) for key in item_part_keys for part in key.split("_")],
+        dtype=np.int16,
+    )
+
+    header = (
+        b"\x11"
+        + date.encode()
+        + b"\x06"
+        + b"+02:00"
+        + bytes([len(field)])
+        + field.encode()
+        + bytes([len(machine)])
+        + machine.encode()
+        + np.float64(0).tobytes()
+        + np.int32(version).tobytes()
+        + np.int32(len(item_part_keys)).tobytes()
+        + item_parts.tobytes()
+    )
+
+    value_dtype = np.dtype(CONFIG["version_row"][str(version)]["dtype"])
+    values = rng.integers(0, 500, size=(number_of_rows, len(item_part_keys))).astype(
+        value_dtype
+    )
+
+    values[:, column_names.index("Linac State/Actual Value (None)")] = rng.choice(
+        LINAC_STATE_CODES, number_of_rows
+    )
+    values[:, column_names.index("Wedge Position/Actual Value (None)")] = rng.choice(
+        WEDGE_CODES, number_of_rows
+    )
+    values[:, column_names.index("Dose/Raw value (1/64th Mu)")] = rng.integers(
+        -(2**15), 2**15, number_of_rows
+    )
+
+    if version == 1:
+        return header + values.tobytes()
+
+    records = np.empty(
+        number_of_rows,
+        dtype=[
+            ("timestamp", np.int64),
+            ("values", value_dtype, (len(item_part_keys),)),
+        ],
+    )
+    records["timestamp"] = rng.integers(0, 2**62, number_of_rows)
+    records["values"] = values
+
+    return header + records.tobytes()
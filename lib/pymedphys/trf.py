@@ -1,5 +1,7 @@
 # pylint: disable = unused-import, missing-docstring
 # ruff: noqa: F401
 
+from pymedphys._trf.decode.batch import read_many
+from pymedphys._trf.decode.cache import read_cached
 from pymedphys._trf.decode.trf2pandas import trf2pandas as read
 from pymedphys._trf.manage.identify import identify_logfile as identify